@@ -0,0 +1,70 @@
+"""Measures how long it takes to render a macro-heavy model for many different intervals.
+
+Usage: python benchmarks/macro_heavy_render.py [renders]
+
+The model calls user macros with typed arguments as well as built-in macros, so every render goes
+through macro call planning, the prepared Python environment and the evaluation of each macro.
+"""
+
+import sys
+import time
+import typing as t
+from datetime import date, timedelta
+
+from sqlglot import exp
+
+from sqlmesh.core import dialect as d
+from sqlmesh.core.macros import MacroEvaluator, macro
+from sqlmesh.core.model import SqlModel, load_sql_based_model
+
+
+def heavy_model() -> SqlModel:
+    registry = macro.get_registry()
+
+    @macro()
+    def heavy_cols(evaluator: MacroEvaluator, prefix: str, count: int) -> t.List[exp.Expression]:
+        return [exp.column(f"{prefix}_{i}") for i in range(count)]
+
+    @macro()
+    def heavy_filter(
+        evaluator: MacroEvaluator, column: exp.Column, value: exp.Literal
+    ) -> exp.Condition:
+        return column.eq(value)
+
+    try:
+        return t.cast(
+            SqlModel,
+            load_sql_based_model(
+                d.parse(
+                    """
+                    MODEL (name db.heavy, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+                    SELECT
+                      @heavy_cols('a', 5),
+                      @EACH([x, y, z], c -> c * 2),
+                      @IF(@start_ds > '2020-01-01', 1, 0) AS flag
+                    FROM db.src
+                    WHERE @heavy_filter(ds, @start_ds)
+                    """
+                ),
+                macros=macro.get_registry(),
+            ),
+        )
+    finally:
+        macro.set_registry(registry)
+
+
+def measure(renders: int) -> float:
+    model = heavy_model()
+    start_date = date(2000, 1, 1)
+
+    start = time.perf_counter()
+    for i in range(renders):
+        model.render_query(start=start_date + timedelta(days=i), optimize=False)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    elapsed = measure(renders)
+    print(f"{renders} renders: {elapsed:.3f}s ({elapsed / renders * 1_000_000:.1f}us per render)")
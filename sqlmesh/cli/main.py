@@ -541,6 +541,18 @@ def create_test(
     default=False,
     help="Preserve the fixture tables in the testing database, useful for debugging.",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="The number of workers that run tests concurrently. Default: 1",
+)
+@click.option(
+    "--use-processes",
+    is_flag=True,
+    default=False,
+    help="Run tests in forked worker processes instead of threads.",
+)
 @click.argument("tests", nargs=-1)
 @click.pass_obj
 @error_handler
@@ -550,6 +562,8 @@ def test(
     k: t.List[str],
     verbose: bool,
     preserve_fixtures: bool,
+    workers: int,
+    use_processes: bool,
     tests: t.List[str],
 ) -> None:
     """Run model unit tests."""
@@ -558,6 +572,8 @@ def test(
         tests=tests,
         verbose=verbose,
         preserve_fixtures=preserve_fixtures,
+        workers=workers,
+        use_processes=use_processes,
     )
     if not result.wasSuccessful():
         exit(1)
@@ -725,6 +741,16 @@ def create_external_models(obj: Context) -> None:
     default=3,
     help="The number of decimal places to keep when comparing floating point columns. Default: 3",
 )
+@click.option(
+    "--buckets",
+    type=int,
+    help="The number of hash buckets to compare before joining rows. Only rows in differing buckets are joined.",
+)
+@click.option(
+    "--sample-rate",
+    type=float,
+    help="The fraction of join keys to sample from both tables.",
+)
 @click.pass_obj
 @error_handler
 @cli_analytics
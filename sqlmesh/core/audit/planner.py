@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+
+from sqlglot import exp, select
+
+from sqlmesh.core.audit import BUILT_IN_AUDITS, builtin
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.audit.definition import Audit
+
+
+@dataclass(frozen=True)
+class AuditQuery:
+    """A query that computes the counts of one or more audits in a single row.
+
+    Args:
+        query: The query which returns one row with one column per audit.
+        indices: The positions of the audits whose counts are returned by the query, in the order
+            of the query's columns.
+    """
+
+    query: exp.Query
+    indices: t.Tuple[int, ...]
+
+
+def plan_audit_queries(
+    rendered_audits: t.Sequence[t.Tuple[Audit, exp.Query]],
+) -> t.List[AuditQuery]:
+    """Plans the queries that compute the counts of the given rendered audits.
+
+    Built-in audits which filter the same source are fused into a single aggregate query with one
+    counter per audit, so that the source is scanned only once. All other audits are counted by
+    their own query.
+
+    Args:
+        rendered_audits: Audits together with their rendered queries.
+
+    Returns:
+        The audit queries which cover every given audit exactly once.
+    """
+    sources: t.Dict[str, exp.Expression] = {}
+    fusable: t.Dict[str, t.List[t.Tuple[int, exp.Expression]]] = {}
+    standalone: t.List[int] = []
+
+    for index, (audit, query) in enumerate(rendered_audits):
+        fused = _fused_counter(audit, query)
+        if fused is None:
+            standalone.append(index)
+        else:
+            source, counter = fused
+            key = source.sql()
+            sources.setdefault(key, source)
+            fusable.setdefault(key, []).append((index, counter))
+
+    queries = []
+    for key, group in fusable.items():
+        if len(group) == 1:
+            standalone.append(group[0][0])
+            continue
+        source = sources[key]
+        queries.append(
+            AuditQuery(
+                query=select(
+                    *(
+                        exp.alias_(counter, f"audit_{position}")
+                        for position, (_, counter) in enumerate(group)
+                    )
+                ).from_(source.copy()),
+                indices=tuple(index for index, _ in group),
+            )
+        )
+
+    for index in sorted(standalone):
+        queries.append(
+            AuditQuery(
+                query=select("COUNT(*)").from_(rendered_audits[index][1].subquery("audit")),
+                indices=(index,),
+            )
+        )
+
+    return queries
+
+
+def _fused_counter(
+    audit: Audit, query: exp.Query
+) -> t.Optional[t.Tuple[exp.Expression, exp.Expression]]:
+    """Returns the source and the counter of an audit query that can be fused with others."""
+    if BUILT_IN_AUDITS.get(audit.name) is not audit:
+        return None
+
+    if audit.query == builtin.number_of_rows_audit.query:
+        return _number_of_rows_counter(query)
+
+    filtered = _filtered_source(query)
+    if filtered is None or not isinstance(query.selects[0], exp.Star):
+        return None
+    source, condition = filtered
+    return source, _count_if(condition)
+
+
+def _number_of_rows_counter(
+    query: exp.Query,
+) -> t.Optional[t.Tuple[exp.Expression, exp.Expression]]:
+    # SELECT COUNT(*) FROM (SELECT 1 FROM src WHERE cond LIMIT threshold + 1) HAVING COUNT(*) <= threshold
+    having = query.args.get("having")
+    from_ = query.args.get("from")
+    if (
+        not isinstance(query, exp.Select)
+        or having is None
+        or from_ is None
+        or not isinstance(from_.this, exp.Subquery)
+        or not isinstance(from_.this.this, exp.Select)
+    ):
+        return None
+
+    filtered = _filtered_source(from_.this.this, allow_limit=True)
+    if filtered is None:
+        return None
+    source, condition = filtered
+
+    # The limit only short-circuits the scan, counting all matching rows yields the same result.
+    matching_rows = _count_if(condition)
+    violation = having.this.transform(
+        lambda node: matching_rows.copy() if isinstance(node, exp.Count) else node
+    )
+    return source, exp.If(this=violation, true=exp.Literal.number(1), false=exp.Literal.number(0))
+
+
+def _filtered_source(
+    query: exp.Query, allow_limit: bool = False
+) -> t.Optional[t.Tuple[exp.Expression, exp.Expression]]:
+    """Returns the source and filter of a query with the shape `SELECT ... FROM src WHERE cond`."""
+    if not isinstance(query, exp.Select) or len(query.selects) != 1:
+        return None
+
+    disallowed = {"joins", "laterals", "group", "having", "qualify", "windows", "distinct", "with"}
+    if not allow_limit:
+        disallowed |= {"limit", "offset"}
+    if any(query.args.get(arg) for arg in disallowed):
+        return None
+
+    from_ = query.args.get("from")
+    where = query.args.get("where")
+    if from_ is None or where is None:
+        return None
+
+    condition = where.this
+    if condition.find(exp.AggFunc, exp.Window, exp.Query):
+        return None
+
+    return from_.this, condition
+
+
+def _count_if(condition: exp.Expression) -> exp.Expression:
+    # COUNT_IF isn't supported by every engine and SUM returns NULL for an empty source.
+    matches = exp.If(this=condition.copy(), true=exp.Literal.number(1), false=exp.Literal.number(0))
+    return exp.func("COALESCE", exp.Sum(this=matches), exp.Literal.number(0))
@@ -36,3 +36,4 @@ from sqlmesh.core.config.scheduler import (
     CloudComposerSchedulerConfig as CloudComposerSchedulerConfig,
     MWAASchedulerConfig as MWAASchedulerConfig,
 )
+from sqlmesh.core.config.staging import DataFrameStagingConfig as DataFrameStagingConfig
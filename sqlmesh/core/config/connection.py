@@ -21,6 +21,7 @@ from sqlmesh.core.config.common import (
     http_headers_validator,
 )
 from sqlmesh.core.engine_adapter import EngineAdapter
+from sqlmesh.core.engine_adapter.shared import DataFrameLoadStrategy
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.pydantic import (
     PYDANTIC_MAJOR_VERSION,
@@ -878,6 +879,7 @@ class RedshiftConnectionConfig(ConnectionConfig):
         serverless_acct_id: The account ID of the serverless. Default value None
         serverless_work_group: The name of work group for serverless end point. Default value None.
         pre_ping: Whether or not to pre-ping the connection before starting a new transaction to ensure it is still alive.
+        df_load_strategy: How pandas DataFrames are loaded. `native` stages them with multi-row prepared inserts.
     """
 
     user: t.Optional[str] = None
@@ -906,6 +908,8 @@ class RedshiftConnectionConfig(ConnectionConfig):
     register_comments: bool = True
     pre_ping: bool = False
 
+    df_load_strategy: DataFrameLoadStrategy = DataFrameLoadStrategy.VALUES
+
     type_: Literal["redshift"] = Field(alias="type", default="redshift")
 
     @property
@@ -938,6 +942,10 @@ class RedshiftConnectionConfig(ConnectionConfig):
     def _engine_adapter(self) -> t.Type[EngineAdapter]:
         return engine_adapter.RedshiftEngineAdapter
 
+    @property
+    def _extra_engine_config(self) -> t.Dict[str, t.Any]:
+        return {"df_load_strategy": self.df_load_strategy}
+
     @property
     def _connection_factory(self) -> t.Callable:
         from redshift_connector import connect
@@ -960,6 +968,8 @@ class PostgresConnectionConfig(ConnectionConfig):
     register_comments: bool = True
     pre_ping: bool = True
 
+    df_load_strategy: DataFrameLoadStrategy = DataFrameLoadStrategy.VALUES
+
     type_: Literal["postgres"] = Field(alias="type", default="postgres")
 
     @property
@@ -986,6 +996,10 @@ class PostgresConnectionConfig(ConnectionConfig):
 
         return connect
 
+    @property
+    def _extra_engine_config(self) -> t.Dict[str, t.Any]:
+        return {"df_load_strategy": self.df_load_strategy}
+
 
 class MySQLConnectionConfig(ConnectionConfig):
     host: str
@@ -999,6 +1013,8 @@ class MySQLConnectionConfig(ConnectionConfig):
     register_comments: bool = True
     pre_ping: bool = True
 
+    df_load_strategy: DataFrameLoadStrategy = DataFrameLoadStrategy.VALUES
+
     type_: Literal["mysql"] = Field(alias="type", default="mysql")
 
     @property
@@ -1027,6 +1043,10 @@ class MySQLConnectionConfig(ConnectionConfig):
     def _engine_adapter(self) -> t.Type[EngineAdapter]:
         return engine_adapter.MySQLEngineAdapter
 
+    @property
+    def _extra_engine_config(self) -> t.Dict[str, t.Any]:
+        return {"df_load_strategy": self.df_load_strategy}
+
     @property
     def _connection_factory(self) -> t.Callable:
         from mysql.connector import connect
@@ -1208,6 +1228,8 @@ class TrinoConnectionConfig(ConnectionConfig):
     register_comments: bool = True
     pre_ping: Literal[False] = False
 
+    df_load_strategy: DataFrameLoadStrategy = DataFrameLoadStrategy.VALUES
+
     type_: Literal["trino"] = Field(alias="type", default="trino")
 
     @model_validator(mode="after")
@@ -1264,6 +1286,10 @@ class TrinoConnectionConfig(ConnectionConfig):
     def _engine_adapter(self) -> t.Type[EngineAdapter]:
         return engine_adapter.TrinoEngineAdapter
 
+    @property
+    def _extra_engine_config(self) -> t.Dict[str, t.Any]:
+        return {"df_load_strategy": self.df_load_strategy}
+
     @property
     def _connection_factory(self) -> t.Callable:
         from trino.dbapi import connect
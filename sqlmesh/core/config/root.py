@@ -29,11 +29,13 @@ from sqlmesh.core.config.model import ModelDefaultsConfig
 from sqlmesh.core.config.naming import NameInferenceConfig as NameInferenceConfig
 from sqlmesh.core.config.plan import PlanConfig
 from sqlmesh.core.config.run import RunConfig
+from sqlmesh.core.config.staging import DataFrameStagingConfig
 from sqlmesh.core.config.scheduler import BuiltInSchedulerConfig, SchedulerConfig
 from sqlmesh.core.config.ui import UIConfig
 from sqlmesh.core.loader import Loader, SqlMeshLoader
 from sqlmesh.core.notification_target import NotificationTarget
 from sqlmesh.core.user import User
+from sqlmesh.utils.cache import CacheBackend
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.pydantic import (
     field_validator,
@@ -76,6 +78,8 @@ class Config(BaseConfig):
         migration: The migration configuration.
         variables: A dictionary of variables that can be used in models / macros.
         disable_anonymized_analytics: Whether to disable the anonymized analytics collection.
+        cache_backend: The storage used to cache model definitions and optimized queries.
+        df_staging: The configuration for staging DataFrames of Python models before they overwrite a table.
     """
 
     gateways: t.Dict[str, GatewayConfig] = {"": GatewayConfig()}
@@ -115,6 +119,8 @@ class Config(BaseConfig):
     model_naming: NameInferenceConfig = NameInferenceConfig()
     variables: t.Dict[str, t.Any] = {}
     disable_anonymized_analytics: bool = False
+    cache_backend: CacheBackend = CacheBackend.FILE
+    df_staging: DataFrameStagingConfig = DataFrameStagingConfig()
 
     _FIELD_UPDATE_STRATEGY: t.ClassVar[t.Dict[str, UpdateStrategy]] = {
         "gateways": UpdateStrategy.KEY_UPDATE,
@@ -126,6 +132,7 @@ class Config(BaseConfig):
         "pinned_environments": UpdateStrategy.EXTEND,
         "physical_schema_override": UpdateStrategy.KEY_UPDATE,
         "run": UpdateStrategy.NESTED_UPDATE,
+        "df_staging": UpdateStrategy.NESTED_UPDATE,
         "format": UpdateStrategy.NESTED_UPDATE,
         "ui": UpdateStrategy.NESTED_UPDATE,
         "loader_kwargs": UpdateStrategy.KEY_UPDATE,
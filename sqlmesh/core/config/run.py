@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import typing as t
+
 from sqlmesh.core.config.base import BaseConfig
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.pydantic import field_validator
@@ -11,14 +13,25 @@ class RunConfig(BaseConfig):
     Args:
         environment_check_interval: Interval in seconds between environment checks.
         environment_check_max_wait: Maximum time in seconds to wait for environment to be ready.
+        janitor_time_budget: Maximum time in seconds the janitor spends on deleting expired snapshots.
+            Expired snapshots that weren't deleted within the budget are deleted by subsequent runs.
+        janitor_in_background: Whether to run the janitor concurrently with the evaluation of models.
+            The janitor runs before the evaluation if the connections don't support concurrent tasks.
     """
 
     environment_check_interval: int = 30
     environment_check_max_wait: int = 6 * 60 * 60  # 6 hours by default
+    janitor_time_budget: t.Optional[int] = None
+    janitor_in_background: bool = False
 
-    @field_validator("environment_check_interval", "environment_check_max_wait", mode="after")
+    @field_validator(
+        "environment_check_interval",
+        "environment_check_max_wait",
+        "janitor_time_budget",
+        mode="after",
+    )
     @classmethod
-    def _validate_positive_int(cls, v: int) -> int:
-        if v <= 0:
+    def _validate_positive_int(cls, v: t.Optional[int]) -> t.Optional[int]:
+        if v is not None and v <= 0:
             raise ConfigError(f"Value must be a positive integer, got {v}")
         return v
@@ -90,7 +90,11 @@ class _EngineAdapterStateSyncSchedulerConfig(_SchedulerConfig):
             )
         schema = context.config.get_state_schema(context.gateway)
         return EngineAdapterStateSync(
-            engine_adapter, schema=schema, context_path=context.path, console=context.console
+            engine_adapter,
+            schema=schema,
+            context_path=context.path,
+            console=context.console,
+            cache_backend=context.config.cache_backend,
         )
 
     def state_sync_fingerprint(self, context: GenericContext) -> str:
@@ -151,6 +155,7 @@ class _BaseAirflowSchedulerConfig(_EngineAdapterStateSyncSchedulerConfig):
     backfill_concurrent_tasks: int
     ddl_concurrent_tasks: int
 
+    max_concurrent_requests: int
     use_state_connection: bool
 
     default_catalog_override: t.Optional[str]
@@ -209,7 +214,8 @@ class AirflowSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig):
             whether a DAG has been created.
         backfill_concurrent_tasks: The number of concurrent tasks used for model backfilling during plan application.
         ddl_concurrent_tasks: The number of concurrent tasks used for DDL operations (table / view creation, deletion, etc).
-        max_snapshot_ids_per_request: The maximum number of snapshot IDs that can be sent in a single HTTP GET request to the Airflow Webserver.
+        max_snapshot_ids_per_request: The maximum number of snapshot IDs that can be sent in a single HTTP request to the Airflow Webserver.
+        max_concurrent_requests: The maximum number of concurrent HTTP requests that are used to read snapshots from the Airflow Webserver.
         use_state_connection: Whether to use the `state_connection` configuration to access the SQLMesh state.
         default_catalog_override: Overrides the default catalog value for this project. If specified, this value takes precedence
             over the default catalog value set on the Airflow side.
@@ -226,6 +232,7 @@ class AirflowSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig):
     ddl_concurrent_tasks: int = 4
 
     max_snapshot_ids_per_request: t.Optional[int] = None
+    max_concurrent_requests: int = 4
     use_state_connection: bool = False
 
     default_catalog_override: t.Optional[str] = None
@@ -244,6 +251,7 @@ class AirflowSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig):
             airflow_url=self.airflow_url,
             console=console,
             snapshot_ids_batch_size=self.max_snapshot_ids_per_request,
+            max_concurrent_requests=self.max_concurrent_requests,
         )
 
 
@@ -258,7 +266,8 @@ class CloudComposerSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig, extr
             whether a DAG has been created.
         backfill_concurrent_tasks: The number of concurrent tasks used for model backfilling during plan application.
         ddl_concurrent_tasks: The number of concurrent tasks used for DDL operations (table / view creation, deletion, etc).
-        max_snapshot_ids_per_request: The maximum number of snapshot IDs that can be sent in a single HTTP GET request to the Airflow Webserver.
+        max_snapshot_ids_per_request: The maximum number of snapshot IDs that can be sent in a single HTTP request to the Airflow Webserver.
+        max_concurrent_requests: The maximum number of concurrent HTTP requests that are used to read snapshots from the Airflow Webserver.
         use_state_connection: Whether to use the `state_connection` configuration to access the SQLMesh state.
         default_catalog_override: Overrides the default catalog value for this project. If specified, this value takes precedence
             over the default catalog value set on the Airflow side.
@@ -273,6 +282,7 @@ class CloudComposerSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig, extr
     ddl_concurrent_tasks: int = 4
 
     max_snapshot_ids_per_request: t.Optional[int] = 20
+    max_concurrent_requests: int = 4
     use_state_connection: bool = False
 
     default_catalog_override: t.Optional[str] = None
@@ -303,6 +313,7 @@ class CloudComposerSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig, extr
             session=self.session,
             console=console,
             snapshot_ids_batch_size=self.max_snapshot_ids_per_request,
+            max_concurrent_requests=self.max_concurrent_requests,
         )
 
     @model_validator(mode="before")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from sqlmesh.core.config.base import BaseConfig
+from sqlmesh.utils.errors import ConfigError
+from sqlmesh.utils.pydantic import field_validator
+
+
+class DataFrameStagingConfig(BaseConfig):
+    """Configuration for staging DataFrames of Python models before they overwrite a table.
+
+    Engines that overwrite partitions with INSERT OVERWRITE or REPLACE WHERE need the whole output of an
+    incremental Python model to be written at once. Without staging, all DataFrames yielded by the model
+    are combined in memory first. With staging, they are appended to a temporary table one chunk at a time
+    and the target table is overwritten from that table with a single statement.
+
+    Args:
+        enabled: Whether DataFrames are staged in a temporary table.
+        chunk_size: The number of rows appended to the temporary table at a time.
+    """
+
+    enabled: bool = False
+    chunk_size: int = 100_000
+
+    @field_validator("chunk_size", mode="after")
+    @classmethod
+    def _validate_chunk_size(cls, v: int) -> int:
+        if v <= 0:
+            raise ConfigError(f"Value must be a positive integer, got {v}")
+        return v
@@ -41,6 +41,7 @@ import time
 import traceback
 import typing as t
 import unittest.result
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import timedelta
 from functools import cached_property
 from io import StringIO
@@ -87,7 +88,7 @@ from sqlmesh.core.snapshot import (
     DeployabilityIndex,
     Snapshot,
     SnapshotEvaluator,
-    SnapshotFingerprint,
+    SnapshotFingerprintCache,
     to_table_mapping,
 )
 from sqlmesh.core.state_sync import (
@@ -382,6 +383,10 @@ class GenericContext(BaseContext, t.Generic[C]):
             self._snapshot_evaluator = SnapshotEvaluator(
                 self.engine_adapter.with_log_level(logging.INFO),
                 ddl_concurrent_tasks=self.concurrent_tasks,
+                audit_concurrent_tasks=self.concurrent_tasks,
+                df_staging_chunk_size=(
+                    self.config.df_staging.chunk_size if self.config.df_staging.enabled else None
+                ),
             )
         return self._snapshot_evaluator
 
@@ -423,6 +428,7 @@ class GenericContext(BaseContext, t.Generic[C]):
             self.dag,
             self._models,
             self.path,
+            cache_backend=self.config.cache_backend,
         )
 
         model.validate_definition()
@@ -1239,6 +1245,8 @@ class GenericContext(BaseContext, t.Generic[C]):
         show: bool = True,
         show_sample: bool = True,
         decimals: int = 3,
+        buckets: t.Optional[int] = None,
+        sample_rate: t.Optional[float] = None,
     ) -> TableDiff:
         """Show a diff between two tables.
 
@@ -1253,6 +1261,9 @@ class GenericContext(BaseContext, t.Generic[C]):
             show: Show the table diff output in the console.
             show_sample: Show the sample dataframe in the console. Requires show=True.
             decimals: The number of decimal places to keep when comparing floating point columns.
+            buckets: The number of hash buckets to compare before joining rows. If set, only rows in
+                buckets that differ between the tables are joined.
+            sample_rate: The fraction of join keys to sample from both tables.
 
         Returns:
             The TableDiff object containing schema and summary differences.
@@ -1298,6 +1309,8 @@ class GenericContext(BaseContext, t.Generic[C]):
             model_name=model.name if model_or_snapshot else None,
             limit=limit,
             decimals=decimals,
+            buckets=buckets,
+            sample_rate=sample_rate,
         )
         if show:
             self.console.show_schema_diff(table_diff.schema_diff())
@@ -1433,8 +1446,20 @@ class GenericContext(BaseContext, t.Generic[C]):
         verbose: bool = False,
         preserve_fixtures: bool = False,
         stream: t.Optional[t.TextIO] = None,
+        workers: int = 1,
+        use_processes: bool = False,
     ) -> ModelTextTestResult:
-        """Discover and run model tests"""
+        """Discover and run model tests.
+
+        Args:
+            match_patterns: Only run tests that match any of these patterns.
+            tests: The tests to run, eg. [tests/test_orders.yaml::test_single_order].
+            verbose: Whether to enable verbose output, which includes the slowest tests.
+            preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            stream: The stream to write test results to.
+            workers: The number of workers that run tests concurrently.
+            use_processes: Whether workers should be forked processes instead of threads.
+        """
         if verbose:
             pd.set_option("display.max_columns", None)
             verbosity = 2
@@ -1454,6 +1479,8 @@ class GenericContext(BaseContext, t.Generic[C]):
                 stream=stream,
                 default_catalog=self.default_catalog,
                 default_catalog_dialect=self.engine_adapter.DIALECT,
+                workers=workers,
+                use_processes=use_processes,
             )
         else:
             test_meta = []
@@ -1478,6 +1505,8 @@ class GenericContext(BaseContext, t.Generic[C]):
                 stream=stream,
                 default_catalog=self.default_catalog,
                 default_catalog_dialect=self.engine_adapter.DIALECT,
+                workers=workers,
+                use_processes=use_processes,
             )
 
         return result
@@ -1658,9 +1687,39 @@ class GenericContext(BaseContext, t.Generic[C]):
         skip_janitor: bool,
         ignore_cron: bool,
     ) -> bool:
+        janitor: t.Optional[Future] = None
         if not skip_janitor and environment.lower() == c.PROD:
-            self._run_janitor()
+            if self._janitor_runs_in_background():
+                janitor = self._run_janitor_in_background()
+            else:
+                self._run_janitor()
+
+        try:
+            success = self._run_scheduler(
+                environment,
+                start=start,
+                end=end,
+                execution_time=execution_time,
+                ignore_cron=ignore_cron,
+            )
+        finally:
+            if janitor is not None:
+                wait([janitor])
+
+        if janitor is not None:
+            janitor.result()
+
+        return success
 
+    def _run_scheduler(
+        self,
+        environment: str,
+        *,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+        ignore_cron: bool,
+    ) -> bool:
         env_check_attempts_num = max(
             1,
             self.config.run.environment_check_max_wait
@@ -1815,9 +1874,23 @@ class GenericContext(BaseContext, t.Generic[C]):
                         if name not in audits:
                             audits[name] = audit
 
+        start_ts = time.perf_counter()
+        fingerprint_store = SnapshotFingerprintCache(
+            self.path / c.CACHE, backend=self.config.cache_backend
+        )
+
         def _nodes_to_snapshots(nodes: t.Dict[str, Node]) -> t.Dict[str, Snapshot]:
             snapshots: t.Dict[str, Snapshot] = {}
-            fingerprint_cache: t.Dict[str, SnapshotFingerprint] = {}
+            fingerprint_cache = fingerprint_store.fingerprints(
+                nodes,
+                entry_ids={
+                    name: entry_id
+                    for name, node in nodes.items()
+                    if local_nodes.get(name) is node
+                    and (entry_id := self._loader.fingerprint_entry_id(node)) is not None
+                },
+                audits=audits,
+            )
 
             for node in nodes.values():
                 if node.fqn not in local_nodes and node.fqn in remote_snapshots:
@@ -1860,6 +1933,9 @@ class GenericContext(BaseContext, t.Generic[C]):
             # Keep the original model instance to preserve the query cache.
             snapshot.node = snapshots[snapshot.name].node
 
+        logger.info(
+            "Created %s snapshots in %.2f seconds", len(snapshots), time.perf_counter() - start_ts
+        )
         return {name: stored_snapshots.get(s.snapshot_id, s) for name, s in snapshots.items()}
 
     def _context_diff(
@@ -1881,18 +1957,84 @@ class GenericContext(BaseContext, t.Generic[C]):
             ensure_finalized_snapshots=ensure_finalized_snapshots,
         )
 
-    def _run_janitor(self) -> None:
-        self._cleanup_environments()
-        expired_snapshots = self.state_sync.delete_expired_snapshots()
-        self.snapshot_evaluator.cleanup(
-            expired_snapshots, on_complete=self.console.update_cleanup_progress
+    def _run_janitor(
+        self,
+        state_sync: t.Optional[StateSync] = None,
+        snapshot_evaluator: t.Optional[SnapshotEvaluator] = None,
+        report_progress: bool = True,
+    ) -> None:
+        self._cleanup_environments(
+            state_sync=state_sync,
+            engine_adapter=snapshot_evaluator.adapter if snapshot_evaluator else None,
+            report_progress=report_progress,
+        )
+
+        state_sync = state_sync or self.state_sync
+        snapshot_evaluator = snapshot_evaluator or self.snapshot_evaluator
+        expired_snapshots = state_sync.delete_expired_snapshots(
+            time_budget=self.config.run.janitor_time_budget
+        )
+        snapshot_evaluator.cleanup(
+            expired_snapshots,
+            on_complete=self.console.update_cleanup_progress if report_progress else None,
+        )
+
+        state_sync.compact_intervals()
+
+    def _janitor_runs_in_background(self) -> bool:
+        if not self.config.run.janitor_in_background:
+            return False
+
+        state_connection = self.config.get_state_connection(self.gateway) or self._connection_config
+        if self._connection_config.concurrent_tasks > 1 and state_connection.concurrent_tasks > 1:
+            return True
+
+        logger.warning(
+            "The janitor can't run in the background since the connection doesn't support concurrent tasks"
         )
+        return False
+
+    def _run_janitor_in_background(self) -> Future:
+        # Make sure that the state has been migrated before it's accessed concurrently.
+        self.state_sync.get_versions()
+
+        def _janitor() -> None:
+            # The janitor uses its own connections, since connections of other threads are closed
+            # by the scheduler when it finishes evaluating snapshots.
+            state_sync = self._scheduler.create_state_sync(self)
+            snapshot_evaluator = SnapshotEvaluator(
+                self._connection_config.create_engine_adapter().with_log_level(logging.INFO),
+                ddl_concurrent_tasks=self.concurrent_tasks,
+            )
+            try:
+                # The console isn't thread-safe, so the cleanup is only logged by the engine adapter.
+                self._run_janitor(
+                    state_sync=state_sync,
+                    snapshot_evaluator=snapshot_evaluator,
+                    report_progress=False,
+                )
+            finally:
+                snapshot_evaluator.close()
+                state_sync.close()
 
-        self.state_sync.compact_intervals()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="janitor")
+        try:
+            return executor.submit(_janitor)
+        finally:
+            executor.shutdown(wait=False)
 
-    def _cleanup_environments(self) -> None:
-        expired_environments = self.state_sync.delete_expired_environments()
-        cleanup_expired_views(self.engine_adapter, expired_environments, console=self.console)
+    def _cleanup_environments(
+        self,
+        state_sync: t.Optional[StateSync] = None,
+        engine_adapter: t.Optional[EngineAdapter] = None,
+        report_progress: bool = True,
+    ) -> None:
+        expired_environments = (state_sync or self.state_sync).delete_expired_environments()
+        cleanup_expired_views(
+            engine_adapter or self.engine_adapter,
+            expired_environments,
+            console=self.console if report_progress else None,
+        )
 
     def _try_connection(self, connection_name: str, validator: t.Callable[[], None]) -> None:
         connection_name = connection_name.capitalize()
@@ -1912,6 +2054,7 @@ class GenericContext(BaseContext, t.Generic[C]):
             context_path=self.path,
             default_catalog=self.default_catalog,
             dialect=self.default_dialect,
+            cache_backend=self.config.cache_backend,
         )
 
     def _register_notification_targets(self) -> None:
@@ -40,7 +40,8 @@ from sqlmesh.core.engine_adapter.shared import (
 from sqlmesh.core.model.kind import TimeColumn
 from sqlmesh.core.schema_diff import SchemaDiffer
 from sqlmesh.utils import columns_to_types_all_known, random_id
-from sqlmesh.utils.connection_pool import create_connection_pool
+from sqlmesh.utils.cache import BoundedCache, CacheStats
+from sqlmesh.utils.connection_pool import ThreadLocalConnectionPool, create_connection_pool
 from sqlmesh.utils.date import TimeLike, make_inclusive, to_time_column
 from sqlmesh.utils.errors import SQLMeshError, UnsupportedCatalogOperationError
 from sqlmesh.utils.pandas import columns_to_types_from_df
@@ -98,6 +99,12 @@ class EngineAdapter:
     SUPPORTS_REPLACE_TABLE = True
     DEFAULT_CATALOG_TYPE = DIALECT
     QUOTE_IDENTIFIERS_IN_VIEWS = True
+    # Rendered SQL is cached for expressions with at most this many nodes. Set to 0 to disable the cache.
+    SQL_CACHE_MAX_NODES = 2000
+    # Shared by all adapters. Entries are keyed by dialect and generator options.
+    SQL_CACHE: BoundedCache[t.Hashable, str] = BoundedCache(
+        max_entries=10_000, sizeof=lambda key, sql: sys.getsizeof(sql)
+    )
 
     def __init__(
         self,
@@ -123,6 +130,7 @@ class EngineAdapter:
         self._extra_config = kwargs
         self._register_comments = register_comments
         self._pre_ping = pre_ping
+        self._metadata_listeners: t.List[t.Callable[[t.Optional[exp.Expression]], None]] = []
 
     def with_log_level(self, level: int) -> EngineAdapter:
         adapter = self.__class__(
@@ -136,9 +144,31 @@ class EngineAdapter:
         )
 
         adapter._connection_pool = self._connection_pool
+        adapter._metadata_listeners = self._metadata_listeners
 
         return adapter
 
+    def add_metadata_listener(
+        self, listener: t.Callable[[t.Optional[exp.Expression]], None]
+    ) -> None:
+        """Registers a callback which is notified whenever this adapter executes a DDL statement.
+
+        Args:
+            listener: Called with the executed CREATE, DROP or ALTER expression, or with None if the
+                changed objects are unknown, eg. for DDL passed as a string.
+        """
+        self._metadata_listeners.append(listener)
+
+    def notify_metadata_change(self, expression: t.Optional[exp.Expression] = None) -> None:
+        """Notifies metadata listeners that catalog objects have changed.
+
+        Args:
+            expression: The DDL statement which changed the objects. If not provided, any object
+                may have changed.
+        """
+        for listener in self._metadata_listeners:
+            listener(expression)
+
     @property
     def cursor(self) -> t.Any:
         return self._connection_pool.get_cursor()
@@ -155,6 +185,16 @@ class EngineAdapter:
     def comments_enabled(self) -> bool:
         return self._register_comments and self.COMMENT_CREATION_TABLE.is_supported
 
+    @property
+    def uses_thread_local_connections(self) -> bool:
+        """Whether each thread uses its own connection, so that the adapter can be used by multiple threads at once."""
+        return isinstance(self._connection_pool, ThreadLocalConnectionPool)
+
+    @property
+    def loads_dataframes_natively(self) -> bool:
+        """Whether DataFrames are loaded through a bulk path of the driver instead of SQL VALUES literals."""
+        return False
+
     @classmethod
     def _casted_columns(cls, columns_to_types: t.Dict[str, exp.DataType]) -> t.List[exp.Alias]:
         return [
@@ -200,17 +240,19 @@ class EngineAdapter:
         assert isinstance(df, pd.DataFrame)
         num_rows = len(df.index)
         batch_size = sys.maxsize if batch_size == 0 else batch_size
-        values = list(df.itertuples(index=False, name=None))
-        return [
-            SourceQuery(
-                query_factory=partial(
-                    self._values_to_sql,
-                    values=values,
-                    columns_to_types=columns_to_types,
-                    batch_start=i,
-                    batch_end=min(i + batch_size, num_rows),
-                ),
+
+        def query_factory(batch_start: int) -> Query:
+            # Rows are only converted to tuples one batch at a time to avoid holding a second copy of the
+            # whole DataFrame in memory.
+            values = list(
+                df.iloc[batch_start : batch_start + batch_size].itertuples(index=False, name=None)
             )
+            return self._values_to_sql(
+                values, columns_to_types, batch_start=0, batch_end=len(values)
+            )
+
+        return [
+            SourceQuery(query_factory=partial(query_factory, i))
             for i in range(0, num_rows, batch_size)
         ]
 
@@ -258,6 +300,11 @@ class EngineAdapter:
         """Closes all open connections and releases all allocated resources."""
         self._connection_pool.close_all()
 
+    def close_thread_connection(self) -> None:
+        """Closes the connection of the calling thread if each thread uses its own connection."""
+        if self.uses_thread_local_connections:
+            self._connection_pool.close()
+
     def get_current_catalog(self) -> t.Optional[str]:
         """Returns the catalog name of the current connection."""
         raise NotImplementedError()
@@ -1813,7 +1860,7 @@ class EngineAdapter:
         **kwargs: t.Any,
     ) -> None:
         """Execute a sql query."""
-        to_sql_kwargs = (
+        to_sql_kwargs: t.Dict[str, t.Any] = (
             {"unsupported_level": ErrorLevel.IGNORE} if ignore_unsupported_errors else {}
         )
 
@@ -1829,6 +1876,12 @@ class EngineAdapter:
                 )
                 self._log_sql(sql)
                 self._execute(sql, **kwargs)
+                if self._metadata_listeners:
+                    if isinstance(e, (exp.Create, exp.Drop, exp.AlterTable)):
+                        self.notify_metadata_change(e)
+                    elif not isinstance(e, exp.Expression) or isinstance(e, exp.Command):
+                        if sql.lstrip()[:6].upper().startswith(("CREATE", "DROP", "ALTER")):
+                            self.notify_metadata_change()
 
     def _log_sql(self, sql: str) -> None:
         logger.log(self._execute_log_level, "Executing SQL: %s", sql)
@@ -1943,11 +1996,19 @@ class EngineAdapter:
     def _truncate_column_comment(self, comment: str) -> str:
         return self._truncate_comment(comment, self.MAX_COLUMN_COMMENT_LENGTH)
 
+    @property
+    def sql_cache_stats(self) -> CacheStats:
+        """Hit and miss counters of the cache of rendered SQL shared by all adapters."""
+        return self.SQL_CACHE.stats
+
     def _to_sql(self, expression: exp.Expression, quote: bool = True, **kwargs: t.Any) -> str:
         """
         Converts an expression to a SQL string. Has a set of default kwargs to apply, and then default
         kwargs defined for the given dialect, and then kwargs provided by the user when defining the engine
         adapter, and then finally kwargs provided by the user when calling this method.
+
+        The rendered SQL is cached by the structure of the expression, so repeated statements are only
+        generated once.
         """
         sql_gen_kwargs = {
             "dialect": self.dialect,
@@ -1957,12 +2018,27 @@ class EngineAdapter:
             **kwargs,
         }
 
-        expression = expression.copy()
+        cache_key: t.Optional[t.Hashable] = None
+        if self.SQL_CACHE_MAX_NODES > 0:
+            structural_key = _sql_cache_key(expression, self.SQL_CACHE_MAX_NODES)
+            if structural_key is not None:
+                cache_key = (structural_key, quote, tuple(sorted(sql_gen_kwargs.items())))
+                try:
+                    sql = self.SQL_CACHE.get(cache_key)
+                except TypeError:
+                    # Generator options which aren't hashable can't be part of the key
+                    cache_key, sql = None, None
+                if sql is not None:
+                    return sql
 
+        expression = expression.copy()
         if quote:
             quote_identifiers(expression)
 
-        return expression.sql(**sql_gen_kwargs, copy=False)  # type: ignore
+        sql = expression.sql(**sql_gen_kwargs, copy=False)  # type: ignore
+        if cache_key is not None:
+            self.SQL_CACHE.put(cache_key, sql)
+        return sql
 
     def _get_data_objects(
         self, schema_name: SchemaName, object_names: t.Optional[t.Set[str]] = None
@@ -2132,3 +2208,43 @@ def _decoded_str(value: t.Union[str, bytes]) -> str:
     if isinstance(value, bytes):
         return value.decode("utf-8")
     return value
+
+
+def _sql_cache_key(expression: exp.Expression, max_nodes: int) -> t.Optional[t.Tuple[t.Any, ...]]:
+    """Returns a hashable key which is equal for structurally identical expressions.
+
+    Unlike `Expression.__hash__` the key is case sensitive and includes comments, so equal keys are
+    guaranteed to generate the same SQL. Returns None if the expression has more than `max_nodes` nodes.
+    """
+    remaining = max_nodes
+
+    def _key(node: t.Any) -> t.Any:
+        nonlocal remaining
+        if isinstance(node, exp.Expression):
+            remaining -= 1
+            if remaining < 0:
+                raise _SqlCacheKeyLimitExceeded
+            return (
+                node.__class__,
+                tuple(
+                    (k, _key(v))
+                    for k, v in node.args.items()
+                    if v is not None and not (type(v) is list and not v)
+                ),
+                tuple(node.comments) if node.comments else None,
+            )
+        if type(node) is list:
+            return tuple(_key(v) for v in node)
+        if type(node) is str:
+            return node
+        # Keep values like 1 and True apart
+        return (node.__class__, node)
+
+    try:
+        return _key(expression)
+    except (_SqlCacheKeyLimitExceeded, RecursionError):
+        return None
+
+
+class _SqlCacheKeyLimitExceeded(Exception):
+    pass
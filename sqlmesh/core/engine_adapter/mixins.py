@@ -3,16 +3,22 @@ from __future__ import annotations
 import logging
 import typing as t
 
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype  # type: ignore
 from sqlglot import exp
 
 from sqlmesh.core.engine_adapter.base import EngineAdapter
-from sqlmesh.core.engine_adapter.shared import InsertOverwriteStrategy, SourceQuery
+from sqlmesh.core.engine_adapter.shared import (
+    DataFrameLoadStrategy,
+    InsertOverwriteStrategy,
+    SourceQuery,
+)
 from sqlmesh.core.node import IntervalUnit
 from sqlmesh.utils.errors import SQLMeshError
 
 if t.TYPE_CHECKING:
     from sqlmesh.core._typing import TableName
-    from sqlmesh.core.engine_adapter._typing import DF
+    from sqlmesh.core.engine_adapter._typing import DF, Query
     from sqlmesh.core.engine_adapter.base import QueryOrDF
 
 logger = logging.getLogger(__name__)
@@ -284,3 +290,122 @@ class VarcharSizeWorkaroundMixin(EngineAdapter):
                 self.drop_view(temp_view_name)
 
         return statement
+
+
+class NativeDataFrameLoadMixin(EngineAdapter):
+    """Loads pandas DataFrames through the driver's bulk load path when the `native` DataFrame load
+    strategy is configured.
+
+    Instead of rendering every value as a SQL literal, the rows are staged in a temporary table using
+    parameterized multi-row inserts (or an engine specific path such as COPY) and the source query
+    selects from that table.
+    """
+
+    BULK_LOAD_PLACEHOLDER = "%s"
+    # The maximum number of bound parameters in a single statement, if the driver or engine has one.
+    BULK_LOAD_MAX_PARAMS: t.Optional[int] = None
+
+    @property
+    def df_load_strategy(self) -> DataFrameLoadStrategy:
+        return DataFrameLoadStrategy(
+            self._extra_config.get("df_load_strategy") or DataFrameLoadStrategy.VALUES
+        )
+
+    @property
+    def loads_dataframes_natively(self) -> bool:
+        return self.df_load_strategy.is_native
+
+    def _df_to_source_queries(
+        self,
+        df: DF,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+        target_table: TableName,
+    ) -> t.List[SourceQuery]:
+        if not self.df_load_strategy.is_native:
+            return super()._df_to_source_queries(df, columns_to_types, batch_size, target_table)
+
+        assert isinstance(df, pd.DataFrame)
+        temp_table = self._get_temp_table(target_table or "pandas")
+        loaded = False
+
+        def query_factory() -> Query:
+            nonlocal loaded
+            # It is possible for the factory to be called multiple times so we only load the data once. This
+            # means we are assuming the first call is the same result as later calls.
+            if not loaded:
+                self.create_table(temp_table, columns_to_types)
+                with self.transaction():
+                    self._bulk_load_df(temp_table, df, columns_to_types, batch_size)
+                loaded = True
+            return exp.select(*self._casted_columns(columns_to_types)).from_(temp_table)
+
+        return [
+            SourceQuery(
+                query_factory=query_factory,
+                cleanup_func=lambda: self.drop_table(temp_table),
+            )
+        ]
+
+    def _bulk_load_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+    ) -> None:
+        """Loads the DataFrame into an existing table using parameterized multi-row inserts."""
+        columns = list(columns_to_types)
+        batch_size = self._bulk_load_batch_size(batch_size, len(columns))
+        insert_prefix = self._bulk_load_insert_prefix(table, columns)
+        row_sql = (
+            "("
+            + ", ".join(self._bulk_load_placeholder(columns_to_types[column]) for column in columns)
+            + ")"
+        )
+
+        cursor = self.cursor
+        statements: t.Dict[int, str] = {}
+        for rows in df_to_row_batches(df[columns], batch_size):
+            sql = statements.get(len(rows))
+            if sql is None:
+                sql = statements[len(rows)] = f"{insert_prefix} {', '.join([row_sql] * len(rows))}"
+            cursor.execute(sql, [value for row in rows for value in row])
+        logger.debug("Bulk loaded %s rows into %s", len(df.index), table.sql(dialect=self.dialect))
+
+    def _bulk_load_batch_size(self, batch_size: int, num_columns: int) -> int:
+        # Unbatched loads still need to be split up since every row adds parameters to the statement
+        batch_size = batch_size if batch_size > 0 else self.DEFAULT_BATCH_SIZE
+        if self.BULK_LOAD_MAX_PARAMS:
+            batch_size = min(batch_size, self.BULK_LOAD_MAX_PARAMS // max(num_columns, 1))
+        return max(batch_size, 1)
+
+    def _bulk_load_insert_prefix(self, table: exp.Table, columns: t.List[str]) -> str:
+        column_names = ", ".join(
+            exp.to_identifier(column).sql(dialect=self.dialect, identify=True) for column in columns
+        )
+        return (
+            f"INSERT INTO {table.sql(dialect=self.dialect, identify=True)} ({column_names}) VALUES"
+        )
+
+    def _bulk_load_placeholder(self, column_type: exp.DataType) -> str:
+        return self.BULK_LOAD_PLACEHOLDER
+
+
+def df_to_row_batches(df: pd.DataFrame, batch_size: int) -> t.Iterator[t.List[t.Tuple[t.Any, ...]]]:
+    """Yields the rows of a DataFrame in batches of tuples containing plain Python values.
+
+    Database drivers don't know how to bind numpy scalars or pandas timestamps, so values are converted
+    to their builtin equivalents and missing values are replaced with None.
+    """
+    for start in range(0, len(df.index), batch_size):
+        chunk = df.iloc[start : start + batch_size]
+        columns = []
+        for _, series in chunk.items():
+            if is_datetime64_any_dtype(series.dtype):
+                values = pd.DatetimeIndex(series).to_pydatetime()
+            else:
+                values = series.to_numpy(dtype=object, copy=True)
+            values[series.isna().to_numpy()] = None
+            columns.append(values)
+        yield list(zip(*columns))
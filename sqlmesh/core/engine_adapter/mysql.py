@@ -3,13 +3,16 @@ from __future__ import annotations
 import logging
 import typing as t
 
+import pandas as pd
 from sqlglot import exp, parse_one
 
 from sqlmesh.core.dialect import to_schema
 from sqlmesh.core.engine_adapter.mixins import (
     LogicalMergeMixin,
+    NativeDataFrameLoadMixin,
     NonTransactionalTruncateMixin,
     PandasNativeFetchDFSupportMixin,
+    df_to_row_batches,
 )
 from sqlmesh.core.engine_adapter.shared import (
     CommentCreationTable,
@@ -30,6 +33,7 @@ class MySQLEngineAdapter(
     LogicalMergeMixin,
     PandasNativeFetchDFSupportMixin,
     NonTransactionalTruncateMixin,
+    NativeDataFrameLoadMixin,
 ):
     DEFAULT_BATCH_SIZE = 200
     DIALECT = "mysql"
@@ -145,5 +149,24 @@ class MySQLEngineAdapter(
                 exc_info=True,
             )
 
+    def _bulk_load_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+    ) -> None:
+        """Loads the DataFrame with `executemany`, which the MySQL connector rewrites into multi-row inserts."""
+        columns = list(columns_to_types)
+        sql = (
+            f"{self._bulk_load_insert_prefix(table, columns)} "
+            f"({', '.join([self.BULK_LOAD_PLACEHOLDER] * len(columns))})"
+        )
+        cursor = self.cursor
+        for rows in df_to_row_batches(
+            df[columns], self._bulk_load_batch_size(batch_size, len(columns))
+        ):
+            cursor.executemany(sql, rows)
+
     def ping(self) -> None:
         self._connection_pool.get().ping(reconnect=False)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import io
 import logging
 import typing as t
 
+import pandas as pd
 from sqlglot import exp
 
 from sqlmesh.core.engine_adapter.base_postgres import BasePostgresEngineAdapter
 from sqlmesh.core.engine_adapter.mixins import (
     GetCurrentCatalogFromFunctionMixin,
+    NativeDataFrameLoadMixin,
     PandasNativeFetchDFSupportMixin,
 )
 from sqlmesh.core.engine_adapter.shared import set_catalog
@@ -23,12 +26,15 @@ class PostgresEngineAdapter(
     BasePostgresEngineAdapter,
     PandasNativeFetchDFSupportMixin,
     GetCurrentCatalogFromFunctionMixin,
+    NativeDataFrameLoadMixin,
 ):
     DIALECT = "postgres"
     SUPPORTS_INDEXES = True
     HAS_VIEW_BINDING = True
     CURRENT_CATALOG_EXPRESSION = exp.column("current_catalog")
     SUPPORTS_REPLACE_TABLE = False
+    # COPY streams rows without binding parameters so it can use much larger batches than VALUES queries
+    BULK_LOAD_COPY_BATCH_SIZE = 100_000
 
     def _fetch_native_df(
         self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
@@ -42,3 +48,35 @@ class PostgresEngineAdapter(
         if not self._connection_pool.is_transaction_active:
             self._connection_pool.commit()
         return df
+
+    def _bulk_load_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+    ) -> None:
+        """Streams the DataFrame into the table as CSV using `COPY ... FROM STDIN`."""
+        columns = list(columns_to_types)
+        df = df[columns]
+        for column, column_type in columns_to_types.items():
+            # Integer columns containing nulls are stored as floats which COPY can't parse as integers
+            if column_type.is_type(*exp.DataType.INTEGER_TYPES) and df[column].dtype.kind == "f":
+                df = df.assign(**{column: df[column].astype("Int64")})
+
+        column_names = ", ".join(
+            exp.to_identifier(column).sql(dialect=self.dialect, identify=True) for column in columns
+        )
+        copy_sql = (
+            f"COPY {table.sql(dialect=self.dialect, identify=True)} ({column_names}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+        cursor = self.cursor
+        for start in range(0, len(df.index), self.BULK_LOAD_COPY_BATCH_SIZE):
+            buffer = io.StringIO()
+            df.iloc[start : start + self.BULK_LOAD_COPY_BATCH_SIZE].to_csv(
+                buffer, index=False, header=False, na_rep="\\N"
+            )
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+        logger.debug("Copied %s rows into %s", len(df.index), table.sql(dialect=self.dialect))
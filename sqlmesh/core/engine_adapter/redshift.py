@@ -10,6 +10,7 @@ from sqlmesh.core.engine_adapter.base_postgres import BasePostgresEngineAdapter
 from sqlmesh.core.engine_adapter.mixins import (
     GetCurrentCatalogFromFunctionMixin,
     LogicalMergeMixin,
+    NativeDataFrameLoadMixin,
     NonTransactionalTruncateMixin,
     VarcharSizeWorkaroundMixin,
 )
@@ -33,12 +34,16 @@ class RedshiftEngineAdapter(
     GetCurrentCatalogFromFunctionMixin,
     NonTransactionalTruncateMixin,
     VarcharSizeWorkaroundMixin,
+    NativeDataFrameLoadMixin,
 ):
     DIALECT = "redshift"
     CURRENT_CATALOG_EXPRESSION = exp.func("current_database")
     # Redshift doesn't support comments for VIEWs WITH NO SCHEMA BINDING (which we always use)
     COMMENT_CREATION_VIEW = CommentCreationView.UNSUPPORTED
     SUPPORTS_REPLACE_TABLE = False
+    # The cursor is configured to use the `qmark` paramstyle, see `cursor` below
+    BULK_LOAD_PLACEHOLDER = "?"
+    BULK_LOAD_MAX_PARAMS = 32767
 
     def _columns_query(self, table: exp.Table) -> exp.Select:
         sql = (
@@ -209,6 +209,25 @@ class InsertOverwriteStrategy(Enum):
         return self == InsertOverwriteStrategy.INTO_IS_OVERWRITE
 
 
+class DataFrameLoadStrategy(str, Enum):
+    """How pandas DataFrames are loaded into the target engine.
+
+    VALUES renders every row as a SQL literal in a `SELECT ... FROM VALUES` query, while NATIVE
+    stages the rows in a temporary table through the driver's bulk load path first.
+    """
+
+    VALUES = "values"
+    NATIVE = "native"
+
+    @property
+    def is_values(self) -> bool:
+        return self == DataFrameLoadStrategy.VALUES
+
+    @property
+    def is_native(self) -> bool:
+        return self == DataFrameLoadStrategy.NATIVE
+
+
 class SourceQuery:
     def __init__(
         self,
@@ -12,6 +12,7 @@ from sqlmesh.core.dialect import schema_, to_schema
 from sqlmesh.core.engine_adapter.mixins import (
     GetCurrentCatalogFromFunctionMixin,
     HiveMetastoreTablePropertiesMixin,
+    NativeDataFrameLoadMixin,
     PandasNativeFetchDFSupportMixin,
 )
 from sqlmesh.core.engine_adapter.shared import (
@@ -38,6 +39,7 @@ class TrinoEngineAdapter(
     PandasNativeFetchDFSupportMixin,
     HiveMetastoreTablePropertiesMixin,
     GetCurrentCatalogFromFunctionMixin,
+    NativeDataFrameLoadMixin,
 ):
     DIALECT = "trino"
     INSERT_OVERWRITE_STRATEGY = InsertOverwriteStrategy.INTO_IS_OVERWRITE
@@ -52,6 +54,9 @@ class TrinoEngineAdapter(
     COMMENT_CREATION_VIEW = CommentCreationView.COMMENT_COMMAND_ONLY
     SUPPORTS_REPLACE_TABLE = False
     DEFAULT_CATALOG_TYPE = "hive"
+    BULK_LOAD_PLACEHOLDER = "?"
+    # Keeps prepared statements well under Trino's default `query.max-length`
+    BULK_LOAD_MAX_PARAMS = 10_000
     QUOTE_IDENTIFIERS_IN_VIEWS = False
 
     @property
@@ -188,6 +193,11 @@ class TrinoEngineAdapter(
 
         return super()._df_to_source_queries(df, columns_to_types, batch_size, target_table)
 
+    def _bulk_load_placeholder(self, column_type: exp.DataType) -> str:
+        # Trino only coerces values on insert when the types are compatible, so bind parameters are
+        # explicitly cast to the type of the column they are inserted into.
+        return f"CAST(? AS {column_type.sql(dialect=self.dialect)})"
+
     def _build_schema_exp(
         self,
         table: exp.Table,
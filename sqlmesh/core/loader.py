@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import functools
 import linecache
 import logging
 import os
@@ -9,6 +10,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
+from sqlglot import exp
 from sqlglot.errors import SchemaError, SqlglotError
 from sqlglot.schema import MappingSchema
 
@@ -18,24 +20,30 @@ from sqlmesh.core.dialect import parse
 from sqlmesh.core.macros import MacroRegistry, macro
 from sqlmesh.core.metric import Metric, MetricMeta, expand_metrics, load_metric_ddl
 from sqlmesh.core.model import (
+    ExternalModel,
     Model,
     ModelCache,
     OptimizedQueryCache,
     SeedModel,
+    SqlModel,
     create_external_model,
     load_sql_based_model,
 )
 from sqlmesh.core.model import model as model_registry
 from sqlmesh.utils import UniqueKeyDict
+from sqlmesh.utils.cache import CacheBackend
+from sqlmesh.utils.concurrency import fork_apply_to_values
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroExtractor
 from sqlmesh.utils.metaprogramming import import_python_file
+from sqlmesh.utils.pydantic import PydanticModel
 from sqlmesh.utils.yaml import YAML
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.config import Config
     from sqlmesh.core.context import GenericContext
+    from sqlmesh.core.node import Node
 
 
 logger = logging.getLogger(__name__)
@@ -46,32 +54,99 @@ def update_model_schemas(
     dag: DAG[str],
     models: UniqueKeyDict[str, Model],
     context_path: Path,
+    processes: int = 1,
+    cache_backend: CacheBackend = CacheBackend.FILE,
 ) -> None:
+    """Updates the schemas of all models in the topological order of the DAG.
+
+    Args:
+        dag: The DAG of models.
+        models: The models to update.
+        context_path: The path of the context, which is used to locate the cache folder.
+        processes: The number of worker processes that optimize model queries. If more than one
+            process is used, the queries are optimized concurrently one DAG level at a time.
+        cache_backend: The storage of cached optimized queries.
+    """
     schema = MappingSchema(normalize=False)
-    optimized_query_cache: OptimizedQueryCache = OptimizedQueryCache(context_path / c.CACHE)
+    optimized_query_cache: OptimizedQueryCache = OptimizedQueryCache(
+        context_path / c.CACHE, backend=cache_backend
+    )
 
-    for name in dag.sorted:
-        model = models.get(name)
+    try:
+        if processes == 1:
+            for name in dag.sorted:
+                model = models.get(name)
 
-        # External models don't exist in the context, so we need to skip them
-        if not model:
-            continue
+                # External models don't exist in the context, so we need to skip them
+                if not model:
+                    continue
 
-        try:
-            model.update_schema(schema)
-            optimized_query_cache.with_optimized_query(model)
+                model.update_schema(schema)
+                optimized_query_cache.with_optimized_query(model)
+                _add_model_to_schema(schema, model)
+            return
 
-            columns_to_types = model.columns_to_types
-            if columns_to_types is not None:
-                schema.add_table(
-                    model.fqn, columns_to_types, dialect=model.dialect, normalize=False
-                )
-        except SchemaError as e:
-            if "nesting level:" in str(e):
-                logger.error(
-                    "SQLMesh requires all model names and references to have the same level of nesting."
-                )
-            raise
+        def _optimize_query(name: str) -> t.Optional[exp.Expression]:
+            return models[name].render_query(optimize=True)
+
+        for level in _dag_levels(dag):
+            level_models = [models[name] for name in level if name in models]
+
+            uncached: t.List[t.Tuple[SqlModel, str]] = []
+            for model in level_models:
+                model.update_schema(schema)
+                if not isinstance(model, SqlModel):
+                    continue
+                entry_name = optimized_query_cache.entry_name(model)
+                if entry_name and not optimized_query_cache.restore(model, entry_name):
+                    uncached.append((model, entry_name))
+
+            # Models within the same level don't depend on each other, so their queries can be
+            # optimized concurrently against the schema of the levels that precede them.
+            optimized_queries = fork_apply_to_values(
+                [model.fqn for model, _ in uncached], _optimize_query, processes
+            )
+            for (model, entry_name), optimized_query in zip(uncached, optimized_queries):
+                if isinstance(optimized_query, exp.Query):
+                    model._query_renderer.update_cache(optimized_query, optimized=True)
+                optimized_query_cache.put(entry_name, optimized_query)
+
+            for model in level_models:
+                _add_model_to_schema(schema, model)
+    except SchemaError as e:
+        if "nesting level:" in str(e):
+            logger.error(
+                "SQLMesh requires all model names and references to have the same level of nesting."
+            )
+        raise
+
+
+def _add_model_to_schema(schema: MappingSchema, model: Model) -> None:
+    columns_to_types = model.columns_to_types
+    if columns_to_types is not None:
+        schema.add_table(model.fqn, columns_to_types, dialect=model.dialect, normalize=False)
+
+
+def _dag_levels(dag: DAG[str]) -> t.List[t.List[str]]:
+    """Groups the nodes of the DAG into levels such that each node only depends on nodes from
+    the preceding levels."""
+    graph = dag.graph
+    node_levels: t.Dict[str, int] = {}
+    levels: t.List[t.List[str]] = []
+    for node in dag.sorted:
+        level = max((node_levels[dep] + 1 for dep in graph[node] if dep in node_levels), default=0)
+        node_levels[node] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(node)
+    return levels
+
+
+class _LoadedModel(PydanticModel):
+    """The picklable representation of a model which was loaded in a worker process."""
+
+    model: Model
+    rendered_query: t.Optional[exp.Expression] = None
 
 
 @dataclass
@@ -85,11 +160,22 @@ class LoadedProject:
 
 
 class Loader(abc.ABC):
-    """Abstract base class to load macros and models for a context"""
+    """Abstract base class to load macros and models for a context
+
+    Args:
+        processes: The number of worker processes used to load models and to update their schemas.
+            Models are loaded in the current process by default.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, processes: int = 1) -> None:
+        if processes < 1:
+            raise ConfigError(
+                f"The number of loader processes must be greater than 0. '{processes}' was provided"
+            )
+        self._processes = processes
         self._path_mtimes: t.Dict[Path, float] = {}
         self._dag: DAG[str] = DAG()
+        self._loaded_models: t.Dict[str, Model] = {}
 
     def load(self, context: GenericContext, update_schemas: bool = True) -> LoadedProject:
         """
@@ -130,11 +216,16 @@ class Loader(abc.ABC):
                 self._dag,
                 models,
                 self._context.path,
+                processes=self._processes,
+                cache_backend=self._context.config.cache_backend,
             )
             for model in models.values():
                 # The model definition can be validated correctly only after the schema is set.
                 model.validate_definition()
 
+        # Models which are later replaced by the context are no longer described by their files
+        self._loaded_models = dict(models)
+
         metrics = self._load_metrics()
 
         project = LoadedProject(
@@ -160,6 +251,18 @@ class Loader(abc.ABC):
             for path, initial_mtime in self._path_mtimes.items()
         )
 
+    def fingerprint_entry_id(self, node: Node) -> t.Optional[str]:
+        """Returns an identifier of the state of the files that the node was loaded from, which
+        is used to invalidate its persisted fingerprint.
+
+        Args:
+            node: The node that was loaded by the latest load.
+
+        Returns:
+            The entry ID or None if the node's fingerprint shouldn't be persisted.
+        """
+        return None
+
     @abc.abstractmethod
     def _load_scripts(self) -> t.Tuple[MacroRegistry, JinjaMacroRegistry]:
         """Loads all user defined macros."""
@@ -278,52 +381,105 @@ class SqlMeshLoader(Loader):
     ) -> UniqueKeyDict[str, Model]:
         """Loads the sql models into a Dict"""
         models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
+        model_paths: t.List[t.Tuple[Path, SqlMeshLoader._Cache]] = []
+        load_fns: t.Dict[Path, t.Callable[[Path], Model]] = {}
+
         for context_path, config in self._context.configs.items():
             cache = SqlMeshLoader._Cache(self, context_path)
             variables = self._variables(config)
 
+            def _load(
+                path: Path,
+                context_path: Path = context_path,
+                config: Config = config,
+                variables: t.Dict[str, t.Any] = variables,
+            ) -> Model:
+                with open(path, "r", encoding="utf-8") as file:
+                    try:
+                        expressions = parse(
+                            file.read(), default_dialect=config.model_defaults.dialect
+                        )
+                    except SqlglotError as ex:
+                        raise ConfigError(f"Failed to parse a model definition at '{path}': {ex}.")
+
+                return load_sql_based_model(
+                    expressions,
+                    defaults=config.model_defaults.dict(),
+                    macros=macros,
+                    jinja_macros=jinja_macros,
+                    path=Path(path).absolute(),
+                    module_path=context_path,
+                    dialect=config.model_defaults.dialect,
+                    time_column_format=config.time_column_format,
+                    physical_schema_override=config.physical_schema_override,
+                    project=config.project,
+                    default_catalog=self._context.default_catalog,
+                    variables=variables,
+                    infer_names=config.model_naming.infer_names,
+                )
+
             for path in self._glob_paths(context_path / c.MODELS, config=config, extension=".sql"):
                 if not os.path.getsize(path):
                     continue
 
                 self._track_file(path)
+                model_paths.append((path, cache))
+                load_fns[path] = _load
 
-                def _load() -> Model:
-                    with open(path, "r", encoding="utf-8") as file:
-                        try:
-                            expressions = parse(
-                                file.read(), default_dialect=config.model_defaults.dialect
-                            )
-                        except SqlglotError as ex:
-                            raise ConfigError(
-                                f"Failed to parse a model definition at '{path}': {ex}."
-                            )
-
-                    return load_sql_based_model(
-                        expressions,
-                        defaults=config.model_defaults.dict(),
-                        macros=macros,
-                        jinja_macros=jinja_macros,
-                        path=Path(path).absolute(),
-                        module_path=context_path,
-                        dialect=config.model_defaults.dialect,
-                        time_column_format=config.time_column_format,
-                        physical_schema_override=config.physical_schema_override,
-                        project=config.project,
-                        default_catalog=self._context.default_catalog,
-                        variables=variables,
-                        infer_names=config.model_naming.infer_names,
-                    )
+        if self._processes == 1:
+            loaded_models = [
+                cache.get_or_load_model(path, functools.partial(load_fns[path], path))
+                for path, cache in model_paths
+            ]
+        else:
+            loaded_models = self._load_sql_models_in_processes(model_paths, load_fns)
 
-                model = cache.get_or_load_model(path, _load)
-                models[model.fqn] = model
+        for model in loaded_models:
+            models[model.fqn] = model
 
-                if isinstance(model, SeedModel):
-                    seed_path = model.seed_path
-                    self._track_file(seed_path)
+            if isinstance(model, SeedModel):
+                seed_path = model.seed_path
+                self._track_file(seed_path)
 
         return models
 
+    def _load_sql_models_in_processes(
+        self,
+        model_paths: t.List[t.Tuple[Path, SqlMeshLoader._Cache]],
+        load_fns: t.Dict[Path, t.Callable[[Path], Model]],
+    ) -> t.List[Model]:
+        """Loads models which are missing from the cache in worker processes.
+
+        Returns:
+            The loaded models in the order of the given paths.
+        """
+        cached_models = {path: cache.get_model(path) for path, cache in model_paths}
+
+        def _load(path: Path) -> t.Dict[str, t.Any]:
+            model = load_fns[path](path)
+            rendered_query = (
+                model.render_query(optimize=False) if isinstance(model, SqlModel) else None
+            )
+            return _LoadedModel(model=model, rendered_query=rendered_query).dict()
+
+        uncached_paths = [path for path, model in cached_models.items() if model is None]
+        for path, loaded in zip(
+            uncached_paths, fork_apply_to_values(uncached_paths, _load, self._processes)
+        ):
+            entry = _LoadedModel.parse_obj(loaded)
+            if isinstance(entry.model, SqlModel):
+                entry.model._query_renderer.update_cache(entry.rendered_query, optimized=False)
+            cached_models[path] = entry.model
+
+        loaded_models = []
+        for path, cache in model_paths:
+            model = cached_models[path]
+            assert model is not None
+            if path in uncached_paths:
+                cache.put_model(path, model)
+            loaded_models.append(model)
+        return loaded_models
+
     def _load_python_models(self) -> UniqueKeyDict[str, Model]:
         """Loads the python models into a Dict"""
         models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
@@ -369,10 +525,12 @@ class SqlMeshLoader(Loader):
     ) -> UniqueKeyDict[str, Audit]:
         """Loads all the model audits."""
         audits_by_name: UniqueKeyDict[str, Audit] = UniqueKeyDict("audits")
+        self._audits_max_mtime: t.Optional[float] = None
         for context_path, config in self._context.configs.items():
             variables = self._variables(config)
             for path in self._glob_paths(context_path / c.AUDITS, config=config, extension=".sql"):
                 self._track_file(path)
+                self._audits_max_mtime = max(self._audits_max_mtime or 0, self._path_mtimes[path])
                 with open(path, "r", encoding="utf-8") as file:
                     expressions = parse(file.read(), default_dialect=config.model_defaults.dialect)
                     audits = load_multiple_audits(
@@ -410,6 +568,34 @@ class SqlMeshLoader(Loader):
 
         return metrics
 
+    def fingerprint_entry_id(self, node: Node) -> t.Optional[str]:
+        # Python models can depend on arbitrary modules of the project
+        if self._loaded_models.get(node.fqn) is not node or not isinstance(
+            node, (SqlModel, SeedModel, ExternalModel)
+        ):
+            return None
+
+        paths = [node._path]
+        if isinstance(node, SeedModel):
+            paths.append(node.seed_path)
+        if any(path not in self._path_mtimes for path in paths):
+            return None
+
+        mtimes = [
+            *(self._path_mtimes[path] for path in paths),
+            self._macros_max_mtime,
+            self._audits_max_mtime,
+            *self._config_mtimes.values(),
+        ]
+        return "__".join(
+            [
+                str(max(m for m in mtimes if m is not None)),
+                self._context.config.fingerprint,
+                self._context.gateway or "",
+                self._context.default_catalog or "",
+            ]
+        )
+
     def _glob_paths(
         self, path: Path, config: Config, extension: str
     ) -> t.Generator[Path, None, None]:
@@ -448,7 +634,9 @@ class SqlMeshLoader(Loader):
         def __init__(self, loader: SqlMeshLoader, context_path: Path):
             self._loader = loader
             self._context_path = context_path
-            self._model_cache = ModelCache(self._context_path / c.CACHE)
+            self._model_cache = ModelCache(
+                self._context_path / c.CACHE, backend=loader._context.config.cache_backend
+            )
 
         def get_or_load_model(self, target_path: Path, loader: t.Callable[[], Model]) -> Model:
             model = self._model_cache.get_or_load(
@@ -459,6 +647,23 @@ class SqlMeshLoader(Loader):
             model._path = target_path
             return model
 
+        def get_model(self, target_path: Path) -> t.Optional[Model]:
+            model = self._model_cache.get(
+                self._cache_entry_name(target_path),
+                self._model_cache_entry_id(target_path),
+            )
+            if model:
+                model._path = target_path
+            return model
+
+        def put_model(self, target_path: Path, model: Model) -> None:
+            self._model_cache.put(
+                self._cache_entry_name(target_path),
+                self._model_cache_entry_id(target_path),
+                model=model,
+            )
+            model._path = target_path
+
         def _cache_entry_name(self, target_path: Path) -> str:
             return "__".join(target_path.relative_to(self._context_path).parts).replace(
                 target_path.suffix, ""
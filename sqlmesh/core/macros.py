@@ -5,6 +5,7 @@ import logging
 import sys
 import types
 import typing as t
+import weakref
 from enum import Enum
 from functools import reduce
 from itertools import chain
@@ -39,7 +40,7 @@ from sqlmesh.utils import (
 )
 from sqlmesh.utils.errors import MacroEvalError, SQLMeshError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, has_jinja
-from sqlmesh.utils.metaprogramming import Executable, prepare_env, print_exception
+from sqlmesh.utils.metaprogramming import Executable, copy_prepared_env, print_exception
 
 if t.TYPE_CHECKING:
     from sqlmesh.core._typing import TableName
@@ -150,15 +151,8 @@ class MacroEvaluator:
             "runtime_stage": runtime_stage.value,
             "default_catalog": default_catalog,
         }
-        self.env = {
-            **ENV,
-            "self": self,
-            "SQL": SQL,
-            "MacroEvaluator": MacroEvaluator,
-        }
         self.python_env = python_env or {}
         self._jinja_env: t.Optional[Environment] = jinja_env
-        self.macros = {normalize_macro_name(k): v.func for k, v in macro.get_registry().items()}
         self._schema = schema
         self._resolve_tables = resolve_tables
         self.columns_to_types_called = False
@@ -166,7 +160,10 @@ class MacroEvaluator:
         self.default_catalog = default_catalog
         self._path = path
 
-        prepare_env(self.python_env, self.env)
+        # Preparing the environment executes its code once, each evaluator gets a private copy of it
+        self.env = copy_prepared_env(self.python_env, _MACRO_BASE_ENV)
+        self.env["self"] = self
+        self.macros = dict(_registered_macros())
         for k, v in self.python_env.items():
             if v.is_definition:
                 self.macros[normalize_macro_name(k)] = self.env[v.name or k]
@@ -185,34 +182,27 @@ class MacroEvaluator:
 
         try:
             # Bind the macro's actual parameters to its formal parameters
-            sig = inspect.signature(func)
-            bound = sig.bind(self, *args, **kwargs)
+            plan = _MacroCallPlan.of(func)
+            bound = plan.signature.bind(self, *args, **kwargs)
             bound.apply_defaults()
         except Exception as e:
             print_exception(e, self.python_env)
             raise MacroEvalError("Error trying to eval macro.") from e
 
-        try:
-            annotations = t.get_type_hints(func)
-        except NameError:  # forward references aren't handled
-            annotations = {}
-
         # If the macro is annotated, we try coerce the actual parameters to the corresponding types
-        if annotations:
-            for arg, value in bound.arguments.items():
-                typ = annotations.get(arg)
-                if not typ:
-                    continue
-
-                # Changes to bound.arguments will reflect in bound.args and bound.kwargs
-                # https://docs.python.org/3/library/inspect.html#inspect.BoundArguments.arguments
-                param = sig.parameters[arg]
-                if param.kind is inspect.Parameter.VAR_POSITIONAL:
-                    bound.arguments[arg] = tuple(self._coerce(v, typ) for v in value)
-                elif param.kind is inspect.Parameter.VAR_KEYWORD:
-                    bound.arguments[arg] = {k: self._coerce(v, typ) for k, v in value.items()}
-                else:
-                    bound.arguments[arg] = self._coerce(value, typ)
+        for arg, typ, kind in plan.coercions:
+            if arg not in bound.arguments:
+                continue
+
+            # Changes to bound.arguments will reflect in bound.args and bound.kwargs
+            # https://docs.python.org/3/library/inspect.html#inspect.BoundArguments.arguments
+            value = bound.arguments[arg]
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                bound.arguments[arg] = tuple(self._coerce(v, typ) for v in value)
+            elif kind is inspect.Parameter.VAR_KEYWORD:
+                bound.arguments[arg] = {k: self._coerce(v, typ) for k, v in value.items()}
+            else:
+                bound.arguments[arg] = self._coerce(value, typ)
 
         try:
             return func(*bound.args, **bound.kwargs)
@@ -571,6 +561,71 @@ class macro(registry_decorator):
 ExecutableOrMacro = t.Union[Executable, macro]
 MacroRegistry = UniqueKeyDict[str, ExecutableOrMacro]
 
+_MACRO_BASE_ENV = {
+    **ENV,
+    "SQL": SQL,
+    "MacroEvaluator": MacroEvaluator,
+}
+
+# The registry of global macros with their normalized names, which is rebuilt once new macros are registered
+_REGISTERED_MACROS: t.Optional[t.Tuple[UniqueKeyDict, int, t.Dict[str, t.Callable]]] = None
+
+
+def _registered_macros() -> t.Dict[str, t.Callable]:
+    global _REGISTERED_MACROS
+
+    registry = macro.registry()
+    registered = _REGISTERED_MACROS
+    if registered is None or registered[0] is not registry or registered[1] != len(registry):
+        registered = (
+            registry,
+            len(registry),
+            {normalize_macro_name(k): v.func for k, v in registry.items()},
+        )
+        _REGISTERED_MACROS = registered
+    return registered[2]
+
+
+class _MacroCallPlan:
+    """The signature and resolved parameter annotations of a macro function, which are computed once
+    per function instead of on every call.
+
+    Args:
+        func: The macro function.
+    """
+
+    _PLANS: weakref.WeakKeyDictionary[t.Callable, _MacroCallPlan] = weakref.WeakKeyDictionary()
+
+    def __init__(self, func: t.Callable):
+        self.signature = inspect.signature(func)
+
+        try:
+            annotations = t.get_type_hints(func)
+        except NameError:  # forward references aren't handled
+            annotations = {}
+
+        # The parameters whose actual values are coerced to their annotated types
+        self.coercions: t.List[t.Tuple[str, t.Any, inspect._ParameterKind]] = [
+            (name, annotations[name], param.kind)
+            for name, param in self.signature.parameters.items()
+            if annotations.get(name)
+        ]
+
+    @classmethod
+    def of(cls, func: t.Callable) -> _MacroCallPlan:
+        # Wrappers, including functions rebound to copies of a prepared environment, have the same
+        # signature and annotations as the functions they wrap.
+        key = getattr(func, "__wrapped__", func)
+        try:
+            plan = cls._PLANS.get(key)
+        except TypeError:  # not every callable can be weakly referenced
+            return cls(func)
+
+        if plan is None:
+            plan = cls(func)
+            cls._PLANS[key] = plan
+        return plan
+
 
 def _norm_var_arg_lambda(
     evaluator: MacroEvaluator, func: exp.Lambda, *items: t.Any
@@ -7,7 +7,7 @@ from sqlglot import exp
 from sqlglot.optimizer.simplify import gen
 
 from sqlmesh.core.model.definition import Model, SqlModel
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.cache import CacheBackend, FileCache, SQLiteCache, create_cache
 from sqlmesh.utils.hashing import crc32
 from sqlmesh.utils.pydantic import PydanticModel
 
@@ -22,15 +22,14 @@ class ModelCache:
 
     Args:
         path: The path to the cache folder.
+        backend: The storage of cached entries.
     """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, backend: CacheBackend = CacheBackend.FILE):
         self.path = path
-        self._file_cache: FileCache[SqlModelCacheEntry] = FileCache(
-            path,
-            SqlModelCacheEntry,
-            prefix="model_definition",
-        )
+        self._file_cache: t.Union[
+            FileCache[SqlModelCacheEntry], SQLiteCache[SqlModelCacheEntry]
+        ] = create_cache(path, SqlModelCacheEntry, prefix="model_definition", backend=backend)
 
     def get_or_load(self, name: str, entry_id: str = "", *, loader: t.Callable[[], Model]) -> Model:
         """Returns an existing cached model definition or loads and caches a new one.
@@ -43,21 +42,45 @@ class ModelCache:
         Returns:
             The model definition.
         """
+        cached_model = self.get(name, entry_id)
+        if cached_model:
+            return cached_model
+
+        loaded_model = loader()
+        self.put(name, entry_id, model=loaded_model)
+        return loaded_model
+
+    def get(self, name: str, entry_id: str = "") -> t.Optional[Model]:
+        """Returns an existing cached model definition if exists.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+
+        Returns:
+            The model definition or None if no entry was found in the cache.
+        """
         cache_entry = self._file_cache.get(name, entry_id)
         if cache_entry:
             model = cache_entry.model
             model._query_renderer.update_cache(cache_entry.rendered_query, optimized=False)
             return model
+        return None
 
-        loaded_model = loader()
-        if isinstance(loaded_model, SqlModel):
+    def put(self, name: str, entry_id: str = "", *, model: Model) -> None:
+        """Stores the given model definition in the cache. Only SQL models are cached.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+            model: The model definition to store in the cache.
+        """
+        if isinstance(model, SqlModel):
             new_entry = SqlModelCacheEntry(
-                model=loaded_model, rendered_query=loaded_model.render_query(optimize=False)
+                model=model, rendered_query=model.render_query(optimize=False)
             )
             self._file_cache.put(name, entry_id, value=new_entry)
 
-        return loaded_model
-
 
 class OptimizedQueryCacheEntry(PydanticModel):
     optimized_rendered_query: exp.Expression
@@ -68,13 +91,14 @@ class OptimizedQueryCache:
 
     Args:
         path: The path to the cache folder.
+        backend: The storage of cached entries.
     """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, backend: CacheBackend = CacheBackend.FILE):
         self.path = path
-        self._file_cache: FileCache[OptimizedQueryCacheEntry] = FileCache(
-            path, OptimizedQueryCacheEntry, prefix="optimized_query"
-        )
+        self._file_cache: t.Union[
+            FileCache[OptimizedQueryCacheEntry], SQLiteCache[OptimizedQueryCacheEntry]
+        ] = create_cache(path, OptimizedQueryCacheEntry, prefix="optimized_query", backend=backend)
 
     def with_optimized_query(self, model: Model) -> bool:
         """Adds an optimized query to the model's in-memory cache.
@@ -85,26 +109,62 @@ class OptimizedQueryCache:
         if not isinstance(model, SqlModel):
             return False
 
+        name = self.entry_name(model)
+        if name is None:
+            return False
+
+        if self.restore(model, name):
+            return True
+
+        self.put(name, model.render_query(optimize=True))
+        return False
+
+    def entry_name(self, model: SqlModel) -> t.Optional[str]:
+        """Returns the name of the cache entry for the model's optimized query.
+
+        The name depends on the model's schema, so it must be computed after the schema was updated.
+
+        Args:
+            model: The target model.
+
+        Returns:
+            The entry name or None if the model's query can't be rendered.
+        """
         unoptimized_query = model.render_query(optimize=False)
         if unoptimized_query is None:
-            return False
+            return None
 
         hash_data = _mapping_schema_hash_data(model.mapping_schema)
         hash_data.append(gen(unoptimized_query))
-        name = f"{model.name}_{crc32(hash_data)}"
-        cache_entry = self._file_cache.get(name)
+        return f"{model.name}_{crc32(hash_data)}"
+
+    def restore(self, model: SqlModel, name: str) -> bool:
+        """Adds a cached optimized query to the model's in-memory cache if exists.
 
+        Args:
+            model: The model to add the optimized query to.
+            name: The name of the cache entry.
+
+        Returns:
+            True if the cached optimized query was found, False otherwise.
+        """
+        cache_entry = self._file_cache.get(name)
         if cache_entry:
             model._query_renderer.update_cache(cache_entry.optimized_rendered_query, optimized=True)
             return True
+        return False
 
-        optimized_query = model.render_query(optimize=True)
+    def put(self, name: str, optimized_query: t.Optional[exp.Expression]) -> None:
+        """Stores the given optimized query in the cache.
+
+        Args:
+            name: The name of the cache entry.
+            optimized_query: The optimized query.
+        """
         if optimized_query is not None:
             new_entry = OptimizedQueryCacheEntry(optimized_rendered_query=optimized_query)
             self._file_cache.put(name, value=new_entry)
 
-        return False
-
 
 def _mapping_schema_hash_data(schema: t.Dict[str, t.Any]) -> t.List[str]:
     keys = sorted(schema) if all(isinstance(v, dict) for v in schema.values()) else schema
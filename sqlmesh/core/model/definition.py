@@ -1320,9 +1320,12 @@ class PythonModel(_Model):
 
     Args:
         entrypoint: The name of a Python function which contains the data fetching / transformation logic.
+        streaming: Whether DataFrames yielded by the entrypoint should be inserted while the next one is
+            being produced. When enabled the entrypoint runs on a separate thread.
     """
 
     entrypoint: str
+    streaming: bool = False
     source_type: Literal["python"] = "python"
 
     def render(
@@ -1381,6 +1384,13 @@ class PythonModel(_Model):
         data.append(self.entrypoint)
         return data
 
+    @property
+    def _additional_metadata(self) -> t.List[str]:
+        additional_metadata = super()._additional_metadata
+        if self.streaming:
+            additional_metadata.append("streaming")
+        return additional_metadata
+
 
 class ExternalModel(_Model):
     """The model definition which represents an external source/table."""
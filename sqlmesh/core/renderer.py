@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import itertools
 import logging
 import typing as t
 from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
+from threading import Lock
 
 from sqlglot import exp, parse
 from sqlglot.errors import SqlglotError
@@ -13,7 +16,7 @@ from sqlglot.optimizer.simplify import simplify
 
 from sqlmesh.core import constants as c
 from sqlmesh.core import dialect as d
-from sqlmesh.core.macros import MacroEvaluator, RuntimeStage
+from sqlmesh.core.macros import MacroEvaluator, RuntimeStage, macro, normalize_macro_name
 from sqlmesh.utils.date import TimeLike, date_dict, make_inclusive_end, to_datetime
 from sqlmesh.utils.errors import (
     ConfigError,
@@ -22,8 +25,8 @@ from sqlmesh.utils.errors import (
     SQLMeshError,
     raise_config_error,
 )
-from sqlmesh.utils.jinja import JinjaMacroRegistry
-from sqlmesh.utils.metaprogramming import Executable, prepare_env
+from sqlmesh.utils.jinja import JinjaMacroRegistry, has_jinja
+from sqlmesh.utils.metaprogramming import Executable, copy_prepared_env
 
 if t.TYPE_CHECKING:
     from sqlglot._typing import E
@@ -33,6 +36,16 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The names of macro variables which are derived from the start, end and execution time of a render
+TIME_VARIABLE_NAMES = frozenset(date_dict(c.EPOCH, c.EPOCH, c.EPOCH))
+
+# Times that are rendered in place of actual ones when building query templates. Values derived from
+# them, eg. their hours or epochs, are unlikely to appear in queries otherwise.
+_PLACEHOLDER_START = datetime(2199, 1, 2, 21, 4, 5, 600007, tzinfo=timezone.utc)
+_PLACEHOLDER_END = datetime(2199, 2, 3, 22, 5, 6, 700008, tzinfo=timezone.utc)
+_PLACEHOLDER_EXECUTION_TIME = datetime(2199, 3, 4, 23, 6, 7, 800009, tzinfo=timezone.utc)
+_PLACEHOLDER_PREFIX = "__sqlmesh_placeholder_"
+
 
 class BaseExpressionRenderer:
     def __init__(
@@ -76,6 +89,7 @@ class BaseExpressionRenderer:
         table_mapping: t.Optional[t.Dict[str, str]] = None,
         deployability_index: t.Optional[DeployabilityIndex] = None,
         runtime_stage: RuntimeStage = RuntimeStage.LOADING,
+        placeholder_times: bool = False,
         **kwargs: t.Any,
     ) -> t.List[t.Optional[exp.Expression]]:
         """Renders a expression, expanding macros with provided kwargs
@@ -88,6 +102,8 @@ class BaseExpressionRenderer:
             table_mapping: Table mapping of physical locations. Takes precedence over snapshot mappings.
             deployability_index: Determines snapshots that are deployable in the context of this evaluation.
             runtime_stage: Indicates the current runtime stage, for example if we're still loading the project, etc.
+            placeholder_times: Whether time variables should only be available to macro variable references
+                outside of macro calls, so that Python code can't depend on their values.
             kwargs: Additional kwargs to pass to the renderer.
 
         Returns:
@@ -116,17 +132,16 @@ class BaseExpressionRenderer:
 
         expressions = [self._expression]
 
-        render_kwargs = {
-            **date_dict(
-                to_datetime(execution_time or c.EPOCH),
-                to_datetime(start or c.EPOCH) if not self._only_execution_time else None,
-                make_inclusive_end(end or c.EPOCH) if not self._only_execution_time else None,
-            ),
-            **kwargs,
-        }
+        time_kwargs = self._time_kwargs(start, end, execution_time)
+        if placeholder_times:
+            # Time variables are renamed so that they can't be looked up by macros
+            expressions = [self._expression.transform(_rename_time_variables)]
+            time_kwargs = {f"{_PLACEHOLDER_PREFIX}{k}": v for k, v in time_kwargs.items()}
+
+        render_kwargs = {**time_kwargs, **kwargs}
 
         jinja_env = self._jinja_macro_registry.build_environment(
-            **{**render_kwargs, **prepare_env(self._python_env)},
+            **{**render_kwargs, **copy_prepared_env(self._python_env)},
             snapshots=(snapshots or {}),
             table_mapping=table_mapping,
             deployability_index=deployability_index,
@@ -302,6 +317,18 @@ class BaseExpressionRenderer:
     def _should_cache(self, runtime_stage: RuntimeStage, *args: t.Any) -> bool:
         return runtime_stage == RuntimeStage.LOADING and not any(args)
 
+    def _time_kwargs(
+        self,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+    ) -> t.Dict[str, t.Any]:
+        return date_dict(
+            to_datetime(execution_time or c.EPOCH),
+            to_datetime(start or c.EPOCH) if not self._only_execution_time else None,
+            make_inclusive_end(end or c.EPOCH) if not self._only_execution_time else None,
+        )
+
     def _to_table_mapping(
         self, snapshots: t.Iterable[Snapshot], deployability_index: t.Optional[DeployabilityIndex]
     ) -> t.Dict[str, str]:
@@ -355,10 +382,23 @@ class QueryRenderer(BaseExpressionRenderer):
     def __init__(self, *args: t.Any, **kwargs: t.Any):
         super().__init__(*args, **kwargs)
         self._optimized_cache: t.Optional[exp.Query] = None
+        self._query_template: t.Optional[_QueryTemplate] = None
+        self._template_lock = Lock()
+        self._is_templatable: t.Optional[bool] = None
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        state = self.__dict__.copy()
+        state.pop("_template_lock", None)
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._template_lock = Lock()
 
     def update_schema(self, schema: t.Dict[str, t.Any]) -> None:
         super().update_schema(schema)
         self._optimized_cache = None
+        self._query_template = None
 
     def render(
         self,
@@ -398,6 +438,87 @@ class QueryRenderer(BaseExpressionRenderer):
             runtime_stage, start, end, execution_time, *kwargs.values()
         )
 
+        # Renders that only differ in their start, end and execution time, eg. those of consecutive
+        # batches, are served from a template in which the time literals are substituted.
+        template_key = (
+            None
+            if should_cache
+            else self._template_key(
+                snapshots,
+                table_mapping,
+                deployability_index,
+                expand,
+                optimize,
+                runtime_stage,
+                kwargs,
+            )
+        )
+        template = self._query_template
+        time_kwargs = self._time_kwargs(start, end, execution_time)
+        if (
+            template_key is not None
+            and template is not None
+            and template.key == template_key[0]
+            and (template.compiled is not None or template.time_kwargs != time_kwargs)
+        ):
+            compiled = template.compiled
+            if compiled is None and template.is_usable:
+                with self._template_lock:
+                    compiled = template.compiled
+                    if compiled is None and template.is_usable:
+                        return self._build_template(
+                            template,
+                            start=start,
+                            end=end,
+                            execution_time=execution_time,
+                            snapshots=snapshots,
+                            table_mapping=table_mapping,
+                            deployability_index=deployability_index,
+                            optimize=optimize,
+                            runtime_stage=runtime_stage,
+                            **kwargs,
+                        )
+            if compiled is not None:
+                return compiled.substitute(time_kwargs)
+
+        query = self._render_query(
+            start=start,
+            end=end,
+            execution_time=execution_time,
+            snapshots=snapshots,
+            table_mapping=table_mapping,
+            deployability_index=deployability_index,
+            expand=expand,
+            optimize=optimize,
+            runtime_stage=runtime_stage,
+            should_cache=should_cache,
+            **kwargs,
+        )
+
+        if (
+            query is not None
+            and template_key is not None
+            and (template is None or template.key != template_key[0])
+        ):
+            key, refs = template_key
+            self._query_template = _QueryTemplate(key, refs, query.copy(), time_kwargs)
+        return query
+
+    def _render_query(
+        self,
+        start: t.Optional[TimeLike] = None,
+        end: t.Optional[TimeLike] = None,
+        execution_time: t.Optional[TimeLike] = None,
+        snapshots: t.Optional[t.Dict[str, Snapshot]] = None,
+        table_mapping: t.Optional[t.Dict[str, str]] = None,
+        deployability_index: t.Optional[DeployabilityIndex] = None,
+        expand: t.Iterable[str] = tuple(),
+        optimize: bool = True,
+        runtime_stage: RuntimeStage = RuntimeStage.LOADING,
+        should_cache: bool = False,
+        placeholder_times: bool = False,
+        **kwargs: t.Any,
+    ) -> t.Optional[exp.Query]:
         if should_cache and self._optimized_cache and optimize:
             query = self._optimized_cache
         else:
@@ -410,6 +531,7 @@ class QueryRenderer(BaseExpressionRenderer):
                     table_mapping=table_mapping,
                     deployability_index=deployability_index,
                     runtime_stage=runtime_stage,
+                    placeholder_times=placeholder_times,
                     **kwargs,
                 )
             except ParsetimeAdapterCallError:
@@ -463,6 +585,103 @@ class QueryRenderer(BaseExpressionRenderer):
         else:
             super().update_cache(expression)
 
+    def _template_key(
+        self,
+        snapshots: t.Optional[t.Dict[str, Snapshot]],
+        table_mapping: t.Optional[t.Dict[str, str]],
+        deployability_index: t.Optional[DeployabilityIndex],
+        expand: t.Iterable[str],
+        optimize: bool,
+        runtime_stage: RuntimeStage,
+        kwargs: t.Dict[str, t.Any],
+    ) -> t.Optional[t.Tuple[t.Tuple[t.Any, ...], t.List[t.Any]]]:
+        """Returns the key of the query template that can serve a render along with the objects that
+        are referenced by their IDs in the key, or None if the render can't be served from a template."""
+        if self._is_templatable is None:
+            self._is_templatable = _is_templatable(
+                self._expression, self._macro_definitions, self._python_env
+            )
+        if not self._is_templatable or expand:
+            return None
+
+        snapshots = snapshots or {}
+        # Embedded models are expanded with their own queries rendered for the same times
+        if any(snapshot.is_embedded for snapshot in snapshots.values()):
+            return None
+
+        mapping = {
+            **self._to_table_mapping(snapshots.values(), deployability_index),
+            **(table_mapping or {}),
+        }
+
+        refs = []
+        kwarg_keys = []
+        for name, value in sorted(kwargs.items()):
+            if not isinstance(value, (str, int, float, bool, type(None))):
+                # The object is kept alive by the template so that its ID can't be reused
+                refs.append(value)
+                value = id(value)
+            kwarg_keys.append((name, value))
+
+        key = (optimize, runtime_stage, tuple(sorted(mapping.items())), tuple(kwarg_keys))
+        return key, refs
+
+    def _build_template(
+        self,
+        template: _QueryTemplate,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+        **kwargs: t.Any,
+    ) -> t.Optional[exp.Query]:
+        """Renders the query with placeholder times and with the given times, and compiles the
+        template if substituting the times of both real renders into it reproduces their queries.
+
+        Returns:
+            The query rendered with the given times.
+        """
+        query = self._render_query(start=start, end=end, execution_time=execution_time, **kwargs)
+        if query is None:
+            return None
+
+        try:
+            placeholder_query = self._render_query(
+                start=_PLACEHOLDER_START,
+                end=_PLACEHOLDER_END,
+                execution_time=_PLACEHOLDER_EXECUTION_TIME,
+                placeholder_times=True,
+                **kwargs,
+            )
+        except Exception as ex:
+            logger.debug(
+                "Failed to render a query template for model '%s': %s", self._model_fqn, ex
+            )
+            placeholder_query = None
+
+        compiled = None
+        if placeholder_query is not None:
+            compiled = _CompiledQueryTemplate.compile(
+                placeholder_query,
+                self._time_kwargs(
+                    _PLACEHOLDER_START, _PLACEHOLDER_END, _PLACEHOLDER_EXECUTION_TIME
+                ),
+                renders=[
+                    (template.query, template.time_kwargs),
+                    (query, self._time_kwargs(start, end, execution_time)),
+                ],
+            )
+
+        if compiled is None:
+            template.is_usable = False
+            logger.debug(
+                "The query of model '%s' depends on times beyond their literals, it can't be templated",
+                self._model_fqn,
+            )
+        else:
+            # Only published once it has been checked so that concurrent renders can't use it before
+            template.compiled = compiled
+        return query
+
     def _optimize_query(self, query: exp.Query, all_deps: t.Set[str]) -> exp.Query:
         # We don't want to normalize names in the schema because that's handled by the optimizer
         original = query
@@ -512,3 +731,132 @@ class QueryRenderer(BaseExpressionRenderer):
                 annotate_types(select)
 
         return query
+
+
+class _QueryTemplate:
+    """The first rendered query for a key, which is compiled into a template on a later render.
+
+    A later render for the same key but different times renders the query both with its own times
+    and with placeholder times, whose literals become the template's slots. The template is only
+    compiled if substituting the times of both real renders into it reproduces their queries.
+
+    Args:
+        key: The key of renders which can be served by this template.
+        refs: Objects that are referenced by their IDs in the key.
+        query: The first rendered query.
+        time_kwargs: The time variables of the first render.
+    """
+
+    def __init__(
+        self,
+        key: t.Tuple[t.Any, ...],
+        refs: t.List[t.Any],
+        query: exp.Query,
+        time_kwargs: t.Dict[str, t.Any],
+    ):
+        self.key = key
+        self.refs = refs
+        self.query = query
+        self.time_kwargs = time_kwargs
+        self.compiled: t.Optional[_CompiledQueryTemplate] = None
+        self.is_usable = True
+
+
+class _CompiledQueryTemplate:
+    """A rendered query in which the literals of time variables can be substituted.
+
+    Args:
+        query: The query rendered with placeholder times.
+        slots: Maps literals of placeholder times to the names of their time variables.
+    """
+
+    def __init__(self, query: exp.Query, slots: t.Dict[t.Tuple[str, bool], str]):
+        self.query = query
+        self.slots = slots
+
+    @classmethod
+    def compile(
+        cls,
+        placeholder_query: exp.Query,
+        placeholder_time_kwargs: t.Dict[str, t.Any],
+        renders: t.List[t.Tuple[exp.Query, t.Dict[str, t.Any]]],
+    ) -> t.Optional[_CompiledQueryTemplate]:
+        """Returns the template of a query rendered with placeholder times, or None if it doesn't
+        reproduce every given render of the query."""
+        slots: t.Dict[t.Tuple[str, bool], str] = {}
+        for name, value in placeholder_time_kwargs.items():
+            literal = _time_literal(value)
+            slots.setdefault((literal.this, literal.is_string), name)
+
+        compiled = cls(placeholder_query, slots)
+        if any(compiled.substitute(time_kwargs) != query for query, time_kwargs in renders):
+            return None
+        return compiled
+
+    def substitute(self, time_kwargs: t.Dict[str, t.Any]) -> exp.Query:
+        def _substitute(node: exp.Expression) -> exp.Expression:
+            if isinstance(node, exp.Literal):
+                name = self.slots.get((node.this, node.is_string))
+                if name is not None:
+                    return _time_literal(time_kwargs[name])
+            return node
+
+        return t.cast(exp.Query, self.query.transform(_substitute))
+
+
+def _time_literal(value: t.Any) -> exp.Literal:
+    # Dates and datetimes are converted into functions of a single string literal
+    literal = exp.convert(value)
+    return (
+        literal
+        if isinstance(literal, exp.Literal)
+        else t.cast(exp.Literal, literal.find(exp.Literal))
+    )
+
+
+def _rename_time_variables(node: exp.Expression) -> exp.Expression:
+    if isinstance(node, d.MacroVar) and node.name in TIME_VARIABLE_NAMES:
+        return d.MacroVar(this=f"{_PLACEHOLDER_PREFIX}{node.name}")
+    return node
+
+
+def _is_templatable(
+    expression: exp.Expression,
+    macro_definitions: t.List[d.MacroDef],
+    python_env: t.Dict[str, Executable],
+) -> bool:
+    """Whether the rendered expression can only depend on times through the literals of time
+    variables, ie. time variables aren't passed to macros, can't be referenced by Jinja and can't
+    be looked up by user-defined macros or Python code."""
+    if isinstance(expression, d.Jinja):
+        return False
+
+    for macro_def in macro_definitions:
+        if any(var.name in TIME_VARIABLE_NAMES for var in macro_def.find_all(d.MacroVar)):
+            return False
+
+    user_macros = {normalize_macro_name(name) for name in python_env}
+    for node in itertools.chain(expression.walk(), *(m.walk() for m in macro_definitions)):
+        if isinstance(node, d.MacroFunc):
+            if isinstance(node, (d.MacroSQL, d.MacroStrReplace)):
+                return False
+            if not isinstance(node, d.MacroDef) and not _is_builtin_macro(
+                node.this.name, user_macros
+            ):
+                return False
+            if any(var.name in TIME_VARIABLE_NAMES for var in node.find_all(d.MacroVar)):
+                return False
+        elif isinstance(node, exp.Identifier):
+            if "@" in node.name:
+                return False
+        elif node.is_string and has_jinja(node.name):
+            return False
+    return True
+
+
+def _is_builtin_macro(name: str, user_macros: t.Set[str]) -> bool:
+    # Built-in macros only see times through their arguments, unlike user macros which can read
+    # them from the evaluator's locals. @EVAL evaluates arbitrary Python code.
+    if normalize_macro_name(name) in user_macros or name.lower() == "eval":
+        return False
+    return getattr(macro.registry().get(name.lower()), c.SQLMESH_BUILTIN, False)
@@ -19,10 +19,12 @@ from sqlmesh.core.snapshot import (
     earliest_start_date,
     missing_intervals,
 )
+from sqlmesh.core.snapshot.definition import MISSING_INTERVALS_CACHE
 from sqlmesh.core.snapshot.definition import Interval as SnapshotInterval
 from sqlmesh.core.snapshot.definition import SnapshotId
 from sqlmesh.core.state_sync import StateSync
 from sqlmesh.utils import format_exception
+from sqlmesh.utils.cache import CacheStats
 from sqlmesh.utils.concurrency import concurrent_apply_to_dag
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
@@ -80,6 +82,8 @@ class Scheduler:
         self.notification_target_manager = (
             notification_target_manager or NotificationTargetManager()
         )
+        self.missing_intervals_cache_stats = CacheStats()
+        """The missing intervals cache counters accumulated by this scheduler's runs."""
 
     def batches(
         self,
@@ -122,7 +126,8 @@ class Scheduler:
 
         self.state_sync.refresh_snapshot_intervals(snapshots)
 
-        return compute_interval_params(
+        cache_stats_before = MISSING_INTERVALS_CACHE.stats
+        batches = compute_interval_params(
             snapshots,
             start=start or earliest_start_date(snapshots),
             end=end or now(),
@@ -132,6 +137,16 @@ class Scheduler:
             ignore_cron=ignore_cron,
             end_bounded=end_bounded,
         )
+        cache_stats = MISSING_INTERVALS_CACHE.stats - cache_stats_before
+        self.missing_intervals_cache_stats += cache_stats
+        logger.info(
+            "Missing intervals cache: %s hits, %s misses, %s evictions",
+            cache_stats.hits,
+            cache_stats.misses,
+            cache_stats.evictions,
+        )
+
+        return batches
 
     def evaluate(
         self,
@@ -270,6 +285,9 @@ class Scheduler:
 
         snapshots_by_name = {snapshot.name: snapshot for snapshot in self.snapshots.values()}
 
+        # Objects may have been changed outside of SQLMesh since metadata was last cached.
+        self.snapshot_evaluator.adapter.notify_metadata_change()
+
         def evaluate_node(node: SchedulingUnit) -> None:
             if circuit_breaker and circuit_breaker():
                 raise CircuitBreakerError()
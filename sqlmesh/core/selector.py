@@ -12,6 +12,7 @@ from sqlmesh.core.loader import update_model_schemas
 from sqlmesh.core.model import Model
 from sqlmesh.core.state_sync import StateReader
 from sqlmesh.utils import UniqueKeyDict
+from sqlmesh.utils.cache import CacheBackend
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.git import GitClient
 
@@ -27,10 +28,12 @@ class Selector:
         dag: t.Optional[DAG[str]] = None,
         default_catalog: t.Optional[str] = None,
         dialect: t.Optional[str] = None,
+        cache_backend: CacheBackend = CacheBackend.FILE,
     ):
         self._state_reader = state_reader
         self._models = models
         self._context_path = context_path
+        self._cache_backend = cache_backend
         self._default_catalog = default_catalog
         self._dialect = dialect
         self._git_client = GitClient(context_path)
@@ -115,7 +118,7 @@ class Selector:
                     dag.add(model.fqn, model.depends_on)
                 models[model.fqn] = model
 
-        update_model_schemas(dag, models, self._context_path)
+        update_model_schemas(dag, models, self._context_path, cache_backend=self._cache_backend)
 
         return models
 
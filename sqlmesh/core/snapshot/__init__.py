@@ -1,7 +1,9 @@
+from sqlmesh.core.snapshot.cache import SnapshotFingerprintCache as SnapshotFingerprintCache
 from sqlmesh.core.snapshot.categorizer import categorize_change as categorize_change
 from sqlmesh.core.snapshot.definition import (
     DeployabilityIndex as DeployabilityIndex,
     Intervals as Intervals,
+    IntervalSet as IntervalSet,
     Node as Node,
     QualifiedViewName as QualifiedViewName,
     Snapshot as Snapshot,
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import logging
+import typing as t
+from pathlib import Path
+
+from sqlmesh.core.snapshot.definition import Node, SnapshotFingerprint, fingerprint_from_node
+from sqlmesh.utils.cache import CacheBackend, FileCache, SQLiteCache, create_cache
+from sqlmesh.utils.dag import DAG
+from sqlmesh.utils.hashing import md5
+from sqlmesh.utils.pydantic import PydanticModel
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.audit import ModelAudit
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotFingerprintCacheEntry(PydanticModel):
+    # Maps node names to the keys and values of their fingerprints.
+    fingerprints: t.Dict[str, t.Tuple[str, SnapshotFingerprint]] = {}
+
+
+class SnapshotFingerprintCache:
+    """Persists fingerprints of nodes across project loads.
+
+    The fingerprint of a node is keyed by the entry ID of the files that the node was loaded from
+    together with the fingerprints of its parents. A node whose key hasn't changed since the last
+    time its fingerprint was computed is neither serialized nor hashed again.
+
+    Args:
+        path: The path to the cache folder.
+        backend: The storage of cached entries.
+    """
+
+    ENTRY_NAME = "fingerprints"
+
+    def __init__(self, path: Path, backend: CacheBackend = CacheBackend.FILE):
+        self.path = path
+        self._file_cache: t.Union[
+            FileCache[SnapshotFingerprintCacheEntry], SQLiteCache[SnapshotFingerprintCacheEntry]
+        ] = create_cache(
+            path, SnapshotFingerprintCacheEntry, prefix="snapshot_fingerprint", backend=backend
+        )
+
+    def fingerprints(
+        self,
+        nodes: t.Dict[str, Node],
+        entry_ids: t.Dict[str, str],
+        audits: t.Optional[t.Dict[str, ModelAudit]] = None,
+    ) -> t.Dict[str, SnapshotFingerprint]:
+        """Returns the fingerprints of nodes with entry IDs, restoring persisted ones where possible.
+
+        Args:
+            nodes: All nodes in the graph by name.
+            entry_ids: The entry IDs of the files that nodes were loaded from by node name. Fingerprints
+                of nodes without an entry ID are neither restored nor persisted.
+            audits: Available audits by name.
+
+        Returns:
+            The fingerprints of nodes with entry IDs and of their parents by node name, which can be
+            used as the cache of `fingerprint_from_node` to fingerprint the remaining nodes.
+        """
+        cache_entry = self._file_cache.get(self.ENTRY_NAME) or SnapshotFingerprintCacheEntry()
+        stored = cache_entry.fingerprints
+
+        fingerprints: t.Dict[str, SnapshotFingerprint] = {}
+        retained = {}
+        computed = {}
+
+        def _fingerprint(name: str) -> SnapshotFingerprint:
+            if name not in fingerprints:
+                fingerprint_from_node(nodes[name], nodes=nodes, audits=audits, cache=fingerprints)
+            return fingerprints[name]
+
+        # Nodes without an entry ID are only fingerprinted when they are parents of cached nodes,
+        # the rest are left for `fingerprint_from_node` to compute on demand.
+        dag: DAG[str] = DAG(
+            {
+                name: (nodes[name].depends_on & entry_ids.keys()) - {name}
+                for name in entry_ids
+                if name in nodes
+            }
+        )
+        for name in dag.sorted:
+            node = nodes[name]
+            key = md5(
+                [
+                    entry_ids[name],
+                    *sorted(
+                        f"{parent}:{_fingerprint(parent).to_identifier()}"
+                        for parent in node.depends_on
+                        if parent in nodes and parent != name
+                    ),
+                ]
+            )
+            stored_key, fingerprint = stored.get(name, ("", None))
+            if fingerprint is not None and stored_key == key:
+                fingerprints[name] = fingerprint
+                retained[name] = (key, fingerprint)
+            else:
+                computed[name] = (key, _fingerprint(name))
+
+        logger.info("Restored %s of %s node fingerprints from the cache", len(retained), len(nodes))
+
+        # Only fingerprints of the given nodes are persisted, so that entries of removed nodes
+        # don't accumulate.
+        if computed or stored.keys() - retained.keys():
+            self._file_cache.put(
+                self.ENTRY_NAME,
+                value=SnapshotFingerprintCacheEntry(fingerprints={**retained, **computed}),
+            )
+
+        return fingerprints
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import itertools
 import sys
 import typing as t
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from datetime import datetime, timedelta
 from enum import IntEnum
-from functools import cached_property, lru_cache
+from functools import cached_property
 
+import numpy as np
 from pydantic import Field
 from sqlglot import exp
 from sqlglot.helper import seq_get
@@ -17,6 +21,8 @@ from sqlmesh.core.model import Model, ModelKindMixin, ModelKindName, ViewKind
 from sqlmesh.core.model.definition import _Model
 from sqlmesh.core.node import IntervalUnit, NodeType
 from sqlmesh.utils import sanitize_name
+from sqlmesh.utils.cache import BoundedCache, CacheStats, EvictionPolicy
+from sqlmesh.utils.cron import interval_seconds
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
     TimeLike,
@@ -47,6 +53,8 @@ if t.TYPE_CHECKING:
 
 Interval = t.Tuple[int, int]
 Intervals = t.List[Interval]
+# Missing intervals together with the start of the last lookback interval for each of them.
+_MissingIntervals = t.Tuple[Intervals, t.List[int]]
 
 Node = Annotated[t.Union[Model, StandaloneAudit], Field(descriminator="source_type")]
 
@@ -665,17 +673,12 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
             # Skipping partial interval.
             return
 
-        intervals = self.dev_intervals if is_dev else self.intervals
-        intervals.append((start_ts, end_ts))
-
-        if len(intervals) < 2:
-            return
-
-        merged_intervals = merge_intervals(intervals)
+        interval_set = IntervalSet(self.dev_intervals if is_dev else self.intervals)
+        interval_set.add(start_ts, end_ts)
         if is_dev:
-            self.dev_intervals = merged_intervals
+            self.dev_intervals = interval_set.to_list()
         else:
-            self.intervals = merged_intervals
+            self.intervals = interval_set.to_list()
 
     def remove_interval(self, interval: Interval) -> None:
         """Remove an interval from the snapshot.
@@ -1427,6 +1430,84 @@ def _parents_from_node(
     return parent_nodes
 
 
+class IntervalSet:
+    """A sorted collection of disjoint [start, end) intervals.
+
+    The boundaries of all intervals are stored in a single flat array of epoch timestamps
+    `[start_0, end_0, start_1, end_1, ...]`. The position returned by a binary search over this array
+    tells whether the searched timestamp falls within one of the intervals (odd position) or
+    between them (even position), which makes inserts, removals and coverage queries O(log n)
+    plus the cost of shifting the array's tail. Intervals that overlap or touch are merged.
+
+    Args:
+        intervals: Optional intervals to initialize the set with. They don't need to be sorted or disjoint.
+    """
+
+    __slots__ = ("_bounds",)
+
+    def __init__(self, intervals: t.Iterable[Interval] = ()):
+        intervals = list(intervals)
+        bounds = array("q", itertools.chain.from_iterable(intervals))
+        # Already sorted and disjoint intervals, which is the common case for snapshot intervals,
+        # are taken as is. The check relies on C-level operations only.
+        if len(set(bounds)) == len(bounds) and bounds.tolist() == sorted(bounds):
+            self._bounds = bounds
+        else:
+            self._bounds = array("q")
+            for start, end in intervals:
+                self.add(start, end)
+
+    def add(self, start: int, end: int) -> None:
+        """Adds the [start, end) interval to the set, merging it with overlapping or adjacent intervals."""
+        if start >= end:
+            return
+        bounds = self._bounds
+        i = bisect_left(bounds, start)
+        j = bisect_right(bounds, end)
+        replacement = array("q")
+        if not i % 2:
+            replacement.append(start)
+        if not j % 2:
+            replacement.append(end)
+        bounds[i:j] = replacement
+
+    def remove(self, start: int, end: int) -> None:
+        """Removes the [start, end) interval from the set, splitting intervals that contain it."""
+        if start >= end:
+            return
+        bounds = self._bounds
+        i = bisect_left(bounds, start)
+        j = bisect_right(bounds, end)
+        replacement = array("q")
+        if i % 2:
+            replacement.append(start)
+        if j % 2:
+            replacement.append(end)
+        bounds[i:j] = replacement
+
+    def covers(self, start: int, end: int) -> bool:
+        """Returns whether the [start, end) interval is fully covered by a single interval of this set."""
+        i = bisect_right(self._bounds, start)
+        return bool(i % 2) and end <= self._bounds[i]
+
+    def to_list(self) -> Intervals:
+        """Returns the intervals of this set as a sorted list of (start, end) pairs."""
+        bounds = self._bounds
+        return list(zip(bounds[::2], bounds[1::2]))
+
+    def __iter__(self) -> t.Iterator[Interval]:
+        return iter(self.to_list())
+
+    def __len__(self) -> int:
+        return len(self._bounds) // 2
+
+    def __eq__(self, other: t.Any) -> bool:
+        return isinstance(other, IntervalSet) and self._bounds == other._bounds
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.to_list()})"
+
+
 def merge_intervals(intervals: Intervals) -> Intervals:
     """Merge a list of intervals.
 
@@ -1436,19 +1517,7 @@ def merge_intervals(intervals: Intervals) -> Intervals:
     Returns:
         A new list of sorted and merged intervals.
     """
-    intervals = sorted(intervals)
-
-    merged = [intervals[0]]
-
-    for interval in intervals[1:]:
-        current = merged[-1]
-
-        if interval[0] <= current[1]:
-            merged[-1] = (current[0], max(current[1], interval[1]))
-        else:
-            merged.append(interval)
-
-    return merged
+    return IntervalSet(intervals).to_list()
 
 
 def _format_date_time(time_like: TimeLike, unit: t.Optional[IntervalUnit]) -> str:
@@ -1479,22 +1548,9 @@ def remove_interval(intervals: Intervals, remove_start: int, remove_end: int) ->
     Returns:
         A new list of intervals.
     """
-    modified: Intervals = []
-
-    for start, end in intervals:
-        if remove_start > start and remove_end < end:
-            modified.extend(
-                (
-                    (start, remove_start),
-                    (remove_end, end),
-                )
-            )
-        elif remove_start > start:
-            modified.append((start, min(remove_start, end)))
-        elif remove_end < end:
-            modified.append((max(remove_end, start), end))
-
-    return modified
+    interval_set = IntervalSet(intervals)
+    interval_set.remove(remove_start, remove_end)
+    return interval_set.to_list()
 
 
 def to_table_mapping(
@@ -1578,7 +1634,139 @@ def missing_intervals(
     return missing
 
 
-@lru_cache(maxsize=None)
+_KEEP_BOUND: t.Any = object()
+"""The default of `MissingIntervalsCache.configure` bounds, which keeps the current bound."""
+
+
+class MissingIntervalsCache:
+    """A bounded cache for the results of `compute_missing_intervals`.
+
+    In the incremental mode, when there's no entry for the given intervals but there is one for the same
+    time range which was computed for a subset of these intervals (eg. before a new interval was added to
+    a snapshot), the new result is derived from the previous one by only rechecking intervals that were
+    missing before. Adding intervals can't make a present interval missing. The latest intervals of each
+    time range are stored alongside the results, so they count towards the same bounds.
+
+    Args:
+        max_entries: The maximum number of cached results and latest intervals.
+        max_bytes: The maximum estimated size of cached results and latest intervals in bytes.
+        eviction_policy: The policy used to pick results to evict.
+        incremental: Whether to derive new results from previous results for the same time range.
+    """
+
+    def __init__(
+        self,
+        max_entries: t.Optional[int] = 100_000,
+        max_bytes: t.Optional[int] = 256 * 1024 * 1024,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+        incremental: bool = True,
+    ):
+        self.incremental = incremental
+        self.incremental_hits = 0
+        # Results are keyed by (params, intervals) and the latest intervals by (params, None).
+        self._results: BoundedCache[t.Tuple, t.Any] = BoundedCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            eviction_policy=eviction_policy,
+            sizeof=_missing_intervals_sizeof,
+        )
+
+    def get_or_compute(
+        self,
+        interval_unit: IntervalUnit,
+        intervals: t.Tuple[Interval, ...],
+        start_ts: int,
+        end_ts: int,
+        upper_bound_ts: int,
+        lookback: int,
+    ) -> Intervals:
+        params = (interval_unit, start_ts, end_ts, upper_bound_ts, lookback)
+
+        result = self._results.get((params, intervals))
+        if result is None:
+            result = self._compute_incrementally(params, intervals) if self.incremental else None
+            if result is None:
+                result = _compute_missing_intervals(interval_unit, intervals, *params[1:])
+            else:
+                self.incremental_hits += 1
+            self._results.put((params, intervals), result)
+            if self.incremental:
+                self._results.put((params, None), intervals)
+
+        return result[0]
+
+    def configure(
+        self,
+        max_entries: t.Optional[int] = _KEEP_BOUND,
+        max_bytes: t.Optional[int] = _KEEP_BOUND,
+        eviction_policy: t.Optional[EvictionPolicy] = None,
+        incremental: t.Optional[bool] = None,
+    ) -> None:
+        """Updates the bounds and the behavior of this cache.
+
+        Args:
+            max_entries: The new maximum number of cached entries, or None to remove the bound. The
+                current bound is kept if not set.
+            max_bytes: The new maximum estimated size of cached entries in bytes, or None to remove
+                the bound. The current bound is kept if not set.
+            eviction_policy: The new eviction policy. The current policy is kept if not set.
+            incremental: Whether to enable the incremental mode. The current mode is kept if not set.
+        """
+        self._results.configure(
+            max_entries if max_entries is not _KEEP_BOUND else self._results.max_entries,
+            max_bytes if max_bytes is not _KEEP_BOUND else self._results.max_bytes,
+            eviction_policy,
+        )
+        if incremental is not None:
+            self.incremental = incremental
+
+    def clear(self) -> None:
+        """Removes all cached results."""
+        self._results.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns the hit, miss and eviction counters. Incrementally derived results are counted as misses."""
+        return self._results.stats
+
+    def _compute_incrementally(
+        self, params: t.Tuple, intervals: t.Tuple[Interval, ...]
+    ) -> t.Optional[_MissingIntervals]:
+        previous_intervals = self._results.peek((params, None))
+        if previous_intervals is None:
+            return None
+        previous_result = self._results.peek((params, previous_intervals))
+        if previous_result is None:
+            return None
+
+        interval_set = IntervalSet(intervals)
+        if not all(interval_set.covers(start, end) for start, end in previous_intervals):
+            return None
+
+        missing = []
+        missing_compare_ts = []
+        for interval, compare_ts in zip(*previous_result):
+            if not interval_set.covers(interval[0], compare_ts + 1):
+                missing.append(interval)
+                missing_compare_ts.append(compare_ts)
+        return missing, missing_compare_ts
+
+
+_INTERVAL_SIZE_BYTES = sys.getsizeof((0, 0)) + 2 * sys.getsizeof(2**40) + 8
+
+
+def _missing_intervals_sizeof(key: t.Tuple, value: t.Any) -> int:
+    _, intervals = key
+    if intervals is None:
+        return _INTERVAL_SIZE_BYTES * len(value) + 256
+    missing, _ = value
+    return _INTERVAL_SIZE_BYTES * (len(intervals) + 2 * len(missing)) + 256
+
+
+MISSING_INTERVALS_CACHE = MissingIntervalsCache()
+"""The cache used by `compute_missing_intervals`. Use `MISSING_INTERVALS_CACHE.configure` to change its bounds."""
+
+
 def compute_missing_intervals(
     interval_unit: IntervalUnit,
     intervals: t.Tuple[Interval, ...],
@@ -1589,6 +1777,8 @@ def compute_missing_intervals(
 ) -> Intervals:
     """Computes all missing intervals between start and end given intervals.
 
+    Results are cached in `MISSING_INTERVALS_CACHE`.
+
     Args:
         interval_unit: The interval unit.
         intervals: The intervals to check what's missing.
@@ -1600,6 +1790,86 @@ def compute_missing_intervals(
     Returns:
         A list of all timestamps in this range.
     """
+    return MISSING_INTERVALS_CACHE.get_or_compute(
+        interval_unit, intervals, start_ts, end_ts, upper_bound_ts, lookback
+    )
+
+
+def _compute_missing_intervals(
+    interval_unit: IntervalUnit,
+    intervals: t.Tuple[Interval, ...],
+    start_ts: int,
+    end_ts: int,
+    upper_bound_ts: int,
+    lookback: int,
+) -> _MissingIntervals:
+    if interval_seconds(interval_unit.cron_expr):
+        return _compute_missing_intervals_vectorized(
+            interval_unit, intervals, start_ts, end_ts, upper_bound_ts, lookback
+        )
+    return _compute_missing_intervals_iterative(
+        interval_unit, intervals, start_ts, end_ts, upper_bound_ts, lookback
+    )
+
+
+def _compute_missing_intervals_vectorized(
+    interval_unit: IntervalUnit,
+    intervals: t.Tuple[Interval, ...],
+    start_ts: int,
+    end_ts: int,
+    upper_bound_ts: int,
+    lookback: int,
+) -> _MissingIntervals:
+    """Same as `_compute_missing_intervals_iterative` but for interval units with a fixed width.
+
+    The grid of interval timestamps is generated in bulk and the coverage of each interval is
+    determined using a binary search over the boundaries of existing intervals.
+    """
+    step = interval_seconds(interval_unit.cron_expr) * 1000
+    ticks_num = max(-(-(end_ts - start_ts) // step), 1)
+    lookback_ticks_num = min(lookback, max(-(-(upper_bound_ts - start_ts) // step) - ticks_num, 0))
+    timestamps = start_ts + np.arange(ticks_num + lookback_ticks_num, dtype=np.int64) * step
+
+    current_ts = timestamps[timestamps < end_ts]
+    if not len(current_ts):
+        return [], []
+
+    indices = np.arange(len(current_ts))
+    next_ts = np.where(
+        indices + 1 < len(timestamps),
+        timestamps[np.minimum(indices + 1, len(timestamps) - 1)],
+        np.minimum(current_ts + step, upper_bound_ts),
+    )
+    compare_ts = timestamps[np.minimum(indices + lookback, len(timestamps) - 1)]
+
+    bounds = np.frombuffer(IntervalSet(intervals)._bounds, dtype=np.int64)
+    positions = np.searchsorted(bounds, current_ts, side="right")
+    covered = (positions % 2 == 1) & (
+        compare_ts < bounds[np.minimum(positions, len(bounds) - 1)] if len(bounds) else False
+    )
+
+    missing = ~covered
+    return (
+        list(zip(current_ts[missing].tolist(), next_ts[missing].tolist())),
+        compare_ts[missing].tolist(),
+    )
+
+
+def _compute_missing_intervals_iterative(
+    interval_unit: IntervalUnit,
+    intervals: t.Tuple[Interval, ...],
+    start_ts: int,
+    end_ts: int,
+    upper_bound_ts: int,
+    lookback: int,
+) -> _MissingIntervals:
+    """Computes all missing intervals between start and end given intervals by stepping through
+    the interval unit's cron schedule.
+
+    Returns:
+        A list of all missing intervals in this range and a list with the start of the last lookback
+        interval for each of them.
+    """
     croniter = interval_unit.croniter(start_ts)
     timestamps = [start_ts]
 
@@ -1621,7 +1891,9 @@ def compute_missing_intervals(
         else:
             break
 
+    interval_set = IntervalSet(intervals)
     missing = []
+    missing_compare_ts = []
     for i in range(len(timestamps)):
         if timestamps[i] >= end_ts:
             break
@@ -1635,16 +1907,13 @@ def compute_missing_intervals(
         )
         compare_ts = seq_get(timestamps, i + lookback) or timestamps[-1]
 
-        for low, high in intervals:
-            if compare_ts < low:
-                missing.append((current_ts, next_ts))
-                break
-            elif current_ts >= low and compare_ts < high:
-                break
-        else:
+        # The interval is present if everything from its start up to and including the start of the
+        # last lookback interval is covered.
+        if not interval_set.covers(current_ts, compare_ts + 1):
             missing.append((current_ts, next_ts))
+            missing_compare_ts.append(compare_ts)
 
-    return missing
+    return missing, missing_compare_ts
 
 
 def earliest_start_date(
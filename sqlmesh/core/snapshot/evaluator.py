@@ -23,19 +23,23 @@ For more information about audits, see `sqlmesh.core.audit`.
 from __future__ import annotations
 
 import abc
+import itertools
 import logging
+import time
 import typing as t
 from collections import defaultdict
 from contextlib import contextmanager
+from dataclasses import dataclass
 from functools import reduce
 
 import pandas as pd
-from sqlglot import exp, select
+from sqlglot import exp
 from sqlglot.executor import execute
 
 from sqlmesh.core import constants as c
 from sqlmesh.core import dialect as d
 from sqlmesh.core.audit import Audit, AuditResult
+from sqlmesh.core.audit.planner import AuditQuery, plan_audit_queries
 from sqlmesh.core.dialect import schema_
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.engine_adapter.shared import InsertOverwriteStrategy
@@ -43,6 +47,7 @@ from sqlmesh.core.macros import RuntimeStage
 from sqlmesh.core.model import (
     IncrementalUnmanagedKind,
     Model,
+    PythonModel,
     SeedModel,
     SCDType2ByColumnKind,
     SCDType2ByTimeKind,
@@ -63,9 +68,11 @@ from sqlmesh.utils import random_id
 from sqlmesh.utils.concurrency import (
     concurrent_apply_to_snapshots,
     concurrent_apply_to_values,
+    prefetch,
 )
 from sqlmesh.utils.date import TimeLike, now
 from sqlmesh.utils.errors import AuditError, ConfigError, SQLMeshError
+from sqlmesh.utils.pandas import columns_to_types_from_df, rechunk_dfs
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
@@ -74,6 +81,25 @@ if t.TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ChunkMetrics:
+    """Metrics of a single chunk yielded by a streaming Python model.
+
+    Args:
+        index: The position of the chunk in the model's output.
+        rows: The number of rows in the chunk, if it's a pandas DataFrame.
+        bytes: The in-memory size of the chunk, if it's a pandas DataFrame.
+        wait_seconds: The time spent waiting for the model to produce the chunk.
+        insert_seconds: The time spent inserting the chunk.
+    """
+
+    index: int
+    rows: t.Optional[int]
+    bytes: t.Optional[int]
+    wait_seconds: float
+    insert_seconds: float
+
+
 class SnapshotEvaluator:
     """Evaluates a snapshot given runtime arguments through an arbitrary EngineAdapter.
 
@@ -85,11 +111,28 @@ class SnapshotEvaluator:
         adapter: The adapter that interfaces with the execution engine.
         ddl_concurrent_tasks: The number of concurrent tasks used for DDL
             operations (table / view creation, deletion, etc). Default: 1.
+        audit_concurrent_tasks: The number of concurrent tasks used to run the audit queries
+            of a snapshot. Default: 1.
+        df_staging_chunk_size: If set, DataFrames which are combined before overwriting a table are
+            instead appended to a temporary table in chunks of this many rows. Default: None.
     """
 
-    def __init__(self, adapter: EngineAdapter, ddl_concurrent_tasks: int = 1):
+    # The number of chunks a streaming Python model can produce ahead of the chunk being inserted.
+    STREAMING_PREFETCH_SIZE = 1
+
+    def __init__(
+        self,
+        adapter: EngineAdapter,
+        ddl_concurrent_tasks: int = 1,
+        audit_concurrent_tasks: int = 1,
+        df_staging_chunk_size: t.Optional[int] = None,
+    ):
         self.adapter = adapter
         self.ddl_concurrent_tasks = ddl_concurrent_tasks
+        self.audit_concurrent_tasks = audit_concurrent_tasks
+        self.df_staging_chunk_size = df_staging_chunk_size
+        # Per-chunk metrics of the latest evaluation of each streaming Python model.
+        self.chunk_metrics: t.Dict[SnapshotId, t.List[ChunkMetrics]] = {}
 
     def evaluate(
         self,
@@ -392,28 +435,22 @@ class SnapshotEvaluator:
             kwargs["table_mapping"] = table_mapping
             kwargs["this_model"] = exp.to_table(wap_table_name, dialect=self.adapter.dialect)
 
-        results = []
-
         audits_with_args = snapshot.audits_with_args
 
         if audits_with_args:
             logger.info("Auditing snapshot %s", snapshot.snapshot_id)
 
-        for audit, audit_args in snapshot.audits_with_args:
-            results.append(
-                self._audit(
-                    audit=audit,
-                    audit_args=audit_args,
-                    snapshot=snapshot,
-                    snapshots=snapshots,
-                    start=start,
-                    end=end,
-                    execution_time=execution_time,
-                    raise_exception=raise_exception,
-                    deployability_index=deployability_index,
-                    **kwargs,
-                )
-            )
+        results = self._audit(
+            audits_with_args=audits_with_args,
+            snapshot=snapshot,
+            snapshots=snapshots,
+            start=start,
+            end=end,
+            execution_time=execution_time,
+            raise_exception=raise_exception,
+            deployability_index=deployability_index,
+            **kwargs,
+        )
 
         if wap_id is not None:
             logger.info(
@@ -580,8 +617,8 @@ class SnapshotEvaluator:
             # DataFrames, unlike SQL expressions, can provide partial results by yielding dataframes. As a result,
             # if the engine supports INSERT OVERWRITE or REPLACE WHERE and the snapshot is incremental by time range, we risk
             # having a partial result since each dataframe write can re-truncate partitions. To avoid this, we
-            # union all the dataframes together before writing. For pandas this could result in OOM and a potential
-            # workaround for that would be to serialize pandas to disk and then read it back with Spark.
+            # union all the dataframes together before writing. For pandas this could result in OOM, so pandas
+            # dataframes can instead be staged in a temporary table which is then written with a single statement.
             # Note: We assume that if multiple things are yielded from `queries_or_dfs` that they are dataframes
             # and not SQL expressions.
             elif (
@@ -589,15 +626,31 @@ class SnapshotEvaluator:
                 in (InsertOverwriteStrategy.INSERT_OVERWRITE, InsertOverwriteStrategy.REPLACE_WHERE)
                 and snapshot.is_incremental_by_time_range
             ):
-                query_or_df = reduce(
-                    lambda a, b: (
-                        pd.concat([a, b], ignore_index=True)  # type: ignore
-                        if isinstance(a, pd.DataFrame)
-                        else a.union_all(b)  # type: ignore
-                    ),  # type: ignore
-                    queries_or_dfs,
-                )
-                apply(query_or_df, index=0)
+                first_query_or_df = None
+                if self.df_staging_chunk_size is not None:
+                    first_query_or_df = next(queries_or_dfs, None)
+                    if first_query_or_df is not None:
+                        queries_or_dfs = itertools.chain([first_query_or_df], queries_or_dfs)
+
+                if isinstance(first_query_or_df, pd.DataFrame):
+                    self._apply_staged(
+                        snapshot,
+                        queries_or_dfs,  # type: ignore
+                        apply,
+                        deployability_index,
+                    )
+                else:
+                    query_or_df = reduce(
+                        lambda a, b: (
+                            pd.concat([a, b], ignore_index=True)  # type: ignore
+                            if isinstance(a, pd.DataFrame)
+                            else a.union_all(b)  # type: ignore
+                        ),  # type: ignore
+                        queries_or_dfs,
+                    )
+                    apply(query_or_df, index=0)
+            elif isinstance(model, PythonModel) and model.streaming:
+                self._apply_streaming(snapshot, queries_or_dfs, apply)
             else:
                 for index, query_or_df in enumerate(queries_or_dfs):
                     apply(query_or_df, index)
@@ -607,6 +660,99 @@ class SnapshotEvaluator:
 
             return wap_id
 
+    def _apply_staged(
+        self,
+        snapshot: Snapshot,
+        dfs: t.Iterator[pd.DataFrame],
+        apply: t.Callable[[QueryOrDF, int], None],
+        deployability_index: DeployabilityIndex,
+    ) -> None:
+        """Appends DataFrames to a temporary table and applies them from that table at once.
+
+        Only one chunk of rows is held in memory at a time, unlike combining all DataFrames before applying them.
+        """
+        assert self.df_staging_chunk_size is not None
+
+        first_df = next(dfs)
+        second_df = next(dfs, None)
+        if second_df is None:
+            apply(first_df, 0)
+            return
+
+        columns_to_types = snapshot.model.columns_to_types or columns_to_types_from_df(first_df)
+
+        staging_table = self.adapter._get_temp_table(
+            snapshot.table_name(is_deployable=deployability_index.is_deployable(snapshot))
+        )
+        self.adapter.create_table(staging_table, columns_to_types)
+        try:
+            rows = 0
+            for chunk in rechunk_dfs(
+                itertools.chain([first_df, second_df], dfs), self.df_staging_chunk_size
+            ):
+                self.adapter.insert_append(staging_table, chunk, columns_to_types=columns_to_types)
+                rows += len(chunk.index)
+            logger.info(
+                "Staged %s rows of snapshot %s in '%s'", rows, snapshot.snapshot_id, staging_table
+            )
+
+            apply(
+                exp.select(*(exp.column(name, quoted=True) for name in columns_to_types)).from_(
+                    staging_table
+                ),
+                0,
+            )
+        finally:
+            self.adapter.drop_table(staging_table)
+
+    def _apply_streaming(
+        self,
+        snapshot: Snapshot,
+        queries_or_dfs: t.Iterator[QueryOrDF],
+        apply: t.Callable[[QueryOrDF, int], None],
+    ) -> None:
+        """Applies chunks yielded by a streaming Python model while the next chunk is being produced.
+
+        Only a bounded number of chunks is produced ahead of the one being inserted, so memory usage is
+        proportional to the chunk size rather than the size of the model's whole output. Models can use
+        the engine adapter while producing chunks, so chunks are only produced in the background when
+        each thread uses its own connection. The connection of the background thread is closed once
+        it's done. Otherwise, chunks are produced in between inserts.
+        """
+        chunk_metrics: t.List[ChunkMetrics] = []
+        self.chunk_metrics[snapshot.snapshot_id] = chunk_metrics
+
+        chunks: t.Iterator[QueryOrDF] = (
+            prefetch(
+                queries_or_dfs,
+                max_prefetched=self.STREAMING_PREFETCH_SIZE,
+                on_exit=self.adapter.close_thread_connection,
+            )
+            if self.adapter.uses_thread_local_connections
+            else queries_or_dfs
+        )
+
+        wait_start = time.perf_counter()
+        for index, query_or_df in enumerate(chunks):
+            insert_start = time.perf_counter()
+            rows, size = None, None
+            if isinstance(query_or_df, pd.DataFrame):
+                rows = len(query_or_df.index)
+                size = int(query_or_df.memory_usage(index=False, deep=True).sum())
+
+            apply(query_or_df, index)
+
+            metrics = ChunkMetrics(
+                index=index,
+                rows=rows,
+                bytes=size,
+                wait_seconds=insert_start - wait_start,
+                insert_seconds=time.perf_counter() - insert_start,
+            )
+            chunk_metrics.append(metrics)
+            logger.info("Inserted chunk of snapshot %s: %s", snapshot.snapshot_id, metrics)
+            wait_start = time.perf_counter()
+
     def _create_snapshot(
         self,
         snapshot: Snapshot,
@@ -788,8 +934,7 @@ class SnapshotEvaluator:
 
     def _audit(
         self,
-        audit: Audit,
-        audit_args: t.Dict[t.Any, t.Any],
+        audits_with_args: t.List[t.Tuple[Audit, t.Dict[t.Any, t.Any]]],
         snapshot: Snapshot,
         snapshots: t.Dict[str, Snapshot],
         start: t.Optional[TimeLike],
@@ -798,47 +943,100 @@ class SnapshotEvaluator:
         raise_exception: bool,
         deployability_index: t.Optional[DeployabilityIndex],
         **kwargs: t.Any,
-    ) -> AuditResult:
-        if audit.skip:
-            return AuditResult(
-                audit=audit,
-                model=snapshot.model_or_none,
-                skipped=True,
+    ) -> t.List[AuditResult]:
+        rendered_audits = [
+            (
+                audit,
+                audit.render_query(
+                    snapshot,
+                    start=start,
+                    end=end,
+                    execution_time=execution_time,
+                    snapshots=snapshots,
+                    deployability_index=deployability_index,
+                    engine_adapter=self.adapter,
+                    **audit_args,
+                    **kwargs,
+                ),
             )
+            for audit, audit_args in audits_with_args
+            if not audit.skip
+        ]
 
-        query = audit.render_query(
-            snapshot,
-            start=start,
-            end=end,
-            execution_time=execution_time,
-            snapshots=snapshots,
-            deployability_index=deployability_index,
-            engine_adapter=self.adapter,
-            **audit_args,
-            **kwargs,
-        )
-        count, *_ = self.adapter.fetchone(
-            select("COUNT(*)").from_(query.subquery("audit")),
-            quote_identifiers=True,
+        # Compatible built-in audits are fused into a single scan of the audited table.
+        audit_queries = plan_audit_queries(rendered_audits)
+
+        def _fetch_counts(audit_query: AuditQuery) -> t.List[t.Tuple[int, int]]:
+            row = self.adapter.fetchone(audit_query.query, quote_identifiers=True)
+            if row is None:
+                raise SQLMeshError(
+                    f"Audit query for snapshot {snapshot.snapshot_id} returned no rows: "
+                    f"{audit_query.query.sql(dialect=self.adapter.dialect)}"
+                )
+            return list(zip(audit_query.indices, row))
+
+        def _fetch_counts_in_worker(audit_query: AuditQuery) -> t.List[t.Tuple[int, int]]:
+            # Only the worker's own connection is closed, since other threads may still be using
+            # theirs to evaluate other snapshots.
+            try:
+                return _fetch_counts(audit_query)
+            finally:
+                self.adapter.close_thread_connection()
+
+        counts: t.Dict[int, int] = {}
+        # Audit queries can only run in parallel if each thread gets its own connection.
+        tasks_num = (
+            min(self.audit_concurrent_tasks, len(audit_queries)) or 1
+            if self.adapter.uses_thread_local_connections
+            else 1
         )
-        if count and raise_exception:
-            audit_error = AuditError(
-                audit_name=audit.name,
-                model=snapshot.model_or_none,
-                count=count,
-                query=query,
-                adapter_dialect=self.adapter.dialect,
+        if tasks_num > 1:
+            for audit_counts in concurrent_apply_to_values(
+                audit_queries, _fetch_counts_in_worker, tasks_num
+            ):
+                counts.update(audit_counts)
+        else:
+            for audit_query in audit_queries:
+                counts.update(_fetch_counts(audit_query))
+
+        results = []
+        rendered_audits_iter = iter(enumerate(rendered_audits))
+        for audit, _ in audits_with_args:
+            if audit.skip:
+                results.append(
+                    AuditResult(
+                        audit=audit,
+                        model=snapshot.model_or_none,
+                        skipped=True,
+                    )
+                )
+                continue
+
+            index, (_, query) = next(rendered_audits_iter)
+            count = counts[index]
+            if count and raise_exception:
+                audit_error = AuditError(
+                    audit_name=audit.name,
+                    model=snapshot.model_or_none,
+                    count=count,
+                    query=query,
+                    adapter_dialect=self.adapter.dialect,
+                )
+                if audit.blocking:
+                    raise audit_error
+                else:
+                    logger.warning(
+                        f"{audit_error}\nAudit is warn only so proceeding with execution."
+                    )
+            results.append(
+                AuditResult(
+                    audit=audit,
+                    model=snapshot.model_or_none,
+                    count=count,
+                    query=query,
+                )
             )
-            if audit.blocking:
-                raise audit_error
-            else:
-                logger.warning(f"{audit_error}\nAudit is warn only so proceeding with execution.")
-        return AuditResult(
-            audit=audit,
-            model=snapshot.model_or_none,
-            count=count,
-            query=query,
-        )
+        return results
 
     def _create_schemas(self, tables: t.Iterable[t.Union[exp.Table, str]]) -> None:
         table_exprs = [exp.to_table(t) for t in tables]
@@ -287,12 +287,18 @@ class StateSync(StateReader, abc.ABC):
         """
 
     @abc.abstractmethod
-    def delete_expired_snapshots(self) -> t.List[SnapshotTableCleanupTask]:
+    def delete_expired_snapshots(
+        self, time_budget: t.Optional[float] = None
+    ) -> t.List[SnapshotTableCleanupTask]:
         """Removes expired snapshots.
 
         Expired snapshots are snapshots that have exceeded their time-to-live
         and are no longer in use within an environment.
 
+        Args:
+            time_budget: The maximum time in seconds to spend on deleting expired snapshots. Snapshots
+                that weren't deleted within the budget are deleted by subsequent calls.
+
         Returns:
             The list of table cleanup tasks.
         """
@@ -38,7 +38,6 @@ from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.environment import Environment
 from sqlmesh.core.model import ModelCache, ModelKindName, SeedModel
 from sqlmesh.core.snapshot import (
-    Intervals,
     Node,
     Snapshot,
     SnapshotFingerprint,
@@ -54,16 +53,17 @@ from sqlmesh.core.snapshot import (
 )
 from sqlmesh.core.snapshot.definition import (
     Interval,
+    IntervalSet,
     _parents_from_node,
-    merge_intervals,
-    remove_interval,
 )
 from sqlmesh.core.state_sync.base import MIGRATIONS, SCHEMA_VERSION, StateSync, Versions
 from sqlmesh.core.state_sync.common import CommonStateSyncMixin, transactional
-from sqlmesh.utils import major_minor, random_id, unique
+from sqlmesh.utils import major_minor, random_id
+from sqlmesh.utils.cache import CacheBackend
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import TimeLike, now_timestamp, time_like_to_str
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.migration import index_text_type
 from sqlmesh.utils.pydantic import parse_obj_as
 
 logger = logging.getLogger(__name__)
@@ -95,9 +95,11 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         schema: The schema to store state metadata in. If None or empty string then no schema is defined
         console: The console to log information to.
         context_path: The context path, used for caching snapshot models.
+        cache_backend: The storage used for caching snapshot models.
     """
 
     INTERVAL_BATCH_SIZE = 1000
+    INTERVAL_COMPACTION_BATCH_SIZE = 100
     SNAPSHOT_BATCH_SIZE = 1000
     SNAPSHOT_MIGRATION_BATCH_SIZE = 500
 
@@ -107,15 +109,19 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         schema: t.Optional[str],
         console: t.Optional[Console] = None,
         context_path: Path = Path(),
+        cache_backend: CacheBackend = CacheBackend.FILE,
     ):
         # Make sure that if an empty string is provided that we treat it as None
         self.schema = schema or None
         self.engine_adapter = engine_adapter
         self._context_path = context_path
+        self._cache_backend = cache_backend
         self.console = console or get_console()
         self.snapshots_table = exp.table_("_snapshots", db=self.schema)
         self.environments_table = exp.table_("_environments", db=self.schema)
+        self.environment_snapshots_table = exp.table_("_environment_snapshots", db=self.schema)
         self.intervals_table = exp.table_("_intervals", db=self.schema)
+        self.interval_summaries_table = exp.table_("_interval_summaries", db=self.schema)
         self.plan_dags_table = exp.table_("_plan_dags", db=self.schema)
         self.versions_table = exp.table_("_versions", db=self.schema)
 
@@ -126,6 +132,9 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             "snapshot": exp.DataType.build("text"),
             "kind_name": exp.DataType.build("text"),
             "expiration_ts": exp.DataType.build("bigint"),
+            "table_info": exp.DataType.build("text"),
+            "unpaused_ts": exp.DataType.build("bigint"),
+            "updated_ts": exp.DataType.build("bigint"),
         }
 
         self._environment_columns_to_types = {
@@ -143,6 +152,13 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             "previous_finalized_snapshots": exp.DataType.build("text"),
         }
 
+        index_type = index_text_type(self.engine_adapter.dialect)
+        self._environment_snapshot_columns_to_types = {
+            "environment": exp.DataType.build(index_type),
+            "name": exp.DataType.build(index_type),
+            "identifier": exp.DataType.build(index_type),
+        }
+
         self._interval_columns_to_types = {
             "id": exp.DataType.build("text"),
             "created_ts": exp.DataType.build("bigint"),
@@ -156,6 +172,15 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             "is_compacted": exp.DataType.build("boolean"),
         }
 
+        self._interval_summary_columns_to_types = {
+            "name": exp.DataType.build("text"),
+            "identifier": exp.DataType.build("text"),
+            "version": exp.DataType.build("text"),
+            "intervals": exp.DataType.build("text"),
+            "dev_intervals": exp.DataType.build("text"),
+            "updated_ts": exp.DataType.build("bigint"),
+        }
+
         self._version_columns_to_types = {
             "schema_version": exp.DataType.build("int"),
             "sqlglot_version": exp.DataType.build("text"),
@@ -256,62 +281,96 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         )
 
     @transactional()
-    def delete_expired_snapshots(self) -> t.List[SnapshotTableCleanupTask]:
+    def delete_expired_snapshots(
+        self, time_budget: t.Optional[float] = None
+    ) -> t.List[SnapshotTableCleanupTask]:
+        start_ts = time.perf_counter()
         current_ts = now_timestamp(minute_floor=False)
+        alias = self.snapshots_table.name
+
+        expired_filter = exp.and_(
+            exp.column("expiration_ts", table=alias) <= current_ts,
+            exp.not_(
+                exp.Exists(
+                    this=exp.select("1")
+                    .from_(self.environment_snapshots_table.as_("environment_snapshots"))
+                    .where(
+                        exp.column("name", table="environment_snapshots").eq(
+                            exp.column("name", table=alias)
+                        ),
+                        exp.column("identifier", table="environment_snapshots").eq(
+                            exp.column("identifier", table=alias)
+                        ),
+                    )
+                )
+            ),
+        )
 
-        expired_query = (
-            exp.select("name", "identifier", "version")
+        expired_versions = {}
+        for name, version in self._fetchall(
+            exp.select("name", "version")
+            .distinct()
             .from_(self.snapshots_table)
-            .where(exp.column("expiration_ts") <= current_ts)
-        )
-        expired_candidates = {
-            SnapshotId(name=name, identifier=identifier): SnapshotNameVersion(
-                name=name, version=version
-            )
-            for name, identifier, version in self._fetchall(expired_query)
-        }
-        if not expired_candidates:
+            .where(expired_filter)
+            .order_by("name", "version")
+        ):
+            expired_versions[(name, version)] = SnapshotNameVersion(name=name, version=version)
+        if not expired_versions:
             return []
 
-        promoted_snapshot_ids = {
-            snapshot.snapshot_id
-            for environment in self.get_environments()
-            for snapshot in environment.snapshots
-        }
+        cleanup_targets = []
+        for i, versions_batch in enumerate(self._batches(list(expired_versions.values()))):
+            # At least one batch is processed to guarantee progress regardless of the budget.
+            if i > 0 and time_budget is not None:
+                if time.perf_counter() - start_ts > time_budget:
+                    logger.info(
+                        "Exceeded the time budget of %s seconds, the remaining expired snapshots will be deleted later",
+                        time_budget,
+                    )
+                    break
+
+            # Snapshots which are still expired are locked and deleted by their IDs, so that
+            # cleanup targets are derived from the rows which were actually deleted.
+            deleted_snapshot_ids: t.Set[SnapshotId] = set()
+            for where in self._snapshot_name_version_filter(versions_batch, alias=alias):
+                query = (
+                    exp.select("name", "identifier")
+                    .from_(self.snapshots_table)
+                    .where(exp.and_(where, expired_filter))
+                )
+                if self.engine_adapter.SUPPORTS_ROW_LEVEL_OP:
+                    query = query.lock(copy=False)
+                deleted_snapshot_ids.update(
+                    SnapshotId(name=name, identifier=identifier)
+                    for name, identifier in self._fetchall(query)
+                )
+            if not deleted_snapshot_ids:
+                continue
 
-        def _is_snapshot_used(snapshot: Snapshot) -> bool:
-            return (
-                snapshot.snapshot_id in promoted_snapshot_ids
-                or snapshot.snapshot_id not in expired_candidates
-            )
+            snapshots = self._get_snapshot_records(name_versions=versions_batch)
 
-        unique_expired_versions = unique(expired_candidates.values())
-        version_batches = self._batches(unique_expired_versions)
-        cleanup_targets = []
-        for versions_batch in version_batches:
-            snapshots = self._get_snapshots_with_same_version(versions_batch)
+            for where in self._snapshot_id_filter(deleted_snapshot_ids):
+                self.engine_adapter.delete_from(self.snapshots_table, where=where)
 
             snapshots_by_version = defaultdict(set)
             snapshots_by_temp_version = defaultdict(set)
             for s in snapshots:
-                snapshots_by_version[(s.name, s.version)].add(s.snapshot_id)
+                snapshots_by_version[(s.name, s.version)].add(s.identifier)
                 snapshots_by_temp_version[(s.name, s.temp_version_get_or_generate())].add(
-                    s.snapshot_id
+                    s.identifier
                 )
 
-            expired_snapshots = [s for s in snapshots if not _is_snapshot_used(s)]
-
-            if expired_snapshots:
-                self.delete_snapshots(expired_snapshots)
+            for snapshot in snapshots:
+                if snapshot.snapshot_id not in deleted_snapshot_ids:
+                    continue
 
-            for snapshot in expired_snapshots:
                 shared_version_snapshots = snapshots_by_version[(snapshot.name, snapshot.version)]
-                shared_version_snapshots.discard(snapshot.snapshot_id)
+                shared_version_snapshots.discard(snapshot.identifier)
 
                 shared_temp_version_snapshots = snapshots_by_temp_version[
                     (snapshot.name, snapshot.temp_version_get_or_generate())
                 ]
-                shared_temp_version_snapshots.discard(snapshot.snapshot_id)
+                shared_temp_version_snapshots.discard(snapshot.identifier)
 
                 if not shared_temp_version_snapshots:
                     cleanup_targets.append(
@@ -342,6 +401,11 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             self.environments_table,
             where=filter_expr,
         )
+        if environments:
+            self.engine_adapter.delete_from(
+                self.environment_snapshots_table,
+                where=exp.column("environment").isin(*(e.name for e in environments)),
+            )
 
         return environments
 
@@ -372,6 +436,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         """Resets the state store to the state when it was first initialized."""
         self.engine_adapter.drop_table(self.snapshots_table)
         self.engine_adapter.drop_table(self.environments_table)
+        self.engine_adapter.drop_table(self.environment_snapshots_table)
         self.engine_adapter.drop_table(self.versions_table)
         self.migrate(default_catalog)
 
@@ -390,12 +455,29 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             columns_to_types=self._environment_columns_to_types,
         )
 
+        self.engine_adapter.delete_from(
+            self.environment_snapshots_table,
+            where=exp.column("environment").eq(environment.name),
+        )
+        if environment.snapshots:
+            self.engine_adapter.insert_append(
+                self.environment_snapshots_table,
+                _environment_snapshots_to_df(environment),
+                columns_to_types=self._environment_snapshot_columns_to_types,
+            )
+
     def _update_snapshot(self, snapshot: Snapshot) -> None:
         snapshot.updated_ts = now_timestamp()
         for where in self._snapshot_id_filter([snapshot.snapshot_id]):
             self.engine_adapter.update_table(
                 self.snapshots_table,
-                {"snapshot": _snapshot_to_json(snapshot), "expiration_ts": snapshot.expiration_ts},
+                {
+                    "snapshot": _snapshot_to_json(snapshot),
+                    "expiration_ts": snapshot.expiration_ts,
+                    "table_info": _snapshot_table_info_to_json(snapshot),
+                    "unpaused_ts": snapshot.unpaused_ts,
+                    "updated_ts": snapshot.updated_ts,
+                },
                 where=where,
             )
 
@@ -469,7 +551,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         """
         snapshots: t.Dict[SnapshotId, Snapshot] = {}
         duplicates: t.Dict[SnapshotId, Snapshot] = {}
-        model_cache = ModelCache(self._context_path / c.CACHE)
+        model_cache = ModelCache(self._context_path / c.CACHE, backend=self._cache_backend)
 
         for query in self._get_snapshots_expressions(snapshot_ids, lock_for_update):
             for serialized_snapshot, name, identifier, _ in self._fetchall(query):
@@ -490,7 +572,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                     snapshots[snapshot_id] = snapshot
 
         if snapshots and hydrate_intervals:
-            _, intervals = self._get_snapshot_intervals(snapshots.values())
+            intervals = self._get_snapshot_intervals(snapshots.values())
             Snapshot.hydrate_with_intervals_by_version(snapshots.values(), intervals)
 
         if duplicates:
@@ -533,6 +615,50 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
 
         return [Snapshot(**json.loads(row[0])) for row in snapshot_rows]
 
+    def _get_snapshot_records(
+        self,
+        snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]] = None,
+        name_versions: t.Optional[t.Iterable[SnapshotNameVersionLike]] = None,
+        lock_for_update: bool = False,
+    ) -> t.List[SnapshotRecord]:
+        """Fetches lightweight records of snapshots without reading their serialized nodes.
+
+        Only the indexed columns and the table info of snapshots are read, which makes this much
+        cheaper than fetching full snapshots. Use `_get_snapshots` with the IDs of records to fetch
+        full snapshots on demand.
+
+        Args:
+            snapshot_ids: The IDs of snapshots to fetch. All snapshots are fetched if neither IDs nor
+                name versions are provided.
+            name_versions: The names and versions of snapshots to fetch.
+            lock_for_update: Lock the snapshot rows for future update.
+
+        Returns:
+            The list of snapshot records.
+        """
+        if snapshot_ids is not None:
+            filters: t.Iterable[t.Optional[exp.Condition]] = self._snapshot_id_filter(
+                snapshot_ids, alias="snapshots"
+            )
+        elif name_versions is not None:
+            filters = self._snapshot_name_version_filter(name_versions)
+        else:
+            filters = [None]
+
+        records: t.List[SnapshotRecord] = []
+        for where in filters:
+            query = (
+                exp.select(
+                    *(f"snapshots.{column}" for column in SnapshotRecord.COLUMNS),
+                )
+                .from_(exp.to_table(self.snapshots_table).as_("snapshots"))
+                .where(where)
+            )
+            if lock_for_update:
+                query = query.lock(copy=False)
+            records.extend(SnapshotRecord(*row) for row in self._fetchall(query))
+        return records
+
     def _get_versions(self, lock_for_update: bool = False) -> Versions:
         no_version = Versions()
 
@@ -632,6 +758,16 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             columns_to_types=self._interval_columns_to_types,
         )
 
+        def _add(summary: SnapshotIntervals) -> SnapshotIntervals:
+            return _update_summary(
+                summary,
+                snapshot_intervals.intervals,
+                snapshot_intervals.dev_intervals,
+                is_removed=False,
+            )
+
+        self._update_interval_summaries({snapshot_intervals.snapshot_id: _add})
+
     @transactional()
     def remove_interval(
         self,
@@ -652,7 +788,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                         )
                         for r in self._fetchall(
                             exp.select("name", "identifier", "version")
-                            .from_(self.intervals_table)
+                            .from_(self.interval_summaries_table)
                             .where(where)
                         )
                     ]
@@ -673,15 +809,74 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                 columns_to_types=self._interval_columns_to_types,
             )
 
-    @transactional()
+        removed_intervals: t.Dict[SnapshotId, t.List[Interval]] = defaultdict(list)
+        for snapshot, interval in intervals_to_remove:
+            removed_intervals[snapshot.snapshot_id].append(interval)
+
+        def _remove(summary: SnapshotIntervals) -> SnapshotIntervals:
+            intervals = removed_intervals[summary.snapshot_id]
+            return _update_summary(summary, intervals, intervals, is_removed=True)
+
+        self._update_interval_summaries({snapshot_id: _remove for snapshot_id in removed_intervals})
+
     def compact_intervals(self) -> None:
-        interval_ids, snapshot_intervals = self._get_snapshot_intervals(uncompacted_only=True)
+        """Compacts intervals incrementally.
+
+        Snapshots with uncompacted intervals are processed in the order of their IDs, at most
+        `INTERVAL_COMPACTION_BATCH_SIZE` snapshots per transaction, so that compaction doesn't block
+        other writers for long and can be interrupted at any point. Snapshots that receive new
+        intervals while compaction is running are compacted during the next run.
+        """
+        last_snapshot_id: t.Optional[SnapshotId] = None
+        while True:
+            last_snapshot_id = self._compact_intervals_batch(last_snapshot_id)
+            if last_snapshot_id is None:
+                break
+
+    @transactional()
+    def _compact_intervals_batch(
+        self, after_snapshot_id: t.Optional[SnapshotId]
+    ) -> t.Optional[SnapshotId]:
+        query = (
+            exp.select("name", "identifier")
+            .distinct()
+            .from_(self.intervals_table)
+            .where(exp.column("is_compacted").not_())
+            .order_by("name", "identifier")
+            .limit(self.INTERVAL_COMPACTION_BATCH_SIZE)
+        )
+        if after_snapshot_id:
+            name_col = exp.column("name")
+            query = query.where(
+                exp.or_(
+                    name_col > exp.Literal.string(after_snapshot_id.name),
+                    exp.and_(
+                        name_col.eq(exp.Literal.string(after_snapshot_id.name)),
+                        exp.column("identifier") > exp.Literal.string(after_snapshot_id.identifier),
+                    ),
+                )
+            )
+
+        snapshot_ids = [
+            SnapshotId(name=name, identifier=identifier)
+            for name, identifier in self._fetchall(query)
+        ]
+        if not snapshot_ids:
+            return None
+
+        # Concurrent writers of the same snapshots are serialized, so that their summaries can't
+        # be replaced with the ones folded before their intervals were recorded.
+        self._lock_snapshots(snapshot_ids)
+        interval_ids, snapshot_intervals = self._get_logged_snapshot_intervals(snapshot_ids)
 
         logger.info(
             "Compacting %s intervals for %s snapshots", len(interval_ids), len(snapshot_intervals)
         )
 
         self._push_snapshot_intervals(snapshot_intervals)
+        # The interval log is the source of truth for summaries, so summaries of compacted
+        # snapshots are rewritten as well to repair any drift.
+        self._push_interval_summaries(snapshot_intervals)
 
         if interval_ids:
             for interval_id_batch in self._batches(
@@ -691,11 +886,13 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                     self.intervals_table, exp.column("id").isin(*interval_id_batch)
                 )
 
+        return snapshot_ids[-1]
+
     def refresh_snapshot_intervals(self, snapshots: t.Collection[Snapshot]) -> t.List[Snapshot]:
         if not snapshots:
             return []
 
-        _, intervals = self._get_snapshot_intervals(snapshots)
+        intervals = self._get_snapshot_intervals(snapshots)
         for s in snapshots:
             s.intervals = []
             s.dev_intervals = []
@@ -782,10 +979,100 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         self.engine_adapter.close()
 
     def _get_snapshot_intervals(
-        self,
-        snapshots: t.Optional[t.Collection[SnapshotNameVersionLike]] = None,
-        uncompacted_only: bool = False,
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.List[SnapshotIntervals]:
+        """Fetches interval summaries of all snapshots that share versions with the given ones."""
+        snapshot_intervals: t.List[SnapshotIntervals] = []
+        for where in self._snapshot_name_version_filter(snapshots, alias=None):
+            snapshot_intervals.extend(
+                _interval_summary_from_row(row)
+                for row in self._fetchall(
+                    exp.select(*self._interval_summary_columns_to_types)
+                    .from_(self.interval_summaries_table)
+                    .where(where)
+                )
+            )
+        return snapshot_intervals
+
+    def _update_interval_summaries(
+        self, updates: t.Dict[SnapshotId, t.Callable[[SnapshotIntervals], SnapshotIntervals]]
+    ) -> None:
+        """Applies the given updates to the stored interval summaries of snapshots.
+
+        Where row-level locks are supported, records of the snapshots are locked first so that
+        concurrent writers of the same snapshots are serialized. Otherwise, a summary that misses a
+        concurrent write is repaired by the next compaction of the snapshot, which folds the
+        interval log into summaries. Snapshots that don't have a summary yet get one folded from
+        the interval log, which already contains the update.
+        """
+        if not updates:
+            return
+
+        self._lock_snapshots(updates)
+
+        summaries = []
+        missing_snapshot_ids = set(updates)
+        for where in self._snapshot_id_filter(updates, alias=None):
+            for row in self._fetchall(
+                exp.select(*self._interval_summary_columns_to_types)
+                .from_(self.interval_summaries_table)
+                .where(where)
+            ):
+                summary = _interval_summary_from_row(row)
+                summaries.append(updates[summary.snapshot_id](summary))
+                missing_snapshot_ids.discard(summary.snapshot_id)
+
+        if missing_snapshot_ids:
+            summaries.extend(self._get_logged_snapshot_intervals(missing_snapshot_ids)[1])
+
+        self._push_interval_summaries(summaries)
+
+    def _lock_snapshots(self, snapshot_ids: t.Collection[SnapshotIdLike]) -> None:
+        if not self.engine_adapter.SUPPORTS_ROW_LEVEL_OP:
+            return
+
+        for where in self._snapshot_id_filter(snapshot_ids):
+            self._fetchall(
+                exp.select("name", "identifier")
+                .from_(self.snapshots_table)
+                .where(where)
+                .lock(copy=False)
+            )
+
+    def _push_interval_summaries(self, summaries: t.Collection[SnapshotIntervals]) -> None:
+        if not summaries:
+            return
+
+        for where in self._snapshot_id_filter({summary.snapshot_id for summary in summaries}):
+            self.engine_adapter.delete_from(self.interval_summaries_table, where)
+
+        updated_ts = now_timestamp()
+        self.engine_adapter.insert_append(
+            self.interval_summaries_table,
+            pd.DataFrame(
+                [
+                    {
+                        "name": summary.name,
+                        "identifier": summary.identifier,
+                        "version": summary.version,
+                        "intervals": json.dumps(summary.intervals),
+                        "dev_intervals": json.dumps(summary.dev_intervals),
+                        "updated_ts": updated_ts,
+                    }
+                    for summary in summaries
+                ]
+            ),
+            columns_to_types=self._interval_summary_columns_to_types,
+        )
+
+    def _get_logged_snapshot_intervals(
+        self, snapshot_ids: t.Collection[SnapshotIdLike]
     ) -> t.Tuple[t.Set[str], t.List[SnapshotIntervals]]:
+        """Folds the interval log records of the given snapshots.
+
+        Returns:
+            A tuple of IDs of all folded records and the resulting snapshot intervals.
+        """
         query = (
             exp.select(
                 "id",
@@ -806,50 +1093,23 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             )
         )
 
-        if uncompacted_only:
-            query.join(
-                exp.select("name", "identifier")
-                .from_(exp.to_table(self.intervals_table).as_("intervals"))
-                .where(exp.column("is_compacted").not_())
-                .distinct()
-                .subquery(alias="uncompacted"),
-                on=exp.and_(
-                    exp.column("name", table="intervals").eq(
-                        exp.column("name", table="uncompacted")
-                    ),
-                    exp.column("identifier", table="intervals").eq(
-                        exp.column("identifier", table="uncompacted")
-                    ),
-                ),
-                copy=False,
-            )
-
-        if not snapshots and snapshots is not None:
-            return (set(), [])
-
         interval_ids: t.Set[str] = set()
-        snapshot_intervals = []
+        snapshot_intervals: t.List[SnapshotIntervals] = []
 
-        for where in (
-            self._snapshot_name_version_filter(snapshots, "intervals") if snapshots else [None]
-        ):
+        for where in self._snapshot_id_filter(snapshot_ids, alias="intervals"):
             rows = self._fetchall(query.where(where))
             interval_ids.update(row[0] for row in rows)
 
-            intervals: t.Dict[t.Tuple[str, str, str], Intervals] = defaultdict(list)
-            dev_intervals: t.Dict[t.Tuple[str, str, str], Intervals] = defaultdict(list)
+            intervals: t.Dict[t.Tuple[str, str, str], IntervalSet] = defaultdict(IntervalSet)
+            dev_intervals: t.Dict[t.Tuple[str, str, str], IntervalSet] = defaultdict(IntervalSet)
             for row in rows:
                 _, name, identifier, version, start, end, is_dev, is_removed = row
                 intervals_key = (name, identifier, version)
                 target_intervals = intervals if not is_dev else dev_intervals
                 if is_removed:
-                    target_intervals[intervals_key] = remove_interval(
-                        target_intervals[intervals_key], start, end
-                    )
+                    target_intervals[intervals_key].remove(int(start), int(end))
                 else:
-                    target_intervals[intervals_key] = merge_intervals(
-                        [*target_intervals[intervals_key], (start, end)]
-                    )
+                    target_intervals[intervals_key].add(int(start), int(end))
 
             for name, identifier, version in {**intervals, **dev_intervals}:
                 snapshot_intervals.append(
@@ -857,8 +1117,12 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                         name=name,
                         identifier=identifier,
                         version=version,
-                        intervals=intervals.get((name, identifier, version), []),
-                        dev_intervals=dev_intervals.get((name, identifier, version), []),
+                        intervals=intervals.get(
+                            (name, identifier, version), IntervalSet()
+                        ).to_list(),
+                        dev_intervals=dev_intervals.get(
+                            (name, identifier, version), IntervalSet()
+                        ).to_list(),
                     )
                 )
 
@@ -949,7 +1213,12 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         """Rollback to the previous migration."""
         logger.info("Starting migration rollback.")
         tables = (self.snapshots_table, self.environments_table, self.versions_table)
-        optional_tables = (self.intervals_table, self.plan_dags_table)
+        optional_tables = (
+            self.environment_snapshots_table,
+            self.intervals_table,
+            self.interval_summaries_table,
+            self.plan_dags_table,
+        )
         versions = self.get_versions(validate=False)
         if versions.schema_version == 0:
             # Clean up state tables
@@ -977,7 +1246,9 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             self.snapshots_table,
             self.environments_table,
             self.versions_table,
+            self.environment_snapshots_table,
             self.intervals_table,
+            self.interval_summaries_table,
             self.plan_dags_table,
         ):
             if self.engine_adapter.table_exists(table):
@@ -1352,6 +1623,36 @@ def _interval_to_df(
     }
 
 
+def _update_summary(
+    summary: SnapshotIntervals,
+    intervals: t.Iterable[Interval],
+    dev_intervals: t.Iterable[Interval],
+    is_removed: bool,
+) -> SnapshotIntervals:
+    interval_set = IntervalSet(summary.intervals)
+    dev_interval_set = IntervalSet(summary.dev_intervals)
+    for target, updated in ((interval_set, intervals), (dev_interval_set, dev_intervals)):
+        for start, end in updated:
+            if is_removed:
+                target.remove(start, end)
+            else:
+                target.add(start, end)
+    return summary.copy(
+        update={"intervals": interval_set.to_list(), "dev_intervals": dev_interval_set.to_list()}
+    )
+
+
+def _interval_summary_from_row(row: t.Tuple) -> SnapshotIntervals:
+    name, identifier, version, intervals, dev_intervals, *_ = row
+    return SnapshotIntervals(
+        name=name,
+        identifier=identifier,
+        version=version,
+        intervals=[tuple(i) for i in json.loads(intervals)],
+        dev_intervals=[tuple(i) for i in json.loads(dev_intervals)],
+    )
+
+
 def _snapshots_to_df(snapshots: t.Iterable[Snapshot]) -> pd.DataFrame:
     return pd.DataFrame(
         [
@@ -1362,12 +1663,28 @@ def _snapshots_to_df(snapshots: t.Iterable[Snapshot]) -> pd.DataFrame:
                 "snapshot": _snapshot_to_json(snapshot),
                 "kind_name": snapshot.model_kind_name.value if snapshot.model_kind_name else None,
                 "expiration_ts": snapshot.expiration_ts,
+                "table_info": _snapshot_table_info_to_json(snapshot),
+                "unpaused_ts": snapshot.unpaused_ts,
+                "updated_ts": snapshot.updated_ts,
             }
             for snapshot in snapshots
         ]
     )
 
 
+def _environment_snapshots_to_df(environment: Environment) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "environment": environment.name,
+                "name": snapshot.name,
+                "identifier": snapshot.identifier,
+            }
+            for snapshot in environment.snapshots
+        ]
+    )
+
+
 def _environment_to_df(environment: Environment) -> pd.DataFrame:
     return pd.DataFrame(
         [
@@ -1409,6 +1726,22 @@ def _snapshot_to_json(snapshot: Snapshot) -> str:
     return snapshot.json(exclude={"intervals", "dev_intervals"})
 
 
+def _snapshot_table_info_to_json(snapshot: Snapshot) -> str:
+    # Uncategorized snapshots can be stored but their table info can't be accessed.
+    return SnapshotTableInfo(
+        physical_schema=snapshot.physical_schema,
+        name=snapshot.name,
+        fingerprint=snapshot.fingerprint,
+        version=snapshot.version,
+        temp_version=snapshot.temp_version,
+        parents=snapshot.parents,
+        previous_versions=snapshot.previous_versions,
+        change_category=snapshot.change_category,
+        kind_name=snapshot.model_kind_name,
+        node_type=snapshot.node_type,
+    ).json()
+
+
 def parse_snapshot(
     model_cache: ModelCache,
     serialized_snapshot: str,
@@ -1448,3 +1781,59 @@ class LazilyParsedSnapshots:
         if snapshot is None:
             raise KeyError(snapshot_id)
         return snapshot
+
+
+class SnapshotRecord:
+    """A lightweight record of a stored snapshot.
+
+    Records are read from indexed columns of the snapshots table without the serialized snapshot,
+    and their table info is only parsed when accessed.
+    """
+
+    COLUMNS = (
+        "name",
+        "identifier",
+        "version",
+        "kind_name",
+        "expiration_ts",
+        "unpaused_ts",
+        "updated_ts",
+        "table_info",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        identifier: str,
+        version: str,
+        kind_name: t.Optional[str],
+        expiration_ts: t.Optional[int],
+        unpaused_ts: t.Optional[int],
+        updated_ts: t.Optional[int],
+        table_info: str,
+    ):
+        self.name = name
+        self.identifier = identifier
+        self.version = version
+        self.kind_name = ModelKindName(kind_name) if kind_name else None
+        self.expiration_ts = expiration_ts
+        self.unpaused_ts = unpaused_ts
+        self.updated_ts = updated_ts
+        self._raw_table_info = table_info
+        self._table_info: t.Optional[SnapshotTableInfo] = None
+        self._snapshot_id: t.Optional[SnapshotId] = None
+
+    @property
+    def snapshot_id(self) -> SnapshotId:
+        if self._snapshot_id is None:
+            self._snapshot_id = SnapshotId(name=self.name, identifier=self.identifier)
+        return self._snapshot_id
+
+    @property
+    def table_info(self) -> SnapshotTableInfo:
+        if self._table_info is None:
+            self._table_info = SnapshotTableInfo.parse_raw(self._raw_table_info)
+        return self._table_info
+
+    def temp_version_get_or_generate(self) -> str:
+        return self.table_info.temp_version_get_or_generate()
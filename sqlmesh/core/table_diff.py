@@ -8,6 +8,7 @@ from sqlglot import exp
 from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
 from sqlglot.optimizer.qualify_columns import quote_identifiers
 
+from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 
 if t.TYPE_CHECKING:
@@ -131,7 +132,17 @@ class RowDiff(PydanticModel, frozen=True):
 
 
 class TableDiff:
-    """Calculates differences between tables, taking into account schema and row level differences."""
+    """Calculates differences between tables, taking into account schema and row level differences.
+
+    By default, rows of the source and target tables are compared with a full outer join. If a number
+    of buckets is set, rows are instead assigned to buckets by a hash of their join keys and each table
+    is first summarized with a single aggregate scan that computes the count and checksum of rows in
+    every bucket. Only rows in buckets whose summaries differ are joined and compared, while rows in
+    identical buckets are counted as full matches. This assumes that join keys are unique.
+
+    Rows can also be sampled deterministically by a hash of their join keys, so that the same keys are
+    sampled from both tables. In that case all counts refer to the sampled rows.
+    """
 
     def __init__(
         self,
@@ -145,7 +156,14 @@ class TableDiff:
         target_alias: t.Optional[str] = None,
         model_name: t.Optional[str] = None,
         decimals: int = 3,
+        buckets: t.Optional[int] = None,
+        sample_rate: t.Optional[float] = None,
     ):
+        if buckets is not None and buckets < 1:
+            raise SQLMeshError(f"The number of buckets must be positive, got {buckets}.")
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise SQLMeshError(f"The sample rate must be between 0 and 1, got {sample_rate}.")
+
         self.adapter = adapter
         self.source = source
         self.target = target
@@ -154,6 +172,8 @@ class TableDiff:
         self.limit = limit
         self.model_name = model_name
         self.decimals = decimals
+        self.buckets = buckets
+        self.sample_rate = sample_rate
 
         # Support environment aliases for diff output improvement in certain cases
         self.source_alias = source_alias
@@ -207,232 +227,439 @@ class TableDiff:
 
     def row_diff(self) -> RowDiff:
         if self._row_diff is None:
-            s_selects = {c: exp.column(c, "s").as_(f"s__{c}") for c in self.source_schema}
-            t_selects = {c: exp.column(c, "t").as_(f"t__{c}") for c in self.target_schema}
-
-            index_cols = []
-            s_index = []
-            t_index = []
-
-            for col in self.on.find_all(exp.Column):
-                index_cols.append(col.name)
-                if col.table == "s":
-                    s_index.append(col)
-                elif col.table == "t":
-                    t_index.append(col)
-            index_cols = list(dict.fromkeys(index_cols))
-
-            matched_columns = {
-                c: t for c, t in self.source_schema.items() if t == self.target_schema.get(c)
-            }
+            if self.buckets:
+                self._row_diff = self._bucketed_row_diff(self.buckets)
+            elif self.sample_rate is not None:
+                self._row_diff = self._joined_row_diff(
+                    self._side_query(self.source, self._key_columns("s")),
+                    self._side_query(self.target, self._key_columns("t")),
+                )
+            else:
+                self._row_diff = self._joined_row_diff(self.source, self.target, where=self.where)
+        return self._row_diff
 
-            def _column_expr(name: str, table: str) -> exp.Expression:
-                if matched_columns[name].this in exp.DataType.FLOAT_TYPES:
-                    return exp.func(
-                        "ROUND", exp.column(name, table), exp.Literal.number(self.decimals)
-                    )
-                return exp.column(name, table)
-
-            comparisons = [
-                exp.Case()
-                .when(_column_expr(c, "s").eq(_column_expr(c, "t")), exp.Literal.number(1))
-                .when(
-                    exp.column(c, "s").is_(exp.Null()) & exp.column(c, "t").is_(exp.Null()),
-                    exp.Literal.number(1),
+    @property
+    def _matched_columns(self) -> t.Dict[str, exp.DataType]:
+        return {c: t for c, t in self.source_schema.items() if t == self.target_schema.get(c)}
+
+    def _key_columns(self, table: str) -> t.List[str]:
+        return list(
+            dict.fromkeys(col.name for col in self.on.find_all(exp.Column) if col.table == table)
+        )
+
+    def _bucketed_row_diff(self, buckets: int) -> RowDiff:
+        s_keys = self._key_columns("s")
+        t_keys = self._key_columns("t")
+        if not s_keys or len(s_keys) != len(t_keys):
+            raise SQLMeshError(
+                "Bucketed table diffs require join conditions that match source and target columns."
+            )
+
+        summaries = [
+            self.adapter.fetchdf(
+                self._bucket_summary_query(table, keys, buckets), quote_identifiers=True
+            ).set_index("bucket")
+            for table, keys in ((self.source, s_keys), (self.target, t_keys))
+        ]
+        s_summary, t_summary = (
+            summary.reindex(summaries[0].index.union(summaries[1].index)).fillna(0)
+            for summary in summaries
+        )
+        differs = (s_summary["row_count"] != t_summary["row_count"]) | (
+            s_summary["checksum"] != t_summary["checksum"]
+        )
+        differing_buckets = [int(b) for b in s_summary.index[differs]]
+
+        return self._joined_row_diff(
+            self._side_query(self.source, s_keys, buckets, differing_buckets),
+            self._side_query(self.target, t_keys, buckets, differing_buckets),
+            identical_count=int(s_summary["row_count"][~differs].sum()),
+        )
+
+    def _bucket_summary_query(
+        self, table: TableName, key_columns: t.List[str], buckets: int
+    ) -> exp.Query:
+        matched_columns = self._matched_columns
+
+        def _hashed_value(name: str) -> exp.Expression:
+            column: exp.Expression = exp.column(name)
+            if matched_columns[name].this in exp.DataType.FLOAT_TYPES:
+                column = exp.func("ROUND", column, exp.Literal.number(self.decimals))
+            return column
+
+        hashes = (
+            exp.select(
+                _md5(exp.column(c) for c in key_columns).as_("key_hash"),
+                _md5(_hashed_value(c) for c in sorted(matched_columns)).as_("row_hash"),
+            )
+            .from_(table)
+            .where(self._side_where)
+        )
+        rows = exp.select(
+            exp.Mod(
+                this=_hash_number(exp.column("key_hash")), expression=exp.Literal.number(buckets)
+            ).as_("bucket"),
+            _hash_number(exp.column("row_hash")).as_("row_hash"),
+        ).from_(hashes.subquery("hashes"))
+        if self.sample_rate is not None:
+            rows = rows.where(self._sample_condition(exp.column("key_hash")))
+
+        return (
+            exp.select(
+                "bucket",
+                exp.func("COUNT", exp.Star()).as_("row_count"),
+                exp.cast(exp.func("SUM", "row_hash"), "BIGINT").as_("checksum"),
+            )
+            .from_(rows.subquery("rows"))
+            .group_by("bucket")
+        )
+
+    def _side_query(
+        self,
+        table: TableName,
+        key_columns: t.List[str],
+        buckets: t.Optional[int] = None,
+        selected_buckets: t.Optional[t.List[int]] = None,
+    ) -> exp.Query:
+        """Returns the rows of a table that are compared.
+
+        Args:
+            table: The source or target table.
+            key_columns: The join key columns of the table.
+            buckets: The number of buckets.
+            selected_buckets: The buckets whose rows are returned.
+
+        Returns:
+            The query of filtered and sampled rows.
+        """
+        key_hash = _md5(exp.column(c) for c in key_columns)
+        query = exp.select("*").from_(table).where(self._side_where)
+        if self.sample_rate is not None:
+            query = query.where(self._sample_condition(key_hash))
+        if buckets is not None and selected_buckets is not None:
+            query = query.where(
+                exp.Mod(this=_hash_number(key_hash), expression=exp.Literal.number(buckets)).isin(
+                    *selected_buckets
                 )
-                .when(
-                    exp.column(c, "s").is_(exp.Null()) | exp.column(c, "t").is_(exp.Null()),
-                    exp.Literal.number(0),
+                if selected_buckets
+                else exp.false()
+            )
+        return query
+
+    def _sample_condition(self, key_hash: exp.Expression) -> exp.Condition:
+        # Hex digests are compared as strings since digits of the same length sort like numbers. The
+        # compared digits aren't used for bucketing, so that sampling is independent of buckets.
+        threshold = round(t.cast(float, self.sample_rate) * 16**_SAMPLE_DIGITS)
+        if threshold >= 16**_SAMPLE_DIGITS:
+            return exp.true()
+        return exp.Substring(
+            this=key_hash,
+            start=exp.Literal.number(_HASH_DIGITS + 1),
+            length=exp.Literal.number(_SAMPLE_DIGITS),
+        ) < exp.Literal.string(f"{threshold:0{_SAMPLE_DIGITS}x}")
+
+    @property
+    def _side_where(self) -> t.Optional[exp.Condition]:
+        """The filter of joined rows applied to the rows of each table."""
+        if self.where is None:
+            return None
+        return t.cast(
+            exp.Condition,
+            self.where.transform(
+                lambda node: (
+                    exp.column(node.this)
+                    if isinstance(node, exp.Column) and node.table in ("s", "t")
+                    else node
                 )
-                .else_(exp.Literal.number(0))
-                .as_(f"{c}_matches")
-                for c, t in matched_columns.items()
-            ]
+            ),
+        )
 
-            def name(e: exp.Expression) -> str:
-                return e.args["alias"].sql(identify=True)
+    def _joined_row_diff(
+        self,
+        source: TableName | exp.Query,
+        target: TableName | exp.Query,
+        where: t.Optional[exp.Condition] = None,
+        identical_count: int = 0,
+    ) -> RowDiff:
+        """Compares rows of the source and target with a full outer join.
+
+        Args:
+            source: The source table or a query of its rows.
+            target: The target table or a query of its rows.
+            where: A filter of joined rows.
+            identical_count: The number of rows that are known to fully match without being joined.
+
+        Returns:
+            The row diff.
+        """
+        s_selects = {c: exp.column(c, "s").as_(f"s__{c}") for c in self.source_schema}
+        t_selects = {c: exp.column(c, "t").as_(f"t__{c}") for c in self.target_schema}
+
+        index_cols = []
+        s_index = []
+        t_index = []
+
+        for col in self.on.find_all(exp.Column):
+            index_cols.append(col.name)
+            if col.table == "s":
+                s_index.append(col)
+            elif col.table == "t":
+                t_index.append(col)
+        index_cols = list(dict.fromkeys(index_cols))
+
+        matched_columns = self._matched_columns
+
+        def _column_expr(name: str, table: str) -> exp.Expression:
+            if matched_columns[name].this in exp.DataType.FLOAT_TYPES:
+                return exp.func("ROUND", exp.column(name, table), exp.Literal.number(self.decimals))
+            return exp.column(name, table)
+
+        comparisons = [
+            exp.Case()
+            .when(_column_expr(c, "s").eq(_column_expr(c, "t")), exp.Literal.number(1))
+            .when(
+                exp.column(c, "s").is_(exp.Null()) & exp.column(c, "t").is_(exp.Null()),
+                exp.Literal.number(1),
+            )
+            .when(
+                exp.column(c, "s").is_(exp.Null()) | exp.column(c, "t").is_(exp.Null()),
+                exp.Literal.number(0),
+            )
+            .else_(exp.Literal.number(0))
+            .as_(f"{c}_matches")
+            for c, t in matched_columns.items()
+        ]
+
+        def name(e: exp.Expression) -> str:
+            return e.args["alias"].sql(identify=True)
+
+        query = (
+            exp.select(
+                *s_selects.values(),
+                *t_selects.values(),
+                exp.func("IF", exp.or_(*(c.not_().is_(exp.Null()) for c in s_index)), 1, 0).as_(
+                    "s_exists"
+                ),
+                exp.func("IF", exp.or_(*(c.not_().is_(exp.Null()) for c in t_index)), 1, 0).as_(
+                    "t_exists"
+                ),
+                exp.func(
+                    "IF",
+                    exp.and_(
+                        *(
+                            exp.and_(
+                                exp.column(c, "s").eq(exp.column(c, "t")),
+                                exp.column(c, "s").not_().is_(exp.Null()),
+                                exp.column(c, "t").not_().is_(exp.Null()),
+                            )
+                            for c in index_cols
+                        ),
+                    ),
+                    1,
+                    0,
+                ).as_("row_joined"),
+                *comparisons,
+            )
+            .from_(
+                source.subquery("s") if isinstance(source, exp.Query) else exp.alias_(source, "s")
+            )
+            .join(
+                target.subquery("t") if isinstance(target, exp.Query) else target,
+                on=self.on,
+                join_type="FULL",
+                join_alias=None if isinstance(target, exp.Query) else "t",
+            )
+            .where(where)
+        )
 
-            query = (
+        query = exp.select(
+            "*",
+            exp.Case()
+            .when(
+                exp.and_(
+                    *[exp.column(f"{c}_matches").eq(exp.Literal.number(1)) for c in matched_columns]
+                ),
+                exp.Literal.number(1),
+            )
+            .else_(exp.Literal.number(0))
+            .as_("row_full_match"),
+        ).from_(query.subquery("stats"))
+
+        query = quote_identifiers(query, dialect=self.dialect)
+        temp_table = exp.table_("diff", db="sqlmesh_temp", quoted=True)
+
+        with self.adapter.temp_table(query, name=temp_table) as table:
+            summary_query = exp.select(
+                exp.func("SUM", "s_exists").as_("s_count"),
+                exp.func("SUM", "t_exists").as_("t_count"),
+                exp.func("SUM", "row_joined").as_("join_count"),
+                exp.func("SUM", "row_full_match").as_("full_match_count"),
+                *(exp.func("SUM", name(c)).as_(c.alias) for c in comparisons),
+            ).from_(table)
+
+            stats_df = self.adapter.fetchdf(summary_query, quote_identifiers=True)
+            if identical_count:
+                stats_df = stats_df.fillna(0) + identical_count
+            stats_df["s_only_count"] = stats_df["s_count"] - stats_df["join_count"]
+            stats_df["t_only_count"] = stats_df["t_count"] - stats_df["join_count"]
+            stats = stats_df.iloc[0].to_dict()
+
+            column_stats_query = (
                 exp.select(
-                    *s_selects.values(),
-                    *t_selects.values(),
-                    exp.func("IF", exp.or_(*(c.not_().is_(exp.Null()) for c in s_index)), 1, 0).as_(
-                        "s_exists"
-                    ),
-                    exp.func("IF", exp.or_(*(c.not_().is_(exp.Null()) for c in t_index)), 1, 0).as_(
-                        "t_exists"
-                    ),
-                    exp.func(
-                        "IF",
-                        exp.and_(
-                            *(
-                                exp.and_(
-                                    exp.column(c, "s").eq(exp.column(c, "t")),
-                                    exp.column(c, "s").not_().is_(exp.Null()),
-                                    exp.column(c, "t").not_().is_(exp.Null()),
+                    *(
+                        exp.func(
+                            "ROUND",
+                            100
+                            * (
+                                (
+                                    exp.func("COALESCE", exp.func("SUM", name(c)), 0)
+                                    + identical_count
                                 )
-                                for c in index_cols
+                                / (exp.func("COUNT", name(c)) + identical_count)
+                                if identical_count
+                                else exp.func("SUM", name(c)) / exp.func("COUNT", name(c))
                             ),
-                        ),
-                        1,
-                        0,
-                    ).as_("row_joined"),
-                    *comparisons,
+                            1,
+                        ).as_(c.alias)
+                        for c in comparisons
+                    )
                 )
-                .from_(exp.alias_(self.source, "s"))
-                .join(
-                    self.target,
-                    on=self.on,
-                    join_type="FULL",
-                    join_alias="t",
+                .from_(table)
+                .where(exp.column("row_joined").eq(exp.Literal.number(1)))
+            )
+            column_stats = (
+                self.adapter.fetchdf(column_stats_query, quote_identifiers=True)
+                .T.rename(
+                    columns={0: "pct_match"},
+                    index=lambda x: str(x).replace("_matches", "") if x else "",
                 )
-                .where(self.where)
+                .drop(index=index_cols)
             )
 
-            query = exp.select(
-                "*",
-                exp.Case()
-                .when(
-                    exp.and_(
-                        *[
-                            exp.column(f"{c}_matches").eq(exp.Literal.number(1))
-                            for c in matched_columns
-                        ]
-                    ),
-                    exp.Literal.number(1),
-                )
-                .else_(exp.Literal.number(0))
-                .as_("row_full_match"),
-            ).from_(query.subquery("stats"))
-
-            query = quote_identifiers(query, dialect=self.dialect)
-            temp_table = exp.table_("diff", db="sqlmesh_temp", quoted=True)
-
-            with self.adapter.temp_table(query, name=temp_table) as table:
-                summary_query = exp.select(
-                    exp.func("SUM", "s_exists").as_("s_count"),
-                    exp.func("SUM", "t_exists").as_("t_count"),
-                    exp.func("SUM", "row_joined").as_("join_count"),
-                    exp.func("SUM", "row_full_match").as_("full_match_count"),
-                    *(exp.func("SUM", name(c)).as_(c.alias) for c in comparisons),
-                ).from_(table)
-
-                stats_df = self.adapter.fetchdf(summary_query, quote_identifiers=True)
-                stats_df["s_only_count"] = stats_df["s_count"] - stats_df["join_count"]
-                stats_df["t_only_count"] = stats_df["t_count"] - stats_df["join_count"]
-                stats = stats_df.iloc[0].to_dict()
-
-                column_stats_query = (
-                    exp.select(
-                        *(
-                            exp.func(
-                                "ROUND",
-                                100 * (exp.func("SUM", name(c)) / exp.func("COUNT", name(c))),
-                                1,
-                            ).as_(c.alias)
-                            for c in comparisons
-                        )
-                    )
-                    .from_(table)
-                    .where(exp.column("row_joined").eq(exp.Literal.number(1)))
-                )
-                column_stats = (
-                    self.adapter.fetchdf(column_stats_query, quote_identifiers=True)
-                    .T.rename(
-                        columns={0: "pct_match"},
-                        index=lambda x: str(x).replace("_matches", "") if x else "",
-                    )
-                    .drop(index=index_cols)
+            sample_filter_cols = ["s_exists", "t_exists", "row_joined", "row_full_match"]
+            sample_query = (
+                exp.select(
+                    *(sample_filter_cols),
+                    *(name(c) for c in s_selects.values()),
+                    *(name(c) for c in t_selects.values()),
                 )
-
-                sample_filter_cols = ["s_exists", "t_exists", "row_joined", "row_full_match"]
-                sample_query = (
-                    exp.select(
-                        *(sample_filter_cols),
-                        *(name(c) for c in s_selects.values()),
-                        *(name(c) for c in t_selects.values()),
-                    )
-                    .from_(table)
-                    .where(exp.or_(*(exp.column(c.alias).eq(0) for c in comparisons)))
-                    .order_by(
-                        *(name(s_selects[c.name]) for c in s_index),
-                        *(name(t_selects[c.name]) for c in t_index),
-                    )
-                    .limit(self.limit)
+                .from_(table)
+                .where(exp.or_(*(exp.column(c.alias).eq(0) for c in comparisons)))
+                .order_by(
+                    *(name(s_selects[c.name]) for c in s_index),
+                    *(name(t_selects[c.name]) for c in t_index),
                 )
-                sample = self.adapter.fetchdf(sample_query, quote_identifiers=True)
+                .limit(self.limit)
+            )
+            sample = self.adapter.fetchdf(sample_query, quote_identifiers=True)
 
-                joined_sample_cols = [f"s__{c}" for c in index_cols]
-                comparison_cols = [
-                    (f"s__{c}", f"t__{c}")
-                    for c in column_stats[column_stats["pct_match"] < 100].index
-                ]
-                for cols in comparison_cols:
-                    joined_sample_cols.extend(cols)
+            joined_sample_cols = [f"s__{c}" for c in index_cols]
+            comparison_cols = [
+                (f"s__{c}", f"t__{c}") for c in column_stats[column_stats["pct_match"] < 100].index
+            ]
+            for cols in comparison_cols:
+                joined_sample_cols.extend(cols)
+            joined_renamed_cols = {
+                c: c.split("__")[1] if c.split("__")[1] in index_cols else c
+                for c in joined_sample_cols
+            }
+            if self.source != self.source_alias and self.target != self.target_alias:
                 joined_renamed_cols = {
-                    c: c.split("__")[1] if c.split("__")[1] in index_cols else c
-                    for c in joined_sample_cols
-                }
-                if self.source != self.source_alias and self.target != self.target_alias:
-                    joined_renamed_cols = {
-                        c: (
-                            n.replace(
-                                "s__", f"{self.source_alias.upper() if self.source_alias else ''}__"
-                            )
-                            if n.startswith("s__")
-                            else n
+                    c: (
+                        n.replace(
+                            "s__", f"{self.source_alias.upper() if self.source_alias else ''}__"
                         )
-                        for c, n in joined_renamed_cols.items()
-                    }
-                    joined_renamed_cols = {
-                        c: (
-                            n.replace(
-                                "t__", f"{self.target_alias.upper() if self.target_alias else ''}__"
-                            )
-                            if n.startswith("t__")
-                            else n
+                        if n.startswith("s__")
+                        else n
+                    )
+                    for c, n in joined_renamed_cols.items()
+                }
+                joined_renamed_cols = {
+                    c: (
+                        n.replace(
+                            "t__", f"{self.target_alias.upper() if self.target_alias else ''}__"
                         )
-                        for c, n in joined_renamed_cols.items()
-                    }
-                joined_sample = sample[sample["row_joined"] == 1][joined_sample_cols]
-                joined_sample.rename(
-                    columns=joined_renamed_cols,
-                    inplace=True,
-                )
+                        if n.startswith("t__")
+                        else n
+                    )
+                    for c, n in joined_renamed_cols.items()
+                }
+            joined_sample = sample[sample["row_joined"] == 1][joined_sample_cols]
+            joined_sample.rename(
+                columns=joined_renamed_cols,
+                inplace=True,
+            )
 
-                s_sample = sample[(sample["s_exists"] == 1) & (sample["row_joined"] == 0)][
-                    [
-                        *[f"s__{c}" for c in index_cols],
-                        *[f"s__{c}" for c in self.source_schema if c not in index_cols],
-                    ]
+            s_sample = sample[(sample["s_exists"] == 1) & (sample["row_joined"] == 0)][
+                [
+                    *[f"s__{c}" for c in index_cols],
+                    *[f"s__{c}" for c in self.source_schema if c not in index_cols],
                 ]
-                s_sample.rename(
-                    columns={c: c.replace("s__", "") for c in s_sample.columns}, inplace=True
-                )
+            ]
+            s_sample.rename(
+                columns={c: c.replace("s__", "") for c in s_sample.columns}, inplace=True
+            )
 
-                t_sample = sample[(sample["t_exists"] == 1) & (sample["row_joined"] == 0)][
-                    [
-                        *[f"t__{c}" for c in index_cols],
-                        *[f"t__{c}" for c in self.target_schema if c not in index_cols],
-                    ]
+            t_sample = sample[(sample["t_exists"] == 1) & (sample["row_joined"] == 0)][
+                [
+                    *[f"t__{c}" for c in index_cols],
+                    *[f"t__{c}" for c in self.target_schema if c not in index_cols],
                 ]
-                t_sample.rename(
-                    columns={c: c.replace("t__", "") for c in t_sample.columns}, inplace=True
-                )
+            ]
+            t_sample.rename(
+                columns={c: c.replace("t__", "") for c in t_sample.columns}, inplace=True
+            )
 
-                sample.drop(columns=sample_filter_cols, inplace=True)
-
-                self._row_diff = RowDiff(
-                    source=self.source,
-                    target=self.target,
-                    stats=stats,
-                    column_stats=column_stats,
-                    sample=sample,
-                    joined_sample=joined_sample,
-                    s_sample=s_sample,
-                    t_sample=t_sample,
-                    source_alias=self.source_alias,
-                    target_alias=self.target_alias,
-                    model_name=self.model_name,
-                )
-        return self._row_diff
+            sample.drop(columns=sample_filter_cols, inplace=True)
+
+            return RowDiff(
+                source=self.source,
+                target=self.target,
+                stats=stats,
+                column_stats=column_stats,
+                sample=sample,
+                joined_sample=joined_sample,
+                s_sample=s_sample,
+                t_sample=t_sample,
+                source_alias=self.source_alias,
+                target_alias=self.target_alias,
+                model_name=self.model_name,
+            )
+
+
+# The number of digits of a hash which are converted to a number.
+_HASH_DIGITS = 9
+# The number of digits of a key hash which decide whether a row is sampled.
+_SAMPLE_DIGITS = 4
+
+
+def _md5(expressions: t.Iterable[exp.Expression]) -> exp.Expression:
+    """Returns the MD5 hex digest of the given values, including NULLs."""
+    values: t.List[exp.Expression] = []
+    for expression in expressions:
+        if values:
+            values.append(exp.Literal.string("|"))
+        values.append(
+            exp.func(
+                "COALESCE", exp.cast(expression, "TEXT"), exp.Literal.string("__sqlmesh_null__")
+            )
+        )
+    return exp.MD5(this=exp.func("CONCAT", *values) if len(values) > 1 else values[0])
+
+
+def _hash_number(hex_digest: exp.Expression, start: int = 1) -> exp.Expression:
+    """Converts digits of a hex digest to a non-negative number.
+
+    Hex letters are translated to decimal digits instead of being parsed, since there is no portable
+    way to parse hexadecimal numbers.
+    """
+    return exp.cast(
+        exp.Substring(
+            this=exp.func(
+                "TRANSLATE", hex_digest, exp.Literal.string("abcdef"), exp.Literal.string("012345")
+            ),
+            start=exp.Literal.number(start),
+            length=exp.Literal.number(_HASH_DIGITS),
+        ),
+        "BIGINT",
+    )
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import io
 import pathlib
+import threading
+import time
 import typing as t
 import unittest
 
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.model import Model
+from sqlmesh.core.test.cache import ModelTestCache as ModelTestCache
 from sqlmesh.core.test.definition import ModelTest as ModelTest, generate_test as generate_test
 from sqlmesh.core.test.discovery import (
     ModelTestMetadata as ModelTestMetadata,
@@ -13,8 +17,13 @@ from sqlmesh.core.test.discovery import (
     get_all_model_tests as get_all_model_tests,
     load_model_test_file as load_model_test_file,
 )
-from sqlmesh.core.test.result import ModelTextTestResult as ModelTextTestResult
+from sqlmesh.core.test.result import (
+    ModelTestOutcome as ModelTestOutcome,
+    ModelTextTestResult as ModelTextTestResult,
+)
 from sqlmesh.utils import UniqueKeyDict
+from sqlmesh.utils.concurrency import concurrent_apply_to_values, fork_apply_to_values
+from sqlmesh.utils.errors import ConfigError
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.config.loader import C
@@ -31,6 +40,8 @@ def run_tests(
     stream: t.TextIO | None = None,
     default_catalog: str | None = None,
     default_catalog_dialect: str = "",
+    workers: int = 1,
+    use_processes: bool = False,
 ) -> ModelTextTestResult:
     """Create a test suite of ModelTest objects and run it.
 
@@ -39,22 +50,33 @@ def run_tests(
         models: All models to use for expansion and mapping of physical locations.
         verbosity: The verbosity level.
         preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+        workers: The number of workers that run tests concurrently, each with its own connection
+            to the testing engine.
+        use_processes: Whether workers should be forked processes instead of threads.
     """
+    if workers < 1:
+        raise ConfigError(f"Invalid number of test workers {workers}")
+
     testing_adapter_by_gateway: t.Dict[str, EngineAdapter] = {}
     default_gateway = gateway or config.default_gateway_name
+    cache = ModelTestCache()
+
+    def create_testing_engine_adapter(gateway: str) -> EngineAdapter:
+        return config.get_test_connection(
+            gateway,
+            default_catalog,
+            default_catalog_dialect,
+        ).create_engine_adapter(register_comments_override=False)
 
     try:
         tests = []
+        test_gateways = []
         for metadata in model_test_metadata:
             body = metadata.body
             gateway = body.get("gateway") or default_gateway
             testing_engine_adapter = testing_adapter_by_gateway.get(gateway)
             if not testing_engine_adapter:
-                testing_engine_adapter = config.get_test_connection(
-                    gateway,
-                    default_catalog,
-                    default_catalog_dialect,
-                ).create_engine_adapter(register_comments_override=False)
+                testing_engine_adapter = create_testing_engine_adapter(gateway)
                 testing_adapter_by_gateway[gateway] = testing_engine_adapter
 
             tests.append(
@@ -67,15 +89,31 @@ def run_tests(
                     path=metadata.path,
                     default_catalog=default_catalog,
                     preserve_fixtures=preserve_fixtures,
+                    cache=cache,
                 )
             )
+            test_gateways.append(gateway)
 
+        suite = (
+            _ParallelTestSuite(
+                tests,
+                test_gateways,
+                testing_adapter_by_gateway,
+                create_testing_engine_adapter,
+                workers=workers,
+                use_processes=use_processes,
+            )
+            if workers > 1 and len(tests) > 1
+            else unittest.TestSuite(tests)
+        )
         result = t.cast(
             ModelTextTestResult,
             unittest.TextTestRunner(
                 stream=stream, verbosity=verbosity, resultclass=ModelTextTestResult
-            ).run(unittest.TestSuite(tests)),
+            ).run(suite),
         )
+        if verbosity > 1:
+            result.log_slowest_tests()
     finally:
         for testing_engine_adapter in testing_adapter_by_gateway.values():
             testing_engine_adapter.close()
@@ -95,6 +133,8 @@ def run_model_tests(
     stream: t.TextIO | None = None,
     default_catalog: t.Optional[str] = None,
     default_catalog_dialect: str = "",
+    workers: int = 1,
+    use_processes: bool = False,
 ) -> ModelTextTestResult:
     """Load and run tests.
 
@@ -104,6 +144,8 @@ def run_model_tests(
         verbosity: The verbosity level.
         patterns: A list of patterns to match against.
         preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+        workers: The number of workers that run tests concurrently.
+        use_processes: Whether workers should be forked processes instead of threads.
     """
     loaded_tests = []
     for test in tests:
@@ -129,4 +171,121 @@ def run_model_tests(
         stream=stream,
         default_catalog=default_catalog,
         default_catalog_dialect=default_catalog_dialect,
+        workers=workers,
+        use_processes=use_processes,
     )
+
+
+class _ParallelTestSuite(unittest.TestSuite):
+    """Runs model tests concurrently in a pool of workers.
+
+    Each worker runs tests against its own connection to the testing engine, while the fixtures of
+    every test are isolated in a randomly named schema. The outcome of each test is recorded by the
+    worker and then added to the main result in the original order of tests, so the output is the
+    same as that of a sequential run.
+
+    Tests of gateways whose testing engine adapter can't be duplicated (eg. DuckDB databases backed
+    by the same file) are run sequentially, as are tests that patch process-global state when
+    workers are threads.
+    """
+
+    def __init__(
+        self,
+        tests: t.List[ModelTest],
+        test_gateways: t.List[str],
+        testing_adapter_by_gateway: t.Dict[str, EngineAdapter],
+        create_testing_engine_adapter: t.Callable[[str], EngineAdapter],
+        workers: int,
+        use_processes: bool,
+    ):
+        super().__init__(tests)
+        self._model_tests = tests
+        self._test_gateways = test_gateways
+        self._testing_adapter_by_gateway = testing_adapter_by_gateway
+        self._create_testing_engine_adapter = create_testing_engine_adapter
+        self._workers = workers
+        self._use_processes = use_processes
+        self._worker_state = threading.local()
+        self._worker_adapters: t.List[EngineAdapter] = []
+        self._worker_adapters_lock = threading.Lock()
+
+    def run(self, result: unittest.TestResult, debug: bool = False) -> unittest.TestResult:
+        if not isinstance(result, ModelTextTestResult):
+            return super().run(result, debug=debug)
+
+        isolated_gateways = self._isolated_gateways()
+        concurrent_indices = []
+        sequential_indices = []
+        for i, (test, gateway) in enumerate(zip(self._model_tests, self._test_gateways)):
+            if gateway in isolated_gateways and (self._use_processes or test.is_thread_safe):
+                concurrent_indices.append(i)
+            else:
+                sequential_indices.append(i)
+
+        outcomes: t.Dict[int, ModelTestOutcome] = {}
+        try:
+            if self._use_processes:
+                # Forked workers close the adapters they created once they're done with a chunk
+                # of tests, since these never make it back to the parent process.
+                concurrent_outcomes = fork_apply_to_values(
+                    concurrent_indices,
+                    self._run_test_in_worker,
+                    self._workers,
+                    on_chunk_exit=self._close_worker_adapters,
+                )
+            else:
+                concurrent_outcomes = concurrent_apply_to_values(
+                    concurrent_indices, self._run_test_in_worker, self._workers
+                )
+        finally:
+            self._close_worker_adapters()
+        outcomes.update(zip(concurrent_indices, concurrent_outcomes))
+
+        for i in sequential_indices:
+            outcomes[i] = self._run_test(self._model_tests[i])
+
+        for i, test in enumerate(self._model_tests):
+            if result.shouldStop:
+                break
+            result.add_outcome(test, outcomes[i])
+        return result
+
+    def _isolated_gateways(self) -> t.Set[str]:
+        isolated_gateways = set()
+        for gateway, adapter in self._testing_adapter_by_gateway.items():
+            worker_adapter = self._create_testing_engine_adapter(gateway)
+            if worker_adapter is not adapter:
+                isolated_gateways.add(gateway)
+                worker_adapter.close()
+        return isolated_gateways
+
+    def _run_test_in_worker(self, index: int) -> ModelTestOutcome:
+        test = self._model_tests[index]
+        test.set_engine_adapter(self._worker_adapter(self._test_gateways[index]))
+        return self._run_test(test)
+
+    def _worker_adapter(self, gateway: str) -> EngineAdapter:
+        adapters = self._worker_state.__dict__.setdefault("adapters", {})
+        adapter = adapters.get(gateway)
+        if adapter is None:
+            adapter = self._create_testing_engine_adapter(gateway)
+            adapters[gateway] = adapter
+            with self._worker_adapters_lock:
+                self._worker_adapters.append(adapter)
+        return adapter
+
+    def _close_worker_adapters(self) -> None:
+        with self._worker_adapters_lock:
+            try:
+                for adapter in self._worker_adapters:
+                    adapter.close()
+            finally:
+                self._worker_adapters.clear()
+                self._worker_state = threading.local()
+
+    @staticmethod
+    def _run_test(test: ModelTest) -> ModelTestOutcome:
+        result = ModelTextTestResult(io.StringIO(), descriptions=True, verbosity=0)  # type: ignore
+        start = time.perf_counter()
+        test(result)
+        return ModelTestOutcome.from_result(result, time.perf_counter() - start)
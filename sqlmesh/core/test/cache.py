@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import typing as t
+
+from sqlglot import exp
+
+from sqlmesh.utils.cache import BoundedCache, CacheStats
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.model import Model
+
+# The schema in which fixture tables of cached queries are referenced. Each test replaces it with
+# its own randomized fixture schema.
+FIXTURE_SCHEMA_PLACEHOLDER = "__sqlmesh_test_fixtures__"
+
+
+class ModelTestCache:
+    """Caches work that is repeated by unit tests of the same models within a test session.
+
+    Rendered and optimized model queries are cached by the model's data hash together with the set
+    of fixtures and the variables of a test. Fixture tables are referenced in a placeholder schema
+    in cached queries, since each test creates its fixtures in a randomized schema. Inferred fixture
+    schemas are cached by the input's data hash together with the dialect of the testing engine, the
+    set of fixture columns and the types of their values.
+    """
+
+    def __init__(self) -> None:
+        self._queries: BoundedCache[t.Tuple[t.Any, ...], exp.Query] = BoundedCache()
+        self._fixture_schemas: BoundedCache[t.Tuple[t.Any, ...], t.Dict[str, exp.DataType]] = (
+            BoundedCache()
+        )
+
+    def get_or_render_query(
+        self,
+        model: Model,
+        fixture_names: t.Iterable[str],
+        variables: t.Dict[str, t.Any],
+        fixture_schema: exp.Identifier,
+        fixture_catalog: t.Optional[exp.Identifier],
+        render: t.Callable[[], exp.Query],
+    ) -> exp.Query:
+        """Returns the rendered query of a model whose fixture tables are in the given schema.
+
+        Args:
+            model: The model that is being tested.
+            fixture_names: The names of the test's fixtures.
+            variables: The test's variables.
+            fixture_schema: The test's fixture schema.
+            fixture_catalog: The catalog of fixture tables, which is that of the testing engine.
+            render: Renders the query with fixture tables in the placeholder schema.
+
+        Returns:
+            The rendered query.
+        """
+        cache_key = (
+            model.fqn,
+            model.data_hash,
+            frozenset(fixture_names),
+            json.dumps(variables, sort_keys=True, default=str),
+            fixture_catalog.name if fixture_catalog else None,
+        )
+        query = self._queries.get_or_load(cache_key, render)
+
+        def _replace_schema(node: exp.Expression) -> exp.Expression:
+            if isinstance(node, exp.Table) and node.db == FIXTURE_SCHEMA_PLACEHOLDER:
+                node.set("db", fixture_schema.copy())
+            return node
+
+        return t.cast(exp.Query, query.transform(_replace_schema))
+
+    def get_or_infer_fixture_schema(
+        self,
+        name: str,
+        model: t.Optional[Model],
+        dialect: str,
+        columns: t.Dict[str, exp.DataType],
+        row: t.Dict[str, t.Any],
+        infer: t.Callable[[], t.Dict[str, exp.DataType]],
+    ) -> t.Dict[str, exp.DataType]:
+        """Returns the inferred columns and types of a fixture.
+
+        Args:
+            name: The name of the fixture.
+            model: The model of the fixture if exists.
+            dialect: The dialect of the testing engine, which determines the inferred types.
+            columns: The explicitly set columns of the fixture.
+            row: The first row of the fixture which is used to infer missing types.
+            infer: Infers the fixture's schema.
+
+        Returns:
+            The columns and their types.
+        """
+        value_types = tuple((col, _value_type_key(value)) for col, value in row.items())
+        if any(value_type is None for _, value_type in value_types):
+            return infer()
+
+        cache_key = (
+            name,
+            model.data_hash if model else None,
+            dialect,
+            tuple((col, data_type.sql()) for col, data_type in columns.items()),
+            value_types,
+        )
+        return self._fixture_schemas.get_or_load(cache_key, infer).copy()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit and miss counters of all caches."""
+        return self._queries.stats + self._fixture_schemas.stats
+
+
+def _value_type_key(value: t.Any) -> t.Optional[t.Tuple[str, ...]]:
+    # Nested values can't be cached since their types depend on their contents
+    if isinstance(value, (dict, list, tuple)):
+        return None
+    value_type = type(value).__name__
+    # Timezone aware and naive datetimes are inferred as different types
+    if getattr(value, "tzinfo", None) is not None:
+        return (value_type, "tz")
+    return (value_type,)
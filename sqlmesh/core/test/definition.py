@@ -22,6 +22,7 @@ from sqlmesh.core.dialect import normalize_model_name, schema_
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.macros import RuntimeStage
 from sqlmesh.core.model import Model, PythonModel, SqlModel
+from sqlmesh.core.test.cache import FIXTURE_SCHEMA_PLACEHOLDER, ModelTestCache
 from sqlmesh.utils import UniqueKeyDict, random_id, type_is_known, yaml
 from sqlmesh.utils.date import pandas_timestamp_to_pydatetime
 from sqlmesh.utils.errors import ConfigError, TestError
@@ -47,6 +48,7 @@ class ModelTest(unittest.TestCase):
         path: Path | None = None,
         preserve_fixtures: bool = False,
         default_catalog: str | None = None,
+        cache: ModelTestCache | None = None,
     ) -> None:
         """ModelTest encapsulates a unit test for a model.
 
@@ -59,6 +61,7 @@ class ModelTest(unittest.TestCase):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            cache: An optional cache shared by tests of the same session.
         """
         self.body = body
         self.test_name = test_name
@@ -69,6 +72,7 @@ class ModelTest(unittest.TestCase):
         self.preserve_fixtures = preserve_fixtures
         self.default_catalog = default_catalog
         self.dialect = dialect
+        self.cache = cache
 
         self._fixture_table_cache: t.Dict[str, exp.Table] = {}
         self._normalized_column_name_cache: t.Dict[str, str] = {}
@@ -97,10 +101,12 @@ class ModelTest(unittest.TestCase):
             exec_time = exp.Literal.string(self._execution_time)
             self._transforms = {
                 **self._transforms,
-                exp.CurrentDate: lambda self, _: self.sql(exp.cast(exec_time, "date")),
-                exp.CurrentDatetime: lambda self, _: self.sql(exp.cast(exec_time, "datetime")),
-                exp.CurrentTime: lambda self, _: self.sql(exp.cast(exec_time, "time")),
-                exp.CurrentTimestamp: lambda self, _: self.sql(exp.cast(exec_time, "timestamp")),
+                **{
+                    expression_type: lambda self, _, to_type=to_type: self.sql(  # type: ignore
+                        exp.cast(exec_time, to_type)
+                    )
+                    for expression_type, to_type in _CURRENT_TIME_TYPES.items()
+                },
             }
 
         super().__init__()
@@ -108,6 +114,19 @@ class ModelTest(unittest.TestCase):
     def shortDescription(self) -> t.Optional[str]:
         return self.body.get("description")
 
+    @property
+    def is_thread_safe(self) -> bool:
+        """Whether this test can run concurrently with other tests in the same process."""
+        return True
+
+    def set_engine_adapter(self, engine_adapter: EngineAdapter) -> None:
+        """Sets the engine adapter to run this test with.
+
+        The adapter must connect to the same testing engine as the one this test was created with.
+        This is used to run tests in workers that each have their own connection.
+        """
+        self.engine_adapter = engine_adapter
+
     def setUp(self) -> None:
         """Load all input tables"""
         self.engine_adapter.create_schema(self._qualified_fixture_schema)
@@ -131,34 +150,69 @@ class ModelTest(unittest.TestCase):
 
             rows = values.get("rows")
             if not all_types_are_known and rows:
-                for col, value in rows[0].items():
-                    if col not in known_columns_to_types:
-                        v_type = annotate_types(exp.convert(value)).type or type(value).__name__
-                        v_type = exp.maybe_parse(
-                            v_type, into=exp.DataType, dialect=self._test_adapter_dialect
-                        )
-
-                        if not type_is_known(v_type):
-                            _raise_error(
-                                f"Failed to infer the data type of column '{col}' for '{name}'. This issue can be "
-                                "mitigated by casting the column in the model definition, setting its type in "
-                                "external_models.yaml if it's an external model, setting the model's 'columns' property, "
-                                "or setting its 'columns' mapping in the test itself",
-                                self.path,
-                            )
-
-                        known_columns_to_types[col] = v_type
+                if self.cache is None:
+                    known_columns_to_types = self._infer_columns_to_types(
+                        name, known_columns_to_types, rows[0]
+                    )
+                else:
+                    known_columns_to_types = self.cache.get_or_infer_fixture_schema(
+                        name,
+                        model,
+                        self.engine_adapter.dialect,
+                        known_columns_to_types,
+                        rows[0],
+                        lambda: self._infer_columns_to_types(name, known_columns_to_types, rows[0]),
+                    )
 
+            fixture_table = self._test_fixture_table(name)
             if rows is None:
-                query_or_df: exp.Query | pd.DataFrame = self._add_missing_columns(
-                    values["query"], known_columns_to_types
+                self.engine_adapter.create_view(
+                    fixture_table,
+                    self._add_missing_columns(values["query"], known_columns_to_types),
+                    known_columns_to_types,
+                )
+            elif self.engine_adapter.loads_dataframes_natively and not any(
+                data_type.is_type(*exp.DataType.NESTED_TYPES)
+                for data_type in known_columns_to_types.values()
+            ):
+                # Bulk loading the rows into a table is cheaper than rendering them as VALUES
+                # literals, but nested values are only converted correctly by the latter
+                self.engine_adapter.ctas(
+                    fixture_table,
+                    self._create_df(values, columns=known_columns_to_types),
+                    known_columns_to_types,
+                    exists=False,
                 )
             else:
-                query_or_df = self._create_df(values, columns=known_columns_to_types)
+                self.engine_adapter.create_view(
+                    fixture_table,
+                    self._create_df(values, columns=known_columns_to_types),
+                    known_columns_to_types,
+                )
 
-            self.engine_adapter.create_view(
-                self._test_fixture_table(name), query_or_df, known_columns_to_types
-            )
+    def _infer_columns_to_types(
+        self, name: str, known_columns_to_types: t.Dict[str, exp.DataType], row: Row
+    ) -> t.Dict[str, exp.DataType]:
+        columns_to_types = known_columns_to_types.copy()
+        for col, value in row.items():
+            if col not in columns_to_types:
+                v_type = annotate_types(exp.convert(value)).type or type(value).__name__
+                v_type = exp.maybe_parse(
+                    v_type, into=exp.DataType, dialect=self._test_adapter_dialect
+                )
+
+                if not type_is_known(v_type):
+                    _raise_error(
+                        f"Failed to infer the data type of column '{col}' for '{name}'. This issue can be "
+                        "mitigated by casting the column in the model definition, setting its type in "
+                        "external_models.yaml if it's an external model, setting the model's 'columns' property, "
+                        "or setting its 'columns' mapping in the test itself",
+                        self.path,
+                    )
+
+                columns_to_types[col] = v_type
+
+        return columns_to_types
 
     def tearDown(self) -> None:
         """Drop all fixture tables."""
@@ -270,6 +324,7 @@ class ModelTest(unittest.TestCase):
         path: Path | None,
         preserve_fixtures: bool = False,
         default_catalog: str | None = None,
+        cache: ModelTestCache | None = None,
     ) -> ModelTest:
         """Create a SqlModelTest or a PythonModelTest.
 
@@ -281,6 +336,7 @@ class ModelTest(unittest.TestCase):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            cache: An optional cache shared by tests of the same session.
         """
         name = normalize_model_name(body["model"], default_catalog=default_catalog, dialect=dialect)
         model = models.get(name)
@@ -304,6 +360,7 @@ class ModelTest(unittest.TestCase):
             path,
             preserve_fixtures,
             default_catalog,
+            cache,
         )
 
     def __str__(self) -> str:
@@ -431,16 +488,20 @@ class ModelTest(unittest.TestCase):
     def _test_fixture_table(self, name: str) -> exp.Table:
         table = self._fixture_table_cache.get(name)
         if not table:
-            table = exp.to_table(name, dialect=self._test_adapter_dialect)
+            table = self._fixture_table(name, self._fixture_schema)
+            self._fixture_table_cache[name] = table
 
-            # We change the table path below, so this ensures there are no name clashes
-            table.this.set("this", "__".join(part.name for part in table.parts))
+        return table
 
-            table.set("db", self._fixture_schema.copy())
-            if self._fixture_catalog:
-                table.set("catalog", self._fixture_catalog.copy())
+    def _fixture_table(self, name: str, schema: exp.Identifier) -> exp.Table:
+        table = exp.to_table(name, dialect=self._test_adapter_dialect)
 
-            self._fixture_table_cache[name] = table
+        # We change the table path below, so this ensures there are no name clashes
+        table.this.set("this", "__".join(part.name for part in table.parts))
+
+        table.set("db", schema.copy())
+        if self._fixture_catalog:
+            table.set("catalog", self._fixture_catalog.copy())
 
         return table
 
@@ -465,8 +526,17 @@ class ModelTest(unittest.TestCase):
 
     def _execute(self, query: exp.Query) -> pd.DataFrame:
         """Executes the given query using the testing engine adapter and returns a DataFrame."""
-        with patch.dict(self._test_adapter_dialect.generator_class.TRANSFORMS, self._transforms):
-            return self.engine_adapter.fetchdf(query)
+        if self._execution_time:
+            # The query is transformed instead of patching the dialect's transforms, which are
+            # shared by all tests that run concurrently.
+            query = t.cast(exp.Query, query.transform(self._freeze_current_time))
+        return self.engine_adapter.fetchdf(query)
+
+    def _freeze_current_time(self, node: exp.Expression) -> exp.Expression:
+        to_type = _CURRENT_TIME_TYPES.get(type(node))
+        if to_type:
+            return exp.cast(exp.Literal.string(self._execution_time), to_type)
+        return node
 
     def _create_df(
         self,
@@ -545,12 +615,26 @@ class SqlModelTest(ModelTest):
             self.assert_equal(expected, actual, sort=sort, partial=partial)
 
     def _render_model_query(self) -> exp.Query:
+        if self.cache is None:
+            return self._render_query_with_fixtures(self._test_fixture_table)
+
+        placeholder_schema = exp.to_identifier(FIXTURE_SCHEMA_PLACEHOLDER)
+        return self.cache.get_or_render_query(
+            self.model,
+            self.body.get("inputs", {}),
+            self.body.get("vars", {}),
+            self._fixture_schema,
+            self._fixture_catalog,
+            lambda: self._render_query_with_fixtures(
+                lambda name: self._fixture_table(name, placeholder_schema)
+            ),
+        )
+
+    def _render_query_with_fixtures(self, fixture_table: t.Callable[[str], exp.Table]) -> exp.Query:
         return self.model.render_query_or_raise(
             **self.body.get("vars", {}),
             engine_adapter=self.engine_adapter,
-            table_mapping={
-                name: self._test_fixture_table(name).sql() for name in self.body.get("inputs", {})
-            },
+            table_mapping={name: fixture_table(name).sql() for name in self.body.get("inputs", {})},
             runtime_stage=RuntimeStage.TESTING,
         )
 
@@ -567,6 +651,7 @@ class PythonModelTest(ModelTest):
         path: Path | None = None,
         preserve_fixtures: bool = False,
         default_catalog: str | None = None,
+        cache: ModelTestCache | None = None,
     ) -> None:
         """PythonModelTest encapsulates a unit test for a Python model.
 
@@ -579,6 +664,7 @@ class PythonModelTest(ModelTest):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            cache: An optional cache shared by tests of the same session.
         """
         from sqlmesh.core.test.context import TestExecutionContext
 
@@ -592,6 +678,7 @@ class PythonModelTest(ModelTest):
             path,
             preserve_fixtures,
             default_catalog,
+            cache,
         )
 
         self.context = TestExecutionContext(
@@ -602,6 +689,23 @@ class PythonModelTest(ModelTest):
             default_catalog=default_catalog,
         )
 
+    @property
+    def is_thread_safe(self) -> bool:
+        # Freezing time patches the time functions of the whole process.
+        return not self._execution_time
+
+    def set_engine_adapter(self, engine_adapter: EngineAdapter) -> None:
+        from sqlmesh.core.test.context import TestExecutionContext
+
+        super().set_engine_adapter(engine_adapter)
+        self.context = TestExecutionContext(
+            engine_adapter=engine_adapter,
+            models=self.models,
+            test=self,
+            default_dialect=self.dialect,
+            default_catalog=self.default_catalog,
+        )
+
     def runTest(self) -> None:
         values = self.body["outputs"].get("query")
         if values is not None:
@@ -615,14 +719,28 @@ class PythonModelTest(ModelTest):
 
     def _execute_model(self) -> pd.DataFrame:
         """Executes the python model and returns a DataFrame."""
-        time_ctx = freeze_time(self._execution_time) if self._execution_time else nullcontext()
-        with patch.dict(self._test_adapter_dialect.generator_class.TRANSFORMS, self._transforms):
-            with t.cast(AbstractContextManager, time_ctx):
+        if self._execution_time:
+            time_ctx: AbstractContextManager = freeze_time(self._execution_time)
+            transforms_ctx: AbstractContextManager = patch.dict(
+                self._test_adapter_dialect.generator_class.TRANSFORMS, self._transforms
+            )
+        else:
+            time_ctx = transforms_ctx = nullcontext()
+        with transforms_ctx:
+            with time_ctx:
                 df = next(self.model.render(context=self.context, **self.body.get("vars", {})))
                 assert not isinstance(df, exp.Expression)
                 return df if isinstance(df, pd.DataFrame) else df.toPandas()
 
 
+_CURRENT_TIME_TYPES: t.Dict[t.Type[exp.Expression], str] = {
+    exp.CurrentDate: "date",
+    exp.CurrentDatetime: "datetime",
+    exp.CurrentTime: "time",
+    exp.CurrentTimestamp: "timestamp",
+}
+
+
 def generate_test(
     model: Model,
     input_queries: t.Dict[str, str],
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import time
 import types
 import typing as t
 import unittest
 
+_SUCCESS = "success"
+_FAILURE = "failure"
+_ERROR = "error"
+_SKIP = "skip"
+
 
 class ModelTextTestResult(unittest.TextTestResult):
     successes: t.List[unittest.TestCase]
+    durations: t.List[t.Tuple[unittest.TestCase, float]]
 
     def __init__(self, *args: t.Any, **kwargs: t.Any):
         super().__init__(*args, **kwargs)
         self.successes = []
+        self.durations = []
+        self._start_times: t.Dict[unittest.TestCase, float] = {}
+
+    def startTest(self, test: unittest.TestCase) -> None:
+        super().startTest(test)
+        self._start_times[test] = time.perf_counter()
+
+    def stopTest(self, test: unittest.TestCase) -> None:
+        start_time = self._start_times.pop(test, None)
+        if start_time is not None:
+            self.durations.append((test, time.perf_counter() - start_time))
+        super().stopTest(test)
 
     def addFailure(
         self,
@@ -38,3 +57,72 @@ class ModelTextTestResult(unittest.TextTestResult):
         """
         super().addSuccess(test)
         self.successes.append(test)
+
+    def add_outcome(self, test: unittest.TestCase, outcome: ModelTestOutcome) -> None:
+        """Records the outcome of a test that was run against a different result, eg. in a worker.
+
+        Args:
+            test: The test case.
+            outcome: The outcome of the test case.
+        """
+        self.startTest(test)
+        self._start_times[test] = time.perf_counter() - outcome.duration
+        for status, details in outcome.statuses:
+            if status == _SUCCESS:
+                self.addSuccess(test)
+            elif status == _SKIP:
+                self.addSkip(test, details)
+            else:
+                err = (_FormattedError, _FormattedError(details), None)
+                if status == _FAILURE:
+                    self.addFailure(test, err)  # type: ignore
+                else:
+                    self.addError(test, err)  # type: ignore
+        self.stopTest(test)
+
+    def log_slowest_tests(self, count: int = 10) -> None:
+        """Writes the slowest tests and their durations to the output stream.
+
+        Args:
+            count: The number of tests to write.
+        """
+        slowest = sorted(self.durations, key=lambda d: d[1], reverse=True)[:count]
+        if not slowest:
+            return
+        self.stream.write(f"\nSlowest {len(slowest)} tests:\n")
+        for test, duration in slowest:
+            self.stream.write(f"{duration:.3f}s {test}\n")
+        self.stream.flush()
+
+    def _exc_info_to_string(self, err: t.Any, test: unittest.TestCase) -> str:
+        if err[0] is _FormattedError:
+            return str(err[1])
+        return super()._exc_info_to_string(err, test)  # type: ignore
+
+
+class ModelTestOutcome(t.NamedTuple):
+    """The picklable outcome of a test case, which may include multiple failures due to subtests.
+
+    Args:
+        statuses: Pairs of statuses and their formatted details, eg. a failure message.
+        duration: The time it took to run the test case in seconds.
+    """
+
+    statuses: t.List[t.Tuple[str, str]]
+    duration: float
+
+    @classmethod
+    def from_result(cls, result: ModelTextTestResult, duration: float) -> ModelTestOutcome:
+        """Creates the outcome of the only test case that was run against the given result."""
+        statuses: t.List[t.Tuple[str, str]] = [
+            *((_FAILURE, details) for _, details in result.failures),
+            *((_ERROR, details) for _, details in result.errors),
+            *((_SKIP, reason) for _, reason in result.skipped),
+        ]
+        if result.successes:
+            statuses.append((_SUCCESS, ""))
+        return cls(statuses=statuses, duration=duration)
+
+
+class _FormattedError(Exception):
+    """Carries an error that has already been formatted by another test result."""
@@ -10,6 +10,7 @@ from sqlglot import exp, parse_one
 from sqlmesh.core.dialect import normalize_and_quote, normalize_model_name
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.snapshot import DeployabilityIndex, Snapshot, to_table_mapping
+from sqlmesh.dbt.cache import RelationCache
 from sqlmesh.utils.errors import ConfigError, ParsetimeAdapterCallError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroReference
 
@@ -46,10 +47,7 @@ class BaseAdapter(abc.ABC):
 
     @abc.abstractmethod
     def list_relations(self, database: t.Optional[str], schema: str) -> t.List[BaseRelation]:
-        """Gets all relations in a given schema and optionally database.
-
-        TODO: Add caching functionality to avoid repeat visits to DB
-        """
+        """Gets all relations in a given schema and optionally database."""
 
     @abc.abstractmethod
     def list_relations_without_caching(self, schema_relation: BaseRelation) -> t.List[BaseRelation]:
@@ -177,6 +175,7 @@ class RuntimeAdapter(BaseAdapter):
         snapshots: t.Optional[t.Dict[str, Snapshot]] = None,
         table_mapping: t.Optional[t.Dict[str, str]] = None,
         deployability_index: t.Optional[DeployabilityIndex] = None,
+        relation_cache: t.Optional[RelationCache] = None,
     ):
         from dbt.adapters.base import BaseRelation
         from dbt.adapters.base.column import Column
@@ -194,6 +193,7 @@ class RuntimeAdapter(BaseAdapter):
             **to_table_mapping((snapshots or {}).values(), deployability_index),
             **table_mapping,
         }
+        self.relation_cache = relation_cache or RelationCache.for_engine_adapter(engine_adapter)
 
     def get_relation(
         self, database: t.Optional[str], schema: str, identifier: str
@@ -209,7 +209,16 @@ class RuntimeAdapter(BaseAdapter):
 
     def load_relation(self, relation: BaseRelation) -> t.Optional[BaseRelation]:
         mapped_table = self._map_table_name(self._normalize(self._relation_to_table(relation)))
-        if not self.engine_adapter.table_exists(mapped_table):
+        if not mapped_table.db:
+            exists = self.engine_adapter.table_exists(mapped_table)
+        else:
+            schema = exp.Table(
+                this=None, db=mapped_table.args["db"], catalog=mapped_table.args.get("catalog")
+            )
+            exists = self.relation_cache.table_exists(
+                mapped_table, lambda: self.engine_adapter.get_data_objects(schema)
+            )
+        if not exists:
             return None
 
         return self._table_to_relation(mapped_table)
@@ -218,12 +227,19 @@ class RuntimeAdapter(BaseAdapter):
         reference_relation = self.relation_type.create(
             database=database, schema=schema, quote_policy=self.quote_policy
         )
-        return self.list_relations_without_caching(reference_relation)
+        return self._list_relations(reference_relation, refresh=False)
 
     def list_relations_without_caching(self, schema_relation: BaseRelation) -> t.List[BaseRelation]:
+        # The listing is still stored so that subsequent lookups in the schema can use it.
+        return self._list_relations(schema_relation, refresh=True)
+
+    def _list_relations(self, schema_relation: BaseRelation, refresh: bool) -> t.List[BaseRelation]:
         from sqlmesh.dbt.relation import RelationType
 
         schema = self._normalize(self._schema(schema_relation))
+        data_objects = self.relation_cache.data_objects(
+            schema, lambda: self.engine_adapter.get_data_objects(schema), refresh=refresh
+        )
 
         relations = [
             self.relation_type.create(
@@ -238,7 +254,7 @@ class RuntimeAdapter(BaseAdapter):
                     else RelationType(do.type.lower().replace("_", ""))
                 ),
             )
-            for do in self.engine_adapter.get_data_objects(schema)
+            for do in data_objects
         ]
         return relations
 
@@ -248,7 +264,9 @@ class RuntimeAdapter(BaseAdapter):
         mapped_table = self._map_table_name(self._normalize(self._relation_to_table(relation)))
         return [
             Column.from_description(name=name, raw_data_type=dtype.sql(dialect=self.dialect))
-            for name, dtype in self.engine_adapter.columns(table_name=mapped_table).items()
+            for name, dtype in self.relation_cache.columns(
+                mapped_table, lambda: self.engine_adapter.columns(table_name=mapped_table)
+            ).items()
         ]
 
     def get_missing_columns(
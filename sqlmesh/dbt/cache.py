@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import typing as t
+import weakref
+from pathlib import Path
+from threading import Lock
+
+from sqlglot import exp
+
+from sqlmesh.dbt.common import Dependencies
+from sqlmesh.utils.cache import CacheBackend, CacheStats, FileCache, SQLiteCache, create_cache
+from sqlmesh.utils.hashing import md5
+from sqlmesh.utils.pydantic import PydanticModel
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.engine_adapter import EngineAdapter
+    from sqlmesh.core.engine_adapter.shared import DataObject
+
+V = t.TypeVar("V")
+
+
+class ManifestCacheEntry(PydanticModel):
+    # Maps unique IDs of manifest nodes and macros to the keys and values of their dependencies.
+    dependencies: t.Dict[str, t.Tuple[str, Dependencies]] = {}
+
+
+class ManifestCache:
+    """Persists the dependencies extracted from the nodes and macros of a dbt manifest across loads.
+
+    Extracting dependencies requires parsing the Jinja of every node and macro. The dependencies of
+    a node are keyed by the hash of the node's contents together with the hash of all macros in the
+    manifest, so only dependencies of nodes that changed since the last load, or of every node if a
+    macro changed, are extracted again.
+
+    Args:
+        path: The path to the cache folder.
+        backend: The storage of cached entries.
+    """
+
+    ENTRY_NAME = "dependencies"
+
+    def __init__(self, path: Path, backend: CacheBackend = CacheBackend.FILE):
+        self.path = path
+        self._file_cache: t.Union[
+            FileCache[ManifestCacheEntry], SQLiteCache[ManifestCacheEntry]
+        ] = create_cache(path, ManifestCacheEntry, prefix="dbt_manifest", backend=backend)
+        self._stored: t.Optional[t.Dict[str, t.Tuple[str, Dependencies]]] = None
+        # Entries of all nodes that were requested since the cache was last saved.
+        self._entries: t.Dict[str, t.Tuple[str, Dependencies]] = {}
+        self.stats = CacheStats()
+
+    def get_or_load(
+        self,
+        unique_id: str,
+        key: t.Iterable[t.Optional[str]],
+        loader: t.Callable[[], Dependencies],
+    ) -> Dependencies:
+        """Returns the stored dependencies of a node or extracts and stores them.
+
+        Args:
+            unique_id: The unique ID of the node in the manifest.
+            key: The contents which the node's dependencies are extracted from.
+            loader: Extracts the node's dependencies.
+
+        Returns:
+            The dependencies of the node.
+        """
+        if self._stored is None:
+            cache_entry = self._file_cache.get(self.ENTRY_NAME) or ManifestCacheEntry()
+            self._stored = cache_entry.dependencies
+
+        entry_key = md5(key)
+        stored_key, dependencies = self._stored.get(unique_id, ("", None))
+        if dependencies is not None and stored_key == entry_key:
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+            dependencies = loader()
+
+        self._entries[unique_id] = (entry_key, dependencies)
+        return dependencies.copy(deep=True)
+
+    def save(self) -> None:
+        """Persists the dependencies of all nodes that were requested since the cache was last saved.
+
+        Entries of nodes that weren't requested, eg. because they were deleted, are dropped.
+        """
+        stored = self._stored or {}
+        if self._entries.keys() != stored.keys() or any(
+            stored[unique_id][0] != key for unique_id, (key, _) in self._entries.items()
+        ):
+            self._file_cache.put(
+                self.ENTRY_NAME, value=ManifestCacheEntry(dependencies=self._entries)
+            )
+        self._stored = self._entries
+        self._entries = {}
+
+
+class RelationCache:
+    """Caches the relations and columns which dbt macros look up in the target database.
+
+    Relations are listed one schema at a time, so looking up many relations of the same schema takes
+    a single catalog query. Entries are invalidated whenever the engine adapter executes DDL, which
+    covers tables and views created, dropped, altered or renamed by SQLMesh as well as by dbt macros.
+    Names are matched case-insensitively, same as in dbt's own relation cache.
+
+    Only the presence of relations and columns is cached. A relation that is missing from a cached
+    listing is looked up in the database again, since it could have been created in a way that
+    doesn't go through DDL of this engine adapter (eg. by a native DataFrame load or by another
+    engine adapter). Empty listings and columns are never cached for the same reason.
+
+    The cache is shared by all runtime adapters of an engine adapter. It's reset at the beginning of
+    every scheduler run to pick up objects which were changed outside of SQLMesh.
+    """
+
+    _instances: weakref.WeakKeyDictionary[EngineAdapter, RelationCache] = (
+        weakref.WeakKeyDictionary()
+    )
+    _instances_lock = Lock()
+
+    def __init__(self) -> None:
+        self._data_objects: t.Dict[t.Tuple[str, str], t.List[DataObject]] = {}
+        self._columns: t.Dict[t.Tuple[str, str, str], t.Dict[str, exp.DataType]] = {}
+        self._lock = Lock()
+        # Incremented on every invalidation so that entries loaded concurrently aren't stored stale.
+        self._generation = 0
+        self.stats = CacheStats()
+
+    @classmethod
+    def for_engine_adapter(cls, engine_adapter: EngineAdapter) -> RelationCache:
+        """Returns the cache of the given engine adapter, which is invalidated by its DDL."""
+        with cls._instances_lock:
+            cache = cls._instances.get(engine_adapter)
+            if cache is None:
+                cache = cls()
+                engine_adapter.add_metadata_listener(cache.invalidate)
+                cls._instances[engine_adapter] = cache
+            return cache
+
+    def data_objects(
+        self,
+        schema: exp.Table,
+        loader: t.Callable[[], t.List[DataObject]],
+        refresh: bool = False,
+    ) -> t.List[DataObject]:
+        """Returns the data objects of a schema, listing them with the loader if they aren't cached.
+
+        Args:
+            schema: The schema, where the schema name is the table's `db` part.
+            loader: Lists the data objects of the schema.
+            refresh: Whether to list the data objects even if they are cached.
+
+        Returns:
+            The data objects of the schema.
+        """
+        data_objects = self._get_or_load(self._data_objects, _schema_key(schema), loader, refresh)
+        return list(data_objects)
+
+    def table_exists(self, table: exp.Table, loader: t.Callable[[], t.List[DataObject]]) -> bool:
+        """Returns whether a table or view exists by listing the data objects of its schema.
+
+        Tables which are missing from the cached listing are looked up again.
+
+        Args:
+            table: The qualified table.
+            loader: Lists the data objects of the table's schema.
+        """
+        key = _schema_key(table)
+        name = table.name.lower()
+        with self._lock:
+            cached = self._data_objects.get(key)
+            if cached is not None and _contains(cached, name):
+                self.stats.hits += 1
+                return True
+        return _contains(self._get_or_load(self._data_objects, key, loader, True), name)
+
+    def columns(
+        self, table: exp.Table, loader: t.Callable[[], t.Dict[str, exp.DataType]]
+    ) -> t.Dict[str, exp.DataType]:
+        """Returns the columns of a table, fetching them with the loader if they aren't cached.
+
+        Args:
+            table: The qualified table.
+            loader: Fetches the column names and types of the table.
+
+        Returns:
+            The column types by column name.
+        """
+        key = (*_schema_key(table), table.name.lower())
+        columns = self._get_or_load(self._columns, key, loader, False)
+        return dict(columns)
+
+    def invalidate(self, expression: t.Optional[exp.Expression] = None) -> None:
+        """Drops entries which are affected by a DDL statement.
+
+        Args:
+            expression: The executed CREATE, DROP or ALTER statement. If not provided, all entries are dropped.
+        """
+        tables = []
+        if isinstance(expression, (exp.Create, exp.Drop, exp.AlterTable)):
+            target = expression.this
+            if isinstance(target, exp.Schema):
+                target = target.this
+            if isinstance(target, exp.Table):
+                tables.append(target)
+            tables.extend(rename.this for rename in expression.find_all(exp.RenameTable))
+
+        with self._lock:
+            self._generation += 1
+            if not tables or any(not table.db and not table.name for table in tables):
+                self.stats.evictions += len(self._data_objects) + len(self._columns)
+                self._data_objects.clear()
+                self._columns.clear()
+                return
+
+            kind = expression.args.get("kind") if expression else None
+            for table in tables:
+                if isinstance(kind, str) and kind.upper() in ("SCHEMA", "DATABASE"):
+                    # Schemas are represented as tables without a name.
+                    schema_name, table_name = (table.db or table.name).lower(), None
+                else:
+                    schema_name, table_name = table.db.lower(), table.name.lower()
+                all_entries: t.List[t.Dict[t.Any, t.Any]] = [self._data_objects, self._columns]
+                for entries in all_entries:
+                    affected = [
+                        key for key in entries if _is_affected(key, schema_name, table_name)
+                    ]
+                    for key in affected:
+                        del entries[key]
+                    self.stats.evictions += len(affected)
+
+    def _get_or_load(
+        self,
+        entries: t.Dict[t.Any, V],
+        key: t.Tuple[str, ...],
+        loader: t.Callable[[], V],
+        refresh: bool,
+    ) -> V:
+        with self._lock:
+            if not refresh and key in entries:
+                self.stats.hits += 1
+                return entries[key]
+            self.stats.misses += 1
+            generation = self._generation
+
+        value = loader()
+
+        with self._lock:
+            if value and generation == self._generation:
+                entries[key] = value
+        return value
+
+
+def _contains(data_objects: t.List[DataObject], name: str) -> bool:
+    return any(data_object.name.lower() == name for data_object in data_objects)
+
+
+def _schema_key(table: exp.Table) -> t.Tuple[str, str]:
+    return (table.catalog.lower(), table.db.lower())
+
+
+def _is_affected(key: t.Tuple[str, ...], schema_name: str, table_name: t.Optional[str]) -> bool:
+    # Listings of a schema are keyed by (catalog, schema) and columns by (catalog, schema, table).
+    # Catalogs are ignored since DDL statements don't necessarily qualify tables with them.
+    if schema_name and key[1] != schema_name:
+        return False
+    return table_name is None or len(key) < 3 or key[2] == table_name
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+import time
 import typing as t
 from argparse import Namespace
 from collections import defaultdict
@@ -18,6 +19,7 @@ from dbt.tracking import do_not_track
 
 from sqlmesh.dbt.basemodel import Dependencies
 from sqlmesh.dbt.builtin import BUILTIN_FILTERS, BUILTIN_GLOBALS, OVERRIDDEN_MACROS
+from sqlmesh.dbt.cache import ManifestCache
 from sqlmesh.dbt.model import ModelConfig
 from sqlmesh.dbt.package import MacroConfig
 from sqlmesh.dbt.seed import SeedConfig
@@ -25,7 +27,9 @@ from sqlmesh.dbt.source import SourceConfig
 from sqlmesh.dbt.target import TargetConfig
 from sqlmesh.dbt.test import TestConfig
 from sqlmesh.dbt.util import DBT_VERSION
+from sqlmesh.utils.cache import CacheBackend
 from sqlmesh.utils.errors import ConfigError
+from sqlmesh.utils.hashing import md5
 from sqlmesh.utils.jinja import (
     MacroInfo,
     MacroReference,
@@ -58,12 +62,18 @@ class ManifestHelper:
         profile_name: str,
         target: TargetConfig,
         variable_overrides: t.Optional[t.Dict[str, t.Any]] = None,
+        cache_path: t.Optional[Path] = None,
+        cache_backend: CacheBackend = CacheBackend.FILE,
     ):
         self.project_path = project_path
         self.profiles_path = profiles_path
         self.profile_name = profile_name
         self.target = target
         self.variable_overrides = variable_overrides or {}
+        self.cache = ManifestCache(cache_path, backend=cache_backend) if cache_path else None
+        # Seconds spent on loading the manifest with dbt and on converting its nodes.
+        self.load_seconds: t.Optional[float] = None
+        self.convert_seconds: t.Optional[float] = None
 
         self.__manifest: t.Optional[Manifest] = None
         self._project_name: str = ""
@@ -80,6 +90,7 @@ class ManifestHelper:
         self._tests_by_owner: t.Dict[str, t.List[TestConfig]] = defaultdict(list)
         self._disabled_refs: t.Optional[t.Set[str]] = None
         self._disabled_sources: t.Optional[t.Set[str]] = None
+        self._dependencies_key: t.Optional[str] = None
 
     def tests(self, package_name: t.Optional[str] = None) -> TestConfigs:
         self._load_all()
@@ -113,12 +124,31 @@ class ManifestHelper:
     def _load_all(self) -> None:
         if self._is_loaded:
             return
+
+        load_start = time.perf_counter()
+        manifest = self._manifest
+        convert_start = time.perf_counter()
+
         self._load_macros()
         self._load_sources()
         self._load_tests()
         self._load_models_and_seeds()
         self._is_loaded = True
 
+        self.load_seconds = convert_start - load_start
+        self.convert_seconds = time.perf_counter() - convert_start
+        if self.cache:
+            self.cache.save()
+            logger.info(
+                "Loaded the dbt manifest of %s nodes and %s macros in %.2fs and converted it in %.2fs. Dependencies of %s nodes were restored from the cache and %s were extracted",
+                len(manifest.nodes),
+                len(manifest.macros),
+                self.load_seconds,
+                self.convert_seconds,
+                self.cache.stats.hits,
+                self.cache.stats.misses,
+            )
+
     def _load_sources(self) -> None:
         for source in self._manifest.sources.values():
             source_config = SourceConfig(
@@ -134,11 +164,11 @@ class ManifestHelper:
             if macro.name.startswith("test_"):
                 macro.macro_sql = _convert_jinja_test_to_macro(macro.macro_sql)
 
-            dependencies = Dependencies(macros=_macro_references(self._manifest, macro))
-            if not macro.name.startswith("materialization_") and not macro.name.startswith("test_"):
-                dependencies = dependencies.union(
-                    self._extra_dependencies(macro.macro_sql, macro.package_name)
-                )
+            dependencies = self._cached_dependencies(
+                macro.unique_id,
+                [macro.macro_sql, *sorted(macro.depends_on.macros)],
+                lambda: self._macro_dependencies(macro),
+            )
 
             self._macros_per_package[macro.package_name][macro.name] = MacroConfig(
                 info=MacroInfo(
@@ -149,6 +179,14 @@ class ManifestHelper:
                 path=Path(macro.original_file_path),
             )
 
+    def _macro_dependencies(self, macro: Macro) -> Dependencies:
+        dependencies = Dependencies(macros=_macro_references(self._manifest, macro))
+        if not macro.name.startswith("materialization_") and not macro.name.startswith("test_"):
+            dependencies = dependencies.union(
+                self._extra_dependencies(macro.macro_sql, macro.package_name)
+            )
+        return dependencies
+
     def _load_tests(self) -> None:
         for node in self._manifest.nodes.values():
             if node.resource_type != "test":
@@ -169,19 +207,11 @@ class ManifestHelper:
             if skip_test:
                 continue
 
-            dependencies = Dependencies(
-                macros=_macro_references(self._manifest, node),
-                refs=refs,
-                sources=_sources(node),
-            )
-            # Implicit dependencies for model test arg
-            dependencies.macros.append(MacroReference(package="dbt", name="get_where_subquery"))
-            dependencies.macros.append(MacroReference(package="dbt", name="should_store_failures"))
-
             sql = node.raw_code if DBT_VERSION >= (1, 3) else node.raw_sql  # type: ignore
-            dependencies = dependencies.union(self._extra_dependencies(sql, node.package_name))
-            dependencies = dependencies.union(
-                self._flatten_dependencies_from_macros(dependencies.macros, node.package_name)
+            dependencies = self._cached_dependencies(
+                node.unique_id,
+                _node_dependencies_key(node, sql),
+                lambda: self._test_dependencies(node, sql, refs),
             )
 
             test_model = _test_model(node)
@@ -197,6 +227,21 @@ class ManifestHelper:
             if test_model:
                 self._tests_by_owner[test_model].append(test)
 
+    def _test_dependencies(self, node: ManifestNode, sql: str, refs: t.Set[str]) -> Dependencies:
+        dependencies = Dependencies(
+            macros=_macro_references(self._manifest, node),
+            refs=refs,
+            sources=_sources(node),
+        )
+        # Implicit dependencies for model test arg
+        dependencies.macros.append(MacroReference(package="dbt", name="get_where_subquery"))
+        dependencies.macros.append(MacroReference(package="dbt", name="should_store_failures"))
+
+        dependencies = dependencies.union(self._extra_dependencies(sql, node.package_name))
+        return dependencies.union(
+            self._flatten_dependencies_from_macros(dependencies.macros, node.package_name)
+        )
+
     def _load_models_and_seeds(self) -> None:
         for node in self._manifest.nodes.values():
             if (
@@ -205,7 +250,6 @@ class ManifestHelper:
             ):
                 continue
 
-            macro_references = _macro_references(self._manifest, node)
             tests = (
                 self._tests_by_owner[node.name]
                 + self._tests_by_owner[f"{node.package_name}.{node.name}"]
@@ -214,12 +258,10 @@ class ManifestHelper:
 
             if node.resource_type in {"model", "snapshot"}:
                 sql = node.raw_code if DBT_VERSION >= (1, 3) else node.raw_sql  # type: ignore
-                dependencies = Dependencies(
-                    macros=macro_references, refs=_refs(node), sources=_sources(node)
-                )
-                dependencies = dependencies.union(self._extra_dependencies(sql, node.package_name))
-                dependencies = dependencies.union(
-                    self._flatten_dependencies_from_macros(dependencies.macros, node.package_name)
+                dependencies = self._cached_dependencies(
+                    node.unique_id,
+                    _node_dependencies_key(node, sql),
+                    lambda: self._model_dependencies(node, sql),
                 )
 
                 self._models_per_package[node.package_name][node.name] = ModelConfig(
@@ -230,11 +272,43 @@ class ManifestHelper:
                 )
             else:
                 self._seeds_per_package[node.package_name][node.name] = SeedConfig(
-                    dependencies=Dependencies(macros=macro_references),
+                    dependencies=Dependencies(macros=_macro_references(self._manifest, node)),
                     tests=tests,
                     **node_config,
                 )
 
+    def _model_dependencies(self, node: ManifestNode, sql: str) -> Dependencies:
+        dependencies = Dependencies(
+            macros=_macro_references(self._manifest, node), refs=_refs(node), sources=_sources(node)
+        )
+        dependencies = dependencies.union(self._extra_dependencies(sql, node.package_name))
+        return dependencies.union(
+            self._flatten_dependencies_from_macros(dependencies.macros, node.package_name)
+        )
+
+    def _cached_dependencies(
+        self, unique_id: str, key: t.List[str], loader: t.Callable[[], Dependencies]
+    ) -> Dependencies:
+        if not self.cache:
+            return loader()
+
+        if self._dependencies_key is None:
+            # Dependencies of a node are resolved against all macros and enabled nodes of the manifest.
+            self._is_disabled_ref("")
+            self._dependencies_key = md5(
+                [
+                    self._project_name,
+                    *sorted(
+                        f"{macro.unique_id}:{macro.macro_sql}"
+                        for macro in self._manifest.macros.values()
+                    ),
+                    *sorted(self._disabled_refs or ()),
+                    *sorted(self._disabled_sources or ()),
+                ]
+            )
+
+        return self.cache.get_or_load(unique_id, [self._dependencies_key, *key], loader)
+
     @property
     def _manifest(self) -> Manifest:
         if not self.__manifest:
@@ -474,6 +548,17 @@ def _test_model(node: ManifestNode) -> t.Optional[str]:
     return None
 
 
+def _node_dependencies_key(node: ManifestNode, sql: str) -> t.List[str]:
+    return [
+        node.resource_type,
+        node.package_name,
+        sql,
+        *sorted(node.depends_on.macros),
+        *sorted(_refs(node)),
+        *sorted(_sources(node)),
+    ]
+
+
 def _node_base_config(node: ManifestNode) -> t.Dict[str, t.Any]:
     return {
         **_config(node),
@@ -4,6 +4,7 @@ import logging
 import typing as t
 from pathlib import Path
 
+from sqlmesh.core import constants as c
 from sqlmesh.dbt.common import PROJECT_FILENAME, load_yaml
 from sqlmesh.dbt.context import DbtContext
 from sqlmesh.dbt.manifest import ManifestHelper
@@ -77,6 +78,8 @@ class Project:
             profile_name,
             target=profile.target,
             variable_overrides=variable_overrides,
+            cache_path=context.project_root / c.CACHE / profile.target.name,
+            cache_backend=context.sqlmesh_config.cache_backend,
         )
 
         extra_fields = profile.target.extra
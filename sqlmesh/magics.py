@@ -604,6 +604,16 @@ class SQLMeshMagics(Magics):
         default=3,
         help="The number of decimal places to keep when comparing floating point columns. Default: 3",
     )
+    @argument(
+        "--buckets",
+        type=int,
+        help="The number of hash buckets to compare before joining rows. Only rows in differing buckets are joined.",
+    )
+    @argument(
+        "--sample-rate",
+        type=float,
+        help="The fraction of join keys to sample from both tables.",
+    )
     @line_magic
     @pass_sqlmesh_context
     def table_diff(self, context: Context, line: str) -> None:
@@ -622,6 +632,8 @@ class SQLMeshMagics(Magics):
             limit=args.limit,
             show_sample=args.show_sample,
             decimals=args.decimals,
+            buckets=args.buckets,
+            sample_rate=args.sample_rate,
         )
 
     @magic_arguments()
@@ -814,6 +826,17 @@ class SQLMeshMagics(Magics):
         action="store_true",
         help="Preserve the fixture tables in the testing database, useful for debugging.",
     )
+    @argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of workers that run tests concurrently. Default: 1",
+    )
+    @argument(
+        "--use-processes",
+        action="store_true",
+        help="Run tests in forked worker processes instead of threads.",
+    )
     @line_magic
     @pass_sqlmesh_context
     def run_test(self, context: Context, line: str) -> None:
@@ -824,6 +847,8 @@ class SQLMeshMagics(Magics):
             tests=args.tests,
             verbose=args.verbose,
             preserve_fixtures=args.preserve_fixtures,
+            workers=args.workers,
+            use_processes=args.use_processes,
         )
 
     @magic_arguments()
@@ -0,0 +1,114 @@
+"""Create a table with materialized interval summaries of snapshots."""
+
+import json
+import typing as t
+from collections import defaultdict
+
+import pandas as pd
+from sqlglot import exp
+
+from sqlmesh.utils.date import now_timestamp
+from sqlmesh.utils.migration import index_text_type
+
+
+def migrate(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    intervals_table = "_intervals"
+    interval_summaries_table = "_interval_summaries"
+    if schema:
+        intervals_table = f"{schema}.{intervals_table}"
+        interval_summaries_table = f"{schema}.{interval_summaries_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+    columns_to_types = {
+        "name": exp.DataType.build(index_type),
+        "identifier": exp.DataType.build(index_type),
+        "version": exp.DataType.build(index_type),
+        "intervals": exp.DataType.build("text"),
+        "dev_intervals": exp.DataType.build("text"),
+        "updated_ts": exp.DataType.build("bigint"),
+    }
+
+    engine_adapter.create_state_table(
+        interval_summaries_table,
+        columns_to_types,
+        primary_key=("name", "identifier"),
+    )
+
+    engine_adapter.create_index(
+        interval_summaries_table, "interval_summaries_name_version_idx", ("name", "version")
+    )
+
+    summaries: t.Dict[t.Tuple[str, str, str], t.Tuple[t.List, t.List]] = {}
+    # Added intervals are buffered and merged in a single pass before the next removal.
+    added: t.Dict[t.Tuple[t.Tuple[str, str, str], bool], t.List] = defaultdict(list)
+    for name, identifier, version, start_ts, end_ts, is_dev, is_removed in engine_adapter.fetchall(
+        exp.select("name", "identifier", "version", "start_ts", "end_ts", "is_dev", "is_removed")
+        .from_(intervals_table)
+        .order_by("name", "identifier", "created_ts", "is_removed"),
+        quote_identifiers=True,
+    ):
+        key = (name, identifier, version)
+        intervals, dev_intervals = summaries.setdefault(key, ([], []))
+        target = dev_intervals if is_dev else intervals
+        pending = added[(key, bool(is_dev))]
+        if is_removed:
+            target[:] = _remove_interval(
+                _merge_intervals(target, pending), int(start_ts), int(end_ts)
+            )
+            pending.clear()
+        else:
+            pending.append([int(start_ts), int(end_ts)])
+
+    for (key, is_dev), pending in added.items():
+        if pending:
+            target = summaries[key][1 if is_dev else 0]
+            target[:] = _merge_intervals(target, pending)
+
+    if summaries:
+        updated_ts = now_timestamp()
+        engine_adapter.insert_append(
+            interval_summaries_table,
+            pd.DataFrame(
+                [
+                    {
+                        "name": name,
+                        "identifier": identifier,
+                        "version": version,
+                        "intervals": json.dumps(intervals),
+                        "dev_intervals": json.dumps(dev_intervals),
+                        "updated_ts": updated_ts,
+                    }
+                    for (name, identifier, version), (intervals, dev_intervals) in summaries.items()
+                ]
+            ),
+            columns_to_types=columns_to_types,
+        )
+
+
+def _merge_intervals(intervals: t.List, added: t.List) -> t.List:
+    if not added:
+        return intervals
+    merged: t.List = []
+    for start, end in sorted([*intervals, *added]):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _remove_interval(intervals: t.List, start: int, end: int) -> t.List:
+    remaining = []
+    for interval_start, interval_end in intervals:
+        if interval_end <= start or interval_start >= end:
+            remaining.append([interval_start, interval_end])
+            continue
+        if interval_start < start:
+            remaining.append([interval_start, start])
+        if interval_end > end:
+            remaining.append([end, interval_end])
+    return remaining
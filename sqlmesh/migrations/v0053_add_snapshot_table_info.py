@@ -0,0 +1,93 @@
+"""Add columns with the table info and timestamps of snapshots to the snapshots table."""
+
+import json
+
+import pandas as pd
+from sqlglot import exp
+
+from sqlmesh.utils.migration import index_text_type
+
+
+def migrate(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    snapshots_table = "_snapshots"
+    if schema:
+        snapshots_table = f"{schema}.{snapshots_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+
+    for column, column_type in (
+        ("table_info", "text"),
+        ("unpaused_ts", "bigint"),
+        ("updated_ts", "bigint"),
+    ):
+        engine_adapter.execute(
+            exp.AlterTable(
+                this=exp.to_table(snapshots_table),
+                actions=[
+                    exp.ColumnDef(
+                        this=exp.to_column(column),
+                        kind=exp.DataType.build(column_type),
+                    )
+                ],
+            )
+        )
+
+    new_snapshots = []
+
+    for name, identifier, version, snapshot, kind_name, expiration_ts in engine_adapter.fetchall(
+        exp.select("name", "identifier", "version", "snapshot", "kind_name", "expiration_ts").from_(
+            snapshots_table
+        ),
+        quote_identifiers=True,
+    ):
+        parsed_snapshot = json.loads(snapshot)
+        node = parsed_snapshot["node"]
+        new_snapshots.append(
+            {
+                "name": name,
+                "identifier": identifier,
+                "version": version,
+                "snapshot": snapshot,
+                "kind_name": kind_name,
+                "expiration_ts": expiration_ts,
+                "table_info": json.dumps(
+                    {
+                        "physical_schema": parsed_snapshot["physical_schema"],
+                        "name": parsed_snapshot["name"],
+                        "fingerprint": parsed_snapshot["fingerprint"],
+                        "version": parsed_snapshot["version"],
+                        "temp_version": parsed_snapshot.get("temp_version"),
+                        "parents": parsed_snapshot["parents"],
+                        "previous_versions": parsed_snapshot.get("previous_versions", []),
+                        "change_category": parsed_snapshot.get("change_category"),
+                        "kind_name": (
+                            node["kind"]["name"] if node.get("source_type") != "audit" else None
+                        ),
+                        "node_type": "audit" if node.get("source_type") == "audit" else "model",
+                    }
+                ),
+                "unpaused_ts": parsed_snapshot.get("unpaused_ts"),
+                "updated_ts": parsed_snapshot["updated_ts"],
+            }
+        )
+
+    if new_snapshots:
+        engine_adapter.delete_from(snapshots_table, "TRUE")
+
+        engine_adapter.insert_append(
+            snapshots_table,
+            pd.DataFrame(new_snapshots),
+            columns_to_types={
+                "name": exp.DataType.build(index_type),
+                "identifier": exp.DataType.build(index_type),
+                "version": exp.DataType.build(index_type),
+                "snapshot": exp.DataType.build("text"),
+                "kind_name": exp.DataType.build(index_type),
+                "expiration_ts": exp.DataType.build("bigint"),
+                "table_info": exp.DataType.build("text"),
+                "unpaused_ts": exp.DataType.build("bigint"),
+                "updated_ts": exp.DataType.build("bigint"),
+            },
+        )
@@ -0,0 +1,69 @@
+"""Create a table with IDs of snapshots that are referenced by environments."""
+
+import json
+import zlib
+
+import pandas as pd
+from sqlglot import exp
+
+from sqlmesh.utils.migration import index_text_type
+
+
+def migrate(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    environments_table = "_environments"
+    environment_snapshots_table = "_environment_snapshots"
+    if schema:
+        environments_table = f"{schema}.{environments_table}"
+        environment_snapshots_table = f"{schema}.{environment_snapshots_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+    columns_to_types = {
+        "environment": exp.DataType.build(index_type),
+        "name": exp.DataType.build(index_type),
+        "identifier": exp.DataType.build(index_type),
+    }
+
+    engine_adapter.create_state_table(
+        environment_snapshots_table,
+        columns_to_types,
+        primary_key=("environment", "name", "identifier"),
+    )
+
+    engine_adapter.create_index(
+        environment_snapshots_table,
+        "environment_snapshots_name_identifier_idx",
+        ("name", "identifier"),
+    )
+
+    environment_snapshots = {
+        (environment, snapshot["name"], _identifier(snapshot["fingerprint"]))
+        for environment, snapshots in engine_adapter.fetchall(
+            exp.select("name", "snapshots").from_(environments_table),
+            quote_identifiers=True,
+        )
+        for snapshot in json.loads(snapshots)
+    }
+
+    if environment_snapshots:
+        engine_adapter.insert_append(
+            environment_snapshots_table,
+            pd.DataFrame(
+                [
+                    {"environment": environment, "name": name, "identifier": identifier}
+                    for environment, name, identifier in sorted(environment_snapshots)
+                ]
+            ),
+            columns_to_types=columns_to_types,
+        )
+
+
+def _identifier(fingerprint):  # type: ignore
+    data = [
+        fingerprint["data_hash"],
+        fingerprint["metadata_hash"],
+        fingerprint["parent_data_hash"],
+        fingerprint["parent_metadata_hash"],
+    ]
+    return str(zlib.crc32(";".join("" if d is None else d for d in data).encode("utf-8")))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import json
 import logging
 import typing as t
@@ -127,6 +128,37 @@ def get_snapshots() -> Response:
         return _success(common.SnapshotsResponse(snapshots=snapshots))
 
 
+@sqlmesh_api_v1.route("/snapshots/bulk", methods=["POST"])
+@csrf.exempt
+@check_authentication
+def get_snapshots_bulk() -> Response:
+    bulk_request = common.SnapshotsBulkRequest.parse_obj(_json_body())
+    cached_etags = {s.snapshot_id: s.etag for s in bulk_request.cached_snapshots}
+
+    response = common.SnapshotsBulkResponse()
+    with util.scoped_state_sync() as state_sync:
+        snapshot_ids = [*bulk_request.snapshot_ids, *cached_etags]
+        if snapshot_ids:
+            for snapshot_id, snapshot in state_sync.get_snapshots(snapshot_ids).items():
+                etag = common.snapshot_etag(snapshot)
+                if cached_etags.get(snapshot_id) == etag:
+                    response.unchanged_snapshot_ids.append(snapshot_id)
+                else:
+                    response.snapshots.append(snapshot)
+                    response.etags.append(etag)
+        if bulk_request.check_existence_ids:
+            response.existing_snapshot_ids = list(
+                state_sync.snapshots_exist(bulk_request.check_existence_ids)
+            )
+        if bulk_request.node_names:
+            response.existing_node_names = list(
+                state_sync.nodes_exist(
+                    bulk_request.node_names, exclude_external=bulk_request.exclude_external
+                )
+            )
+    return _success(response, compress=True)
+
+
 @sqlmesh_api_v1.route("/models")
 @csrf.exempt
 @check_authentication
@@ -151,9 +183,22 @@ def get_versions() -> Response:
 T = t.TypeVar("T", bound=PydanticModel)
 
 
-def _success(data: T, status_code: int = 200) -> Response:
-    response = make_response(data.json(), status_code)
+# Response bodies smaller than this number of bytes are never compressed.
+MIN_COMPRESSED_RESPONSE_SIZE = 1024
+
+
+def _success(data: T, status_code: int = 200, compress: bool = False) -> Response:
+    body = data.json().encode("utf-8")
+    compressed = (
+        compress
+        and len(body) >= MIN_COMPRESSED_RESPONSE_SIZE
+        and "gzip" in request.accept_encodings
+    )
+    response = make_response(gzip.compress(body) if compressed else body, status_code)
     response.mimetype = "application/json"
+    if compressed:
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
     return response
 
 
@@ -161,6 +206,13 @@ def _error(message: str, status_code: int = 400) -> Response:
     return make_response(jsonify(message=message), status_code)
 
 
+def _json_body() -> t.Any:
+    body = request.get_data()
+    if request.content_encoding == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body) if body else {}
+
+
 def _snapshot_ids_from_request() -> t.Optional[t.List[SnapshotId]]:
     if "ids" not in request.args:
         return None
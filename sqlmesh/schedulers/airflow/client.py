@@ -1,5 +1,7 @@
 import abc
+import gzip
 import json
+import logging
 import time
 import typing as t
 import uuid
@@ -16,6 +18,7 @@ from sqlmesh.core.state_sync import Versions
 from sqlmesh.core.user import User
 from sqlmesh.schedulers.airflow import common
 from sqlmesh.utils import unique
+from sqlmesh.utils.concurrency import concurrent_apply_to_values
 from sqlmesh.utils.date import TimeLike
 from sqlmesh.utils.errors import (
     ApiServerError,
@@ -25,17 +28,25 @@ from sqlmesh.utils.errors import (
 )
 from sqlmesh.utils.pydantic import PydanticModel
 
+logger = logging.getLogger(__name__)
+
+A = t.TypeVar("A")
+
 DAG_RUN_PATH_TEMPLATE = "api/v1/dags/{}/dagRuns"
 
 
 PLANS_PATH = f"{common.SQLMESH_API_BASE_PATH}/plans"
 ENVIRONMENTS_PATH = f"{common.SQLMESH_API_BASE_PATH}/environments"
 SNAPSHOTS_PATH = f"{common.SQLMESH_API_BASE_PATH}/snapshots"
+SNAPSHOTS_BULK_PATH = f"{SNAPSHOTS_PATH}/bulk"
 SEEDS_PATH = f"{common.SQLMESH_API_BASE_PATH}/seeds"
 INTERVALS_PATH = f"{common.SQLMESH_API_BASE_PATH}/intervals"
 MODELS_PATH = f"{common.SQLMESH_API_BASE_PATH}/models"
 VERSIONS_PATH = f"{common.SQLMESH_API_BASE_PATH}/versions"
 
+# The number of snapshot IDs or node names in a single bulk request if no batch size was configured.
+DEFAULT_BULK_BATCH_SIZE = 1000
+
 
 class BaseAirflowClient(abc.ABC):
     def __init__(self, airflow_url: str, console: t.Optional[Console]):
@@ -176,10 +187,16 @@ class AirflowClient(BaseAirflowClient):
         airflow_url: str,
         console: t.Optional[Console] = None,
         snapshot_ids_batch_size: t.Optional[int] = None,
+        max_concurrent_requests: int = 1,
     ):
         super().__init__(airflow_url, console)
         self._session = session
         self._snapshot_ids_batch_size = snapshot_ids_batch_size
+        self._max_concurrent_requests = max_concurrent_requests
+        # Servers running an older version of the SQLMesh plugin don't provide the bulk API.
+        self._bulk_api_supported = True
+        # Snapshots fetched through the bulk API together with their ETags.
+        self._snapshot_cache: t.Dict[SnapshotId, t.Tuple[str, Snapshot]] = {}
 
     def apply_plan(
         self,
@@ -234,12 +251,26 @@ class AirflowClient(BaseAirflowClient):
         raise_for_status(response)
 
     def get_snapshots(self, snapshot_ids: t.Optional[t.List[SnapshotId]]) -> t.List[Snapshot]:
-        output = []
-
-        if snapshot_ids is not None:
-            for ids_batch in _list_to_json(
-                unique(snapshot_ids), batch_size=self._snapshot_ids_batch_size
-            ):
+        if snapshot_ids is None:
+            return common.SnapshotsResponse.parse_obj(self._get(SNAPSHOTS_PATH)).snapshots
+
+        snapshot_ids = unique(snapshot_ids)
+        responses = self._post_bulk(
+            [
+                common.SnapshotsBulkRequest(
+                    snapshot_ids=[s for s in batch if s not in self._snapshot_cache],
+                    cached_snapshots=[
+                        common.SnapshotEtag(snapshot_id=s, etag=self._snapshot_cache[s][0])
+                        for s in batch
+                        if s in self._snapshot_cache
+                    ],
+                )
+                for batch in self._bulk_batches(snapshot_ids)
+            ]
+        )
+        if responses is None:
+            output = []
+            for ids_batch in _list_to_json(snapshot_ids, batch_size=self._snapshot_ids_batch_size):
                 output.extend(
                     common.SnapshotsResponse.parse_obj(
                         self._get(SNAPSHOTS_PATH, ids=ids_batch)
@@ -247,13 +278,36 @@ class AirflowClient(BaseAirflowClient):
                 )
             return output
 
-        return common.SnapshotsResponse.parse_obj(self._get(SNAPSHOTS_PATH)).snapshots
+        found = set()
+        for response in responses:
+            for snapshot, etag in zip(response.snapshots, response.etags):
+                self._snapshot_cache[snapshot.snapshot_id] = (etag, snapshot)
+                found.add(snapshot.snapshot_id)
+            found.update(response.unchanged_snapshot_ids)
+
+        output = []
+        for snapshot_id in snapshot_ids:
+            if snapshot_id in found:
+                # Callers modify returned snapshots, so the cached instances are never handed out.
+                output.append(self._snapshot_cache[snapshot_id][1].copy(deep=True))
+            else:
+                # The snapshot has been deleted since it was cached.
+                self._snapshot_cache.pop(snapshot_id, None)
+        return output
 
     def snapshots_exist(self, snapshot_ids: t.List[SnapshotId]) -> t.Set[SnapshotId]:
+        snapshot_ids = unique(snapshot_ids)
+        responses = self._post_bulk(
+            [
+                common.SnapshotsBulkRequest(check_existence_ids=batch)
+                for batch in self._bulk_batches(snapshot_ids)
+            ]
+        )
+        if responses is not None:
+            return {s for response in responses for s in response.existing_snapshot_ids}
+
         output = set()
-        for ids_batch in _list_to_json(
-            unique(snapshot_ids), batch_size=self._snapshot_ids_batch_size
-        ):
+        for ids_batch in _list_to_json(snapshot_ids, batch_size=self._snapshot_ids_batch_size):
             output |= set(
                 common.SnapshotIdsResponse.parse_obj(
                     self._get(SNAPSHOTS_PATH, "check_existence", ids=ids_batch)
@@ -263,6 +317,16 @@ class AirflowClient(BaseAirflowClient):
         return output
 
     def nodes_exist(self, names: t.Iterable[str], exclude_external: bool = False) -> t.Set[str]:
+        names = unique(names)
+        responses = self._post_bulk(
+            [
+                common.SnapshotsBulkRequest(node_names=batch, exclude_external=exclude_external)
+                for batch in self._bulk_batches(names)
+            ]
+        )
+        if responses is not None:
+            return {name for response in responses for name in response.existing_node_names}
+
         flags = ["exclude_external"] if exclude_external else []
         return set(
             common.ExistingModelsResponse.parse_obj(
@@ -341,6 +405,46 @@ class AirflowClient(BaseAirflowClient):
     def _get_dag(self, dag_id: str) -> t.Dict[str, t.Any]:
         return self._get(f"api/v1/dags/{dag_id}")
 
+    def _bulk_batches(self, values: t.List[A]) -> t.List[t.List[A]]:
+        batch_size = self._snapshot_ids_batch_size or DEFAULT_BULK_BATCH_SIZE
+        return [values[i : i + batch_size] for i in range(0, len(values), batch_size)]
+
+    def _post_bulk(
+        self, requests: t.List[common.SnapshotsBulkRequest]
+    ) -> t.Optional[t.List[common.SnapshotsBulkResponse]]:
+        """Sends bulk requests concurrently.
+
+        Args:
+            requests: The bulk requests.
+
+        Returns:
+            The responses in the same order as the requests or None if the server doesn't support
+            the bulk API.
+        """
+        if not self._bulk_api_supported:
+            return None
+        try:
+            return concurrent_apply_to_values(
+                requests, self._post_bulk_request, self._max_concurrent_requests
+            )
+        except NotFoundError:
+            logger.warning(
+                "The Airflow webserver doesn't support bulk state requests, consider upgrading the SQLMesh plugin"
+            )
+            self._bulk_api_supported = False
+            return None
+
+    def _post_bulk_request(
+        self, request: common.SnapshotsBulkRequest
+    ) -> common.SnapshotsBulkResponse:
+        response = self._session.post(
+            urljoin(self._airflow_url, SNAPSHOTS_BULK_PATH),
+            data=gzip.compress(request.json().encode("utf-8")),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        raise_for_status(response)
+        return common.SnapshotsBulkResponse.parse_obj(response.json())
+
     def _get(self, path: str, *flags: str, **params: str) -> t.Dict[str, t.Any]:
         all_params = [*flags, *([urlencode(params)] if params else [])]
         query_string = "&".join(all_params)
@@ -18,6 +18,7 @@ from sqlmesh.core.snapshot.definition import Interval as SnapshotInterval
 from sqlmesh.core.user import User
 from sqlmesh.utils import sanitize_name
 from sqlmesh.utils.date import TimeLike
+from sqlmesh.utils.hashing import md5
 from sqlmesh.utils.pydantic import PydanticModel
 
 JANITOR_DAG_ID = "sqlmesh_janitor_dag"
@@ -103,6 +104,34 @@ class SnapshotsResponse(PydanticModel):
     snapshots: t.List[Snapshot]
 
 
+class SnapshotEtag(PydanticModel):
+    snapshot_id: SnapshotId
+    etag: str
+
+
+class SnapshotsBulkRequest(PydanticModel):
+    """A request that reads snapshots and nodes in a single round trip.
+
+    Snapshots which the client has already cached are passed together with their ETags and are
+    only returned if they have changed since.
+    """
+
+    snapshot_ids: t.List[SnapshotId] = []
+    cached_snapshots: t.List[SnapshotEtag] = []
+    check_existence_ids: t.List[SnapshotId] = []
+    node_names: t.List[str] = []
+    exclude_external: bool = False
+
+
+class SnapshotsBulkResponse(PydanticModel):
+    # The returned snapshots and their ETags in the same order.
+    snapshots: t.List[Snapshot] = []
+    etags: t.List[str] = []
+    unchanged_snapshot_ids: t.List[SnapshotId] = []
+    existing_snapshot_ids: t.List[SnapshotId] = []
+    existing_node_names: t.List[str] = []
+
+
 class SnapshotIntervalsResponse(PydanticModel):
     snapshot_intervals: t.List[SnapshotIntervals]
 
@@ -133,5 +162,10 @@ def dag_id_for_name_version(name: str, version: str) -> str:
     return f"sqlmesh_snapshot_{sanitize_name(name)}_{version}_dag"
 
 
+def snapshot_etag(snapshot: Snapshot) -> str:
+    """Returns the ETag of a snapshot which changes whenever any of its attributes change."""
+    return md5([snapshot.json()])
+
+
 def plan_application_dag_id(environment: str, request_id: str) -> str:
     return f"sqlmesh_plan_application__{environment}__{request_id}"
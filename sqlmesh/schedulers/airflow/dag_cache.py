@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import logging
+import typing as t
+from pathlib import Path
+
+from sqlglot import exp
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.snapshot import Snapshot, SnapshotId, SnapshotIdLike, SnapshotTableInfo
+from sqlmesh.core.state_sync import EngineAdapterStateSync, StateSync
+from sqlmesh.core.state_sync.base import DelegatingStateSync, Versions
+from sqlmesh.schedulers.airflow import common
+from sqlmesh.schedulers.airflow.plan import PlanDagState
+from sqlmesh.utils import random_id
+from sqlmesh.utils.cache import SQLiteCache
+from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.pydantic import PydanticModel
+
+logger = logging.getLogger(__name__)
+
+
+class DagStateStamp(PydanticModel):
+    """Version stamps of the state that DAG generation depends on.
+
+    The stamps are read with cheap queries that don't deserialize any environments, snapshots or
+    plan DAG specs, so that an unchanged state can be detected on every DAG file parse.
+    """
+
+    versions: Versions
+    prod_plan_id: t.Optional[str] = None
+    prod_finalized_ts: t.Optional[int] = None
+    plan_request_ids: t.List[str] = []
+
+    @property
+    def prod_stamp(self) -> t.Tuple[Versions, t.Optional[str], t.Optional[int]]:
+        return (self.versions, self.prod_plan_id, self.prod_finalized_ts)
+
+
+class _DagState(PydanticModel):
+    stamp: DagStateStamp
+    prod_snapshots: t.Optional[t.List[SnapshotTableInfo]] = None
+    plan_dag_specs: t.List[common.PlanDagSpec] = []
+    # Maps cached snapshots to IDs of their cache entries.
+    snapshot_entry_ids: t.Dict[str, str] = {}
+
+
+class DagStateCache(DelegatingStateSync):
+    """Persists the state that DAG generation reads across DAG file parses on an Airflow worker.
+
+    The production environment, plan DAG specs and snapshots are cached on the local disk together
+    with version stamps of the state. Each call to `refresh` probes the state for the current stamps.
+    When they match the cached ones, no other state is read. Otherwise, only new plan DAG specs and
+    snapshots that could have been updated since the previous refresh are fetched.
+
+    Snapshot records are only updated in ways that matter for DAG generation (eg. when they get
+    unpaused) while the production environment is being promoted. Therefore, all cached snapshots
+    are reused while the production environment stays the same, and only the production snapshots
+    which remain in the finalized production environment are reused after it changes.
+
+    The cache folder is only made accessible to the current user and entries are stored as JSON,
+    so that nothing is unpickled from the local disk during DAG file parsing.
+
+    Args:
+        state_sync: The base state sync.
+        path: The path to the cache folder.
+    """
+
+    STATE_ENTRY_NAME = "dag_state"
+
+    def __init__(self, state_sync: StateSync, path: Path):
+        super().__init__(state_sync)
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.chmod(0o700)
+        self._state_cache = SQLiteCache(path, _DagState, prefix="airflow_dag_state", trusted=False)
+        self._snapshot_cache = SQLiteCache(
+            path, Snapshot, prefix="airflow_dag_snapshot", trusted=False
+        )
+        self._state: t.Optional[_DagState] = None
+        self._snapshots: t.Dict[SnapshotId, Snapshot] = {}
+
+    @property
+    def prod_snapshots(self) -> t.Optional[t.List[SnapshotTableInfo]]:
+        """Snapshots of the production environment or None if it doesn't exist."""
+        return self._refreshed_state.prod_snapshots
+
+    @property
+    def plan_dag_specs(self) -> t.List[common.PlanDagSpec]:
+        """All plan DAG specs in the state."""
+        return self._refreshed_state.plan_dag_specs
+
+    def refresh(self) -> bool:
+        """Brings the cached state up to date.
+
+        Returns:
+            Whether the production environment or plan DAG specs have changed since the last refresh
+            on this worker.
+        """
+        stamp = self._read_stamp()
+        cached_state = self._state_cache.get(self.STATE_ENTRY_NAME)
+        if cached_state is not None and cached_state.stamp == stamp:
+            self._state = cached_state
+            return False
+
+        logger.info("The state has changed since the last DAG generation, refreshing the cache")
+
+        cached_specs = {
+            spec.request_id: spec for spec in (cached_state.plan_dag_specs if cached_state else [])
+        }
+        new_request_ids = [r for r in stamp.plan_request_ids if r not in cached_specs]
+        new_specs = {
+            spec.request_id: spec
+            for spec in PlanDagState.from_state_sync(self.state_sync).get_dag_specs(new_request_ids)
+        }
+        plan_dag_specs = [
+            spec
+            for spec in (cached_specs.get(r) or new_specs.get(r) for r in stamp.plan_request_ids)
+            if spec
+        ]
+
+        prod_env = self.state_sync.get_environment(c.PROD) if stamp.prod_plan_id else None
+        prod_snapshots = prod_env.snapshots if prod_env else None
+
+        snapshot_entry_ids = {}
+        if cached_state is not None:
+            if cached_state.stamp.prod_stamp == stamp.prod_stamp:
+                snapshot_entry_ids = cached_state.snapshot_entry_ids
+            elif (
+                cached_state.stamp.versions == stamp.versions
+                and cached_state.stamp.prod_finalized_ts
+                and cached_state.prod_snapshots
+            ):
+                new_prod_snapshot_ids = {s.snapshot_id for s in prod_snapshots or []}
+                snapshot_entry_ids = {
+                    entry_name: cached_state.snapshot_entry_ids[entry_name]
+                    for entry_name in (
+                        _snapshot_entry_name(s.snapshot_id)
+                        for s in cached_state.prod_snapshots
+                        if s.snapshot_id in new_prod_snapshot_ids
+                    )
+                    if entry_name in cached_state.snapshot_entry_ids
+                }
+
+        snapshot_ids = {s.snapshot_id for s in prod_snapshots or []}
+        for spec in plan_dag_specs:
+            snapshot_ids.update(s.snapshot_id for s in spec.environment.snapshots)
+
+        # Snapshots that can't be reused get a new entry ID, which invalidates their cache entries.
+        new_entry_id = random_id()
+        self._state = _DagState(
+            stamp=stamp,
+            prod_snapshots=prod_snapshots,
+            plan_dag_specs=plan_dag_specs,
+            snapshot_entry_ids={
+                entry_name: snapshot_entry_ids.get(entry_name, new_entry_id)
+                for entry_name in map(_snapshot_entry_name, snapshot_ids)
+            },
+        )
+        self._snapshots = {}
+        self._state_cache.put(self.STATE_ENTRY_NAME, value=self._state)
+        return True
+
+    def get_snapshots(
+        self, snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]]
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        if snapshot_ids is None:
+            return self.state_sync.get_snapshots(snapshot_ids)
+
+        snapshot_entry_ids = self._refreshed_state.snapshot_entry_ids
+        result = {}
+        missing = set()
+        for s in snapshot_ids:
+            snapshot_id = s.snapshot_id
+            snapshot = self._snapshots.get(snapshot_id)
+            if snapshot is None:
+                entry_name = _snapshot_entry_name(snapshot_id)
+                if entry_name in snapshot_entry_ids:
+                    snapshot = self._snapshot_cache.get(entry_name, snapshot_entry_ids[entry_name])
+            if snapshot is not None:
+                result[snapshot_id] = snapshot
+            else:
+                missing.add(snapshot_id)
+
+        if missing:
+            logger.info("Fetching %s snapshots missing from the DAG state cache", len(missing))
+            fetched = self.state_sync.get_snapshots(missing)
+            for snapshot_id, snapshot in fetched.items():
+                entry_name = _snapshot_entry_name(snapshot_id)
+                if entry_name in snapshot_entry_ids:
+                    self._snapshot_cache.put(
+                        entry_name, snapshot_entry_ids[entry_name], value=snapshot
+                    )
+            result.update(fetched)
+
+        self._snapshots.update(result)
+        return result
+
+    @property
+    def _refreshed_state(self) -> _DagState:
+        if self._state is None:
+            raise SQLMeshError("The DAG state cache must be refreshed before use.")
+        return self._state
+
+    @property
+    def _engine_adapter_state_sync(self) -> EngineAdapterStateSync:
+        state_sync = self.state_sync
+        while isinstance(state_sync, DelegatingStateSync):
+            state_sync = state_sync.state_sync
+        if not isinstance(state_sync, EngineAdapterStateSync):
+            raise SQLMeshError(f"Unsupported state sync {state_sync.__class__.__name__}")
+        return state_sync
+
+    def _read_stamp(self) -> DagStateStamp:
+        state_sync = self._engine_adapter_state_sync
+        prod_row = state_sync.engine_adapter.fetchone(
+            exp.select("plan_id", "finalized_ts")
+            .from_(state_sync.environments_table)
+            .where(exp.column("name").eq(c.PROD)),
+            ignore_unsupported_errors=True,
+            quote_identifiers=True,
+        )
+        return DagStateStamp(
+            versions=self.state_sync.get_versions(validate=False),
+            prod_plan_id=prod_row[0] if prod_row else None,
+            prod_finalized_ts=prod_row[1] if prod_row else None,
+            plan_request_ids=PlanDagState.from_state_sync(self.state_sync).get_request_ids(),
+        )
+
+
+def _snapshot_entry_name(snapshot_id: SnapshotId) -> str:
+    return f"{snapshot_id.name}__{snapshot_id.identifier}"
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import typing as t
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from airflow import DAG
 from airflow.models import BaseOperator, TaskInstance, Variable
@@ -15,6 +16,7 @@ from sqlmesh.core import constants as c
 from sqlmesh.core.state_sync import StateReader
 from sqlmesh.engines import commands
 from sqlmesh.schedulers.airflow import common, util
+from sqlmesh.schedulers.airflow.dag_cache import DagStateCache
 from sqlmesh.schedulers.airflow.dag_generator import SnapshotDagGenerator
 from sqlmesh.schedulers.airflow.operators import targets
 from sqlmesh.schedulers.airflow.plan import PlanDagState
@@ -66,6 +68,9 @@ class SQLMeshAirflow:
             Once this period is exceeded, finished plan application DAGs are deleted by the janitor. Default: 2 days.
         external_table_sensor_factory: A factory function that creates a sensor operator for a given signal payload.
         generate_cadence_dags: Whether to generate cadence DAGs for model versions that are currently deployed to production.
+        dag_cache_dir: The directory on the Airflow worker in which the state used for DAG generation is cached
+            between DAG file parses. The directory is created with permissions restricted to the current user
+            and should not be shared with other users. If not specified, the whole state is read on every parse.
     """
 
     def __init__(
@@ -81,6 +86,7 @@ class SQLMeshAirflow:
             t.Callable[[t.Dict[str, t.Any]], BaseSensorOperator]
         ] = None,
         generate_cadence_dags: bool = True,
+        dag_cache_dir: t.Optional[t.Union[str, Path]] = None,
     ):
         if isinstance(engine_operator, str):
             if not ddl_engine_operator:
@@ -105,6 +111,7 @@ class SQLMeshAirflow:
         self._external_table_sensor_factory = external_table_sensor_factory
         self._generate_cadence_dags = generate_cadence_dags
         self._default_catalog = default_catalog
+        self._dag_cache_dir = Path(dag_cache_dir) if dag_cache_dir is not None else None
 
     @classmethod
     def set_default_catalog(cls, default_catalog: str) -> None:
@@ -124,6 +131,11 @@ class SQLMeshAirflow:
         """
         self.set_default_catalog(self._default_catalog)
         with util.scoped_state_sync() as state_sync:
+            if self._dag_cache_dir is not None:
+                return self._generate_dags_from_cache(
+                    DagStateCache(state_sync, self._dag_cache_dir)  # type: ignore
+                )
+
             dag_generator = self._create_dag_generator(state_sync)
 
             if self._generate_cadence_dags:
@@ -146,6 +158,25 @@ class SQLMeshAirflow:
 
             return system_dags + cadence_dags + [d for d in plan_application_dags if d]
 
+    def _generate_dags_from_cache(self, dag_state_cache: DagStateCache) -> t.List[DAG]:
+        state_changed = dag_state_cache.refresh()
+        dag_generator = self._create_dag_generator(dag_state_cache)
+
+        cadence_dags = []
+        if self._generate_cadence_dags:
+            prod_snapshots = dag_state_cache.prod_snapshots
+            if prod_snapshots is not None:
+                cadence_dags = dag_generator.generate_cadence_dags(prod_snapshots)
+            if state_changed:
+                # Orphaned DAGs can only appear when the production environment changes.
+                _delete_orphaned_snapshot_dags({d.dag_id for d in cadence_dags})
+
+        plan_application_dags = [
+            dag_generator.generate_plan_application_dag(s) for s in dag_state_cache.plan_dag_specs
+        ]
+
+        return [self._create_janitor_dag()] + cadence_dags + [d for d in plan_application_dags if d]
+
     def _create_janitor_dag(self) -> DAG:
         dag = self._create_system_dag(common.JANITOR_DAG_ID, self._janitor_interval)
         janitor_task_op = PythonOperator(
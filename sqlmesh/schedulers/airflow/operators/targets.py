@@ -70,6 +70,7 @@ class BaseTarget(abc.ABC, t.Generic[CP]):
                 **kwargs,
             ),
             ddl_concurrent_tasks=self.ddl_concurrent_tasks,
+            audit_concurrent_tasks=self.ddl_concurrent_tasks,
         )
         try:
             self.command_handler(snapshot_evaluator, payload)
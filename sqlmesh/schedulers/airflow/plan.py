@@ -60,9 +60,20 @@ class PlanDagState:
             columns_to_types=self._plan_dag_columns_to_types,
         )
 
-    def get_dag_specs(self) -> t.List[common.PlanDagSpec]:
-        """Returns all DAG specs in the state."""
+    def get_dag_specs(
+        self, request_ids: t.Optional[t.Collection[str]] = None
+    ) -> t.List[common.PlanDagSpec]:
+        """Returns DAG specs in the state.
+
+        Args:
+            request_ids: The IDs of plan requests which DAG specs should be returned. If not provided,
+                all DAG specs are returned.
+        """
         query = exp.select("dag_spec").from_(self._plan_dags_table)
+        if request_ids is not None:
+            if not request_ids:
+                return []
+            query = query.where(exp.column("request_id").isin(*request_ids))
         return [
             common.PlanDagSpec.parse_raw(row[0])
             for row in self.engine_adapter.fetchall(
@@ -70,6 +81,16 @@ class PlanDagState:
             )
         ]
 
+    def get_request_ids(self) -> t.List[str]:
+        """Returns the sorted IDs of plan requests for all DAG specs in the state without fetching the specs."""
+        query = exp.select("request_id").from_(self._plan_dags_table).order_by("request_id")
+        return [
+            row[0]
+            for row in self.engine_adapter.fetchall(
+                query, ignore_unsupported_errors=True, quote_identifiers=True
+            )
+        ]
+
     def delete_dag_specs(self, dag_ids: t.Collection[str]) -> None:
         """Deletes the DAG specs with the given DAG IDs."""
         if not dag_ids:
@@ -108,10 +108,8 @@ class HttpStateSync(StateSync):
     ) -> t.Dict[SnapshotId, Snapshot]:
         """Gets multiple snapshots from the rest api.
 
-        Because of the limitations of the Airflow API, this method is inherently inefficient.
-        It's impossible to bulkfetch the snapshots and thus every snapshot needs to make an individual
-        call to the rest api. Multiple threads can be used, but it could possibly have detrimental effects
-        on the production server.
+        Snapshots are fetched in batches of concurrent bulk requests. Snapshots that have been fetched
+        before are only validated with their ETags and are not transferred again unless they've changed.
         """
         snapshots = self._client.get_snapshots(
             [s.snapshot_id for s in snapshot_ids] if snapshot_ids is not None else None
@@ -176,12 +174,18 @@ class HttpStateSync(StateSync):
         """
         raise NotImplementedError("Deleting snapshots is not supported by the Airflow state sync.")
 
-    def delete_expired_snapshots(self) -> t.List[SnapshotTableCleanupTask]:
+    def delete_expired_snapshots(
+        self, time_budget: t.Optional[float] = None
+    ) -> t.List[SnapshotTableCleanupTask]:
         """Removes expired snapshots.
 
         Expired snapshots are snapshots that have exceeded their time-to-live
         and are no longer in use within an environment.
 
+        Args:
+            time_budget: The maximum time in seconds to spend on deleting expired snapshots. Snapshots
+                that weren't deleted within the budget are deleted by subsequent calls.
+
         Returns:
             The list of table cleanup tasks.
         """
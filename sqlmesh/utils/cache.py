@@ -2,20 +2,35 @@ from __future__ import annotations
 
 import gzip
 import logging
+import os
 import pickle
+import sqlite3
+import sys
+import time
 import typing as t
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from threading import Lock, get_ident
 
+from pydantic import BaseModel
 from sqlglot import __version__ as SQLGLOT_VERSION
 
 from sqlmesh.utils import sanitize_name
 from sqlmesh.utils.date import to_datetime
 from sqlmesh.utils.errors import SQLMeshError
-from sqlmesh.utils.pydantic import PydanticModel
+from sqlmesh.utils.pydantic import PYDANTIC_MAJOR_VERSION, PydanticModel
 
 logger = logging.getLogger(__name__)
 
 T = t.TypeVar("T", bound=PydanticModel)
+K = t.TypeVar("K", bound=t.Hashable)
+V = t.TypeVar("V")
 
 
 SQLGLOT_VERSION_TUPLE = tuple(SQLGLOT_VERSION.split("."))
@@ -42,24 +57,7 @@ class FileCache(t.Generic[T]):
         self._path = path / prefix if prefix else path
         self._entry_class = entry_class
 
-        from sqlmesh.core.state_sync.base import SCHEMA_VERSION
-
-        try:
-            from sqlmesh._version import __version_tuple__
-
-            major, minor = __version_tuple__[0], __version_tuple__[1]
-        except ImportError:
-            major, minor = 0, 0
-
-        self._cache_version = "_".join(
-            [
-                str(major),
-                str(minor),
-                SQLGLOT_MAJOR_VERSION,
-                SQLGLOT_MINOR_VERSION,
-                str(SCHEMA_VERSION),
-            ]
-        )
+        self._cache_version = _cache_version()
 
         threshold = to_datetime("1 week ago").timestamp()
         # delete all old cache files
@@ -124,3 +122,571 @@ class FileCache(t.Generic[T]):
     def _cache_entry_path(self, name: str, entry_id: str = "") -> Path:
         entry_file_name = "__".join(p for p in (self._cache_version, name, entry_id) if p)
         return self._path / sanitize_name(entry_file_name)
+
+
+class CacheBackend(str, Enum):
+    """The storage used by the caches of model definitions and optimized queries."""
+
+    FILE = "file"
+    """Stores each entry in a separate file."""
+    SQLITE = "sqlite"
+    """Stores all entries in a single SQLite database file."""
+
+    @property
+    def is_file(self) -> bool:
+        return self == CacheBackend.FILE
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self == CacheBackend.SQLITE
+
+
+class SQLiteCache(t.Generic[T]):
+    """Generic cache implementation which stores all entries in a single SQLite database file.
+
+    Entries are indexed by their name and identifier, so opening the cache doesn't depend on the
+    number of stored entries. By default, entries are trusted, which is why they are pickled as is and
+    are restored without being validated by pydantic. Untrusted entries are stored as JSON instead and
+    are validated when restored. The database is shared between processes and caches with different
+    prefixes. Entries which haven't been accessed for a week are removed and the least recently
+    accessed entries are evicted once the total size of entries exceeds the limit.
+
+    Args:
+        path: The path to the cache folder.
+        entry_class: The type of cached entries.
+        prefix: The prefix shared between all entries to distinguish them from other entries
+            stored in the same database.
+        max_bytes: The maximum total size of all entries stored in the database.
+        trusted: Whether the entries can be pickled. Untrusted entries must be pydantic models.
+    """
+
+    DATABASE_FILE_NAME = "cache.db"
+    DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+    ACCESS_TIME_RESOLUTION_SEC = 3600
+    BUSY_TIMEOUT_SEC = 60.0
+    INIT_ATTEMPTS = 5
+    INIT_RETRY_DELAY_SEC = 0.1
+    EVICTION_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        path: Path,
+        entry_class: t.Type[T],
+        prefix: t.Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        trusted: bool = True,
+    ):
+        if not trusted and not issubclass(entry_class, PydanticModel):
+            raise SQLMeshError("Untrusted cache entries must be pydantic models.")
+
+        self._path = path / self.DATABASE_FILE_NAME
+        self._entry_class = entry_class
+        self._prefix = prefix or ""
+        self.max_bytes = max_bytes
+        self._trusted = trusted
+        self._cache_version = _cache_version()
+        self._connections: t.Dict[int, sqlite3.Connection] = {}
+        _SQLITE_CACHES.add(self)
+
+        path.mkdir(parents=True, exist_ok=True)
+        if not path.is_dir():
+            raise SQLMeshError(f"Cache path '{path}' is not a directory.")
+
+        for attempt in range(self.INIT_ATTEMPTS):
+            try:
+                self._initialize()
+                break
+            except sqlite3.OperationalError as ex:
+                # Processes opening a new database at the same time may fail while another one
+                # creates it, in which case the connection is reopened and the whole step retried.
+                if attempt == self.INIT_ATTEMPTS - 1 or not _is_transient_sqlite_error(ex):
+                    raise
+                logger.debug("Retrying the initialization of the SQLite cache '%s': %s", path, ex)
+                self._close_connection()
+                time.sleep(self.INIT_RETRY_DELAY_SEC * 2**attempt)
+
+    def _initialize(self) -> None:
+        connection = self._connection()
+        # The journal mode is stored in the database file, so it only needs to be set once. It
+        # can't be changed within a transaction.
+        if connection.execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+            connection.execute("PRAGMA journal_mode = WAL")
+
+        threshold = to_datetime("1 week ago").timestamp()
+        with self._transaction() as connection:
+            for statement in _SQLITE_CACHE_SCHEMA:
+                connection.execute(statement)
+            row = connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+            if row is None or row[0] != self._cache_version:
+                connection.execute("DELETE FROM entries")
+                connection.execute(
+                    "INSERT OR REPLACE INTO metadata (key, value) VALUES ('version', ?)",
+                    (self._cache_version,),
+                )
+            connection.execute("DELETE FROM entries WHERE accessed_at < ?", (threshold,))
+            self._evict(connection)
+
+    def get_or_load(self, name: str, entry_id: str = "", *, loader: t.Callable[[], T]) -> T:
+        """Returns an existing cached entry or loads and caches a new one.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+            loader: Used to load a new entry when no cached instance was found.
+
+        Returns:
+            The entry.
+        """
+        cached_entry = self.get(name, entry_id)
+        if cached_entry:
+            return cached_entry
+
+        loaded_entry = loader()
+        self.put(name, entry_id, value=loaded_entry)
+        return loaded_entry
+
+    def get(self, name: str, entry_id: str = "") -> t.Optional[T]:
+        """Returns a cached entry if exists.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+
+        Returns:
+            The entry or None if no entry was found in the cache.
+        """
+        key = (self._prefix, name, entry_id)
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, accessed_at FROM entries WHERE prefix = ? AND name = ? AND entry_id = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            if self._trusted:
+                entry = pickle.loads(row[0])
+            else:
+                entry = self._entry_class.parse_raw(row[0])  # type: ignore
+        except Exception as ex:
+            logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+            return None
+        if not isinstance(entry, self._entry_class):
+            logger.warning("Unexpected type of a cache entry '%s': %s", name, type(entry))
+            return None
+
+        # Access times are only needed for eviction, so they are updated coarsely to avoid
+        # turning every read into a write.
+        now = time.time()
+        if now - row[1] > self.ACCESS_TIME_RESOLUTION_SEC:
+            with self._transaction() as connection:
+                connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE prefix = ? AND name = ? AND entry_id = ?",
+                    (now, *key),
+                )
+
+        return entry
+
+    def put(self, name: str, entry_id: str = "", *, value: T) -> None:
+        """Stores the given value in the cache.
+
+        Args:
+            name: The name of the entry.
+            entry_id: The unique entry identifier. Used for cache invalidation.
+            value: The value to store in the cache.
+        """
+        data = _dump_trusted(value) if self._trusted else value.json().encode("utf-8")  # type: ignore
+        with self._transaction() as connection:
+            connection.execute(
+                """
+                INSERT INTO entries (prefix, name, entry_id, value, size, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (prefix, name, entry_id) DO UPDATE SET
+                    value = excluded.value, size = excluded.size, accessed_at = excluded.accessed_at
+                """,
+                (self._prefix, name, entry_id, data, len(data), time.time()),
+            )
+            self._evict(connection)
+
+    @property
+    def size(self) -> int:
+        """Returns the total size of all entries stored in the database in bytes."""
+        row = (
+            self._connection()
+            .execute("SELECT value FROM metadata WHERE key = 'total_size'")
+            .fetchone()
+        )
+        return int(row[0]) if row else 0
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        while True:
+            row = connection.execute(
+                "SELECT value FROM metadata WHERE key = 'total_size'"
+            ).fetchone()
+            if not row or int(row[0]) <= self.max_bytes:
+                return
+            evicted = connection.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY accessed_at LIMIT ?)",
+                (self.EVICTION_BATCH_SIZE,),
+            ).rowcount
+            if not evicted:
+                return
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections can't be shared between threads, so each thread opens its own.
+        # Connections inherited by forked processes are detached in _detach_sqlite_connections.
+        thread_id = get_ident()
+        connection = self._connections.get(thread_id)
+        if connection is None:
+            # Identifiers of finished threads may be reused by new ones, which then take over
+            # their connections.
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self.BUSY_TIMEOUT_SEC,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA synchronous = NORMAL")
+            self._connections[thread_id] = connection
+        return connection
+
+    def _close_connection(self) -> None:
+        connection = self._connections.pop(get_ident(), None)
+        if connection is not None:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+
+    @contextmanager
+    def _transaction(self) -> t.Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        # Take the write lock upfront so that concurrent writers wait for each other instead of
+        # failing when upgrading a read lock.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+
+def create_cache(
+    path: Path,
+    entry_class: t.Type[T],
+    prefix: t.Optional[str] = None,
+    backend: CacheBackend = CacheBackend.FILE,
+) -> t.Union[FileCache[T], SQLiteCache[T]]:
+    """Creates a cache of entries using the given backend.
+
+    Args:
+        path: The path to the cache folder.
+        entry_class: The type of cached entries.
+        prefix: The prefix shared between all entries to distinguish them from other entries
+            stored in the same cache folder.
+        backend: The storage of cached entries.
+
+    Returns:
+        The cache.
+    """
+    if backend.is_sqlite:
+        return SQLiteCache(path, entry_class, prefix=prefix)
+    return FileCache(path, entry_class, prefix=prefix)
+
+
+_SQLITE_CACHE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        prefix TEXT NOT NULL,
+        name TEXT NOT NULL,
+        entry_id TEXT NOT NULL,
+        value BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        accessed_at REAL NOT NULL,
+        PRIMARY KEY (prefix, name, entry_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)",
+    "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value)",
+    "INSERT OR IGNORE INTO metadata (key, value) VALUES ('total_size', 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+        UPDATE metadata SET value = value + NEW.size WHERE key = 'total_size';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+        UPDATE metadata SET value = value - OLD.size + NEW.size WHERE key = 'total_size';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+        UPDATE metadata SET value = value - OLD.size WHERE key = 'total_size';
+    END
+    """,
+]
+"""The statements that create the cache schema, which are run in a single transaction."""
+
+
+def _is_transient_sqlite_error(ex: sqlite3.OperationalError) -> bool:
+    message = str(ex).lower()
+    return any(error in message for error in ("locked", "busy", "disk i/o error"))
+
+
+_SQLITE_CACHES: weakref.WeakSet[SQLiteCache] = weakref.WeakSet()
+_INHERITED_SQLITE_CONNECTIONS: t.List[sqlite3.Connection] = []
+
+
+def _detach_sqlite_connections() -> None:
+    # A forked process must never close connections inherited from its parent, eg. when the cache
+    # that owns them is garbage collected, since that resets the shared WAL file and discards
+    # writes made by other processes. These connections are kept around until the process exits.
+    for cache in _SQLITE_CACHES:
+        _INHERITED_SQLITE_CONNECTIONS.extend(cache._connections.values())
+        cache._connections = {}
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_detach_sqlite_connections)
+
+
+class _TrustedPickler(pickle.Pickler):
+    """Pickles pydantic models as their field values only, leaving out private attributes and
+    cached properties, which hold derived state that often can't be pickled."""
+
+    def reducer_override(self, obj: t.Any) -> t.Any:
+        if isinstance(obj, BaseModel):
+            field_names = _field_names(type(obj))
+            values = {k: v for k, v in obj.__dict__.items() if k in field_names}
+            fields_set = (
+                obj.model_fields_set if PYDANTIC_MAJOR_VERSION >= 2 else obj.__fields_set__  # type: ignore
+            )
+            return _restore_trusted, (type(obj), values, set(fields_set))
+        return NotImplemented
+
+
+def _dump_trusted(value: t.Any) -> bytes:
+    buffer = BytesIO()
+    _TrustedPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+def _restore_trusted(
+    cls: t.Type[BaseModel], values: t.Dict[str, t.Any], fields_set: t.Set[str]
+) -> BaseModel:
+    if PYDANTIC_MAJOR_VERSION >= 2:
+        return cls.model_construct(_fields_set=fields_set, **values)
+    return cls.construct(_fields_set=fields_set, **values)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: t.Type[BaseModel]) -> t.FrozenSet[str]:
+    fields: t.Dict[str, t.Any] = (
+        cls.model_fields if PYDANTIC_MAJOR_VERSION >= 2 else cls.__fields__  # type: ignore
+    )
+    return frozenset(fields)
+
+
+def _cache_version() -> str:
+    from sqlmesh.core.state_sync.base import SCHEMA_VERSION
+
+    try:
+        from sqlmesh._version import __version_tuple__
+
+        major, minor = __version_tuple__[0], __version_tuple__[1]
+    except ImportError:
+        major, minor = 0, 0
+
+    return "_".join(
+        [
+            str(major),
+            str(minor),
+            SQLGLOT_MAJOR_VERSION,
+            SQLGLOT_MINOR_VERSION,
+            str(SCHEMA_VERSION),
+        ]
+    )
+
+
+class EvictionPolicy(str, Enum):
+    """The policy used by `BoundedCache` to pick an entry to evict."""
+
+    LRU = "lru"
+    """Evicts the least recently accessed entry."""
+    FIFO = "fifo"
+    """Evicts the oldest entry regardless of how often it's accessed."""
+
+
+@dataclass
+class CacheStats:
+    """Counters which describe the efficiency of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: CacheStats) -> CacheStats:
+        return CacheStats(
+            hits=self.hits + other.hits,
+            misses=self.misses + other.misses,
+            evictions=self.evictions + other.evictions,
+        )
+
+    def __sub__(self, other: CacheStats) -> CacheStats:
+        return CacheStats(
+            hits=self.hits - other.hits,
+            misses=self.misses - other.misses,
+            evictions=self.evictions - other.evictions,
+        )
+
+
+class BoundedCache(t.Generic[K, V]):
+    """Thread-safe in-memory cache which is bounded by the number of entries and by their estimated size.
+
+    Args:
+        max_entries: The maximum number of entries. Unbounded if not set.
+        max_bytes: The maximum estimated size of all entries in bytes. Unbounded if not set.
+        eviction_policy: The policy used to pick entries to evict once one of the bounds is exceeded.
+        sizeof: The function which estimates the size of an entry in bytes given its key and value.
+    """
+
+    def __init__(
+        self,
+        max_entries: t.Optional[int] = None,
+        max_bytes: t.Optional[int] = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+        sizeof: t.Optional[t.Callable[[K, V], int]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self._sizeof = sizeof or (lambda key, value: sys.getsizeof(key) + sys.getsizeof(value))
+
+        self._entries: OrderedDict[K, t.Tuple[V, int]] = OrderedDict()
+        self._size = 0
+        self._stats = CacheStats()
+        self._lock = Lock()
+
+    def get(self, key: K) -> t.Optional[V]:
+        """Returns a cached value if exists.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value or None if no entry was found in the cache.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            if self.eviction_policy == EvictionPolicy.LRU:
+                self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: K, value: V) -> None:
+        """Stores the given value in the cache evicting other entries if necessary.
+
+        Args:
+            key: The key of the entry.
+            value: The value to store.
+        """
+        size = self._sizeof(key, value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            self._evict()
+
+    def get_or_load(self, key: K, loader: t.Callable[[], V]) -> V:
+        """Returns an existing cached value or loads and caches a new one.
+
+        Args:
+            key: The key of the entry.
+            loader: Used to load a new value when no cached value was found.
+
+        Returns:
+            The value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            self.put(key, value)
+        return value
+
+    def peek(self, key: K) -> t.Optional[V]:
+        """Returns a cached value if exists without affecting the eviction order or the counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def invalidate(self, key: K) -> None:
+        """Removes an entry from the cache if exists."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry[1]
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def configure(
+        self,
+        max_entries: t.Optional[int] = None,
+        max_bytes: t.Optional[int] = None,
+        eviction_policy: t.Optional[EvictionPolicy] = None,
+    ) -> None:
+        """Updates the bounds of this cache evicting entries which no longer fit.
+
+        Args:
+            max_entries: The new maximum number of entries.
+            max_bytes: The new maximum estimated size of all entries in bytes.
+            eviction_policy: The new eviction policy. The current policy is kept if not set.
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self.eviction_policy = eviction_policy or self.eviction_policy
+            self._evict()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the hit, miss and eviction counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits, misses=self._stats.misses, evictions=self._stats.evictions
+            )
+
+    @property
+    def size(self) -> int:
+        """Returns the estimated size of all entries in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+            self._stats.evictions += 1
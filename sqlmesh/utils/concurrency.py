@@ -1,6 +1,11 @@
+import heapq
+import multiprocessing
+import pickle
 import typing as t
-from concurrent.futures import Executor, Future, ThreadPoolExecutor
-from threading import Lock
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from queue import Full, Queue
+from threading import Event, Lock, Thread
 
 from sqlmesh.core.snapshot import SnapshotId, SnapshotInfoLike
 from sqlmesh.utils.dag import DAG
@@ -10,6 +15,7 @@ H = t.TypeVar("H", bound=t.Hashable)
 S = t.TypeVar("S", bound=SnapshotInfoLike)
 A = t.TypeVar("A")
 R = t.TypeVar("R")
+T = t.TypeVar("T")
 
 
 class NodeExecutionFailedError(t.Generic[H], SQLMeshError):
@@ -21,6 +27,10 @@ class NodeExecutionFailedError(t.Generic[H], SQLMeshError):
 class ConcurrentDAGExecutor(t.Generic[H]):
     """Concurrently traverses the given DAG in topological order while applying a function to each node.
 
+    Nodes are tracked using the number of their unprocessed dependencies and a reverse adjacency map,
+    so that completing a node only touches its direct dependents. Nodes whose dependencies have all
+    been processed are kept in a ready queue and are dispatched in the order defined by `priority`.
+
     If `raise_on_error` is set to False maintains a state of execution errors as well as of skipped nodes.
 
     Args:
@@ -30,6 +40,9 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        priority: An optional function which returns a sort key for a node. When more nodes are ready
+            than there are available tasks, nodes with smaller keys are dispatched first. Ready nodes
+            are dispatched in the order they became ready by default.
     """
 
     def __init__(
@@ -38,11 +51,13 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         fn: t.Callable[[H], None],
         tasks_num: int,
         raise_on_error: bool,
+        priority: t.Optional[t.Callable[[H], t.Any]] = None,
     ):
         self.dag = dag
         self.fn = fn
         self.tasks_num = tasks_num
         self.raise_on_error = raise_on_error
+        self.priority = priority
 
         self._init_state()
 
@@ -59,7 +74,10 @@ class ConcurrentDAGExecutor(t.Generic[H]):
             self._init_state()
 
         with ThreadPoolExecutor(max_workers=self.tasks_num) as pool:
-            with self._unprocessed_nodes_lock:
+            with self._lock:
+                for node, indegree in self._indegrees.items():
+                    if not indegree:
+                        self._push_ready(node)
                 self._submit_next_nodes(pool)
             self._finished_future.result()
         return self._node_errors, self._skipped_nodes
@@ -68,62 +86,119 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         try:
             self.fn(node)
 
-            with self._unprocessed_nodes_lock:
+            with self._lock:
+                self._in_flight_num -= 1
                 self._unprocessed_nodes_num -= 1
-                self._submit_next_nodes(executor, node)
+                for dependent in self._dependents[node]:
+                    self._indegrees[dependent] -= 1
+                    if not self._indegrees[dependent]:
+                        self._push_ready(dependent)
+                self._submit_next_nodes(executor)
         except Exception as ex:
             error = NodeExecutionFailedError(node)
             error.__cause__ = ex
 
             if self.raise_on_error:
-                self._finished_future.set_exception(error)
+                with self._lock:
+                    if not self._finished_future.done():
+                        self._finished_future.set_exception(error)
                 return
 
-            with self._unprocessed_nodes_lock:
+            with self._lock:
+                self._in_flight_num -= 1
                 self._unprocessed_nodes_num -= 1
                 self._node_errors.append(error)
                 self._skip_next_nodes(node)
+                self._submit_next_nodes(executor)
 
-    def _submit_next_nodes(self, executor: Executor, processed_node: t.Optional[H] = None) -> None:
-        if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
-            return
+    def _push_ready(self, node: H) -> None:
+        key = self.priority(node) if self.priority is not None else 0
+        heapq.heappush(self._ready_nodes, (key, self._ready_seq, node))
+        self._ready_seq += 1
 
-        submitted_nodes = []
-        for next_node, deps in self._unprocessed_nodes.items():
-            if processed_node:
-                deps.discard(processed_node)
-            if not deps:
-                submitted_nodes.append(next_node)
-
-        for submitted_node in submitted_nodes:
-            self._unprocessed_nodes.pop(submitted_node)
-            executor.submit(self._process_node, submitted_node, executor)
+    def _submit_next_nodes(self, executor: Executor) -> None:
+        if self._finished_future.done():
+            return
 
-    def _skip_next_nodes(self, parent: H) -> None:
         if not self._unprocessed_nodes_num:
             self._finished_future.set_result(None)
             return
 
-        skipped_nodes = [node for node, deps in self._unprocessed_nodes.items() if parent in deps]
+        while self._ready_nodes and self._in_flight_num < self.tasks_num:
+            _, _, node = heapq.heappop(self._ready_nodes)
+            self._in_flight_num += 1
+            executor.submit(self._process_node, node, executor)
 
-        self._skipped_nodes.extend(skipped_nodes)
+        if not self._in_flight_num:
+            self._finished_future.set_exception(
+                SQLMeshError(
+                    "Detected a cycle in the DAG. "
+                    "Please make sure there are no circular references between nodes."
+                )
+            )
 
-        for skipped_node in skipped_nodes:
+    def _skip_next_nodes(self, parent: H) -> None:
+        # Dependents of a failed or skipped node never become ready, since their unprocessed
+        # dependency counters can't reach zero, so they only need to be accounted for here.
+        queue = deque(self._dependents[parent])
+        while queue:
+            node = queue.popleft()
+            if node in self._skipped_nodes_set:
+                continue
+            self._skipped_nodes_set.add(node)
+            self._skipped_nodes.append(node)
             self._unprocessed_nodes_num -= 1
-            self._unprocessed_nodes.pop(skipped_node)
-
-        for skipped_node in skipped_nodes:
-            self._skip_next_nodes(skipped_node)
+            queue.extend(self._dependents[node])
 
     def _init_state(self) -> None:
-        self._unprocessed_nodes = self.dag.graph
-        self._unprocessed_nodes_num = len(self._unprocessed_nodes)
-        self._unprocessed_nodes_lock = Lock()
+        graph = self.dag.graph
+
+        self._indegrees: t.Dict[H, int] = {}
+        self._dependents: t.Dict[H, t.List[H]] = {}
+        for node, deps in graph.items():
+            self._indegrees[node] = len(deps)
+            self._dependents.setdefault(node, [])
+            for dep in deps:
+                self._dependents.setdefault(dep, []).append(node)
+
+        self._ready_nodes: t.List[t.Tuple[t.Any, int, H]] = []
+        self._ready_seq = 0
+        self._in_flight_num = 0
+        self._unprocessed_nodes_num = len(graph)
+        self._lock = Lock()
         self._finished_future = Future()  # type: ignore
 
         self._node_errors: t.List[NodeExecutionFailedError[H]] = []
         self._skipped_nodes: t.List[H] = []
+        self._skipped_nodes_set: t.Set[H] = set()
+
+
+def critical_path_priority(
+    dag: DAG[H], weight: t.Optional[t.Callable[[H], float]] = None
+) -> t.Callable[[H], float]:
+    """Returns a priority function which dispatches nodes on the longest remaining path first.
+
+    The path length of a node is the total weight of the heaviest chain of nodes that starts at this
+    node and ends at one of the DAG's leaves. Prioritizing nodes with the longest paths reduces the
+    overall runtime of DAGs which have a few long chains of dependent nodes.
+
+    Args:
+        dag: The target DAG.
+        weight: An optional function which returns the cost of an individual node, eg. the size of
+            the interval that needs to be backfilled. Every node has the weight of 1 by default.
+
+    Returns:
+        The priority function that can be passed to `concurrent_apply_to_dag`.
+    """
+    weight = weight or (lambda _: 1)
+    graph = dag.graph
+
+    path_lengths: t.Dict[H, float] = {node: weight(node) for node in graph}
+    for node in reversed(dag.sorted):
+        for dep in graph[node]:
+            path_lengths[dep] = max(path_lengths[dep], weight(dep) + path_lengths[node])
+
+    return lambda node: -path_lengths[node]
 
 
 def concurrent_apply_to_snapshots(
@@ -173,6 +248,7 @@ def concurrent_apply_to_dag(
     fn: t.Callable[[H], None],
     tasks_num: int,
     raise_on_error: bool = True,
+    priority: t.Optional[t.Callable[[H], t.Any]] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     """Applies a function to the given DAG concurrently while preserving the topological
     order between snapshots.
@@ -184,6 +260,8 @@ def concurrent_apply_to_dag(
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        priority: An optional function which returns a sort key for a node. Ready nodes with
+            smaller keys are dispatched first. See `critical_path_priority`.
 
     Raises:
         NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any snapshot.
@@ -202,6 +280,7 @@ def concurrent_apply_to_dag(
         fn,
         tasks_num,
         raise_on_error,
+        priority=priority,
     ).run()
 
 
@@ -269,3 +348,146 @@ def concurrent_apply_to_values(
             pool.submit(_process_value, value, index)
 
     return [f.result() for f in futures]
+
+
+def prefetch(
+    iterable: t.Iterable[T],
+    max_prefetched: int = 1,
+    on_exit: t.Optional[t.Callable[[], None]] = None,
+) -> t.Iterator[T]:
+    """Consumes the given iterable in a background thread so that producing the next item overlaps
+    with the processing of the current one.
+
+    At most `max_prefetched` items are buffered, which bounds memory usage to a few items regardless
+    of the length of the iterable. Errors raised while producing items are re-raised to the consumer.
+    If the consumer stops early, the producer stops once its current item is ready.
+
+    Args:
+        iterable: The iterable to consume.
+        max_prefetched: The maximum number of items produced ahead of the consumer.
+        on_exit: Called in the background thread once it stops producing items, eg. to release
+            resources that were acquired by that thread while producing them.
+
+    Returns:
+        An iterator over the items of the iterable.
+    """
+    queue: Queue = Queue(maxsize=max(max_prefetched, 1))
+    stopped = Event()
+    done = object()
+
+    def _put(entry: t.Tuple[t.Any, t.Optional[BaseException]]) -> bool:
+        while not stopped.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _produce() -> None:
+        error: t.Optional[BaseException] = None
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    break
+        except BaseException as ex:
+            error = ex
+        if on_exit is not None:
+            try:
+                on_exit()
+            except BaseException as ex:
+                error = error or ex
+        # Nothing is put once the consumer has stopped.
+        _put((done, error))
+
+    producer = Thread(target=_produce, name="prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = queue.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
+
+
+_FORKED_FN: t.Optional[t.Callable[[t.Any], t.Any]] = None
+_FORKED_ON_CHUNK_EXIT: t.Optional[t.Callable[[], None]] = None
+_FORKED_FN_LOCK = Lock()
+
+
+def fork_apply_to_values(
+    values: t.Sequence[A],
+    fn: t.Callable[[A], R],
+    processes: int,
+    on_chunk_exit: t.Optional[t.Callable[[], None]] = None,
+) -> t.List[R]:
+    """Applies a function to the given collection of values in forked worker processes.
+
+    Workers inherit the function together with any state it closes over from the parent process,
+    so only the values and the returned results need to be picklable. The function is applied
+    sequentially in the current process if the platform doesn't support forking.
+
+    Args:
+        values: Target values.
+        fn: The function that will be applied to each value.
+        processes: The number of worker processes.
+        on_chunk_exit: An optional callback invoked by the worker once it's done applying the
+            function to a chunk of values, regardless of the outcome. It can be used to release
+            resources that the function acquired in the worker.
+
+    Returns:
+        A list of results in the order of the given values. The first error encountered in that
+        order is re-raised.
+    """
+    global _FORKED_FN, _FORKED_ON_CHUNK_EXIT
+
+    if processes < 1:
+        raise ConfigError(f"Invalid number of processes {processes}")
+
+    if processes == 1 or len(values) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        try:
+            return [fn(value) for value in values]
+        finally:
+            if on_chunk_exit:
+                on_chunk_exit()
+
+    processes = min(processes, len(values))
+    chunksize = max(1, len(values) // (processes * 4))
+    chunks = [values[i : i + chunksize] for i in range(0, len(values), chunksize)]
+    with _FORKED_FN_LOCK:
+        _FORKED_FN = fn
+        _FORKED_ON_CHUNK_EXIT = on_chunk_exit
+        try:
+            with ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                return [
+                    result
+                    for chunk_results in pool.map(_apply_forked_fn, chunks)
+                    for result in chunk_results
+                ]
+        finally:
+            _FORKED_FN = None
+            _FORKED_ON_CHUNK_EXIT = None
+
+
+def _apply_forked_fn(values: t.Sequence[t.Any]) -> t.List[t.Any]:
+    assert _FORKED_FN is not None
+    try:
+        return [_FORKED_FN(value) for value in values]
+    except Exception as ex:
+        # Errors are sent back to the parent process, which breaks the whole pool if they
+        # can't be unpickled there.
+        try:
+            pickle.loads(pickle.dumps(ex))
+        except Exception:
+            raise SQLMeshError(str(ex)) from None
+        raise
+    finally:
+        if _FORKED_ON_CHUNK_EXIT:
+            _FORKED_ON_CHUNK_EXIT()
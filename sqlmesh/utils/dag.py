@@ -9,6 +9,7 @@ allows SQLMesh to easily determine a model's lineage and to identify upstream an
 from __future__ import annotations
 
 import typing as t
+from types import MappingProxyType
 
 from sqlmesh.utils.errors import SQLMeshError
 
@@ -18,7 +19,13 @@ T = t.TypeVar("T", bound=t.Hashable)
 class DAG(t.Generic[T]):
     def __init__(self, graph: t.Optional[t.Dict[T, t.Set[T]]] = None):
         self._dag: t.Dict[T, t.Set[T]] = {}
+        # The reverse adjacency map of each node to the nodes that depend on it.
+        self._dependents: t.Dict[T, t.Set[T]] = {}
         self._sorted: t.Optional[t.List[T]] = None
+        self._positions: t.Optional[t.Dict[T, int]] = None
+        self._graph: t.Optional[t.Mapping[T, t.FrozenSet[T]]] = None
+        self._upstream_cache: t.Dict[T, t.List[T]] = {}
+        self._downstream_cache: t.Dict[T, t.List[T]] = {}
 
         for node, dependencies in (graph or {}).items():
             self.add(node, dependencies)
@@ -30,25 +37,19 @@ class DAG(t.Generic[T]):
             node: The node to add.
             dependencies: Optional dependencies to add to the node.
         """
-        self._sorted = None
-        if node not in self._dag:
-            self._dag[node] = set()
+        self._invalidate()
+        self._add_node(node)
         if dependencies:
-            self._dag[node].update(dependencies)
-            for d in dependencies:
-                self.add(d)
+            node_dependencies = self._dag[node]
+            for dependency in dependencies:
+                self._add_node(dependency)
+                node_dependencies.add(dependency)
+                self._dependents[dependency].add(node)
 
     @property
     def reversed(self) -> DAG[T]:
         """Returns a copy of this DAG with all its edges reversed."""
-        result = DAG[T]()
-
-        for node, deps in self._dag.items():
-            result.add(node)
-            for dep in deps:
-                result.add(dep, [node])
-
-        return result
+        return DAG._from_adjacency(self._dependents, self._dag)
 
     def subdag(self, *nodes: T) -> DAG[T]:
         """Create a new subdag given node(s).
@@ -59,16 +60,9 @@ class DAG(t.Generic[T]):
         Returns:
             A new dag consisting of the specified nodes and upstream.
         """
-        queue = set(nodes)
-        graph = {}
-
-        while queue:
-            node = queue.pop()
-            deps = self._dag.get(node, set())
-            graph[node] = deps
-            queue.update(deps)
-
-        return DAG(graph)
+        return self._induced(
+            {node: self._dag.get(node, set()) for node in self._closure(nodes, self._dag)}
+        )
 
     def prune(self, *nodes: T) -> DAG[T]:
         """Create a dag keeping only the included nodes.
@@ -79,17 +73,19 @@ class DAG(t.Generic[T]):
         Returns:
             A new dag consisting of the specified nodes.
         """
-        graph = {}
-
-        for node, deps in self._dag.items():
-            if node in nodes:
-                graph[node] = {dep for dep in deps if dep in nodes}
-
-        return DAG(graph)
+        included = set(nodes)
+        return self._induced(
+            {node: self._dag[node] & included for node in self._dag if node in included}
+        )
 
     def upstream(self, node: T) -> t.List[T]:
         """Returns all upstream dependencies in topologically sorted order."""
-        return self.subdag(node).sorted[:-1]
+        if node not in self._dag:
+            return []
+        if node not in self._upstream_cache:
+            upstream = self._closure(self._dag[node], self._dag)
+            self._upstream_cache[node] = self._topologically_sorted(upstream)
+        return list(self._upstream_cache[node])
 
     @property
     def roots(self) -> t.Set[T]:
@@ -97,63 +93,49 @@ class DAG(t.Generic[T]):
         return {node for node, deps in self._dag.items() if not deps}
 
     @property
-    def graph(self) -> t.Dict[T, t.Set[T]]:
-        graph = {}
-        for node, deps in self._dag.items():
-            graph[node] = deps.copy()
-        return graph
+    def graph(self) -> t.Mapping[T, t.FrozenSet[T]]:
+        """Returns a read-only view of the adjacency map of each node to its upstream dependencies.
+
+        The view is cached until the DAG changes.
+        """
+        if self._graph is None:
+            self._graph = MappingProxyType(
+                {node: frozenset(deps) for node, deps in self._dag.items()}
+            )
+        return self._graph
 
     @property
     def sorted(self) -> t.List[T]:
         """Returns a list of nodes sorted in topological order."""
-        if self._sorted is None:
-            self._sorted = []
-
-            unprocessed_nodes = self.graph
-
-            last_processed_nodes: t.Set[T] = set()
-            cycle_candidates: t.Collection = unprocessed_nodes
-
-            while unprocessed_nodes:
-                next_nodes = {node for node, deps in unprocessed_nodes.items() if not deps}
+        return list(self._sorted_nodes())
 
-                if not next_nodes:
-                    # Sort cycle candidates to make the order deterministic
-                    cycle_candidates_msg = (
-                        "\nPossible candidates to check for circular references: "
-                        + ", ".join(str(node) for node in sorted(cycle_candidates))
-                    )
-
-                    if last_processed_nodes:
-                        last_processed_msg = "\nLast nodes added to the DAG: " + ", ".join(
-                            str(node) for node in last_processed_nodes
-                        )
-                    else:
-                        last_processed_msg = ""
-
-                    raise SQLMeshError(
-                        "Detected a cycle in the DAG. "
-                        "Please make sure there are no circular references between nodes."
-                        f"{last_processed_msg}{cycle_candidates_msg}"
-                    )
-
-                for node in next_nodes:
-                    unprocessed_nodes.pop(node)
-
-                nodes_with_unaffected_deps: t.Set[T] = set()
-                for node, deps in unprocessed_nodes.items():
-                    deps_before_subtraction = deps
-
-                    deps -= next_nodes
-                    if deps_before_subtraction == deps:
-                        nodes_with_unaffected_deps.add(node)
-
-                cycle_candidates = nodes_with_unaffected_deps or unprocessed_nodes
-
-                # Sort to make the order deterministic
-                # TODO: Make protocol that makes the type var both hashable and sortable once we are on Python 3.8+
-                last_processed_nodes = sorted(next_nodes)  # type: ignore
-                self._sorted.extend(last_processed_nodes)
+    def _sorted_nodes(self) -> t.List[T]:
+        if self._sorted is None:
+            # Kahn's algorithm which processes nodes one level at a time. Each level is sorted to
+            # make the order deterministic.
+            indegrees = {node: len(deps) for node, deps in self._dag.items()}
+            # TODO: Make protocol that makes the type var both hashable and sortable once we are on Python 3.8+
+            level: t.List[T] = sorted(  # type: ignore
+                node for node, indegree in indegrees.items() if not indegree
+            )
+            last_processed_nodes: t.List[T] = []
+            result: t.List[T] = []
+
+            while level:
+                result.extend(level)
+                next_level = []
+                for node in level:
+                    for dependent in self._dependents[node]:
+                        indegrees[dependent] -= 1
+                        if not indegrees[dependent]:
+                            next_level.append(dependent)
+                last_processed_nodes = level
+                level = sorted(next_level)  # type: ignore
+
+            if len(result) < len(self._dag):
+                self._raise_cycle_error(indegrees, last_processed_nodes)
+
+            self._sorted = result
 
         return self._sorted
 
@@ -166,22 +148,12 @@ class DAG(t.Generic[T]):
         Returns:
             A list of descendant nodes sorted in topological order.
         """
-        sorted_nodes = self.sorted
-        try:
-            node_index = sorted_nodes.index(node)
-        except ValueError:
+        if node not in self._dag:
             return []
-
-        def visit() -> t.Iterator[T]:
-            """Visit topologically sorted nodes after input node and yield downstream dependants."""
-            downstream = {node}
-            for current_node in sorted_nodes[node_index + 1 :]:
-                upstream = self._dag.get(current_node, set())
-                if not upstream.isdisjoint(downstream):
-                    downstream.add(current_node)
-                    yield current_node
-
-        return list(visit())
+        if node not in self._downstream_cache:
+            downstream = self._closure(self._dependents[node], self._dependents)
+            self._downstream_cache[node] = self._topologically_sorted(downstream)
+        return list(self._downstream_cache[node])
 
     def lineage(self, node: T) -> DAG[T]:
         """Get a dag of the node and its upstream dependencies and downstream dependents.
@@ -195,8 +167,87 @@ class DAG(t.Generic[T]):
         return self.subdag(node, *self.downstream(node))
 
     def __contains__(self, item: T) -> bool:
-        return item in self.graph
+        return item in self._dag
 
     def __iter__(self) -> t.Iterator[T]:
-        for node in self.sorted:
+        for node in self._sorted_nodes():
             yield node
+
+    def _add_node(self, node: T) -> None:
+        if node not in self._dag:
+            self._dag[node] = set()
+            self._dependents[node] = set()
+
+    def _invalidate(self) -> None:
+        self._sorted = None
+        self._positions = None
+        self._graph = None
+        self._upstream_cache.clear()
+        self._downstream_cache.clear()
+
+    def _induced(self, graph: t.Dict[T, t.Set[T]]) -> DAG[T]:
+        """Creates a new DAG from the given subset of this DAG's nodes, whose dependencies are
+        already restricted to that subset."""
+        dependents: t.Dict[T, t.Set[T]] = {node: set() for node in graph}
+        for node, deps in graph.items():
+            for dep in deps:
+                dependents[dep].add(node)
+        return DAG._from_adjacency({node: set(deps) for node, deps in graph.items()}, dependents)
+
+    @classmethod
+    def _from_adjacency(
+        cls, dependencies: t.Dict[T, t.Set[T]], dependents: t.Dict[T, t.Set[T]]
+    ) -> DAG[T]:
+        dag: DAG[T] = cls()
+        dag._dag = {node: set(deps) for node, deps in dependencies.items()}
+        dag._dependents = {node: set(deps) for node, deps in dependents.items()}
+        return dag
+
+    @staticmethod
+    def _closure(nodes: t.Iterable[T], adjacency: t.Dict[T, t.Set[T]]) -> t.Set[T]:
+        """Returns the given nodes together with all nodes that are reachable from them."""
+        visited = set(nodes)
+        queue = list(visited)
+        while queue:
+            for next_node in adjacency.get(queue.pop(), ()):
+                if next_node not in visited:
+                    visited.add(next_node)
+                    queue.append(next_node)
+        return visited
+
+    def _topologically_sorted(self, nodes: t.Collection[T]) -> t.List[T]:
+        if self._positions is None:
+            self._positions = {node: i for i, node in enumerate(self._sorted_nodes())}
+        return sorted(nodes, key=self._positions.__getitem__)
+
+    def _raise_cycle_error(
+        self, indegrees: t.Dict[T, int], last_processed_nodes: t.List[T]
+    ) -> None:
+        unprocessed_nodes = [node for node, indegree in indegrees.items() if indegree]
+        # Nodes whose dependencies weren't affected by the last processed nodes are more likely
+        # to be part of a cycle.
+        affected_nodes = {
+            dependent for node in last_processed_nodes for dependent in self._dependents[node]
+        }
+        cycle_candidates = [
+            node for node in unprocessed_nodes if node not in affected_nodes
+        ] or unprocessed_nodes
+
+        # Sort cycle candidates to make the order deterministic
+        cycle_candidates_msg = (
+            "\nPossible candidates to check for circular references: "
+            + ", ".join(str(node) for node in sorted(cycle_candidates))  # type: ignore
+        )
+
+        if last_processed_nodes:
+            last_processed_msg = "\nLast nodes added to the DAG: " + ", ".join(
+                str(node) for node in last_processed_nodes
+            )
+        else:
+            last_processed_msg = ""
+
+        raise SQLMeshError(
+            "Detected a cycle in the DAG. "
+            "Please make sure there are no circular references between nodes."
+            f"{last_processed_msg}{cycle_candidates_msg}"
+        )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import ast
+import copy
 import dis
+import functools
 import importlib
 import inspect
 import linecache
@@ -18,6 +20,7 @@ from astor import to_source
 
 from sqlmesh.core import constants as c
 from sqlmesh.utils import format_exception, unique
+from sqlmesh.utils.cache import BoundedCache
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 
@@ -413,6 +416,81 @@ def prepare_env(
     return env
 
 
+# Prepared environments are shared by all callers which prepare identical Python environments.
+PREPARED_ENV_CACHE: BoundedCache[t.Tuple[t.Any, ...], t.Dict[str, t.Any]] = BoundedCache(
+    max_entries=1000
+)
+
+
+def python_env_key(python_env: t.Dict[str, Executable]) -> t.Tuple[t.Any, ...]:
+    """Returns a hashable key which identifies the contents of the given Python environment."""
+    return tuple(
+        (name, executable.kind, executable.payload, executable.name, executable.alias)
+        for name, executable in sorted(python_env.items(), key=lambda item: item[0])
+    )
+
+
+def get_prepared_env(
+    python_env: t.Dict[str, Executable],
+    base_env: t.Optional[t.Dict[str, t.Any]] = None,
+) -> t.Dict[str, t.Any]:
+    """Returns a prepared environment which is shared by all callers that prepare the same Python
+    environment on top of the same base environment.
+
+    Executing the serialized code is expensive, so it only happens once per distinct environment.
+    The returned dictionary must not be modified and its functions share it as their globals, so
+    callers that run the functions should use `copy_prepared_env` instead.
+
+    Args:
+        python_env: The dictionary containing the serialized python environment.
+        base_env: An optional long-lived dictionary whose entries are available to the executed code.
+
+    Returns:
+        The prepared environment with hydrated functions.
+    """
+    key = (id(base_env) if base_env is not None else None, python_env_key(python_env))
+    return PREPARED_ENV_CACHE.get_or_load(
+        key, lambda: prepare_env(python_env, dict(base_env) if base_env is not None else None)
+    )
+
+
+def copy_prepared_env(
+    python_env: t.Dict[str, Executable],
+    base_env: t.Optional[t.Dict[str, t.Any]] = None,
+) -> t.Dict[str, t.Any]:
+    """Returns a private copy of the shared prepared environment, which can be used and modified
+    independently of other copies.
+
+    Serialized values are deep-copied and the functions defined by the environment are rebound to the
+    copy, so that state which they keep in their globals isn't shared between copies.
+
+    Args:
+        python_env: The dictionary containing the serialized python environment.
+        base_env: An optional long-lived dictionary whose entries are available to the executed code.
+
+    Returns:
+        The copied environment.
+    """
+    shared = get_prepared_env(python_env, base_env)
+    env = dict(shared)
+    for name, executable in python_env.items():
+        if executable.is_value:
+            env[name] = copy.deepcopy(shared[name])
+
+    rebound: t.Dict[int, t.Callable] = {}
+    for name, value in shared.items():
+        if isinstance(value, types.FunctionType) and value.__globals__ is shared:
+            if id(value) not in rebound:
+                func = types.FunctionType(
+                    value.__code__, env, value.__name__, value.__defaults__, value.__closure__
+                )
+                func.__kwdefaults__ = value.__kwdefaults__
+                # Also sets __wrapped__, which lets per-function caches be shared by all copies
+                rebound[id(value)] = functools.update_wrapper(func, value)
+            env[name] = rebound[id(value)]
+    return env
+
+
 def print_exception(
     exception: Exception,
     python_env: t.Dict[str, Executable],
@@ -39,3 +39,39 @@ def columns_to_types_from_df(df: pd.DataFrame) -> t.Dict[str, exp.DataType]:
             raise ValueError(f"Unsupported pandas type '{column_type}'")
         result[str(column_name)] = exp_type
     return result
+
+
+def rechunk_dfs(dfs: t.Iterable[pd.DataFrame], chunk_size: int) -> t.Iterator[pd.DataFrame]:
+    """Splits and combines DataFrames into chunks with the given number of rows.
+
+    Only the rows of the current chunk are buffered, so the number of rows held in memory is bounded
+    by the chunk size and the size of the largest DataFrame. The last chunk may be smaller.
+
+    Args:
+        dfs: The DataFrames to rechunk.
+        chunk_size: The number of rows per chunk.
+
+    Returns:
+        An iterator over the chunks.
+    """
+    buffer: t.List[pd.DataFrame] = []
+    buffered_rows = 0
+    for df in dfs:
+        if df.empty:
+            continue
+        buffer.append(df)
+        buffered_rows += len(df.index)
+        if buffered_rows < chunk_size:
+            continue
+
+        combined = buffer[0] if len(buffer) == 1 else pd.concat(buffer, ignore_index=True)
+        full_rows = buffered_rows - buffered_rows % chunk_size
+        for chunk_start in range(0, full_rows, chunk_size):
+            yield combined.iloc[chunk_start : chunk_start + chunk_size]
+
+        remainder = combined.iloc[full_rows:]
+        buffer = [remainder] if not remainder.empty else []
+        buffered_rows = len(remainder.index)
+
+    if buffer:
+        yield buffer[0] if len(buffer) == 1 else pd.concat(buffer, ignore_index=True)
@@ -1,4 +1,5 @@
 # type: ignore
+import logging
 import typing as t
 from datetime import datetime
 from unittest.mock import call
@@ -16,6 +17,7 @@ from sqlmesh.core.engine_adapter import EngineAdapter, EngineAdapterWithIndexSup
 from sqlmesh.core.engine_adapter.shared import InsertOverwriteStrategy
 from sqlmesh.core.schema_diff import SchemaDiffer, TableAlterOperation
 from sqlmesh.utils import columns_to_types_to_struct
+from sqlmesh.utils.cache import BoundedCache, CacheStats
 from sqlmesh.utils.date import to_ds
 from sqlmesh.utils.errors import SQLMeshError, UnsupportedCatalogOperationError
 from tests.core.engine_adapter import to_sql_calls
@@ -2625,6 +2627,24 @@ def test_drop_schema_catalog(make_mocked_engine_adapter: t.Callable):
         adapter.drop_schema("test_catalog.test_schema")
 
 
+def test_metadata_listeners(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    notifications: t.List[t.Optional[exp.Expression]] = []
+    adapter.add_metadata_listener(notifications.append)
+
+    adapter.create_schema("test_schema")
+    adapter.rename_table("test_schema.a", "test_schema.b")
+    adapter.execute(parse_one("SELECT 1"))
+    adapter.execute("INSERT INTO test_schema.b VALUES (1)")
+    adapter.with_log_level(logging.INFO).execute("drop table test_schema.b")
+
+    assert [e.sql() if e else None for e in notifications] == [
+        "CREATE SCHEMA IF NOT EXISTS test_schema",
+        "ALTER TABLE test_schema.a RENAME TO test_schema.b",
+        None,
+    ]
+
+
 def test_get_current_catalog(make_mocked_engine_adapter: t.Callable):
     adapter = make_mocked_engine_adapter(EngineAdapter)
 
@@ -2752,3 +2772,33 @@ def test_insert_overwrite_by_partition_query_insert_overwrite_strategy(
     assert sql_calls == [
         'INSERT OVERWRITE TABLE "test_schema"."test_table" ("a", "ds", "b") SELECT "a", "ds", "b" FROM "tbl"'
     ]
+
+
+def test_to_sql_cache(make_mocked_engine_adapter: t.Callable, mocker: MockerFixture):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    mocker.patch.object(EngineAdapter, "SQL_CACHE", BoundedCache(max_entries=10))
+
+    query = parse_one("SELECT a FROM tbl WHERE b = 'x'")
+    assert adapter._to_sql(query) == """SELECT "a" FROM "tbl" WHERE "b" = 'x'"""
+    assert adapter._to_sql(query.copy()) == """SELECT "a" FROM "tbl" WHERE "b" = 'x'"""
+    assert adapter.sql_cache_stats == CacheStats(hits=1, misses=1)
+    # The expression passed by the caller is not modified
+    assert query.sql() == "SELECT a FROM tbl WHERE b = 'x'"
+
+    # Keys are case sensitive and depend on quoting and generator options
+    assert adapter._to_sql(parse_one("SELECT a FROM tbl WHERE b = 'X'")).endswith("'X'")
+    assert adapter._to_sql(query, quote=False) == "SELECT a FROM tbl WHERE b = 'x'"
+    assert adapter._to_sql(query, pretty=True) == 'SELECT\n  "a"\nFROM "tbl"\nWHERE\n  "b" = \'x\''
+    assert adapter._to_sql(exp.Var(this="ABC")) == "ABC"
+    assert adapter._to_sql(exp.Var(this="abc")) == "abc"
+    assert adapter.sql_cache_stats == CacheStats(hits=1, misses=6)
+
+    # Mutating an expression after it was rendered doesn't return stale SQL
+    query.set("where", None)
+    assert adapter._to_sql(query) == 'SELECT "a" FROM "tbl"'
+
+    # Large expressions are not cached
+    mocker.patch.object(EngineAdapter, "SQL_CACHE_MAX_NODES", 3)
+    adapter._to_sql(parse_one("SELECT a, b, c FROM tbl"))
+    adapter._to_sql(parse_one("SELECT a, b, c FROM tbl"))
+    assert adapter.sql_cache_stats == CacheStats(hits=1, misses=7)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import os
 import pathlib
 import sys
+import time
 import typing as t
 from datetime import datetime, timedelta
 
@@ -19,7 +20,11 @@ from sqlmesh.core.dialect import normalize_model_name
 import sqlmesh.core.dialect as d
 from sqlmesh.core.engine_adapter import SparkEngineAdapter, TrinoEngineAdapter
 from sqlmesh.core.model import load_sql_based_model
-from sqlmesh.core.engine_adapter.shared import DataObject, DataObjectType
+from sqlmesh.core.engine_adapter.shared import (
+    DataFrameLoadStrategy,
+    DataObject,
+    DataObjectType,
+)
 from sqlmesh.core.model.definition import create_sql_model
 from sqlmesh.utils import random_id
 from sqlmesh.utils.date import now, to_date, to_ds, to_time_column, yesterday
@@ -2242,3 +2247,56 @@ def test_batch_size_on_incremental_by_unique_key_model(
 
     finally:
         ctx.cleanup(context)
+
+
+@pytest.mark.docker
+@pytest.mark.engine
+@pytest.mark.postgres
+@pytest.mark.slow
+@pytest.mark.xdist_group("engine_integration_postgres")
+def test_df_load_strategy_throughput(config: Config):
+    gateway = "inttest_postgres"
+    if gateway not in config.gateways:
+        pytest.skip(f"Gateway {gateway} not configured")
+
+    num_rows = 100_000
+    df = pd.DataFrame(
+        {
+            "id": np.arange(num_rows),
+            "ds": pd.date_range("2023-01-01", periods=num_rows, freq="min").strftime("%Y-%m-%d"),
+            "value": np.random.random(num_rows),
+        }
+    )
+    columns_to_types = {
+        "id": exp.DataType.build("int"),
+        "ds": exp.DataType.build("text"),
+        "value": exp.DataType.build("double"),
+    }
+    schema = f"test_df_load_{random_id(short=True)}"
+
+    rows_per_second = {}
+    for strategy in DataFrameLoadStrategy:
+        engine_adapter = (
+            config.gateways[gateway]
+            .connection.copy(update={"df_load_strategy": strategy})
+            .create_engine_adapter()
+        )
+        table = exp.table_(strategy.value, db=schema)
+        try:
+            engine_adapter.create_schema(schema)
+            engine_adapter.create_table(table, columns_to_types)
+
+            start = time.perf_counter()
+            engine_adapter.insert_append(table, df, columns_to_types=columns_to_types)
+            rows_per_second[strategy] = num_rows / (time.perf_counter() - start)
+
+            assert engine_adapter.fetchone(exp.select("COUNT(*)").from_(table)) == (num_rows,)
+        finally:
+            engine_adapter.drop_schema(schema, cascade=True)
+            engine_adapter.close()
+
+    # Rows per second for each strategy are reported on failure
+    assert (
+        rows_per_second[DataFrameLoadStrategy.NATIVE]
+        > rows_per_second[DataFrameLoadStrategy.VALUES]
+    ), rows_per_second
@@ -1,10 +1,13 @@
 # type: ignore
 import typing as t
+from datetime import datetime
 
+import pandas as pd
 from pytest_mock.plugin import MockerFixture
 from sqlglot import exp, parse_one
 
 from sqlmesh.core.engine_adapter import MySQLEngineAdapter
+from sqlmesh.core.engine_adapter.shared import DataFrameLoadStrategy
 from tests.core.engine_adapter import to_sql_calls
 
 
@@ -75,3 +78,35 @@ def test_pre_ping(mocker: MockerFixture, make_mocked_engine_adapter: t.Callable)
     ]
 
     adapter._connection_pool.get().ping.assert_called_once_with(reconnect=False)
+
+
+def test_insert_append_df_native_load(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture
+):
+    adapter = make_mocked_engine_adapter(
+        MySQLEngineAdapter, df_load_strategy=DataFrameLoadStrategy.NATIVE
+    )
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=exp.to_table("__temp_test_table"),
+    )
+
+    df = pd.DataFrame({"a": [1, 2], "ts": pd.to_datetime(["2023-01-01 01:00:00", None])})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={"a": exp.DataType.build("int"), "ts": exp.DataType.build("datetime")},
+    )
+
+    adapter.cursor.executemany.assert_called_once_with(
+        "INSERT INTO `__temp_test_table` (`a`, `ts`) VALUES (%s, %s)",
+        [(1, datetime(2023, 1, 1, 1)), (2, None)],
+    )
+    rows = adapter.cursor.executemany.call_args[0][1]
+    assert type(rows[0][0]) is int
+    assert type(rows[0][1]) is datetime
+    assert to_sql_calls(adapter) == [
+        "CREATE TABLE IF NOT EXISTS `__temp_test_table` (`a` INT, `ts` DATETIME)",
+        "INSERT INTO `test_table` (`a`, `ts`) SELECT CAST(`a` AS SIGNED) AS `a`, CAST(`ts` AS DATETIME) AS `ts` FROM `__temp_test_table`",
+        "DROP TABLE IF EXISTS `__temp_test_table`",
+    ]
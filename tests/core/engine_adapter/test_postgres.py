@@ -1,5 +1,7 @@
 import typing as t
 
+import numpy as np
+import pandas as pd
 import pytest
 from pytest_mock import MockFixture
 from pytest_mock.plugin import MockerFixture
@@ -7,6 +9,7 @@ from sqlglot import exp
 from sqlglot.helper import ensure_list
 
 from sqlmesh.core.engine_adapter import PostgresEngineAdapter
+from sqlmesh.core.engine_adapter.shared import DataFrameLoadStrategy
 from tests.core.engine_adapter import to_sql_calls
 
 pytestmark = [pytest.mark.engine, pytest.mark.postgres]
@@ -80,3 +83,36 @@ def test_comments(make_mocked_engine_adapter: t.Callable, mocker: MockerFixture)
         """COMMENT ON TABLE "test_table" IS '\\'""",
         """COMMENT ON COLUMN "test_table"."a" IS '\\'""",
     ]
+
+
+def test_insert_append_df_native_copy(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture
+):
+    adapter = make_mocked_engine_adapter(
+        PostgresEngineAdapter, df_load_strategy=DataFrameLoadStrategy.NATIVE
+    )
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=exp.to_table("__temp_test_table"),
+    )
+    copied = []
+    adapter.cursor.copy_expert.side_effect = lambda sql, buffer: copied.append((sql, buffer.read()))
+
+    df = pd.DataFrame({"a": [1, np.nan, 3], "b": ["x", None, "z,w"]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={"a": exp.DataType.build("int"), "b": exp.DataType.build("text")},
+    )
+
+    assert copied == [
+        (
+            """COPY "__temp_test_table" ("a", "b") FROM STDIN WITH (FORMAT csv, NULL '\\N')""",
+            '1,x\n\\N,\\N\n3,"z,w"\n',
+        )
+    ]
+    assert to_sql_calls(adapter) == [
+        'CREATE TABLE IF NOT EXISTS "__temp_test_table" ("a" INT, "b" TEXT)',
+        'INSERT INTO "test_table" ("a", "b") SELECT CAST("a" AS INT) AS "a", CAST("b" AS TEXT) AS "b" FROM "__temp_test_table"',
+        'DROP TABLE IF EXISTS "__temp_test_table"',
+    ]
@@ -8,6 +8,7 @@ from sqlglot import expressions as exp
 from sqlglot import parse_one
 
 from sqlmesh.core.engine_adapter import RedshiftEngineAdapter
+from sqlmesh.core.engine_adapter.shared import DataFrameLoadStrategy
 from tests.core.engine_adapter import to_sql_calls
 
 pytestmark = [pytest.mark.engine, pytest.mark.redshift]
@@ -253,3 +254,35 @@ def test_create_view(adapter: t.Callable):
         'DROP VIEW IF EXISTS "test_view" CASCADE',
         'CREATE VIEW "test_view" ("a", "b") AS SELECT "cola" FROM "table" WITH NO SCHEMA BINDING',
     ]
+
+
+def test_insert_append_df_native_load(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture
+):
+    adapter = make_mocked_engine_adapter(
+        RedshiftEngineAdapter, df_load_strategy=DataFrameLoadStrategy.NATIVE
+    )
+    adapter.DEFAULT_BATCH_SIZE = 2
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=exp.to_table("__temp_test_table"),
+    )
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={"a": exp.DataType.build("int"), "b": exp.DataType.build("varchar")},
+    )
+
+    assert [call[0][1] for call in adapter.cursor.execute.call_args_list if len(call[0]) > 1] == [
+        [1, "x", 2, None],
+        [3, "z"],
+    ]
+    assert to_sql_calls(adapter) == [
+        'CREATE TABLE IF NOT EXISTS "__temp_test_table" ("a" INTEGER, "b" VARCHAR)',
+        'INSERT INTO "__temp_test_table" ("a", "b") VALUES (?, ?), (?, ?)',
+        'INSERT INTO "__temp_test_table" ("a", "b") VALUES (?, ?)',
+        'INSERT INTO "test_table" ("a", "b") SELECT CAST("a" AS INTEGER) AS "a", CAST("b" AS VARCHAR) AS "b" FROM "__temp_test_table"',
+        'DROP TABLE IF EXISTS "__temp_test_table"',
+    ]
@@ -1,12 +1,14 @@
 import typing as t
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 from pytest_mock.plugin import MockerFixture
 from sqlglot import exp, parse_one
 
 import sqlmesh.core.dialect as d
 from sqlmesh.core.engine_adapter import TrinoEngineAdapter
+from sqlmesh.core.engine_adapter.shared import DataFrameLoadStrategy
 from sqlmesh.core.model import load_sql_based_model
 from sqlmesh.core.model.definition import SqlModel
 from tests.core.engine_adapter import to_sql_calls
@@ -400,3 +402,35 @@ def test_delta_timestamps(make_mocked_engine_adapter: t.Callable):
         "ts_tz": ts3_tz,
         "ts_tz_1": ts3_tz,
     }
+
+
+def test_insert_append_df_native_load(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture
+):
+    adapter = make_mocked_engine_adapter(
+        TrinoEngineAdapter, df_load_strategy=DataFrameLoadStrategy.NATIVE
+    )
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.trino.TrinoEngineAdapter.current_catalog_type",
+        new_callable=mocker.PropertyMock(return_value="hive"),
+    )
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table",
+        return_value=exp.to_table("__temp_test_table"),
+    )
+
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        columns_to_types={"a": exp.DataType.build("int"), "b": exp.DataType.build("varchar")},
+    )
+
+    adapter.cursor.execute.assert_any_call(
+        'INSERT INTO "__temp_test_table" ("a", "b") VALUES (CAST(? AS INTEGER), CAST(? AS VARCHAR)), (CAST(? AS INTEGER), CAST(? AS VARCHAR))',
+        [1, "x", 2, "y"],
+    )
+    assert to_sql_calls(adapter)[-2:] == [
+        'INSERT INTO "test_table" ("a", "b") SELECT CAST("a" AS INTEGER) AS "a", CAST("b" AS VARCHAR) AS "b" FROM "__temp_test_table"',
+        'DROP TABLE IF EXISTS "__temp_test_table"',
+    ]
@@ -16,6 +16,7 @@ from sqlmesh.core.config.connection import (
     TrinoAuthenticationMethod,
     _connection_config_validator,
 )
+from sqlmesh.core.engine_adapter.shared import DataFrameLoadStrategy
 from sqlmesh.utils.errors import ConfigError
 
 
@@ -585,6 +586,19 @@ def test_postgres(make_config):
     )
     assert isinstance(config, PostgresConnectionConfig)
     assert config.is_recommended_for_state_sync is True
+    assert config.df_load_strategy == DataFrameLoadStrategy.VALUES
+
+    config = make_config(
+        type="postgres",
+        host="host",
+        user="user",
+        password="password",
+        port=5432,
+        database="database",
+        df_load_strategy="native",
+    )
+    assert config.df_load_strategy == DataFrameLoadStrategy.NATIVE
+    assert config._extra_engine_config == {"df_load_strategy": DataFrameLoadStrategy.NATIVE}
 
 
 def test_gcp_postgres(make_config):
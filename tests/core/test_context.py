@@ -1,5 +1,7 @@
 import logging
 import pathlib
+import shutil
+import threading
 import typing as t
 from datetime import date, timedelta
 from tempfile import TemporaryDirectory
@@ -24,7 +26,7 @@ from sqlmesh.core.config import (
 from sqlmesh.core.context import Context
 from sqlmesh.core.dialect import parse, schema_
 from sqlmesh.core.environment import Environment
-from sqlmesh.core.model import load_sql_based_model
+from sqlmesh.core.model import SqlModel, load_sql_based_model
 from sqlmesh.core.model.kind import ModelKindName
 from sqlmesh.core.plan import BuiltInPlanEvaluator, PlanBuilder
 from sqlmesh.utils.date import (
@@ -69,6 +71,38 @@ def test_config_parameter(copy_to_temp_path: t.Callable):
     assert context.config.project == "test_project"
 
 
+def test_load_in_processes(copy_to_temp_path: t.Callable):
+    path = copy_to_temp_path("examples/sushi")[0]
+
+    def load(processes: int) -> Context:
+        config = Config(
+            model_defaults=ModelDefaultsConfig(dialect="duckdb"),
+            loader_kwargs={"processes": processes},
+        )
+        return Context(paths=path, config=config)
+
+    serial_context = load(1)
+    shutil.rmtree(path / sqlmesh.core.constants.CACHE)
+    parallel_context = load(2)
+
+    assert parallel_context.models.keys() == serial_context.models.keys()
+    for name, model in serial_context.models.items():
+        parallel_model = parallel_context.models[name]
+        assert parallel_model.columns_to_types == model.columns_to_types
+        assert parallel_model._path == model._path
+        if isinstance(model, SqlModel):
+            assert parallel_model.render_query_or_raise() == model.render_query_or_raise()
+    assert parallel_context._loader._path_mtimes == serial_context._loader._path_mtimes
+
+    # Models are now loaded from the cache.
+    fingerprints = {s.name: s.fingerprint for s in parallel_context.snapshots.values()}
+    assert {s.name: s.fingerprint for s in load(2).snapshots.values()} == fingerprints
+
+    create_temp_file(path, pathlib.Path("models", "invalid.sql"), "MODEL (name a.b); SELECT ((")
+    with pytest.raises(ConfigError, match=r"Failed to parse a model definition at '.*invalid.sql'"):
+        load(2)
+
+
 def test_generate_table_name_in_dialect(mocker: MockerFixture):
     context = Context(config=Config(model_defaults=ModelDefaultsConfig(dialect="bigquery")))
     mocker.patch(
@@ -509,6 +543,34 @@ def test_janitor(sushi_context, mocker: MockerFixture) -> None:
     )
 
 
+def test_janitor_in_background(sushi_context, mocker: MockerFixture) -> None:
+    sushi_context.config.run.janitor_in_background = True
+    run_janitor_mock = mocker.patch.object(sushi_context, "_run_janitor")
+    mocker.patch.object(sushi_context, "_run_scheduler", return_value=True)
+
+    # DuckDB connections don't support concurrent tasks.
+    with patch.object(logging.getLogger("sqlmesh.core.context"), "warning") as warning_mock:
+        assert sushi_context.run()
+    warning_mock.assert_called_once()
+    run_janitor_mock.assert_called_once_with()
+
+    run_janitor_mock.reset_mock()
+    mocker.patch.object(sushi_context, "_janitor_runs_in_background", return_value=True)
+    create_state_sync_mock = mocker.patch.object(
+        type(sushi_context._scheduler), "create_state_sync"
+    )
+    janitor_threads = []
+    run_janitor_mock.side_effect = lambda **kwargs: janitor_threads.append(
+        threading.current_thread()
+    )
+
+    assert sushi_context.run()
+    assert janitor_threads and janitor_threads[0] is not threading.current_thread()
+    assert run_janitor_mock.call_args.kwargs["state_sync"] is create_state_sync_mock.return_value
+    assert run_janitor_mock.call_args.kwargs["report_progress"] is False
+    create_state_sync_mock.return_value.close.assert_called_once()
+
+
 @pytest.mark.slow
 def test_plan_default_end(sushi_context_pre_scheduling: Context):
     prod_plan_builder = sushi_context_pre_scheduling.plan_builder("prod")
@@ -676,3 +738,43 @@ def test_load_external_models(copy_to_temp_path):
 
     # from external_models/model2.yaml
     assert "raw.model2" in external_model_names
+
+
+def test_snapshot_fingerprint_cache_restore(tmp_path: pathlib.Path, mocker: MockerFixture):
+    from sqlmesh.core.snapshot import SnapshotFingerprintCache, fingerprint_from_node
+
+    num_models = 100
+    for i in range(num_models):
+        query = (
+            f"SELECT a.id, a.v + 1 AS v FROM db.m_{i // 2} AS a JOIN db.m_{i // 3} AS b ON a.id = b.id"
+            if i
+            else "SELECT 1 AS id, 1 AS v"
+        )
+        create_temp_file(
+            tmp_path,
+            pathlib.Path("models", f"m_{i}.sql"),
+            f"MODEL (name db.m_{i}, kind FULL); {query}",
+        )
+
+    context = Context(
+        paths=tmp_path, config=Config(model_defaults=ModelDefaultsConfig(dialect="duckdb"))
+    )
+
+    nodes = dict(context._models)
+    entry_ids = {
+        name: entry_id
+        for name, node in nodes.items()
+        if (entry_id := context._loader.fingerprint_entry_id(node)) is not None
+    }
+    assert len(entry_ids) == num_models
+    cache_path = tmp_path / sqlmesh.core.constants.CACHE
+    SnapshotFingerprintCache(cache_path).fingerprints(nodes, entry_ids)  # type: ignore
+
+    fingerprint_spy = mocker.spy(sqlmesh.core.snapshot.cache, "fingerprint_from_node")
+    restored = SnapshotFingerprintCache(cache_path).fingerprints(nodes, entry_ids)  # type: ignore
+    assert fingerprint_spy.call_count == 0
+
+    computed: t.Dict[str, t.Any] = {}
+    for node in nodes.values():
+        fingerprint_from_node(node, nodes=nodes, cache=computed)  # type: ignore
+    assert restored == computed
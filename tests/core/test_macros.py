@@ -3,8 +3,10 @@ import typing as t
 import pytest
 from sqlglot import MappingSchema, exp, parse_one
 
+from sqlmesh.core import dialect as d
 from sqlmesh.core.dialect import StagedFilePath
-from sqlmesh.core.macros import SQL, MacroEvalError, MacroEvaluator, macro
+from sqlmesh.core.macros import SQL, MacroEvalError, MacroEvaluator, _MacroCallPlan, macro
+from sqlmesh.core.model import load_sql_based_model
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.metaprogramming import Executable
 
@@ -599,3 +601,95 @@ def test_macro_parameter_resolution(macro_evaluator):
     with pytest.raises(MacroEvalError) as e:
         macro_evaluator.evaluate(parse_one("@test_arg_resolution(1, 2, 3)"))
     assert str(e.value.__cause__) == "too many positional arguments"
+
+
+def test_prepared_env_shared():
+    python_env = {
+        "add_one": Executable(
+            name="add_one",
+            payload="def add_one(evaluator, value: int):\n    return value + 1",
+            kind="definition",
+        ),
+        "record_call": Executable(
+            name="record_call",
+            payload="def record_call(evaluator):\n    counts.append(3)\n    return len(counts)",
+            kind="definition",
+        ),
+        "counts": Executable.value([1, 2]),
+    }
+    evaluator_a = MacroEvaluator(python_env=python_env)
+    evaluator_b = MacroEvaluator(python_env=python_env)
+
+    # Definitions are executed once per Python environment and rebound to each evaluator's copy
+    add_one_a, add_one_b = evaluator_a.macros["@ADD_ONE"], evaluator_b.macros["@ADD_ONE"]
+    assert add_one_a is not add_one_b
+    assert add_one_a.__wrapped__ is add_one_b.__wrapped__
+    assert _MacroCallPlan.of(add_one_a) is _MacroCallPlan.of(add_one_b)
+    assert add_one_a.__globals__ is evaluator_a.env
+    assert evaluator_a.env["self"] is evaluator_a
+    assert evaluator_b.env["self"] is evaluator_b
+
+    # Values are copied for each evaluator
+    evaluator_a.locals["counts"].append(3)
+    assert evaluator_a.env["counts"] == [1, 2, 3]
+    assert evaluator_b.locals["counts"] == [1, 2]
+    assert evaluator_b.env["counts"] == [1, 2]
+
+    assert evaluator_a.transform(parse_one("SELECT @ADD_ONE(1)")).sql() == "SELECT 2"  # type: ignore
+
+    # Functions see the values of their own evaluator
+    for _ in range(3):
+        evaluator = MacroEvaluator(python_env=python_env)
+        assert evaluator.transform(parse_one("SELECT @RECORD_CALL()")).sql() == "SELECT 3"  # type: ignore
+
+
+def test_macro_call_plan(macro_evaluator):
+    func = macro_evaluator.macros["@BITSHIFT_SQUARE"]
+    plan = _MacroCallPlan.of(func)
+    assert _MacroCallPlan.of(func) is plan
+    assert list(plan.signature.parameters) == ["evaluator", "x", "y"]
+    assert [(arg, typ) for arg, typ, _ in plan.coercions][-2:] == [("x", int), ("y", int)]
+
+    assert macro_evaluator.transform(parse_one("SELECT @bitshift_square(4, 1)")).sql() == "SELECT 4"
+
+
+def test_macro_heavy_render():
+    registry = macro.get_registry()
+
+    @macro()
+    def heavy_cols(evaluator: MacroEvaluator, prefix: str, count: int) -> t.List[exp.Expression]:
+        return [exp.column(f"{prefix}_{i}") for i in range(count)]
+
+    @macro()
+    def heavy_filter(
+        evaluator: MacroEvaluator, column: exp.Column, value: exp.Literal
+    ) -> exp.Condition:
+        return column.eq(value)
+
+    try:
+        model = load_sql_based_model(
+            d.parse(
+                """
+                MODEL (name db.heavy, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+                SELECT
+                  @heavy_cols('a', 5),
+                  @EACH([x, y, z], c -> c * 2),
+                  @IF(@start_ds > '2020-01-01', 1, 0) AS flag
+                FROM db.src
+                WHERE @heavy_filter(ds, @start_ds)
+                """
+            ),
+            macros=macro.get_registry(),
+        )
+    finally:
+        macro.set_registry(registry)
+
+    for day in range(1, 29):
+        query = model.render_query(start=f"2021-01-{day:02d}", optimize=False)
+        assert query is not None
+        assert query.sql() == (
+            'SELECT "a_0" AS "a_0", "a_1" AS "a_1", "a_2" AS "a_2", "a_3" AS "a_3", "a_4" AS "a_4", '
+            '"x" * 2, "y" * 2, "z" * 2, 1 AS "flag" FROM "db"."src" AS "src" '
+            f"WHERE \"ds\" = '2021-01-{day:02d}'"
+        )
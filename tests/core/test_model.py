@@ -2,6 +2,7 @@
 import json
 import logging
 import typing as t
+from copy import deepcopy
 from datetime import date
 from pathlib import Path
 from unittest.mock import patch
@@ -22,7 +23,7 @@ from sqlmesh.core.config import (
 )
 from sqlmesh.core.context import Context, ExecutionContext
 from sqlmesh.core.dialect import parse
-from sqlmesh.core.macros import MacroEvaluator, macro
+from sqlmesh.core.macros import MacroEvaluator, RuntimeStage, macro
 from sqlmesh.core.model import (
     PythonModel,
     FullKind,
@@ -1349,6 +1350,124 @@ def test_render_query(assert_exp_eq, sushi_context):
     )
 
 
+def test_render_query_template(mocker: MockerFixture):
+    model = t.cast(
+        SqlModel,
+        load_sql_based_model(
+            d.parse(
+                """
+            MODEL (name db.model, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+            SELECT
+              @EACH([a, b], c -> c * 2),
+              @start_millis AS start_millis,
+              @execution_hour AS execution_hour,
+              @end_dt AS end_dt
+            FROM db.source
+            WHERE ds BETWEEN @start_ds AND @end_ds
+            """
+            )
+        ),
+    )
+    intervals = [
+        ("2023-01-01", "2023-01-01"),
+        ("2023-01-02", "2023-01-03"),
+        ("2023-02-28", "2023-03-01"),
+    ]
+
+    def render(start: str, end: str) -> str:
+        query = model.render_query(
+            start=start,
+            end=end,
+            execution_time=f"{end} 05:00:00",
+            table_mapping={"db.source": "db.source_mapped"},
+            runtime_stage=RuntimeStage.EVALUATING,
+        )
+        assert query is not None
+        return query.sql()
+
+    expected = []
+    for start, end in intervals:
+        # Without a template of the same key every interval is fully rendered
+        model._query_renderer._query_template = None
+        expected.append(render(start, end))
+
+    model._query_renderer._query_template = None
+    evaluate_macros = mocker.spy(MacroEvaluator, "transform")
+    assert [render(start, end) for start, end in intervals] == expected
+    assert [render(start, end) for start, end in intervals] == expected
+    # The first two renders of the same key are full renders, the second one also renders the
+    # template with placeholder times, the rest are substituted
+    assert evaluate_macros.call_count == 3
+    assert expected[1] == (
+        'SELECT "a" * 2, "b" * 2, 1672617600000 AS "start_millis", 5 AS "execution_hour", '
+        "TIME_STR_TO_TIME('2023-01-03 23:59:59.999999+00:00') AS \"end_dt\" "
+        'FROM "db"."source_mapped" AS "source" /* db.source */ '
+        "WHERE \"ds\" BETWEEN '2023-01-02' AND '2023-01-03'"
+    )
+
+    # A different table mapping is a different key
+    query = model.render_query(
+        start="2023-01-02", end="2023-01-03", execution_time="2023-01-03 05:00:00"
+    )
+    assert query is not None
+    assert query.sql() == (
+        'SELECT "a" * 2, "b" * 2, 1672617600000 AS "start_millis", 5 AS "execution_hour", '
+        "TIME_STR_TO_TIME('2023-01-03 23:59:59.999999+00:00') AS \"end_dt\" "
+        'FROM "db"."source" AS "source" '
+        "WHERE \"ds\" BETWEEN '2023-01-02' AND '2023-01-03'"
+    )
+
+    # Models with a renderer can still be copied
+    model_copy = deepcopy(model)
+    assert model_copy._query_renderer._template_lock is not model._query_renderer._template_lock
+    assert (
+        model_copy.render_query(
+            start="2023-01-02", end="2023-01-03", execution_time="2023-01-03 05:00:00"
+        )
+        == query
+    )
+
+
+def test_render_query_template_fallback():
+    @macro()
+    def late_flag(evaluator):
+        return 1 if evaluator.locals["start_ds"] > "2023-01-15" else 0
+
+    @macro()
+    def after_first_day(evaluator):
+        return 1 if evaluator.locals.get("start_ds") in (None, "2023-01-20") else 2
+
+    def render_all(query: str) -> t.List[str]:
+        model = load_sql_based_model(
+            d.parse(
+                f"""
+                MODEL (name db.model, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+                {query}
+                """
+            ),
+            macros=macro.get_registry(),
+        )
+        return [
+            model.render_query_or_raise(start=start, end=start).sql()
+            for start in ("2023-01-20", "2023-01-21", "2023-01-02")
+        ]
+
+    # Macros that branch on times are fully rendered for every interval
+    assert render_all("SELECT @late_flag() AS f FROM db.source WHERE ds >= @start_ds")[-1] == (
+        'SELECT 0 AS "f" FROM "db"."source" AS "source" WHERE "ds" >= \'2023-01-02\''
+    )
+    assert render_all("SELECT @after_first_day() = 1 AS f FROM db.source") == [
+        'SELECT 1 = 1 AS "f" FROM "db"."source" AS "source"',
+        'SELECT 2 = 1 AS "f" FROM "db"."source" AS "source"',
+        'SELECT 2 = 1 AS "f" FROM "db"."source" AS "source"',
+    ]
+    assert render_all(
+        "SELECT @IF(@start_ds > '2023-01-15', 1, 0) AS f FROM db.source WHERE ds >= @start_ds"
+    )[-1] == ('SELECT 0 AS "f" FROM "db"."source" AS "source" WHERE "ds" >= \'2023-01-02\'')
+
+
 def test_time_column():
     expressions = d.parse(
         """
@@ -16,6 +16,7 @@ from sqlmesh.core.model.kind import (
 from sqlmesh.core.node import IntervalUnit
 from sqlmesh.core.scheduler import Scheduler, compute_interval_params
 from sqlmesh.core.snapshot import Snapshot, SnapshotEvaluator, SnapshotChangeCategory
+from sqlmesh.core.snapshot.definition import MISSING_INTERVALS_CACHE
 from sqlmesh.utils.date import to_datetime
 from sqlmesh.utils.errors import CircuitBreakerError
 
@@ -458,3 +459,30 @@ def test_external_model_audit(mocker, make_snapshot):
     )
 
     spy.assert_called_once()
+
+
+def test_missing_intervals_cache_stats(mocker: MockerFixture, make_snapshot):
+    snapshot: Snapshot = make_snapshot(
+        SqlModel(
+            name="name",
+            kind=IncrementalByTimeRangeKind(time_column="ds"),
+            interval_unit=IntervalUnit.DAY,
+            start="2023-01-01",
+            query=parse_one("SELECT ds FROM parent.tbl"),
+        )
+    )
+
+    scheduler = Scheduler(
+        snapshots=[snapshot],
+        snapshot_evaluator=SnapshotEvaluator(adapter=mocker.MagicMock(), ddl_concurrent_tasks=1),
+        state_sync=mocker.MagicMock(),
+        max_workers=2,
+        default_catalog=None,
+    )
+
+    MISSING_INTERVALS_CACHE.clear()
+    scheduler.batches(start="2023-01-01", end="2023-01-10", execution_time="2023-01-11")
+    scheduler.batches(start="2023-01-01", end="2023-01-10", execution_time="2023-01-11")
+
+    assert scheduler.missing_intervals_cache_stats.misses == 1
+    assert scheduler.missing_intervals_cache_stats.hits == 1
@@ -1,4 +1,5 @@
 import json
+import random
 import typing as t
 from copy import deepcopy
 from datetime import datetime, timedelta
@@ -9,6 +10,7 @@ from _pytest.monkeypatch import MonkeyPatch
 from pytest_mock.plugin import MockerFixture
 from sqlglot import exp, to_column
 
+import sqlmesh.core.snapshot.cache
 from sqlmesh.core.audit import StandaloneAudit
 from sqlmesh.core.config import (
     AutoCategorizationMode,
@@ -33,18 +35,29 @@ from sqlmesh.core.model import (
 from sqlmesh.core.model.kind import TimeColumn, ModelKindName
 from sqlmesh.core.snapshot import (
     DeployabilityIndex,
+    IntervalSet,
+    Node,
     QualifiedViewName,
     Snapshot,
     SnapshotChangeCategory,
     SnapshotFingerprint,
+    SnapshotFingerprintCache,
     categorize_change,
     earliest_start_date,
     fingerprint_from_node,
     has_paused_forward_only,
     missing_intervals,
 )
-from sqlmesh.core.snapshot.definition import display_name
+from sqlmesh.core.node import IntervalUnit
+from sqlmesh.core.snapshot.definition import (
+    MissingIntervalsCache,
+    _compute_missing_intervals,
+    _compute_missing_intervals_iterative,
+    _compute_missing_intervals_vectorized,
+    display_name,
+)
 from sqlmesh.utils import AttributeDict
+from sqlmesh.utils.cache import CacheStats
 from sqlmesh.utils.date import to_date, to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroInfo
@@ -687,6 +700,48 @@ def test_fingerprint(model: Model, parent_model: Model):
     assert new_fingerprint.metadata_hash == fingerprint.metadata_hash
 
 
+def test_snapshot_fingerprint_cache(
+    model: Model, parent_model: Model, tmp_path: Path, mocker: MockerFixture
+):
+    nodes: t.Dict[str, Node] = {parent_model.fqn: parent_model, model.fqn: model}
+    expected = {name: fingerprint_from_node(node, nodes=nodes) for name, node in nodes.items()}
+    entry_ids = {parent_model.fqn: "1", model.fqn: "1"}
+
+    compute_fingerprint = mocker.spy(sqlmesh.core.snapshot.cache, "fingerprint_from_node")
+
+    def fingerprints(
+        nodes: t.Dict[str, Node], entry_ids: t.Dict[str, str]
+    ) -> t.Dict[str, SnapshotFingerprint]:
+        compute_fingerprint.reset_mock()
+        return SnapshotFingerprintCache(tmp_path).fingerprints(nodes, entry_ids=entry_ids)
+
+    assert fingerprints(nodes, entry_ids) == expected
+    assert compute_fingerprint.call_count == 2
+
+    assert fingerprints(nodes, entry_ids) == expected
+    assert compute_fingerprint.call_count == 0
+
+    # Nodes without entry IDs are only fingerprinted as parents of nodes with entry IDs
+    assert fingerprints(nodes, {parent_model.fqn: "1"}) == {
+        parent_model.fqn: expected[parent_model.fqn]
+    }
+    assert compute_fingerprint.call_count == 0
+
+    # Persisted fingerprints of nodes which weren't given are pruned
+    assert fingerprints(nodes, {model.fqn: "1"}) == expected
+    assert compute_fingerprint.call_count == 2
+
+    # A changed parent invalidates the fingerprints of its children
+    new_parent_model = SqlModel(**{**parent_model.dict(), "query": parse_one("SELECT 2, ds")})
+    nodes = {parent_model.fqn: new_parent_model, model.fqn: model}
+    new_fingerprints = fingerprints(nodes, {parent_model.fqn: "2", model.fqn: "1"})
+    assert compute_fingerprint.call_count == 2
+    assert new_fingerprints == {
+        name: fingerprint_from_node(node, nodes=nodes) for name, node in nodes.items()
+    }
+    assert new_fingerprints[model.fqn] != expected[model.fqn]
+
+
 def test_fingerprint_seed_model():
     expressions = parse(
         """
@@ -1814,3 +1869,220 @@ def test_external_model_audits(sushi_context):
     assert snapshot.evaluatable
     assert len(snapshot.model.audits) == 2
     assert snapshot.intervals
+
+
+def test_interval_set():
+    interval_set = IntervalSet([(5, 10), (0, 2), (1, 3), (10, 12)])
+    assert interval_set.to_list() == [(0, 3), (5, 12)]
+    assert len(interval_set) == 2
+
+    interval_set.add(3, 4)
+    assert interval_set.to_list() == [(0, 4), (5, 12)]
+    interval_set.add(4, 5)
+    assert interval_set.to_list() == [(0, 12)]
+    interval_set.add(20, 30)
+    interval_set.add(14, 15)
+    assert interval_set.to_list() == [(0, 12), (14, 15), (20, 30)]
+    interval_set.add(1, 1)
+    assert interval_set.to_list() == [(0, 12), (14, 15), (20, 30)]
+
+    interval_set.remove(2, 4)
+    assert interval_set.to_list() == [(0, 2), (4, 12), (14, 15), (20, 30)]
+    interval_set.remove(0, 2)
+    interval_set.remove(12, 14)
+    assert interval_set.to_list() == [(4, 12), (14, 15), (20, 30)]
+    interval_set.remove(10, 25)
+    assert interval_set.to_list() == [(4, 10), (25, 30)]
+    interval_set.remove(0, 100)
+    assert interval_set.to_list() == []
+    assert not interval_set
+
+    interval_set = IntervalSet([(0, 10), (20, 30)])
+    assert interval_set.covers(0, 10)
+    assert interval_set.covers(5, 6)
+    assert interval_set.covers(20, 30)
+    assert not interval_set.covers(5, 11)
+    assert not interval_set.covers(10, 11)
+    assert not interval_set.covers(9, 21)
+    assert not interval_set.covers(30, 31)
+
+
+def test_interval_set_matches_list_based_folding():
+    def merge_intervals_reference(intervals):
+        intervals = sorted(intervals)
+        merged = [intervals[0]]
+        for interval in intervals[1:]:
+            current = merged[-1]
+            if interval[0] <= current[1]:
+                merged[-1] = (current[0], max(current[1], interval[1]))
+            else:
+                merged.append(interval)
+        return merged
+
+    def remove_interval_reference(intervals, remove_start, remove_end):
+        modified = []
+        for start, end in intervals:
+            if remove_start > start and remove_end < end:
+                modified.extend(((start, remove_start), (remove_end, end)))
+            elif remove_start > start:
+                modified.append((start, min(remove_start, end)))
+            elif remove_end < end:
+                modified.append((max(remove_end, start), end))
+        return modified
+
+    rng = random.Random(42)
+    expected: t.List[t.Tuple[int, int]] = []
+    interval_set = IntervalSet()
+    for _ in range(2000):
+        start = rng.randrange(0, 500)
+        end = start + rng.randrange(1, 20)
+        if rng.random() < 0.3:
+            expected = remove_interval_reference(expected, start, end)
+            interval_set.remove(start, end)
+        else:
+            expected = merge_intervals_reference([*expected, (start, end)])
+            interval_set.add(start, end)
+        assert interval_set.to_list() == expected
+
+
+@pytest.mark.slow
+def test_interval_set_fold_1m_rows():
+    hour = 3600000
+    interval_set = IntervalSet()
+    # Every other hour is missing, so that none of the added intervals can be merged.
+    for i in range(1_000_000):
+        start = i * 2 * hour
+        interval_set.add(start, start + hour)
+    assert len(interval_set) == 1_000_000
+
+    # Restatements remove a range of intervals which is then added back as a single interval.
+    for i in range(1_000):
+        start = i * 2_000 * hour
+        interval_set.remove(start, start + 1_000 * hour)
+        interval_set.add(start, start + 1_000 * hour)
+    # Each restated range also absorbs the adjacent interval that follows it.
+    assert len(interval_set) == 500_000
+    assert interval_set.to_list()[:2] == [(0, 1_001 * hour), (1_002 * hour, 1_003 * hour)]
+
+
+@pytest.mark.parametrize(
+    "interval_unit",
+    [
+        IntervalUnit.DAY,
+        IntervalUnit.HOUR,
+        IntervalUnit.HALF_HOUR,
+        IntervalUnit.QUARTER_HOUR,
+        IntervalUnit.FIVE_MINUTE,
+    ],
+)
+def test_compute_missing_intervals_vectorized_matches_iterative(interval_unit: IntervalUnit):
+    rng = random.Random(interval_unit.value)
+    step = interval_unit.milliseconds
+    base_ts = to_timestamp("2023-01-01")
+
+    for _ in range(200):
+        start_ts = base_ts + rng.randrange(0, 50) * step
+        end_ts = start_ts + rng.randrange(-2, 50) * step
+        upper_bound_ts = end_ts + rng.randrange(0, 10) * step
+        lookback = rng.randrange(0, 5)
+
+        interval_set = IntervalSet()
+        for _ in range(rng.randrange(0, 10)):
+            interval_start = base_ts + rng.randrange(0, 100) * step
+            interval_set.add(interval_start, interval_start + rng.randrange(1, 20) * step)
+        intervals = tuple(interval_set)
+
+        args = (interval_unit, intervals, start_ts, end_ts, upper_bound_ts, lookback)
+        assert _compute_missing_intervals_vectorized(*args) == _compute_missing_intervals_iterative(
+            *args
+        )
+
+
+def test_compute_missing_intervals_no_croniter(mocker: MockerFixture):
+    hour = IntervalUnit.HOUR.milliseconds
+    start_ts = to_timestamp("2023-01-01")
+    _compute_missing_intervals(IntervalUnit.HOUR, (), start_ts, start_ts + hour, start_ts + hour, 0)
+
+    # The interval width is memoized per cron expression, so croniter is no longer used
+    mocker.patch("sqlmesh.utils.cron.croniter", side_effect=AssertionError("croniter was used"))
+    for i in range(1, 10):
+        end_ts = start_ts + i * hour
+        missing, _ = _compute_missing_intervals(
+            IntervalUnit.HOUR, ((start_ts, start_ts + hour),), start_ts, end_ts, end_ts, 0
+        )
+        assert missing == [(start_ts + j * hour, start_ts + (j + 1) * hour) for j in range(1, i)]
+
+
+def test_missing_intervals_cache():
+    cache = MissingIntervalsCache(max_entries=10)
+    day = IntervalUnit.DAY.milliseconds
+    start_ts = to_timestamp("2023-01-01")
+    end_ts = start_ts + 10 * day
+
+    def get_or_compute(intervals, lookback=0):
+        return cache.get_or_compute(
+            IntervalUnit.DAY, tuple(intervals), start_ts, end_ts, end_ts, lookback
+        )
+
+    intervals = [(start_ts, start_ts + 3 * day)]
+    assert get_or_compute(intervals) == [
+        (start_ts + i * day, start_ts + (i + 1) * day) for i in range(3, 10)
+    ]
+    assert get_or_compute(intervals) == [
+        (start_ts + i * day, start_ts + (i + 1) * day) for i in range(3, 10)
+    ]
+    assert cache.stats == CacheStats(hits=1, misses=1, evictions=0)
+    assert cache.incremental_hits == 0
+
+    # Appending an interval reuses the previous result
+    intervals.append((start_ts + 3 * day, start_ts + 4 * day))
+    assert get_or_compute(intervals) == [
+        (start_ts + i * day, start_ts + (i + 1) * day) for i in range(4, 10)
+    ]
+    assert cache.incremental_hits == 1
+
+    # Removing an interval requires a full computation
+    assert get_or_compute(intervals[1:]) == [
+        (start_ts + i * day, start_ts + (i + 1) * day) for i in range(10) if i != 3
+    ]
+    assert cache.incremental_hits == 1
+
+    # Results derived incrementally match the ones computed from scratch
+    for lookback in range(3):
+        cache.clear()
+        get_or_compute([(start_ts, start_ts + 2 * day)], lookback=lookback)
+        incremental = get_or_compute(
+            [(start_ts, start_ts + 2 * day), (start_ts + 3 * day, start_ts + 6 * day)],
+            lookback=lookback,
+        )
+        assert incremental == MissingIntervalsCache(incremental=False).get_or_compute(
+            IntervalUnit.DAY,
+            ((start_ts, start_ts + 2 * day), (start_ts + 3 * day, start_ts + 6 * day)),
+            start_ts,
+            end_ts,
+            end_ts,
+            lookback,
+        )
+
+    cache.configure(max_entries=1)
+    assert len(cache._results) == 1
+
+    # Bounds which aren't set are kept
+    cache.configure(max_bytes=1024 * 1024)
+    assert cache._results.max_entries == 1
+    assert cache._results.max_bytes == 1024 * 1024
+
+    # Bounds which are explicitly set to None are removed
+    cache.configure(max_entries=None)
+    assert cache._results.max_entries is None
+    assert cache._results.max_bytes == 1024 * 1024
+    cache.configure(max_bytes=None)
+    assert cache._results.max_bytes is None
+
+    # The latest intervals of a time range count towards the bounds
+    cache.configure(max_entries=10)
+    cache.clear()
+    get_or_compute(intervals)
+    assert len(cache._results) == 2
+    cache.configure(max_bytes=cache._results.size - 1)
+    assert len(cache._results) == 1
@@ -2,6 +2,7 @@ import typing as t
 from unittest.mock import call, patch
 
 import logging
+import threading
 import pytest
 from pathlib import Path
 from pytest_mock.plugin import MockerFixture
@@ -43,7 +44,7 @@ from sqlmesh.core.snapshot import (
 )
 from sqlmesh.utils.concurrency import NodeExecutionFailedError
 from sqlmesh.utils.date import to_timestamp
-from sqlmesh.utils.errors import ConfigError
+from sqlmesh.utils.errors import AuditError, ConfigError, SQLMeshError
 from sqlmesh.utils.metaprogramming import Executable
 
 
@@ -1071,6 +1072,202 @@ def python_func(**kwargs):
     assert adapter_mock.insert_overwrite_by_time_partition.call_args[0][1].to_dict() == output_dict
 
 
+def test_snapshot_evaluator_yield_pd_staged(adapter_mock, make_snapshot):
+    adapter_mock.INSERT_OVERWRITE_STRATEGY = InsertOverwriteStrategy.INSERT_OVERWRITE
+    staging_table = exp.to_table("sqlmesh__db.__temp_db__model_abcd")
+    adapter_mock._get_temp_table.return_value = staging_table
+    evaluator = SnapshotEvaluator(adapter_mock, df_staging_chunk_size=2)
+
+    snapshot = make_snapshot(
+        PythonModel(
+            name="db.model",
+            entrypoint="python_func",
+            kind=IncrementalByTimeRangeKind(time_column=TimeColumn(column="ds", format="%Y-%m-%d")),
+            columns={
+                "a": "INT",
+                "ds": "STRING",
+                "My Col": "INT",
+                "select": "INT",
+            },
+            python_env={
+                "python_func": Executable(
+                    name="python_func",
+                    alias="python_func",
+                    path="test_snapshot_evaluator.py",
+                    payload="""import pandas as pd
+def python_func(**kwargs):
+    for i in range(3):
+        yield pd.DataFrame(
+            {"a": [i, i], "ds": ["2023-01-01", "2023-01-02"], "My Col": [i, i], "select": [i, i]}
+        ).head(i + 1)""",
+                )
+            },
+        )
+    )
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    evaluator.evaluate(
+        snapshot,
+        start="2023-01-01",
+        end="2023-01-09",
+        execution_time="2023-01-09",
+        snapshots={},
+    )
+
+    columns_to_types = {
+        "a": exp.DataType.build("INT"),
+        "ds": exp.DataType.build("STRING"),
+        "My Col": exp.DataType.build("INT"),
+        "select": exp.DataType.build("INT"),
+    }
+    adapter_mock._get_temp_table.assert_called_once_with(snapshot.table_name())
+    adapter_mock.create_table.assert_called_once_with(staging_table, columns_to_types)
+
+    staged_chunks = [
+        call_args[0][1]["a"].tolist() for call_args in adapter_mock.insert_append.call_args_list
+    ]
+    assert staged_chunks == [[0, 1], [1, 2], [2]]
+
+    adapter_mock.insert_overwrite_by_time_partition.assert_called_once()
+    assert (
+        adapter_mock.insert_overwrite_by_time_partition.call_args[0][1].sql()
+        == 'SELECT "a", "ds", "My Col", "select" FROM sqlmesh__db.__temp_db__model_abcd'
+    )
+    adapter_mock.drop_table.assert_called_once_with(staging_table)
+
+
+def test_snapshot_evaluator_streaming_python_model(adapter_mock, make_snapshot):
+    adapter_mock.INSERT_OVERWRITE_STRATEGY = InsertOverwriteStrategy.DELETE_INSERT
+    evaluator = SnapshotEvaluator(adapter_mock)
+
+    snapshot = make_snapshot(
+        PythonModel(
+            name="db.model",
+            entrypoint="python_func",
+            kind=FullKind(),
+            columns={"a": "INT"},
+            streaming=True,
+            python_env={
+                "python_func": Executable(
+                    name="python_func",
+                    alias="python_func",
+                    path="test_snapshot_evaluator.py",
+                    payload="""import pandas as pd
+def python_func(**kwargs):
+    for i in range(3):
+        yield pd.DataFrame({"a": list(range(i + 1))})""",
+                )
+            },
+        )
+    )
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    evaluator.evaluate(
+        snapshot,
+        start="2023-01-01",
+        end="2023-01-09",
+        execution_time="2023-01-09",
+        snapshots={},
+    )
+
+    assert adapter_mock.replace_query.call_args[0][1].to_dict() == {"a": {0: 0}}
+    assert [c[0][1].to_dict() for c in adapter_mock.insert_append.call_args_list] == [
+        {"a": {0: 0, 1: 1}},
+        {"a": {0: 0, 1: 1, 2: 2}},
+    ]
+
+    chunk_metrics = evaluator.chunk_metrics[snapshot.snapshot_id]
+    assert [(m.index, m.rows) for m in chunk_metrics] == [(0, 1), (1, 2), (2, 3)]
+    assert all(m.bytes and m.insert_seconds >= 0 and m.wait_seconds >= 0 for m in chunk_metrics)
+
+
+@pytest.mark.parametrize("thread_local_connections", [True, False])
+def test_snapshot_evaluator_streaming_python_model_connections(
+    adapter_mock, make_snapshot, thread_local_connections: bool
+):
+    adapter_mock.INSERT_OVERWRITE_STRATEGY = InsertOverwriteStrategy.DELETE_INSERT
+    adapter_mock.uses_thread_local_connections = thread_local_connections
+    evaluator = SnapshotEvaluator(adapter_mock)
+
+    snapshot = make_snapshot(
+        PythonModel(
+            name="db.model",
+            entrypoint="python_func",
+            kind=FullKind(),
+            columns={"a": "INT"},
+            streaming=True,
+            python_env={
+                "python_func": Executable(
+                    name="python_func",
+                    alias="python_func",
+                    path="test_snapshot_evaluator.py",
+                    payload="""import threading
+import pandas as pd
+def python_func(**kwargs):
+    for _ in range(2):
+        yield pd.DataFrame({"a": [threading.get_ident()]})""",
+                )
+            },
+        )
+    )
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    evaluator.evaluate(
+        snapshot,
+        start="2023-01-01",
+        end="2023-01-09",
+        execution_time="2023-01-09",
+        snapshots={},
+    )
+
+    # Chunks are only produced in a background thread with its own connection
+    producer_thread = adapter_mock.replace_query.call_args[0][1]["a"][0]
+    assert (producer_thread != threading.get_ident()) == thread_local_connections
+    assert adapter_mock.close_thread_connection.call_count == int(thread_local_connections)
+
+
+def test_snapshot_evaluator_streaming_python_model_error(adapter_mock, make_snapshot):
+    adapter_mock.INSERT_OVERWRITE_STRATEGY = InsertOverwriteStrategy.DELETE_INSERT
+    # Let errors propagate through the mocked transaction and session context managers
+    adapter_mock.transaction.return_value.__exit__.return_value = False
+    adapter_mock.session.return_value.__exit__.return_value = False
+    evaluator = SnapshotEvaluator(adapter_mock)
+
+    snapshot = make_snapshot(
+        PythonModel(
+            name="db.model",
+            entrypoint="python_func",
+            kind=FullKind(),
+            columns={"a": "INT"},
+            streaming=True,
+            python_env={
+                "python_func": Executable(
+                    name="python_func",
+                    alias="python_func",
+                    path="test_snapshot_evaluator.py",
+                    payload="""import pandas as pd
+def python_func(**kwargs):
+    yield pd.DataFrame({"a": [1]})
+    raise ValueError("boom")""",
+                )
+            },
+        )
+    )
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    with pytest.raises(SQLMeshError, match="Error executing Python model 'db.model'"):
+        evaluator.evaluate(
+            snapshot,
+            start="2023-01-01",
+            end="2023-01-09",
+            execution_time="2023-01-09",
+            snapshots={},
+        )
+
+    adapter_mock.replace_query.assert_called_once()
+    assert len(evaluator.chunk_metrics[snapshot.snapshot_id]) == 1
+
+
 def test_create_clone_in_dev(mocker: MockerFixture, adapter_mock, make_snapshot):
     adapter_mock.SUPPORTS_CLONING = True
     adapter_mock.get_alter_expressions.return_value = []
@@ -1965,6 +2162,131 @@ def test_audit_wap(adapter_mock, make_snapshot):
     adapter_mock.wap_publish.assert_called_once_with(snapshot.table_name(), wap_id)
 
 
+def test_audit_fused_builtin_audits(adapter_mock, make_snapshot):
+    evaluator = SnapshotEvaluator(adapter_mock)
+
+    custom_audit = ModelAudit(
+        name="test_audit",
+        query="SELECT * FROM test_schema.test_table WHERE 1 = 2",
+    )
+
+    model = SqlModel(
+        name="test_schema.test_table",
+        kind=FullKind(),
+        query=parse_one("SELECT a::int FROM tbl"),
+        audits=[
+            ("not_null", {"columns": exp.to_column("a")}),
+            ("test_audit", {}),
+            (
+                "accepted_values_non_blocking",
+                {
+                    "column": exp.to_column("a"),
+                    "is_in": exp.Tuple(expressions=[exp.Literal.number(1), exp.Literal.number(2)]),
+                },
+            ),
+            ("number_of_rows", {"threshold": exp.Literal.number(10)}),
+        ],
+    )
+    snapshot = make_snapshot(model, audits={custom_audit.name: custom_audit})
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    adapter_mock.fetchone.side_effect = [(0, 3, 1), (0,)]
+
+    with pytest.raises(AuditError, match="'number_of_rows'"):
+        evaluator.audit(snapshot, snapshots={})
+
+    call_args = adapter_mock.fetchone.call_args_list
+    assert len(call_args) == 2
+
+    table = exp.to_table(snapshot.table_name())
+    fused_query = call_args[0][0][0]
+    assert (
+        fused_query.sql()
+        == 'SELECT COALESCE(SUM(CASE WHEN "a" IS NULL AND TRUE THEN 1 ELSE 0 END), 0) AS audit_0, '
+        'COALESCE(SUM(CASE WHEN NOT "a" IN (1, 2) AND TRUE THEN 1 ELSE 0 END), 0) AS audit_1, '
+        "CASE WHEN COALESCE(SUM(CASE WHEN TRUE THEN 1 ELSE 0 END), 0) <= 10 THEN 1 ELSE 0 END AS audit_2 "
+        f'FROM (SELECT * FROM "{table.db}"."{table.name}" AS "{table.name}") AS "_q_0"'
+    )
+
+    custom_audit_query = call_args[1][0][0]
+    assert custom_audit_query.sql().startswith("SELECT COUNT(*) FROM (SELECT * FROM")
+
+    adapter_mock.fetchone.reset_mock()
+    adapter_mock.fetchone.side_effect = [(0, 3, 0), (0,)]
+
+    results = evaluator.audit(snapshot, snapshots={})
+    assert [(result.audit.name, result.count) for result in results] == [
+        ("not_null", 0),
+        ("test_audit", 0),
+        ("accepted_values_non_blocking", 3),
+        ("number_of_rows", 0),
+    ]
+    assert results[2].query.sql().startswith("SELECT * FROM")
+
+    adapter_mock.fetchone.side_effect = [(0, 3, 0), None]
+    with pytest.raises(SQLMeshError, match="returned no rows"):
+        evaluator.audit(snapshot, snapshots={})
+
+    # Audit queries aren't run in parallel if threads share a connection
+    adapter_mock.uses_thread_local_connections = False
+    adapter_mock.fetchone.side_effect = [(0, 3, 0), (0,)]
+    SnapshotEvaluator(adapter_mock, audit_concurrent_tasks=2).audit(snapshot, snapshots={})
+    adapter_mock.close_thread_connection.assert_not_called()
+    adapter_mock.recycle.assert_not_called()
+
+
+def test_audit_fused_builtin_audits_duckdb(duck_conn, make_snapshot, mocker: MockerFixture):
+    # Audit queries run in parallel, so each thread gets its own connection to the same database
+    adapter = create_engine_adapter(lambda: duck_conn.cursor(), "duckdb", multithreaded=True)
+    evaluator = SnapshotEvaluator(adapter, audit_concurrent_tasks=2)
+    fetchone_spy = mocker.spy(adapter, "fetchone")
+
+    custom_audit = ModelAudit(
+        name="test_audit",
+        query="SELECT * FROM @this_model WHERE a > 2",
+        blocking=False,
+    )
+
+    model = SqlModel(
+        name="test_schema.test_table",
+        kind=FullKind(),
+        query=parse_one("SELECT 1 AS a"),
+        audits=[
+            ("not_null_non_blocking", {"columns": exp.to_column("a")}),
+            ("test_audit", {}),
+            (
+                "accepted_range_non_blocking",
+                {"column": exp.to_column("a"), "min_v": exp.Literal.number(2)},
+            ),
+            ("number_of_rows", {"threshold": exp.Literal.number(3)}),
+            ("unique_values_non_blocking", {"columns": exp.to_column("a")}),
+        ],
+    )
+    snapshot = make_snapshot(model, audits={custom_audit.name: custom_audit})
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    duck_conn.execute(f"CREATE SCHEMA {snapshot.physical_schema}")
+    duck_conn.execute(
+        f"CREATE TABLE {snapshot.table_name()} AS SELECT * FROM (VALUES (1), (1), (3), (NULL)) AS t(a)"
+    )
+
+    results = evaluator.audit(snapshot, snapshots={})
+    assert [(result.audit.name, result.count) for result in results] == [
+        ("not_null_non_blocking", 1),
+        ("test_audit", 1),
+        ("accepted_range_non_blocking", 2),
+        ("number_of_rows", 0),
+        ("unique_values_non_blocking", 1),
+    ]
+    # Five audits are computed by three queries
+    assert fetchone_spy.call_count == 3
+
+    duck_conn.execute(f"DELETE FROM {snapshot.table_name()} WHERE a = 1")
+
+    with pytest.raises(AuditError, match="'number_of_rows'"):
+        evaluator.audit(snapshot, snapshots={})
+
+
 def test_create_post_statements_use_deployable_table(
     mocker: MockerFixture, adapter_mock, make_snapshot
 ):
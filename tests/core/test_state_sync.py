@@ -30,6 +30,7 @@ from sqlmesh.core.snapshot import (
     SnapshotChangeCategory,
     SnapshotId,
     SnapshotIntervals,
+    SnapshotNameVersion,
     SnapshotTableCleanupTask,
     missing_intervals,
 )
@@ -216,8 +217,14 @@ def test_snapshots_exists(state_sync: EngineAdapterStateSync, snapshots: t.List[
 @pytest.fixture
 def get_snapshot_intervals(state_sync) -> t.Callable[[Snapshot], t.Optional[SnapshotIntervals]]:
     def _get_snapshot_intervals(snapshot: Snapshot) -> t.Optional[SnapshotIntervals]:
-        intervals = state_sync._get_snapshot_intervals([snapshot])[-1]
-        return intervals[0] if intervals else None
+        return next(
+            (
+                intervals
+                for intervals in state_sync._get_snapshot_intervals([snapshot])
+                if intervals.snapshot_id == snapshot.snapshot_id
+            ),
+            None,
+        )
 
     return _get_snapshot_intervals
 
@@ -508,6 +515,162 @@ def test_compact_intervals_delete_batches(
     delete_from_mock.assert_has_calls([call(state_sync.intervals_table, mocker.ANY)] * 3)
 
 
+def test_interval_summaries(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    get_snapshot_intervals: t.Callable,
+    mocker: MockerFixture,
+) -> None:
+    snapshot_a = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")),
+        version="a",
+    )
+    snapshot_b = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 2, ds")),
+        version="a",
+    )
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+
+    state_sync.add_interval(snapshot_a, "2020-01-01", "2020-01-10")
+    state_sync.add_interval(snapshot_b, "2020-01-05", "2020-01-15", is_dev=True)
+    state_sync.remove_interval(
+        [(snapshot_a, snapshot_a.inclusive_exclusive("2020-01-03", "2020-01-06"))],
+        remove_shared_versions=True,
+    )
+
+    summaries = state_sync._get_snapshot_intervals([snapshot_a])
+    assert len(summaries) == 2
+    assert get_snapshot_intervals(snapshot_a).intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-03")),
+        (to_timestamp("2020-01-07"), to_timestamp("2020-01-11")),
+    ]
+    assert get_snapshot_intervals(snapshot_b).dev_intervals == [
+        (to_timestamp("2020-01-07"), to_timestamp("2020-01-16")),
+    ]
+
+    # Summaries always match the intervals folded from the interval log.
+    _, logged_intervals = state_sync._get_logged_snapshot_intervals(
+        [snapshot_a.snapshot_id, snapshot_b.snapshot_id]
+    )
+    assert sorted(summaries, key=lambda s: s.identifier) == sorted(
+        logged_intervals, key=lambda s: s.identifier
+    )
+
+    # Compaction repairs summaries that have drifted from the interval log.
+    state_sync.engine_adapter.delete_from(state_sync.interval_summaries_table, "TRUE")
+    assert get_snapshot_intervals(snapshot_a) is None
+
+    state_sync.INTERVAL_COMPACTION_BATCH_SIZE = 1
+    state_sync.compact_intervals()
+    assert sorted(
+        state_sync._get_snapshot_intervals([snapshot_a]), key=lambda s: s.identifier
+    ) == sorted(logged_intervals, key=lambda s: s.identifier)
+
+    # Writes merge intervals into stored summaries without folding the interval log.
+    logged_intervals_spy = mocker.spy(state_sync, "_get_logged_snapshot_intervals")
+    state_sync.add_interval(snapshot_a, "2020-01-20", "2020-01-21")
+    state_sync.remove_interval(
+        [(snapshot_a, snapshot_a.inclusive_exclusive("2020-01-02", "2020-01-02"))]
+    )
+    assert get_snapshot_intervals(snapshot_a).intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-02")),
+        (to_timestamp("2020-01-07"), to_timestamp("2020-01-11")),
+        (to_timestamp("2020-01-20"), to_timestamp("2020-01-22")),
+    ]
+    logged_intervals_spy.assert_not_called()
+
+    # Snapshots without a summary get one folded from the interval log.
+    state_sync.engine_adapter.delete_from(state_sync.interval_summaries_table, "TRUE")
+    state_sync.add_interval(snapshot_a, "2020-01-25", "2020-01-25")
+    assert get_snapshot_intervals(snapshot_a).intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-02")),
+        (to_timestamp("2020-01-07"), to_timestamp("2020-01-11")),
+        (to_timestamp("2020-01-20"), to_timestamp("2020-01-22")),
+        (to_timestamp("2020-01-25"), to_timestamp("2020-01-26")),
+    ]
+    logged_intervals_spy.assert_called_once()
+
+
+def test_compact_intervals_locks_snapshots(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+) -> None:
+    snapshot = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")), version="a"
+    )
+    state_sync.push_snapshots([snapshot])
+    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-10")
+
+    # Snapshots are locked before their interval log is read, so that a concurrent write can't
+    # commit in between and get its summary replaced with a stale one.
+    manager = mocker.Mock()
+    mocker.patch.object(state_sync.engine_adapter, "SUPPORTS_ROW_LEVEL_OP", True)
+    manager.attach_mock(mocker.spy(state_sync, "_lock_snapshots"), "lock")
+    manager.attach_mock(mocker.spy(state_sync, "_get_logged_snapshot_intervals"), "fold")
+    state_sync.compact_intervals()
+    assert [call[0] for call in manager.mock_calls] == ["lock", "fold"]
+    assert manager.lock.call_args[0][0] == [snapshot.snapshot_id]
+
+
+def test_interval_summaries_many_rows(
+    state_sync: EngineAdapterStateSync, mocker: MockerFixture
+) -> None:
+    num_snapshots = 100
+    rows_per_snapshot = 100
+    day = 86400000
+
+    snapshot_ids = [
+        SnapshotId(name=f"model_{i}", identifier=f"identifier_{i}") for i in range(num_snapshots)
+    ]
+    state_sync.engine_adapter.insert_append(
+        state_sync.intervals_table,
+        pd.DataFrame(
+            {
+                "id": [str(i) for i in range(num_snapshots * rows_per_snapshot)],
+                "created_ts": list(range(rows_per_snapshot)) * num_snapshots,
+                "name": [
+                    snapshot_id.name
+                    for snapshot_id in snapshot_ids
+                    for _ in range(rows_per_snapshot)
+                ],
+                "identifier": [
+                    snapshot_id.identifier
+                    for snapshot_id in snapshot_ids
+                    for _ in range(rows_per_snapshot)
+                ],
+                "version": [
+                    snapshot_id.name
+                    for snapshot_id in snapshot_ids
+                    for _ in range(rows_per_snapshot)
+                ],
+                # Every other day is missing, so that none of the intervals can be merged.
+                "start_ts": [i * 2 * day for i in range(rows_per_snapshot)] * num_snapshots,
+                "end_ts": [(i * 2 + 1) * day for i in range(rows_per_snapshot)] * num_snapshots,
+                "is_dev": [False] * (num_snapshots * rows_per_snapshot),
+                "is_removed": [False] * (num_snapshots * rows_per_snapshot),
+                "is_compacted": [False] * (num_snapshots * rows_per_snapshot),
+            }
+        ),
+        columns_to_types=state_sync._interval_columns_to_types,
+    )
+
+    _, logged_intervals = state_sync._get_logged_snapshot_intervals(snapshot_ids)
+    state_sync._push_interval_summaries(logged_intervals)
+
+    fetchall_spy = mocker.spy(state_sync.engine_adapter, "fetchall")
+    summaries = state_sync._get_snapshot_intervals(
+        [SnapshotNameVersion(name=s.name, version=s.name) for s in snapshot_ids]
+    )
+
+    assert len(summaries) == num_snapshots
+    assert all(len(summary.intervals) == rows_per_snapshot for summary in summaries)
+    assert sorted(summaries, key=lambda s: s.name) == sorted(logged_intervals, key=lambda s: s.name)
+    # Summaries are read as one row per snapshot instead of folding the whole interval log.
+    assert fetchall_spy.call_count == 1
+    assert [table.name for table in fetchall_spy.call_args[0][0].find_all(exp.Table)] == [
+        state_sync.interval_summaries_table.name
+    ]
+
+
 def test_promote_snapshots(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
     snapshot_a = make_snapshot(
         SqlModel(
@@ -1037,6 +1200,11 @@ def test_delete_expired_environments(state_sync: EngineAdapterStateSync, make_sn
 
     assert state_sync.get_environment(env_a.name) is None
     assert state_sync.get_environment(env_b.name) == env_b
+    assert state_sync.engine_adapter.fetchall(
+        exp.select("environment", "name", "identifier").from_(
+            state_sync.environment_snapshots_table
+        )
+    ) == [(env_b.name, snapshot.name, snapshot.identifier)]
 
 
 def test_delete_expired_snapshots(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
@@ -1074,6 +1242,85 @@ def test_delete_expired_snapshots(state_sync: EngineAdapterStateSync, make_snaps
     assert not state_sync.get_snapshots(None)
 
 
+def test_get_snapshot_records(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    snapshot = make_snapshot(
+        SqlModel(
+            name="a",
+            query=parse_one("select a, ds"),
+        ),
+    )
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot])
+    state_sync.unpause_snapshots([snapshot], "2023-01-01")
+
+    fetchall_spy = mocker.spy(state_sync.engine_adapter, "fetchall")
+
+    (record,) = state_sync._get_snapshot_records(snapshot_ids=[snapshot.snapshot_id])
+    assert record.snapshot_id == snapshot.snapshot_id
+    assert record.version == snapshot.version
+    assert record.kind_name == ModelKindName.VIEW
+    assert record.unpaused_ts == to_timestamp("2023-01-01")
+    assert (
+        record.updated_ts == state_sync.get_snapshots([snapshot])[snapshot.snapshot_id].updated_ts
+    )
+    assert record.table_info == snapshot.table_info
+
+    assert "snapshot" not in [column.name for column in fetchall_spy.call_args[0][0].expressions]
+
+    assert [r.snapshot_id for r in state_sync._get_snapshot_records(name_versions=[snapshot])] == [
+        snapshot.snapshot_id
+    ]
+    assert [r.snapshot_id for r in state_sync._get_snapshot_records()] == [snapshot.snapshot_id]
+    assert not state_sync._get_snapshot_records(snapshot_ids=[])
+
+
+def test_delete_expired_snapshots_many(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    snapshot = make_snapshot(SqlModel(name="__model__", query=parse_one("select 1 as a")))
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    serialized_snapshot = snapshot.json()
+    serialized_table_info = snapshot.table_info.json()
+
+    snapshot_count = 2_000
+    expiration_ts = now_timestamp() - 1000
+    state_sync.engine_adapter.insert_append(
+        state_sync.snapshots_table,
+        pd.DataFrame(
+            [
+                {
+                    "name": f'"model_{i // 2}"',
+                    "identifier": str(i),
+                    "version": str(i // 2),
+                    "snapshot": serialized_snapshot,
+                    "kind_name": ModelKindName.FULL.value,
+                    "expiration_ts": expiration_ts,
+                    "table_info": serialized_table_info.replace("__model__", f"model_{i // 2}"),
+                    "unpaused_ts": None,
+                    "updated_ts": expiration_ts,
+                }
+                for i in range(snapshot_count)
+            ]
+        ),
+        columns_to_types=state_sync._snapshot_columns_to_types,
+    )
+
+    fetchall_spy = mocker.spy(state_sync.engine_adapter, "fetchall")
+    cleanup_tasks = state_sync.delete_expired_snapshots()
+
+    assert len(cleanup_tasks) == snapshot_count // 2
+    assert not state_sync._get_snapshot_records()
+    # Expired snapshots are cleaned up without reading their full payloads.
+    assert fetchall_spy.called
+    assert all(
+        "snapshot" not in [column.name for column in call[0][0].find_all(exp.Column)]
+        for call in fetchall_spy.call_args_list
+        if isinstance(call[0][0], exp.Expression)
+    )
+
+
 def test_delete_expired_snapshots_seed(
     state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
 ):
@@ -1139,6 +1386,36 @@ def test_delete_expired_snapshots_batching(
     assert not state_sync.get_snapshots(None)
 
 
+def test_delete_expired_snapshots_time_budget(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
+):
+    state_sync.SNAPSHOT_BATCH_SIZE = 1
+    now_ts = now_timestamp()
+
+    snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("select a, ds")))
+    snapshot_a.ttl = "in 10 seconds"
+    snapshot_a.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot_a.updated_ts = now_ts - 15000
+
+    snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("select a, b, ds")))
+    snapshot_b.ttl = "in 10 seconds"
+    snapshot_b.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot_b.updated_ts = now_ts - 11000
+
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+
+    # At least one batch is deleted even if the budget is exceeded right away.
+    assert state_sync.delete_expired_snapshots(time_budget=0) == [
+        SnapshotTableCleanupTask(snapshot=snapshot_a.table_info, dev_table_only=False),
+    ]
+    assert set(state_sync.get_snapshots(None)) == {snapshot_b.snapshot_id}
+
+    assert state_sync.delete_expired_snapshots(time_budget=0) == [
+        SnapshotTableCleanupTask(snapshot=snapshot_b.table_info, dev_table_only=False),
+    ]
+    assert not state_sync.get_snapshots(None)
+
+
 def test_delete_expired_snapshots_promoted(
     state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
 ):
@@ -1181,6 +1458,37 @@ def test_delete_expired_snapshots_promoted(
     assert not state_sync.get_snapshots(None)
 
 
+def test_delete_expired_snapshots_promoted_concurrently(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    snapshot = make_snapshot(SqlModel(name="a", query=parse_one("select a, ds")))
+    snapshot.ttl = "in 10 seconds"
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot.updated_ts = now_timestamp() - 15000
+    state_sync.push_snapshots([snapshot])
+
+    # The snapshot gets promoted after it was found to be expired but before it's deleted.
+    name_version_filter = state_sync._snapshot_name_version_filter
+
+    def promote_and_filter(*args: t.Any, **kwargs: t.Any) -> t.Iterator[exp.Condition]:
+        if not state_sync.get_environment("test_environment"):
+            state_sync.promote(
+                Environment(
+                    name="test_environment",
+                    snapshots=[snapshot.table_info],
+                    start_at="2022-01-01",
+                    end_at="2022-01-01",
+                    plan_id="test_plan_id",
+                )
+            )
+        return name_version_filter(*args, **kwargs)
+
+    mocker.patch.object(state_sync, "_snapshot_name_version_filter", side_effect=promote_and_filter)
+
+    assert not state_sync.delete_expired_snapshots()
+    assert set(state_sync.get_snapshots(None)) == {snapshot.snapshot_id}
+
+
 def test_delete_expired_snapshots_dev_table_cleanup_only(
     state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
 ):
@@ -1674,6 +1982,18 @@ def test_migrate_rows(state_sync: EngineAdapterStateSync, mocker: MockerFixture)
     assert all(s.migrated for s in dev_snapshots)
     assert all(s.change_category is not None for s in dev_snapshots)
 
+    assert set(
+        state_sync.engine_adapter.fetchall(
+            exp.select("environment", "name", "identifier").from_(
+                state_sync.environment_snapshots_table
+            )
+        )
+    ) == {
+        (environment.name, s.name, s.identifier)
+        for environment in state_sync.get_environments()
+        for s in environment.snapshots
+    }
+
     assert not missing_intervals(dev_snapshots, start=start, end=end)
 
     assert not missing_intervals(dev_snapshots, start="2023-01-08", end="2023-01-10") == 8
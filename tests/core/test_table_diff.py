@@ -3,7 +3,10 @@ import pandas as pd
 from sqlglot import exp
 
 from sqlmesh.core.config import AutoCategorizationMode, CategorizerConfig
+from sqlmesh.core.engine_adapter import DuckDBEngineAdapter
 from sqlmesh.core.model import SqlModel
+from sqlmesh.core.table_diff import TableDiff
+from sqlmesh.utils.errors import SQLMeshError
 
 
 @pytest.mark.slow
@@ -134,3 +137,76 @@ def test_data_diff_decimals(sushi_context_fixed_date):
     )
     assert diff.row_diff().full_match_count == 2
     assert diff.row_diff().partial_match_count == 1
+
+
+def test_data_diff_buckets(duck_conn, mocker):
+    engine_adapter = DuckDBEngineAdapter(lambda: duck_conn)
+
+    source = pd.DataFrame(
+        {
+            "key": range(1000),
+            "value": [i * 1.5 for i in range(1000)],
+            "name": [f"name_{i}" for i in range(1000)],
+        }
+    )
+    target = source.copy()
+    target.loc[5, "value"] = 0.0
+    target.loc[77, "name"] = None
+    target = pd.concat(
+        [target.drop(index=[100]), pd.DataFrame({"key": [1000], "value": [1.0], "name": ["x"]})]
+    )
+    engine_adapter.ctas("table_diff_source", source)
+    engine_adapter.ctas("table_diff_target", target)
+    engine_adapter.ctas("table_diff_copy", source)
+
+    expected = TableDiff(
+        engine_adapter, "table_diff_source", "table_diff_target", on=["key"]
+    ).row_diff()
+    for buckets in (1, 64):
+        row_diff = TableDiff(
+            engine_adapter, "table_diff_source", "table_diff_target", on=["key"], buckets=buckets
+        ).row_diff()
+        assert row_diff.stats == expected.stats
+        pd.testing.assert_frame_equal(row_diff.column_stats, expected.column_stats)
+        pd.testing.assert_frame_equal(row_diff.sample, expected.sample)
+        assert row_diff.s_sample.shape == (1, 3)
+        assert row_diff.t_sample.shape == (1, 3)
+
+    execute_spy = mocker.spy(engine_adapter, "execute")
+    fetchdf_spy = mocker.spy(engine_adapter, "fetchdf")
+    row_diff = TableDiff(
+        engine_adapter, "table_diff_source", "table_diff_copy", on=["key"], buckets=64
+    ).row_diff()
+    assert row_diff.full_match_count == 1000
+    assert row_diff.full_match_pct == 100.0
+    assert row_diff.column_stats["pct_match"].tolist() == [100.0, 100.0]
+    assert row_diff.sample.empty
+    # Only the bucket summaries scan the tables, since no bucket is joined.
+    assert ["GROUP BY" in c[0][0].sql() for c in fetchdf_spy.call_args_list[:2]] == [True, True]
+    create_diff_table = next(
+        c[0][0].sql() for c in execute_spy.call_args_list if "__temp_diff" in c[0][0].sql()
+    )
+    assert create_diff_table.count("WHERE FALSE") == 2
+
+    sampled = [
+        TableDiff(
+            engine_adapter,
+            "table_diff_source",
+            "table_diff_target",
+            on=["key"],
+            buckets=buckets,
+            sample_rate=0.5,
+        ).row_diff()
+        for buckets in (None, 64)
+    ]
+    assert sampled[0].stats == sampled[1].stats
+    assert 400 < sampled[0].source_count < 600
+
+
+def test_data_diff_invalid_options(duck_conn):
+    engine_adapter = DuckDBEngineAdapter(lambda: duck_conn)
+
+    with pytest.raises(SQLMeshError, match="The number of buckets must be positive"):
+        TableDiff(engine_adapter, "source", "target", on=["key"], buckets=0)
+    with pytest.raises(SQLMeshError, match="The sample rate must be between 0 and 1"):
+        TableDiff(engine_adapter, "source", "target", on=["key"], sample_rate=1.5)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import copy
 import datetime
+import io
+import unittest
 import typing as t
 from pathlib import Path
 from unittest.mock import call
@@ -24,6 +27,7 @@ from sqlmesh.core.dialect import parse
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.macros import MacroEvaluator, macro
 from sqlmesh.core.model import Model, SqlModel, load_sql_based_model, model
+from sqlmesh.core.test import ModelTestCache, get_all_model_tests
 from sqlmesh.core.test.definition import ModelTest, PythonModelTest, SqlModelTest
 from sqlmesh.utils.errors import ConfigError, TestError
 from sqlmesh.utils.yaml import dump as dump_yaml
@@ -1225,6 +1229,145 @@ def test_successes(sushi_context: Context) -> None:
     assert "test_customer_revenue_by_day" in successful_tests
 
 
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_parallel_workers(sushi_context: Context, use_processes: bool) -> None:
+    stream = io.StringIO()
+    results = sushi_context.test(
+        verbose=True, stream=stream, workers=2, use_processes=use_processes
+    )
+    assert results.wasSuccessful()
+    assert results.testsRun == 3
+    assert sorted(success.test_name for success in results.successes) == sorted(  # type: ignore
+        success.test_name  # type: ignore
+        for success in sushi_context.test().successes
+    )
+    assert len(results.durations) == 3
+    assert all(duration > 0 for _, duration in results.durations)
+    assert "Slowest 3 tests:" in stream.getvalue()
+
+    with pytest.raises(ConfigError, match="Invalid number of test workers"):
+        sushi_context.test(workers=0)
+
+
+def test_parallel_workers_failures(tmp_path: Path) -> None:
+    init_example_project(tmp_path, dialect="duckdb")
+    config = Config(
+        default_connection=DuckDBConnectionConfig(),
+        model_defaults=ModelDefaultsConfig(dialect="duckdb"),
+    )
+    test_file = tmp_path / c.TESTS / "test_full_model.yaml"
+    tests = load_yaml(test_file)
+    failing_test = tests["test_example_full_model"].copy()
+    failing_test["outputs"] = {"query": [{"item_id": 1, "num_orders": 100}]}
+    for i in range(3):
+        tests[f"test_example_full_model_failure_{i}"] = failing_test
+    test_file.write_text(dump_yaml(tests))
+    context = Context(paths=tmp_path, config=config)
+
+    serial_results = context.test(stream=io.StringIO())
+    for use_processes in (False, True):
+        results = context.test(stream=io.StringIO(), workers=3, use_processes=use_processes)
+        assert results.testsRun == serial_results.testsRun == 4
+        assert len(results.successes) == 1
+        assert [(str(test), details) for test, details in results.failures] == [
+            (str(test), details) for test, details in serial_results.failures
+        ]
+        assert all("Data mismatch" in details for _, details in results.failures)
+
+
+def test_model_test_cache(sushi_context: Context) -> None:
+    cache = ModelTestCache()
+    body = load_yaml(
+        (sushi_context.path / c.TESTS / "test_customer_revenue_by_day.yaml").read_text()
+    )
+    tests = [
+        ModelTest.create_test(
+            body=copy.deepcopy(body["test_customer_revenue_by_day"]),
+            test_name=f"test_customer_revenue_by_day_{i}",
+            models=sushi_context._models,
+            engine_adapter=sushi_context._test_connection_config.create_engine_adapter(
+                register_comments_override=False
+            ),
+            dialect=sushi_context.default_dialect,
+            path=None,
+            default_catalog=sushi_context.default_catalog,
+            cache=cache,
+        )
+        for i in range(3)
+    ]
+    for test in tests:
+        _check_successful_or_raise(test.run())
+
+    # The query is only rendered by the first test, while the fixture schemas are fully known
+    stats = cache.stats
+    assert stats.misses == 1
+    assert stats.hits == 2
+
+    # Each test references fixtures in its own schema
+    queries = [t.cast(SqlModelTest, test)._render_model_query() for test in tests]
+    for test, query in zip(tests, queries):
+        assert {table.db for table in query.find_all(exp.Table) if table.db} == {
+            test._fixture_schema.name
+        }
+
+    # Inferred fixture schemas depend on the dialect of the testing engine
+    def infer() -> t.Dict[str, exp.DataType]:
+        return {"a": exp.DataType.build("int")}
+
+    row = {"a": 1}
+    cache.get_or_infer_fixture_schema("db.fixture", None, "duckdb", {}, row, infer)
+    misses = cache.stats.misses
+    cache.get_or_infer_fixture_schema("db.fixture", None, "duckdb", {}, row, infer)
+    assert cache.stats.misses == misses
+    cache.get_or_infer_fixture_schema("db.fixture", None, "bigquery", {}, row, infer)
+    assert cache.stats.misses == misses + 1
+
+
+def test_model_test_cache_examples(mocker: MockerFixture) -> None:
+    """Repeated unit tests of examples reuse rendered queries and inferred fixture schemas."""
+    infer_spy = mocker.spy(ModelTest, "_infer_columns_to_types")
+    for path in ("examples/sushi", "examples/wursthall"):
+        context = Context(paths=path)
+        engine_adapter = context._test_connection_config.create_engine_adapter(
+            register_comments_override=False
+        )
+        cache = ModelTestCache()
+
+        def run_tests() -> None:
+            tests = [
+                ModelTest.create_test(
+                    body=copy.deepcopy(metadata.body),
+                    test_name=metadata.test_name,
+                    models=context._models,
+                    engine_adapter=engine_adapter,
+                    dialect=context.default_dialect,
+                    path=metadata.path,
+                    default_catalog=context.default_catalog,
+                    cache=cache,
+                )
+                for metadata in get_all_model_tests(context.path / c.TESTS)
+            ]
+            result = unittest.TextTestRunner(stream=io.StringIO(), verbosity=0).run(
+                unittest.TestSuite(tests)
+            )
+            assert result.wasSuccessful()
+
+        try:
+            run_tests()
+            misses = cache.stats.misses
+            hits = cache.stats.hits
+            infer_calls = infer_spy.call_count
+            assert misses > 0
+
+            # The second run is served from the cache without rendering or inferring anything
+            run_tests()
+            assert cache.stats.misses == misses
+            assert cache.stats.hits - hits >= misses
+            assert infer_spy.call_count == infer_calls
+        finally:
+            engine_adapter.close()
+
+
 def test_create_external_model_fixture(sushi_context: Context, mocker: MockerFixture) -> None:
     mocker.patch("sqlmesh.core.test.definition.random_id", return_value="jzngz56a")
     test = _create_test(
@@ -1303,23 +1446,18 @@ def test_gateway(copy_to_temp_path: t.Callable, mocker: MockerFixture) -> None:
     result = context.test(tests=[f"{test_path}::test_customer_revenue_by_day"])
     _check_successful_or_raise(result)
 
-    expected_view_sql = (
-        'CREATE OR REPLACE VIEW "test"."sqlmesh_test_jzngz56a"."db__sushi__orders" '
-        '("id", "customer_id", "waiter_id", "start_ts", "end_ts", "event_date") AS '
-        "SELECT "
-        'CAST("id" AS INT) AS "id", '
-        'CAST("customer_id" AS INT) AS "customer_id", '
-        'CAST("waiter_id" AS INT) AS "waiter_id", '
-        'CAST("start_ts" AS INT) AS "start_ts", '
-        'CAST("end_ts" AS INT) AS "end_ts", '
-        'CAST("event_date" AS DATE) AS "event_date" '
-        "FROM (VALUES "
-        "(1, 1, 1, 1641002340, 1641004140, CAST('2022-01-01' AS DATE)), "
-        "(2, 1, 2, 1641007740, 1641009540, CAST('2022-01-01' AS DATE))) "
-        'AS "t"("id", "customer_id", "waiter_id", "start_ts", "end_ts", "event_date")'
+    # Fixture rows are bulk loaded from a DataFrame into a table of the test gateway's catalog
+    expected_table_sql_prefix = (
+        'CREATE TABLE "test"."sqlmesh_test_jzngz56a"."db__sushi__orders" AS '
+        'SELECT "id", "customer_id", "waiter_id", "start_ts", "end_ts", "event_date" '
+        'FROM "test"."sqlmesh_test_jzngz56a"."__temp_db__sushi__orders_'
     )
     test_adapter = t.cast(ModelTest, result.successes[0]).engine_adapter
-    assert call(test_adapter, expected_view_sql) in spy_execute.mock_calls
+    assert any(
+        mock_call.args[0] is test_adapter
+        and mock_call.args[1].startswith(expected_table_sql_prefix)
+        for mock_call in spy_execute.mock_calls
+    )
 
     _check_successful_or_raise(context.test())
 
@@ -14,6 +14,7 @@ from sqlglot import exp
 from sqlmesh import Context
 from sqlmesh.core.dialect import schema_
 from sqlmesh.core.snapshot import SnapshotId
+from sqlmesh.dbt.cache import RelationCache
 from sqlmesh.dbt.project import Project
 from sqlmesh.dbt.relation import Policy
 from sqlmesh.dbt.target import SnowflakeConfig
@@ -67,6 +68,75 @@ def test_adapter_relation(sushi_test_project: Project, runtime_renderer: t.Calla
 
 
 @pytest.mark.cicdonly
+def test_adapter_relation_cache(sushi_test_project: Project, runtime_renderer: t.Callable):
+    context = sushi_test_project.context
+    assert context.target
+    engine_adapter = context.target.to_sqlmesh().create_engine_adapter()
+    renderer = runtime_renderer(context, engine_adapter=engine_adapter)
+    cache = RelationCache.for_engine_adapter(engine_adapter)
+
+    engine_adapter.create_schema("foo")
+    engine_adapter.create_table(
+        table_name="foo.bar", columns_to_types={"baz": exp.DataType.build("int")}
+    )
+
+    get_relations = (
+        "{{ adapter.get_relation(database=None, schema='foo', identifier='bar') }} "
+        "{{ adapter.get_relation(database=None, schema='foo', identifier='another') }}"
+    )
+    get_columns = "{{ adapter.get_columns_in_relation(api.Relation.create(schema='foo', identifier='bar'))|length }}"
+
+    # Relations of a schema are listed once, while missing relations are always looked up again.
+    assert renderer(get_relations) == '"memory"."foo"."bar" None'
+    assert renderer(get_relations) == '"memory"."foo"."bar" None'
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+    assert renderer(get_columns) == "1"
+    assert renderer(get_columns) == "1"
+    assert (cache.stats.hits, cache.stats.misses) == (2, 4)
+
+    # Relations created without going through the engine adapter's DDL are found too.
+    engine_adapter.cursor.execute("CREATE TABLE foo.external (col INT)")
+    assert (
+        renderer("{{ adapter.get_relation(database=None, schema='foo', identifier='external') }}")
+        == '"memory"."foo"."external"'
+    )
+    engine_adapter.cursor.execute("DROP TABLE foo.external")
+    engine_adapter.notify_metadata_change()
+    misses = cache.stats.misses
+
+    # DDL issued by SQLMesh invalidates the entries of the affected schema and table.
+    engine_adapter.create_table(
+        table_name="foo.another", columns_to_types={"col": exp.DataType.build("int")}
+    )
+    engine_adapter.execute("ALTER TABLE foo.bar ADD COLUMN qux INT")
+    assert renderer(get_relations) == '"memory"."foo"."bar" "memory"."foo"."another"'
+    assert renderer(get_columns) == "2"
+    assert cache.stats.misses == misses + 2
+
+    engine_adapter.rename_table("foo.another", "foo.renamed")
+    assert renderer(get_relations) == '"memory"."foo"."bar" None'
+    assert renderer(get_columns) == "2"
+    assert renderer("{{ adapter.list_relations(database=None, schema='foo')|length }}") == "2"
+    assert cache.stats.misses == misses + 4
+
+    renderer(
+        "{{ adapter.drop_relation(api.Relation.create(schema='foo', identifier='bar')) }}"
+        "{{ adapter.get_relation(database=None, schema='foo', identifier='bar') }}"
+    )
+    assert renderer(get_relations) == "None None"
+
+    # Notifications without a statement drop all entries.
+    engine_adapter.create_table(
+        table_name="foo.bar", columns_to_types={"baz": exp.DataType.build("int")}
+    )
+    assert renderer(get_columns) == "1"
+    misses = cache.stats.misses
+    engine_adapter.notify_metadata_change()
+    assert renderer(get_columns) == "1"
+    assert cache.stats.misses == misses + 1
+
+
 def test_normalization(
     sushi_test_project: Project, runtime_renderer: t.Callable, mocker: MockerFixture
 ):
@@ -93,7 +163,7 @@ def test_normalization(
     relation_bla_bob = exp.table_("BOB", db="BLA", catalog="TEST", quoted=True)
 
     renderer("{{ adapter.get_relation(database=None, schema='bla', identifier='bob') }}")
-    adapter_mock.table_exists.assert_has_calls([call(relation_bla_bob)])
+    adapter_mock.get_data_objects.assert_has_calls([call(schema_bla)])
 
     renderer(
         "{%- set relation = api.Relation.create(schema='bla') -%}"
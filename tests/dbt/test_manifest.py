@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import typing as t
 from pathlib import Path
 
 import pytest
 
 from sqlmesh.dbt.basemodel import Dependencies
+from sqlmesh.dbt.cache import ManifestCache
 from sqlmesh.dbt.context import DbtContext
 from sqlmesh.dbt.manifest import ManifestHelper
 from sqlmesh.dbt.profile import Profile
@@ -140,3 +142,134 @@ def test_variable_override():
         variable_overrides={"top_waiters:limit": 1, "start": "2020-01-01"},
     )
     assert helper.models()["top_waiters"].limit_value == 1
+
+
+@pytest.mark.xdist_group("dbt_manifest")
+def test_manifest_helper_cache(tmp_path: Path):
+    project_path = Path("tests/fixtures/dbt/sushi_test")
+    profile = Profile.load(DbtContext(project_path))
+
+    def load_helper(cache_path: t.Optional[Path] = None) -> ManifestHelper:
+        helper = ManifestHelper(
+            project_path,
+            project_path,
+            "sushi",
+            profile.target,
+            variable_overrides={"start": "2020-01-01"},
+            cache_path=cache_path,
+        )
+        helper.models()
+        return helper
+
+    def dependencies(helper: ManifestHelper) -> t.Dict[str, Dependencies]:
+        return {
+            **{name: model.dependencies for name, model in helper.models().items()},
+            **{name: test.dependencies for name, test in helper.tests().items()},
+            **{
+                f"{package}.{name}": macro.dependencies
+                for package in ("sushi", "dbt")
+                for name, macro in helper.macros(package).items()
+            },
+        }
+
+    expected = dependencies(load_helper())
+
+    cold = load_helper(tmp_path)
+    assert cold.cache
+    assert cold.cache.stats.hits == 0
+    assert cold.cache.stats.misses > 0
+    assert dependencies(cold) == expected
+
+    warm = load_helper(tmp_path)
+    assert warm.cache
+    assert warm.cache.stats.hits == cold.cache.stats.misses
+    assert warm.cache.stats.misses == 0
+    assert dependencies(warm) == expected
+
+
+def test_manifest_cache(tmp_path: Path):
+    cache = ManifestCache(tmp_path)
+    loaded = []
+
+    def loader(dependencies: Dependencies) -> t.Callable[[], Dependencies]:
+        def load() -> Dependencies:
+            loaded.append(dependencies)
+            return dependencies
+
+        return load
+
+    a = Dependencies(refs={"b"})
+    b = Dependencies(macros=[MacroReference(name="ref")])
+    assert cache.get_or_load("model.a", ["select * from b"], loader(a)) == a
+    assert cache.get_or_load("model.b", ["select 1"], loader(b)) == b
+    cache.save()
+    assert loaded == [a, b]
+
+    # Only the changed node is loaded again and nodes that weren't requested are dropped.
+    cache = ManifestCache(tmp_path)
+    changed_a = Dependencies(refs={"c"})
+    assert cache.get_or_load("model.a", ["select * from c"], loader(changed_a)) == changed_a
+    cache.save()
+    assert loaded == [a, b, changed_a]
+    assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+
+    cache = ManifestCache(tmp_path)
+    assert cache.get_or_load("model.a", ["select * from c"], loader(a)) == changed_a
+    assert cache.get_or_load("model.b", ["select 1"], loader(b)) == b
+    assert loaded == [a, b, changed_a, b]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@pytest.mark.slow
+def test_manifest_helper_cache_load_time(tmp_path: Path):
+    project_path = tmp_path / "project"
+    (project_path / "models").mkdir(parents=True)
+    (project_path / "macros").mkdir()
+    (project_path / "dbt_project.yml").write_text(
+        "name: 'bench'\nversion: '1.0.0'\nconfig-version: 2\nprofile: 'bench'\n"
+        "models:\n  +start: '2020-01-01'\n"
+    )
+    (project_path / "profiles.yml").write_text(
+        "bench:\n  outputs:\n    in_memory:\n      type: duckdb\n      schema: bench\n  target: in_memory\n"
+    )
+    (project_path / "macros" / "add_one.sql").write_text(
+        "{% macro add_one(col) %}{{ col }} + 1{% endmacro %}\n"
+    )
+
+    model_count = 2000
+    schema = ["version: 2", "models:"]
+    for i in range(model_count):
+        if i == 0:
+            sql = "SELECT 1 AS id"
+        else:
+            sql = f"SELECT id, {{{{ add_one('id') }}}} AS id_plus_one FROM {{{{ ref('model_{(i - 1) // 2}') }}}}"
+        (project_path / "models" / f"model_{i}.sql").write_text(sql)
+        schema.append(
+            f"  - name: model_{i}\n    columns:\n      - name: id\n        tests: [not_null]"
+        )
+    (project_path / "models" / "schema.yml").write_text("\n".join(schema))
+
+    profile = Profile.load(DbtContext(project_path))
+
+    def load_helper() -> ManifestHelper:
+        helper = ManifestHelper(
+            project_path,
+            project_path,
+            "bench",
+            profile.target,
+            cache_path=tmp_path / "cache",
+        )
+        assert len(helper.models()) == model_count
+        return helper
+
+    cold = load_helper()
+    warm = load_helper()
+    assert cold.load_seconds and cold.convert_seconds
+    assert warm.load_seconds and warm.convert_seconds
+    print(
+        f"Cold load: manifest {cold.load_seconds:.2f}s, conversion {cold.convert_seconds:.2f}s; "
+        f"warm load: manifest {warm.load_seconds:.2f}s, conversion {warm.convert_seconds:.2f}s"
+    )
+
+    assert warm.cache and warm.cache.stats.misses == 0
+    assert warm.load_seconds + warm.convert_seconds < cold.load_seconds + cold.convert_seconds
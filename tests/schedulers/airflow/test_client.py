@@ -1,3 +1,4 @@
+import gzip
 import json
 from unittest.mock import call
 from urllib.parse import urlencode
@@ -183,33 +184,62 @@ def snapshot_url(snapshot_ids, key="ids") -> str:
     return urlencode({key: _list_to_json(snapshot_ids)[0]})
 
 
-def test_get_snapshots(mocker: MockerFixture, snapshot: Snapshot):
-    snapshots = common.SnapshotsResponse(snapshots=[snapshot])
+def bulk_request(post_call) -> common.SnapshotsBulkRequest:
+    assert post_call.args == ("http://localhost:8080/sqlmesh/api/v1/snapshots/bulk",)
+    assert post_call.kwargs["headers"]["Content-Encoding"] == "gzip"
+    return common.SnapshotsBulkRequest.parse_raw(gzip.decompress(post_call.kwargs["data"]))
+
+
+def bulk_response_mock(mocker: MockerFixture, *responses: common.SnapshotsBulkResponse):
+    response_mocks = []
+    for response in responses:
+        response_mock = mocker.Mock()
+        response_mock.status_code = 200
+        response_mock.json.return_value = json.loads(response.json())
+        response_mocks.append(response_mock)
+    return mocker.patch("requests.Session.post", side_effect=response_mocks)
 
-    get_snapshots_response_mock = mocker.Mock()
-    get_snapshots_response_mock.status_code = 200
-    get_snapshots_response_mock.json.return_value = snapshots.dict()
-    get_snapshots_mock = mocker.patch("requests.Session.get")
-    get_snapshots_mock.return_value = get_snapshots_response_mock
+
+def test_get_snapshots(mocker: MockerFixture, snapshot: Snapshot):
+    get_snapshots_mock = bulk_response_mock(
+        mocker,
+        common.SnapshotsBulkResponse(snapshots=[snapshot], etags=["etag"]),
+        common.SnapshotsBulkResponse(unchanged_snapshot_ids=[snapshot.snapshot_id]),
+        common.SnapshotsBulkResponse(),
+    )
 
     client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
     result = client.get_snapshots([snapshot.snapshot_id])
 
     assert result == [snapshot]
+    assert bulk_request(get_snapshots_mock.call_args) == common.SnapshotsBulkRequest(
+        snapshot_ids=[snapshot.snapshot_id]
+    )
 
-    get_snapshots_mock.assert_called_once_with(
-        f"http://localhost:8080/sqlmesh/api/v1/snapshots?{snapshot_url([snapshot.snapshot_id])}"
+    # The cached snapshot is only validated with its ETag. Changes to returned snapshots don't
+    # affect the cached one.
+    result[0].unpaused_ts = 1
+    cached_result = client.get_snapshots([snapshot.snapshot_id])
+    assert cached_result == [snapshot]
+    assert cached_result[0].unpaused_ts is None
+    assert bulk_request(get_snapshots_mock.call_args) == common.SnapshotsBulkRequest(
+        cached_snapshots=[common.SnapshotEtag(snapshot_id=snapshot.snapshot_id, etag="etag")]
     )
 
+    # The snapshot has been deleted.
+    assert client.get_snapshots([snapshot.snapshot_id]) == []
+    assert bulk_request(get_snapshots_mock.call_args) == common.SnapshotsBulkRequest(
+        cached_snapshots=[common.SnapshotEtag(snapshot_id=snapshot.snapshot_id, etag="etag")]
+    )
+    assert not client._snapshot_cache
 
-def test_get_snapshots_batching(mocker: MockerFixture, snapshot: Snapshot):
-    snapshots = common.SnapshotsResponse(snapshots=[snapshot])
 
-    get_snapshots_response_mock = mocker.Mock()
-    get_snapshots_response_mock.status_code = 200
-    get_snapshots_response_mock.json.return_value = snapshots.dict()
-    get_snapshots_mock = mocker.patch("requests.Session.get")
-    get_snapshots_mock.return_value = get_snapshots_response_mock
+def test_get_snapshots_batching(mocker: MockerFixture, snapshot: Snapshot):
+    get_snapshots_mock = bulk_response_mock(
+        mocker,
+        common.SnapshotsBulkResponse(),
+        common.SnapshotsBulkResponse(snapshots=[snapshot], etags=["etag"]),
+    )
 
     snapshot_ids_batch_size = 40
     first_batch_ids = [
@@ -220,50 +250,70 @@ def test_get_snapshots_batching(mocker: MockerFixture, snapshot: Snapshot):
         airflow_url=common.AIRFLOW_LOCAL_URL,
         session=requests.Session(),
         snapshot_ids_batch_size=snapshot_ids_batch_size,
+        max_concurrent_requests=2,
     )
     result = client.get_snapshots([*first_batch_ids, snapshot.snapshot_id])
 
-    assert result == [snapshot] * 2
+    assert result == [snapshot]
+    assert sorted(
+        (bulk_request(c) for c in get_snapshots_mock.call_args_list),
+        key=lambda r: len(r.snapshot_ids),
+    ) == [
+        common.SnapshotsBulkRequest(snapshot_ids=[snapshot.snapshot_id]),
+        common.SnapshotsBulkRequest(snapshot_ids=first_batch_ids),
+    ]
+
+
+def test_get_snapshots_without_bulk_api(mocker: MockerFixture, snapshot: Snapshot):
+    post_response_mock = mocker.Mock()
+    post_response_mock.status_code = 404
+    post_mock = mocker.patch("requests.Session.post")
+    post_mock.return_value = post_response_mock
 
+    get_snapshots_response_mock = mocker.Mock()
+    get_snapshots_response_mock.status_code = 200
+    get_snapshots_response_mock.json.return_value = common.SnapshotsResponse(
+        snapshots=[snapshot]
+    ).dict()
+    get_snapshots_mock = mocker.patch("requests.Session.get")
+    get_snapshots_mock.return_value = get_snapshots_response_mock
+
+    client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
+    assert client.get_snapshots([snapshot.snapshot_id]) == [snapshot]
+    assert client.get_snapshots([snapshot.snapshot_id]) == [snapshot]
+
+    post_mock.assert_called_once()
     get_snapshots_mock.assert_has_calls(
         [
-            call(f"http://localhost:8080/sqlmesh/api/v1/snapshots?{snapshot_url(first_batch_ids)}"),
-            call().json(),
             call(
                 f"http://localhost:8080/sqlmesh/api/v1/snapshots?{snapshot_url([snapshot.snapshot_id])}"
             ),
             call().json(),
         ]
+        * 2
     )
 
 
 def test_snapshots_exist(mocker: MockerFixture, snapshot: Snapshot):
-    snapshot_ids = common.SnapshotIdsResponse(snapshot_ids=[snapshot.snapshot_id])
-
-    snapshots_exist_response_mock = mocker.Mock()
-    snapshots_exist_response_mock.status_code = 200
-    snapshots_exist_response_mock.json.return_value = snapshot_ids.dict()
-    snapshots_exist_mock = mocker.patch("requests.Session.get")
-    snapshots_exist_mock.return_value = snapshots_exist_response_mock
+    snapshots_exist_mock = bulk_response_mock(
+        mocker, common.SnapshotsBulkResponse(existing_snapshot_ids=[snapshot.snapshot_id])
+    )
 
     client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
     result = client.snapshots_exist([snapshot.snapshot_id])
 
     assert result == {snapshot.snapshot_id}
-
-    snapshots_exist_mock.assert_called_once_with(
-        f"http://localhost:8080/sqlmesh/api/v1/snapshots?check_existence&{snapshot_url([snapshot.snapshot_id])}"
+    assert bulk_request(snapshots_exist_mock.call_args) == common.SnapshotsBulkRequest(
+        check_existence_ids=[snapshot.snapshot_id]
     )
 
 
 def test_snapshots_exist_batching(mocker: MockerFixture, snapshot: Snapshot):
-    snapshot_ids = common.SnapshotIdsResponse(snapshot_ids=[snapshot.snapshot_id])
-
-    snapshots_exist_response_mock = mocker.Mock()
-    snapshots_exist_response_mock.status_code = 200
-    snapshots_exist_response_mock.json.return_value = snapshot_ids.dict()
-    snapshots_exist_mock = mocker.patch("requests.Session.get")
-    snapshots_exist_mock.return_value = snapshots_exist_response_mock
+    snapshots_exist_mock = bulk_response_mock(
+        mocker,
+        common.SnapshotsBulkResponse(),
+        common.SnapshotsBulkResponse(existing_snapshot_ids=[snapshot.snapshot_id]),
+    )
 
     snapshot_ids_batch_size = 40
     first_batch_ids = [
@@ -278,39 +328,25 @@ def test_snapshots_exist_batching(mocker: MockerFixture, snapshot: Snapshot):
     result = client.snapshots_exist([*first_batch_ids, snapshot.snapshot_id])
 
     assert result == {snapshot.snapshot_id}
-
-    snapshots_exist_mock.assert_has_calls(
-        [
-            call(
-                f"http://localhost:8080/sqlmesh/api/v1/snapshots?check_existence&{snapshot_url(first_batch_ids)}"
-            ),
-            call().json(),
-            call(
-                f"http://localhost:8080/sqlmesh/api/v1/snapshots?check_existence&{snapshot_url([snapshot.snapshot_id])}"
-            ),
-            call().json(),
-        ]
-    )
+    assert [bulk_request(c) for c in snapshots_exist_mock.call_args_list] == [
+        common.SnapshotsBulkRequest(check_existence_ids=first_batch_ids),
+        common.SnapshotsBulkRequest(check_existence_ids=[snapshot.snapshot_id]),
+    ]
 
 
 def test_models_exist(mocker: MockerFixture, snapshot: Snapshot):
     model_names = ["model_a", "model_b"]
 
-    models_exist_response_mock = mocker.Mock()
-    models_exist_response_mock.status_code = 200
-    models_exist_response_mock.json.return_value = common.ExistingModelsResponse(
-        names=model_names
-    ).dict()
-    models_exist_mock = mocker.patch("requests.Session.get")
-    models_exist_mock.return_value = models_exist_response_mock
+    models_exist_mock = bulk_response_mock(
+        mocker, common.SnapshotsBulkResponse(existing_node_names=model_names)
+    )
 
     client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
     result = client.nodes_exist(model_names, exclude_external=True)
 
     assert result == set(model_names)
-
-    models_exist_mock.assert_called_once_with(
-        "http://localhost:8080/sqlmesh/api/v1/models?exclude_external&names=model_a%2Cmodel_b"
+    assert bulk_request(models_exist_mock.call_args) == common.SnapshotsBulkRequest(
+        node_names=model_names, exclude_external=True
     )
 
 
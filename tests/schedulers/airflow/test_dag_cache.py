@@ -0,0 +1,139 @@
+import typing as t
+
+import pytest
+from pytest_mock.plugin import MockerFixture
+from sqlglot import parse_one
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.engine_adapter import create_engine_adapter
+from sqlmesh.core.environment import Environment
+from sqlmesh.core.model import SqlModel
+from sqlmesh.core.snapshot import Snapshot, SnapshotChangeCategory
+from sqlmesh.core.state_sync import EngineAdapterStateSync
+from sqlmesh.schedulers.airflow import common
+from sqlmesh.schedulers.airflow.dag_cache import DagStateCache
+from sqlmesh.schedulers.airflow.plan import PlanDagState
+from sqlmesh.utils.date import now_timestamp, to_timestamp
+
+pytestmark = pytest.mark.airflow
+
+
+@pytest.fixture
+def state_sync(duck_conn) -> EngineAdapterStateSync:
+    state_sync = EngineAdapterStateSync(
+        create_engine_adapter(lambda: duck_conn, "duckdb"), schema=c.SQLMESH
+    )
+    state_sync.migrate(default_catalog=None)
+    return state_sync
+
+
+def _make_snapshot(make_snapshot: t.Callable, name: str, query: str) -> Snapshot:
+    snapshot = make_snapshot(SqlModel(name=name, cron="@daily", query=parse_one(query)))
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    return snapshot
+
+
+def _promote_to_prod(
+    state_sync: EngineAdapterStateSync, snapshots: t.List[Snapshot], plan_id: str
+) -> None:
+    previous_environment = state_sync.get_environment(c.PROD)
+    environment = Environment(
+        name=c.PROD,
+        snapshots=[s.table_info for s in snapshots],
+        start_at="2023-01-01",
+        end_at=None,
+        plan_id=plan_id,
+        previous_plan_id=previous_environment.plan_id if previous_environment else None,
+    )
+    state_sync.promote(environment)
+    state_sync.unpause_snapshots(snapshots, now_timestamp())
+    state_sync.finalize(environment)
+
+
+def _plan_dag_spec(request_id: str, snapshots: t.List[Snapshot]) -> common.PlanDagSpec:
+    return common.PlanDagSpec(
+        request_id=request_id,
+        environment=Environment(
+            name="dev",
+            snapshots=[s.table_info for s in snapshots],
+            start_at=to_timestamp("2023-01-01"),
+            end_at=None,
+            plan_id=f"{request_id}_plan",
+        ),
+        new_snapshots=[],
+        backfill_intervals_per_snapshot=[],
+        demoted_snapshots=[],
+        no_gaps=False,
+        notification_targets=[],
+        backfill_concurrent_tasks=1,
+        ddl_concurrent_tasks=1,
+        users=[],
+        is_dev=True,
+        allow_destructive_snapshots=set(),
+    )
+
+
+def test_dag_state_cache(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, tmp_path, mocker: MockerFixture
+):
+    snapshot_a = _make_snapshot(make_snapshot, "a", "SELECT 1 AS a")
+    snapshot_b = _make_snapshot(make_snapshot, "b", "SELECT 2 AS b")
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+    _promote_to_prod(state_sync, [snapshot_a], "plan_1")
+
+    plan_dag_state = PlanDagState.from_state_sync(state_sync)
+    plan_dag_state.add_dag_spec(_plan_dag_spec("request_1", [snapshot_a, snapshot_b]))
+
+    cache_dir = tmp_path / "dag_cache"
+    cache = DagStateCache(state_sync, cache_dir)  # type: ignore
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    assert cache.refresh()
+    assert cache.prod_snapshots == [snapshot_a.table_info]
+    assert [s.request_id for s in cache.plan_dag_specs] == ["request_1"]
+    snapshots = cache.get_snapshots([snapshot_a, snapshot_b])
+    assert snapshots[snapshot_a.snapshot_id].unpaused_ts
+    assert snapshots[snapshot_b.snapshot_id].fingerprint == snapshot_b.fingerprint
+
+    # A new cache instance on the same worker reads nothing but version stamps from the state.
+    get_environment_spy = mocker.spy(state_sync, "get_environment")
+    get_snapshots_spy = mocker.spy(state_sync, "get_snapshots")
+    get_dag_specs_spy = mocker.spy(PlanDagState, "get_dag_specs")
+
+    cache = DagStateCache(state_sync, cache_dir)  # type: ignore
+    assert not cache.refresh()
+    assert cache.prod_snapshots == [snapshot_a.table_info]
+    assert [s.request_id for s in cache.plan_dag_specs] == ["request_1"]
+    assert cache.get_snapshots([snapshot_a, snapshot_b]) == snapshots
+    get_environment_spy.assert_not_called()
+    get_snapshots_spy.assert_not_called()
+    get_dag_specs_spy.assert_not_called()
+
+    # Only new plan DAG specs and snapshots that changed are fetched after the state changes.
+    snapshot_c = _make_snapshot(make_snapshot, "c", "SELECT 3 AS c")
+    state_sync.push_snapshots([snapshot_c])
+    _promote_to_prod(state_sync, [snapshot_a, snapshot_b, snapshot_c], "plan_2")
+    plan_dag_state.add_dag_spec(_plan_dag_spec("request_2", [snapshot_c]))
+
+    cache = DagStateCache(state_sync, cache_dir)  # type: ignore
+    assert cache.refresh()
+    assert {s.snapshot_id for s in cache.prod_snapshots or []} == {
+        snapshot_a.snapshot_id,
+        snapshot_b.snapshot_id,
+        snapshot_c.snapshot_id,
+    }
+    assert [s.request_id for s in cache.plan_dag_specs] == ["request_1", "request_2"]
+    assert get_dag_specs_spy.call_args[0][1] == ["request_2"]
+
+    snapshots = cache.get_snapshots([snapshot_a, snapshot_b, snapshot_c])
+    assert all(s.unpaused_ts for s in snapshots.values())
+    # Snapshot A hasn't changed since the last refresh.
+    assert set(get_snapshots_spy.call_args[0][0]) == {
+        snapshot_b.snapshot_id,
+        snapshot_c.snapshot_id,
+    }
+
+    # Removed plan DAG specs are dropped from the cache.
+    plan_dag_state.delete_dag_specs([common.plan_application_dag_id("dev", "request_1")])
+    cache = DagStateCache(state_sync, cache_dir)  # type: ignore
+    assert cache.refresh()
+    assert [s.request_id for s in cache.plan_dag_specs] == ["request_2"]
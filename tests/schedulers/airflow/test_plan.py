@@ -549,6 +549,10 @@ def test_plan_dag_state(snapshot: Snapshot, sushi_context: Context, random_name)
 
     plan_dag_state.add_dag_spec(plan_dag_spec)
     assert plan_dag_state.get_dag_specs() == [plan_dag_spec]
+    assert plan_dag_state.get_request_ids() == ["test_request_id"]
+    assert plan_dag_state.get_dag_specs(["test_request_id"]) == [plan_dag_spec]
+    assert not plan_dag_state.get_dag_specs(["missing_request_id"])
+    assert not plan_dag_state.get_dag_specs([])
 
     plan_dag_state.delete_dag_specs([])
     assert plan_dag_state.get_dag_specs() == [plan_dag_spec]
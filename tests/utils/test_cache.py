@@ -1,11 +1,23 @@
+import sqlite3
 from pathlib import Path
 
+import pytest
 from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one
 
 from sqlmesh.core.model import SqlModel
 from sqlmesh.core.model.cache import OptimizedQueryCache
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.core.model.cache import ModelCache
+from sqlmesh.utils.cache import (
+    BoundedCache,
+    CacheBackend,
+    CacheStats,
+    EvictionPolicy,
+    FileCache,
+    SQLiteCache,
+)
+from sqlmesh.utils.concurrency import fork_apply_to_values
+from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 
 
@@ -39,6 +51,148 @@ def test_file_cache(tmp_path: Path, mocker: MockerFixture):
     assert "___test_model_" in cache._cache_entry_path('"test_model"').name
 
 
+def test_sqlite_cache(tmp_path: Path, mocker: MockerFixture):
+    cache = SQLiteCache(tmp_path, _TestEntry, prefix="test")
+
+    test_entry_a = _TestEntry(value="value_a")
+    test_entry_b = _TestEntry(value="value_b")
+
+    loader = mocker.Mock(return_value=test_entry_a)
+
+    assert cache.get("test_name", "test_entry_a") is None
+
+    assert cache.get_or_load("test_name", "test_entry_a", loader=loader) == test_entry_a
+    assert cache.get_or_load("test_name", "test_entry_a", loader=loader) == test_entry_a
+    assert cache.get("test_name", "test_entry_a") == test_entry_a
+
+    cache.put("test_name", "test_entry_b", value=test_entry_b)
+    assert cache.get("test_name", "test_entry_b") == test_entry_b
+    assert cache.get("test_name", "test_entry_a") == test_entry_a
+
+    assert cache.get("different_name", "test_entry_b") is None
+    assert (
+        SQLiteCache(tmp_path, _TestEntry, prefix="other").get("test_name", "test_entry_a") is None
+    )
+
+    loader.assert_called_once()
+
+    # Entries are stored in a single file and outlive the cache instance.
+    assert [p.name for p in tmp_path.glob("*.db")] == ["cache.db"]
+    assert SQLiteCache(tmp_path, _TestEntry, prefix="test").get("test_name", "test_entry_b") == (
+        test_entry_b
+    )
+
+    mocker.patch("sqlmesh.utils.cache._cache_version", return_value="new_version")
+    assert SQLiteCache(tmp_path, _TestEntry, prefix="test").get("test_name", "test_entry_b") is None
+
+
+def test_sqlite_cache_eviction(tmp_path: Path, mocker: MockerFixture):
+    mocker.patch.object(SQLiteCache, "EVICTION_BATCH_SIZE", 1)
+    cache = SQLiteCache(tmp_path, _TestEntry)
+    time_mock = mocker.patch("sqlmesh.utils.cache.time.time")
+
+    for i in range(3):
+        time_mock.return_value = float(i)
+        cache.put(f"entry_{i}", value=_TestEntry(value="a" * 100))
+    entry_size = cache.size // 3
+
+    # Reading an entry refreshes its access time.
+    time_mock.return_value = SQLiteCache.ACCESS_TIME_RESOLUTION_SEC + 1.0
+    assert cache.get("entry_0")
+
+    cache.max_bytes = entry_size * 3
+    time_mock.return_value = SQLiteCache.ACCESS_TIME_RESOLUTION_SEC + 2.0
+    cache.put("entry_3", value=_TestEntry(value="a" * 100))
+
+    assert cache.get("entry_1") is None
+    assert cache.get("entry_0") and cache.get("entry_2") and cache.get("entry_3")
+    assert cache.size == entry_size * 3
+
+
+def test_sqlite_cache_untrusted(tmp_path: Path, mocker: MockerFixture):
+    cache = SQLiteCache(tmp_path, _TestEntry, prefix="test", trusted=False)
+    cache.put("test_name", value=_TestEntry(value="value_a"))
+
+    loads_mock = mocker.patch("sqlmesh.utils.cache.pickle.loads")
+    assert cache.get("test_name") == _TestEntry(value="value_a")
+    loads_mock.assert_not_called()
+
+    # Stored values are validated as JSON when restored.
+    with cache._transaction() as connection:
+        connection.execute("UPDATE entries SET value = ?", (b'{"value": 1}',))
+    assert cache.get("test_name") is None
+
+    with pytest.raises(SQLMeshError, match="must be pydantic models"):
+        SQLiteCache(tmp_path, str, trusted=False)  # type: ignore
+
+
+def test_sqlite_cache_multiple_processes(tmp_path: Path):
+    processes = 12
+
+    def _put(i: int) -> None:
+        # All workers create the database at the same time
+        cache = SQLiteCache(tmp_path / str(i // processes), _TestEntry)
+        for j in range(10):
+            cache.put(f"entry_{i}_{j}", value=_TestEntry(value=str(j)))
+
+    fork_apply_to_values(list(range(processes * 5)), _put, processes)
+
+    for i in range(processes * 5):
+        cache = SQLiteCache(tmp_path / str(i // processes), _TestEntry)
+        assert all(cache.get(f"entry_{i}_{j}") == _TestEntry(value=str(j)) for j in range(10))
+
+
+def test_sqlite_cache_init_retry(tmp_path: Path, mocker: MockerFixture):
+    initialize = SQLiteCache._initialize
+    errors = [sqlite3.OperationalError("disk I/O error"), sqlite3.OperationalError("locked")]
+
+    def _initialize(self: SQLiteCache) -> None:
+        if errors:
+            raise errors.pop()
+        initialize(self)
+
+    mocker.patch.object(SQLiteCache, "INIT_RETRY_DELAY_SEC", 0)
+    mocker.patch.object(SQLiteCache, "_initialize", _initialize)
+    cache = SQLiteCache(tmp_path, _TestEntry)
+    cache.put("test_name", value=_TestEntry(value="value"))
+    assert cache.get("test_name") == _TestEntry(value="value")
+
+    errors.append(sqlite3.OperationalError("no such table"))
+    with pytest.raises(sqlite3.OperationalError, match="no such table"):
+        SQLiteCache(tmp_path, _TestEntry)
+
+
+def test_sqlite_cache_forked_connections(tmp_path: Path):
+    cache = SQLiteCache(tmp_path, _TestEntry)
+    cache.put("parent", value=_TestEntry(value="parent"))
+
+    def _put(i: int) -> None:
+        # Workers open their own connections instead of using the ones inherited from the parent
+        assert not cache._connections
+        cache.put(f"entry_{i}", value=_TestEntry(value=str(i)))
+        # Closing the connections of a worker doesn't affect entries written by other workers
+        for connection in cache._connections.values():
+            connection.close()
+        cache._connections.clear()
+
+    fork_apply_to_values(list(range(4)), _put, 4)
+
+    assert cache.get("parent") == _TestEntry(value="parent")
+    assert all(cache.get(f"entry_{i}") == _TestEntry(value=str(i)) for i in range(4))
+
+
+def test_model_cache_sqlite_backend(tmp_path: Path):
+    model = SqlModel(name="test_model", query=parse_one("SELECT a FROM tbl"))
+    model.render_query()
+
+    ModelCache(tmp_path, backend=CacheBackend.SQLITE).put("test_model", model=model)
+    cached_model = ModelCache(tmp_path, backend=CacheBackend.SQLITE).get("test_model")
+
+    assert cached_model == model
+    assert cached_model is not model
+    assert cached_model.render_query_or_raise().sql() == model.render_query_or_raise().sql()
+
+
 def test_optimized_query_cache(tmp_path: Path, mocker: MockerFixture):
     model = SqlModel(
         name="test_model",
@@ -50,3 +204,54 @@ def test_optimized_query_cache(tmp_path: Path, mocker: MockerFixture):
 
     assert not cache.with_optimized_query(model)
     assert cache.with_optimized_query(model)
+
+
+def test_bounded_cache_lru():
+    cache: BoundedCache[str, int] = BoundedCache(max_entries=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get_or_load("c", lambda: 4) == 3
+    assert cache.stats == CacheStats(hits=2, misses=1, evictions=1)
+    assert cache.stats.hit_rate == 2 / 3
+
+
+def test_bounded_cache_fifo():
+    cache: BoundedCache[str, int] = BoundedCache(max_entries=2, eviction_policy=EvictionPolicy.FIFO)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "a" not in cache
+    assert "b" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_bounded_cache_max_bytes():
+    cache: BoundedCache[str, str] = BoundedCache(max_bytes=10, sizeof=lambda key, value: len(value))
+
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert len(cache) == 2
+    assert cache.size == 8
+
+    cache.put("c", "cccc")
+    assert len(cache) == 2
+    assert "a" not in cache
+    assert cache.size == 8
+
+    cache.put("b", "b")
+    assert cache.size == 5
+
+    cache.configure(max_bytes=2)
+    assert len(cache) == 1
+    assert cache.peek("b") == "b"
+    assert cache.stats == CacheStats(hits=0, misses=0, evictions=2)
@@ -1,12 +1,24 @@
+import os
+import typing as t
+from pathlib import Path
+from threading import Lock, current_thread
+
 import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.core.snapshot import SnapshotId
 from sqlmesh.utils.concurrency import (
+    ConcurrentDAGExecutor,
     NodeExecutionFailedError,
+    concurrent_apply_to_dag,
     concurrent_apply_to_snapshots,
     concurrent_apply_to_values,
+    critical_path_priority,
+    fork_apply_to_values,
+    prefetch,
 )
+from sqlmesh.utils.dag import DAG
+from sqlmesh.utils.errors import SQLMeshError
 
 
 @pytest.mark.parametrize("tasks_num", [1, 2])
@@ -147,3 +159,191 @@ def test_concurrent_apply(tasks_num: int):
     values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     results = concurrent_apply_to_values(values, lambda x: x * 2, tasks_num)
     assert results == [x * 2 for x in values]
+
+
+def test_concurrent_apply_to_dag_priority():
+    dag: DAG[str] = DAG({"root": set(), "a": {"root"}, "b": {"root"}, "c": {"root"}, "d": {"root"}})
+
+    lock = Lock()
+    processed_nodes = []
+
+    def fn(node: str) -> None:
+        with lock:
+            processed_nodes.append(node)
+
+    priorities = {"root": 0, "a": 4, "b": 3, "c": 2, "d": 1}
+    errors, skipped = concurrent_apply_to_dag(dag, fn, 2, priority=lambda n: priorities[n])
+
+    assert not errors
+    assert not skipped
+    assert processed_nodes[0] == "root"
+    assert set(processed_nodes[1:3]) == {"c", "d"}
+    assert set(processed_nodes[3:]) == {"a", "b"}
+
+
+def test_critical_path_priority():
+    dag: DAG[str] = DAG(
+        {
+            "a": set(),
+            "b": {"a"},
+            "c": {"b"},
+            "d": set(),
+            "e": {"d"},
+        }
+    )
+
+    priority = critical_path_priority(dag)
+    assert [priority(n) for n in "abcde"] == [-3, -2, -1, -2, -1]
+
+    weights = {"a": 1, "b": 1, "c": 1, "d": 1, "e": 10}
+    priority = critical_path_priority(dag, weight=lambda n: weights[n])
+    assert [priority(n) for n in "abcde"] == [-3, -2, -1, -11, -10]
+
+
+def test_concurrent_apply_to_dag_cycle():
+    dag: DAG[str] = DAG({"a": set(), "b": {"a", "c"}, "c": {"b"}})
+
+    with pytest.raises(SQLMeshError, match="Detected a cycle in the DAG"):
+        concurrent_apply_to_dag(dag, lambda _: None, 2)
+
+
+def _layered_dag(nodes_num: int, width: int = 100) -> DAG[int]:
+    return DAG(
+        {
+            i: {
+                dep
+                for dep in (i - width, i - width - 1)
+                if dep >= 0 and dep // width == i // width - 1
+            }
+            for i in range(nodes_num)
+        }
+    )
+
+
+def test_concurrent_apply_to_dag_dispatch_overhead_is_linear(mocker: MockerFixture):
+    class _CountingDict(dict):
+        writes = 0
+
+        def __setitem__(self, key: t.Any, value: t.Any) -> None:
+            self.writes += 1
+            super().__setitem__(key, value)
+
+    dag = _layered_dag(10_000)
+    processed_nodes: t.List[int] = []
+    executor = ConcurrentDAGExecutor(dag, processed_nodes.append, 4, raise_on_error=False)
+    indegrees = _CountingDict(executor._indegrees)
+    executor._indegrees = indegrees
+    push_ready_spy = mocker.spy(executor, "_push_ready")
+
+    errors, skipped = executor.run()
+
+    assert not errors
+    assert not skipped
+    assert sorted(processed_nodes) == list(range(10_000))
+    # Completing a node only touches its direct dependents, and each node becomes ready once.
+    assert indegrees.writes == sum(len(deps) for deps in dag.graph.values())
+    assert push_ready_spy.call_count == 10_000
+
+
+def test_prefetch():
+    produced = []
+
+    def produce():
+        for i in range(5):
+            produced.append(i)
+            yield i
+
+    consumed = []
+    for item in prefetch(produce(), max_prefetched=1):
+        # The producer is never more than the buffered item plus the one in progress ahead.
+        assert len(produced) <= item + 3
+        consumed.append(item)
+    assert consumed == [0, 1, 2, 3, 4]
+
+
+def test_prefetch_error():
+    def produce():
+        yield 1
+        raise ValueError("boom")
+
+    items = prefetch(produce())
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(items)
+
+
+def test_prefetch_stops_producer_early():
+    produced = []
+
+    def produce():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    items = prefetch(produce(), max_prefetched=1)
+    assert next(items) == 0
+    items.close()
+    assert len(produced) < 5
+
+
+def test_prefetch_on_exit():
+    exit_threads = []
+
+    def on_exit():
+        exit_threads.append(current_thread())
+
+    assert list(prefetch(iter(range(3)), on_exit=on_exit)) == [0, 1, 2]
+    assert len(exit_threads) == 1
+    assert exit_threads[0] is not current_thread()
+
+    # The producer cleans up after the consumer stops early too.
+    items = prefetch(iter(range(100)), on_exit=on_exit)
+    assert next(items) == 0
+    items.close()
+    assert len(exit_threads) == 2
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_fork_apply_to_values(processes: int):
+    # The function closes over state that isn't picklable, which workers inherit through fork.
+    lock = Lock()
+
+    def _double(value: int) -> int:
+        with lock:
+            return value * 2
+
+    values = list(range(10))
+    assert fork_apply_to_values(values, _double, processes) == [v * 2 for v in values]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_fork_apply_to_values_error(processes: int):
+    def _fail(value: int) -> int:
+        if value >= 3:
+            raise SQLMeshError(f"Failed on {value}")
+        return value
+
+    with pytest.raises(SQLMeshError, match="Failed on 3"):
+        fork_apply_to_values(list(range(10)), _fail, processes)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_fork_apply_to_values_on_chunk_exit(tmp_path: Path, processes: int):
+    # Each worker logs applied values and chunk exits to its own file
+    def _log(line: str) -> None:
+        with open(tmp_path / str(os.getpid()), "a") as f:
+            f.write(f"{line}\n")
+
+    def _apply(value: int) -> int:
+        _log(str(value))
+        if value == 7:
+            raise SQLMeshError("Failed on 7")
+        return value
+
+    with pytest.raises(SQLMeshError, match="Failed on 7"):
+        fork_apply_to_values(list(range(10)), _apply, processes, on_chunk_exit=lambda: _log("exit"))
+
+    logs = [path.read_text().splitlines() for path in tmp_path.iterdir()]
+    assert set(range(8)) <= {int(line) for log in logs for line in log if line != "exit"}
+    # Workers always exit a chunk after applying the function, even if it failed
+    assert all(log[-1] == "exit" for log in logs)
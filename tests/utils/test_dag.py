@@ -1,3 +1,6 @@
+import typing as t
+from random import Random
+
 import pytest
 
 from sqlmesh.utils.dag import DAG
@@ -99,3 +102,92 @@ def test_prune():
         "a": {"d"},
         "d": set(),
     }
+
+
+def test_subdag_and_prune():
+    dag = DAG({"a": {"b", "c"}, "b": {"d"}, "c": {"d"}, "e": {"a"}})
+
+    subdag = dag.subdag("b", "x")
+    assert subdag.graph == {"b": {"d"}, "d": set(), "x": set()}
+    assert subdag.downstream("d") == ["b"]
+    assert subdag.reversed.graph == {"b": set(), "d": {"b"}, "x": set()}
+
+    pruned = dag.prune("a", "c", "e")
+    assert pruned.graph == {"a": {"c"}, "c": set(), "e": {"a"}}
+    assert pruned.sorted == ["c", "a", "e"]
+
+
+def test_closures_invalidated_on_add():
+    dag = DAG({"a": {"b"}, "b": {"c"}})
+
+    assert dag.upstream("a") == ["c", "b"]
+    assert dag.downstream("c") == ["b", "a"]
+    graph = dag.graph
+    assert dag.graph is graph
+
+    # Callers can't modify the cached state of the DAG
+    with pytest.raises(TypeError):
+        graph["d"] = frozenset()  # type: ignore
+    assert isinstance(graph["a"], frozenset)
+    dag.sorted.append("d")
+    assert dag.sorted == ["c", "b", "a"]
+
+    dag.add("d", ["a"])
+    dag.add("b", ["e"])
+
+    assert dag.upstream("a") == ["c", "e", "b"]
+    assert dag.upstream("d") == ["c", "e", "b", "a"]
+    assert dag.downstream("c") == ["b", "a", "d"]
+    assert dag.downstream("e") == ["b", "a", "d"]
+    assert dag.sorted == ["c", "e", "b", "a", "d"]
+    assert graph == {"a": {"b"}, "b": {"c"}, "c": set()}
+    assert dag.graph == {"a": {"b"}, "b": {"c", "e"}, "c": set(), "d": {"a"}, "e": set()}
+    assert "e" in dag
+    assert "f" not in dag
+
+
+def test_dag_random_graph():
+    random = Random(42)
+    nodes_num = 500
+    edges_num = 2_000
+
+    graph: t.Dict[int, t.Set[int]] = {node: set() for node in range(nodes_num)}
+    for _ in range(edges_num):
+        node = random.randrange(1, nodes_num)
+        graph[node].add(random.randrange(node))
+
+    def closure(node: int, edges: t.Dict[int, t.Set[int]]) -> t.Set[int]:
+        result: t.Set[int] = set()
+        stack = list(edges[node])
+        while stack:
+            current = stack.pop()
+            if current not in result:
+                result.add(current)
+                stack.extend(edges[current])
+        return result
+
+    dependents: t.Dict[int, t.Set[int]] = {node: set() for node in graph}
+    for node, deps in graph.items():
+        for dep in deps:
+            dependents[dep].add(node)
+
+    dag = DAG(graph)
+    positions = {node: i for i, node in enumerate(dag.sorted)}
+    assert len(positions) == nodes_num
+    assert all(positions[dep] < positions[node] for node, deps in graph.items() for dep in deps)
+
+    for node in range(0, nodes_num, 50):
+        downstream = dag.downstream(node)
+        assert set(downstream) == closure(node, dependents)
+        assert downstream == sorted(downstream, key=positions.__getitem__)
+        assert set(dag.upstream(node)) == closure(node, graph)
+
+    subdag_nodes = range(nodes_num - 10, nodes_num)
+    assert set(dag.subdag(*subdag_nodes).sorted) == set(subdag_nodes).union(
+        *(closure(node, graph) for node in subdag_nodes)
+    )
+
+    pruned = dag.prune(*range(0, nodes_num, 2))
+    assert pruned.graph == {
+        node: {dep for dep in deps if dep % 2 == 0} for node, deps in graph.items() if node % 2 == 0
+    }
@@ -152,4 +152,4 @@ async def model_lineage(
             origin="API -> lineage -> model_lineage",
         )
 
-    return context.dag.lineage(model_name).graph
+    return {node: set(deps) for node, deps in context.dag.lineage(model_name).graph.items()}